@@ -7,7 +7,6 @@ import streamlit as st
 import sys
 import os
 from datetime import datetime
-import io
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(__file__))
@@ -27,22 +26,11 @@ setup_logging(log_to_file=True)
 logger = get_logger(__name__)
 
 from src.graph.state import create_initial_state, Message, QuestionAnswer
-from src.graph.workflow import InterviewWorkflow
-
-# Document processing imports
-try:
-    import PyPDF2
-    PDF_SUPPORT = True
-except ImportError:
-    PDF_SUPPORT = False
-    logger.warning("PyPDF2 not installed - PDF resume upload disabled")
-
-try:
-    import docx
-    DOCX_SUPPORT = True
-except ImportError:
-    DOCX_SUPPORT = False
-    logger.warning("python-docx not installed - DOCX resume upload disabled")
+from src.graph.workflow import InterviewWorkflow, get_workflow
+from src.llm.rate_limit import StreamInterruptedError
+from src.sessions import SessionConflictError, SessionStore, get_session_store
+
+from src.resume import PDF_SUPPORT, DOCX_SUPPORT, ResumeParseError, extract_resume_text
 
 logger.info("="*60)
 logger.info("AI Interviewer Streamlit Application Started")
@@ -390,86 +378,51 @@ st.markdown("""
 
 
 # Job roles and experience levels
-JOB_ROLES = [
-    "Software Engineer",
-    "Data Engineer",
-    "Data Scientist",
-    "Machine Learning Engineer",
-    "DevOps Engineer",
-    "Frontend Developer",
-    "Backend Developer",
-    "Full Stack Developer",
-    "Product Manager",
-    "System Architect",
-    "PowerBI Analyst",
-    "Google Looker Analyst",
-    "Business Intelligence Analyst",
-    "Other (Specify)"
-]
-
-EXPERIENCE_LEVELS = ["Junior", "Mid-Level", "Senior"]
-
-
-def extract_text_from_pdf(file):
-    """Extract text from PDF file."""
-    if not PDF_SUPPORT:
-        return None
-    
-    try:
-        pdf_reader = PyPDF2.PdfReader(file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        logger.info(f"Successfully extracted {len(text)} characters from PDF resume")
-        return text.strip()
-    except Exception as e:
-        logger.error(f"Error extracting PDF text: {e}")
-        return None
+from config.settings import JOB_ROLES, EXPERIENCE_LEVELS
 
 
-def extract_text_from_docx(file):
-    """Extract text from DOCX file."""
-    if not DOCX_SUPPORT:
+def process_resume_upload(uploaded_file):
+    """Process uploaded resume file and extract text (raises ResumeParseError on failure)."""
+    if uploaded_file is None:
         return None
     
-    try:
-        doc = docx.Document(file)
-        text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-        logger.info(f"Successfully extracted {len(text)} characters from DOCX resume")
-        return text.strip()
-    except Exception as e:
-        logger.error(f"Error extracting DOCX text: {e}")
-        return None
+    return extract_resume_text(uploaded_file.getvalue(), uploaded_file.name)
 
 
-def extract_text_from_txt(file):
-    """Extract text from TXT file."""
-    try:
-        text = file.read().decode('utf-8')
-        logger.info(f"Successfully extracted {len(text)} characters from TXT resume")
-        return text.strip()
-    except Exception as e:
-        logger.error(f"Error extracting TXT text: {e}")
-        return None
+@st.cache_resource
+def get_shared_workflow() -> InterviewWorkflow:
+    """Get the compiled interview workflow shared by every session."""
+    return get_workflow()
 
 
-def process_resume_upload(uploaded_file):
-    """Process uploaded resume file and extract text."""
-    if uploaded_file is None:
-        return None
+@st.cache_resource
+def get_shared_session_store() -> SessionStore:
+    """Get the session store holding every interview's latest state."""
+    return get_session_store()
+
+
+def save_interview(state):
+    """
+    Save the interview to the session store and show the saved state.
     
-    file_type = uploaded_file.name.split('.')[-1].lower()
-    logger.info(f"Processing resume upload: {uploaded_file.name} (type: {file_type})")
+    If the interview was continued elsewhere (another tab or replica) in the
+    meantime, its latest state is shown instead.
     
-    if file_type == 'pdf':
-        return extract_text_from_pdf(uploaded_file)
-    elif file_type in ['docx', 'doc']:
-        return extract_text_from_docx(uploaded_file)
-    elif file_type == 'txt':
-        return extract_text_from_txt(uploaded_file)
-    else:
-        logger.warning(f"Unsupported file type: {file_type}")
-        return None
+    Args:
+        state: Interview state to save
+        
+    Returns:
+        InterviewState: The state now shown
+    """
+    store = get_shared_session_store()
+    try:
+        state = store.save(state)
+    except SessionConflictError as e:
+        logger.warning(str(e))
+        st.warning("This interview was continued elsewhere - showing its latest state.")
+        state = store.load(state["interview_id"])
+    st.session_state.interview_state = state
+    return state
 
 
 def initialize_session_state():
@@ -484,14 +437,38 @@ def initialize_session_state():
         st.session_state.experience_level = ''
     if 'interview_state' not in st.session_state:
         st.session_state.interview_state = None
-    if 'workflow' not in st.session_state:
-        st.session_state.workflow = None
     if 'current_answer' not in st.session_state:
         st.session_state.current_answer = ''
     if 'interview_started' not in st.session_state:
         st.session_state.interview_started = False
     if 'resume_text' not in st.session_state:
         st.session_state.resume_text = None
+    
+    if st.session_state.interview_state is None and "interview" in st.query_params:
+        restore_interview(st.query_params["interview"])
+
+
+def restore_interview(interview_id: str):
+    """
+    Pick up a saved interview after a reload, on any replica of the app.
+    
+    Args:
+        interview_id: ID of the interview, taken from the page URL
+    """
+    state = get_shared_session_store().load(interview_id) or get_shared_workflow().load_state(interview_id)
+    if state is None:
+        logger.warning(f"No saved session for interview {interview_id}")
+        del st.query_params["interview"]
+        return
+    
+    logger.info(f"Resuming interview {interview_id}")
+    st.session_state.candidate_name = state["candidate_name"]
+    st.session_state.job_role = state["job_role"]
+    st.session_state.experience_level = state["experience_level"]
+    st.session_state.resume_text = state.get("resume_text")
+    st.session_state.interview_state = state
+    st.session_state.stage = 'interview'
+    st.session_state.interview_started = True
 
 
 def show_welcome_screen():
@@ -585,13 +562,18 @@ def show_welcome_screen():
         resume_text = None
         if uploaded_file is not None:
             with st.spinner("Processing your resume..."):
-                resume_text = process_resume_upload(uploaded_file)
+                try:
+                    resume_text = process_resume_upload(uploaded_file)
+                    parse_error = None
+                except ResumeParseError as e:
+                    resume_text = None
+                    parse_error = e.user_message
                 if resume_text:
                     st.success(f"✅ Resume processed successfully! ({len(resume_text)} characters extracted)")
                     with st.expander("📝 Preview extracted text"):
                         st.text_area("Resume Content", resume_text[:1000] + ("..." if len(resume_text) > 1000 else ""), height=200, disabled=True)
                 else:
-                    st.error("❌ Failed to process resume. Please try a different file or continue without it.")
+                    st.error(f"❌ {parse_error or 'Failed to process resume.'} Please try a different file or continue without it.")
         
         st.markdown("---")
         
@@ -608,15 +590,18 @@ def show_welcome_screen():
                 st.session_state.stage = 'interview'
                 st.session_state.interview_started = True
                 
-                # Initialize interview state and workflow
-                st.session_state.interview_state = create_initial_state(
+                # Initialize interview state and start prefetching with the shared workflow
+                state = create_initial_state(
                     candidate_name=candidate_name,
                     job_role=job_role,
                     experience_level=experience_level,
                     resume_text=resume_text
                 )
-                st.session_state.workflow = InterviewWorkflow()
-                logger.info("Interview state and workflow initialized")
+                get_shared_workflow().prefetch_openers(state)
+                save_interview(state)
+                # Keep the interview in the URL so a reload resumes it
+                st.query_params["interview"] = st.session_state.interview_state["interview_id"]
+                logger.info("Interview state initialized")
                 
                 st.rerun()
             else:
@@ -648,10 +633,41 @@ def get_agent_header(agent_type):
     return headers.get(agent_type, headers["technical"])
 
 
+def render_agent_header(agent_type):
+    """Render the header card for an agent's round."""
+    agent_info = get_agent_header(agent_type)
+    st.markdown(f"""
+    <div class="agent-card {agent_info['color']}">
+        <h2>{agent_info['emoji']} {agent_info['title']}</h2>
+        <p>{agent_info['description']}</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+def render_question_box(question_text):
+    """Get the HTML for the question box."""
+    return f"""
+    <div class="question-box">
+        {question_text}
+    </div>
+    """
+
+
+def get_question_progress(state, agent_type):
+    """Get the (question number, max questions) shown for an agent's next question."""
+    from config import settings
+    if agent_type == "technical":
+        return state['technical_questions_asked'] + 1, settings.MAX_TECHNICAL_QUESTIONS
+    elif agent_type == "hr":
+        return state['hr_questions_asked'] + 1, settings.MAX_HR_QUESTIONS
+    else:
+        return state['manager_questions_asked'] + 1, settings.MAX_MANAGER_QUESTIONS
+
+
 def show_interview_screen():
     """Display the interview screen."""
     state = st.session_state.interview_state
-    workflow = st.session_state.workflow
+    workflow = get_shared_workflow()
     
     # Sidebar with progress
     with st.sidebar:
@@ -693,40 +709,46 @@ def show_interview_screen():
     if not state['is_complete']:
         # Get current question if not already set
         if not state.get('current_question'):
-            state = workflow.run_step(state)
-            st.session_state.interview_state = state
+            next_agent = workflow.next_agent(state)
+            if next_agent == "evaluation":
+                with st.spinner("🤖 AI is evaluating your interview performance..."):
+                    state = workflow.run_step(state)
+            else:
+                # Stream the question into the page as it is generated
+                render_agent_header(next_agent)
+                q_num, max_q = get_question_progress(state, next_agent)
+                st.markdown(f"### Question {q_num}/{max_q}")
+                question_placeholder = st.empty()
+                streamed_text = ""
+                try:
+                    for event, payload in workflow.stream_step(state):
+                        if event == "token":
+                            streamed_text += payload
+                            question_placeholder.markdown(
+                                render_question_box(streamed_text + "▌"),
+                                unsafe_allow_html=True
+                            )
+                        else:
+                            state = payload
+                except StreamInterruptedError as e:
+                    # Nothing was saved; drop the partial question and ask again on request
+                    logger.warning(str(e))
+                    question_placeholder.empty()
+                    st.error("❌ The connection dropped while the question was being written.")
+                    st.button("🔄 Ask again")
+                    st.stop()
+            save_interview(state)
             st.rerun()
         
         current_agent = state['current_agent']
-        agent_info = get_agent_header(current_agent)
-        
-        # Agent Header
-        st.markdown(f"""
-        <div class="agent-card {agent_info['color']}">
-            <h2>{agent_info['emoji']} {agent_info['title']}</h2>
-            <p>{agent_info['description']}</p>
-        </div>
-        """, unsafe_allow_html=True)
+        render_agent_header(current_agent)
         
         # Question number
-        if current_agent == "technical":
-            q_num = state['technical_questions_asked'] + 1
-            max_q = settings.MAX_TECHNICAL_QUESTIONS
-        elif current_agent == "hr":
-            q_num = state['hr_questions_asked'] + 1
-            max_q = settings.MAX_HR_QUESTIONS
-        else:
-            q_num = state['manager_questions_asked'] + 1
-            max_q = settings.MAX_MANAGER_QUESTIONS
-        
+        q_num, max_q = get_question_progress(state, current_agent)
         st.markdown(f"### Question {q_num}/{max_q}")
         
         # Display question
-        st.markdown(f"""
-        <div class="question-box">
-            {state['current_question']}
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(render_question_box(state['current_question']), unsafe_allow_html=True)
         
         # Answer input
         answer = st.text_area(
@@ -750,8 +772,7 @@ def show_interview_screen():
                 logger.info(f"Answer submitted for {current_agent} - Question {q_num} (length: {len(answer)} chars)")
                 with st.spinner("Processing your answer..."):
                     # Process the answer
-                    state = workflow.process_answer(state, answer)
-                    st.session_state.interview_state = state
+                    state = save_interview(workflow.process_answer(state, answer))
                     
                     # Check if we've completed all questions before generating next one
                     from config import settings
@@ -761,15 +782,12 @@ def show_interview_screen():
                         # Trigger evaluation node
                         logger.info("All questions completed - triggering AI evaluation")
                         with st.spinner("🤖 AI is evaluating your interview performance..."):
-                            state = workflow.run_step(state)
-                            st.session_state.interview_state = state
+                            state = save_interview(workflow.run_step(state))
                         logger.info("Interview evaluation completed successfully")
                         st.success("🎉 Interview Complete! Your results are ready!")
                     else:
-                        # Run the next step to generate the next question
-                        logger.debug(f"Generating next question - Current state: Tech={state['technical_questions_asked']}, HR={state['hr_questions_asked']}, Manager={state['manager_questions_asked']}")
-                        state = workflow.run_step(state)
-                        st.session_state.interview_state = state
+                        # The next question is streamed in on the rerun
+                        logger.debug(f"Next question will be streamed - Current state: Tech={state['technical_questions_asked']}, HR={state['hr_questions_asked']}, Manager={state['manager_questions_asked']}")
                         
                 st.rerun()
             else:
@@ -968,6 +986,7 @@ def show_results_screen():
             # Reset session state
             for key in list(st.session_state.keys()):
                 del st.session_state[key]
+            st.query_params.clear()
             st.rerun()
 
 
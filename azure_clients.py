@@ -1,40 +1,267 @@
 """
 Azure OpenAI clients for chat and embeddings.
+
+Clients are pooled per process: every agent and every interview session
+shares the same LangChain client for a given configuration, and all clients
+share one tuned httpx connection pool. Async connections belong to the
+event loop that opened them, so the async client keeps one pool per loop.
 """
+import asyncio
+import threading
+import weakref
+from typing import Any, Dict, List, Optional
 
+import httpx
 from langchain_openai import AzureChatOpenAI, AzureOpenAIEmbeddings
 from config import settings
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import h2  # noqa: F401
+    HTTP2_SUPPORT = True
+except ImportError:
+    HTTP2_SUPPORT = False
+
+_lock = threading.Lock()
+_http_client: Optional[httpx.Client] = None
+_http_async_client: Optional[httpx.AsyncClient] = None
+_chat_clients: Dict[tuple, AzureChatOpenAI] = {}
+_embedding_clients: Dict[tuple, AzureOpenAIEmbeddings] = {}
+_registry_stats = {"requests": 0, "created": 0}
+
+
+def _http_client_options() -> Dict[str, Any]:
+    """Connection pool options shared by the sync and async HTTP clients."""
+    return {
+        "limits": httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+        ),
+        "timeout": httpx.Timeout(settings.HTTP_TIMEOUT),
+        "http2": settings.HTTP2_ENABLED and HTTP2_SUPPORT,
+    }
+
+
+class LoopBoundTransport(httpx.AsyncBaseTransport):
+    """
+    Async transport with a separate connection pool for each event loop.
+    
+    Sockets opened on one loop cannot be used from another, so a client
+    shared across loops (successive asyncio.run calls, Streamlit reruns)
+    would otherwise fail with "Event loop is closed". A loop's pool is
+    dropped with the loop.
+    """
+    
+    def __init__(self, **options: Any):
+        """
+        Args:
+            **options: httpx.AsyncHTTPTransport options of every pool
+        """
+        self._options = options
+        self._lock = threading.Lock()
+        self._pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport]" = (
+            weakref.WeakKeyDictionary()
+        )
+    
+    def _pool(self) -> httpx.AsyncHTTPTransport:
+        """Get the running loop's pool, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            pool = self._pools.get(loop)
+            if pool is None:
+                pool = httpx.AsyncHTTPTransport(**self._options)
+                self._pools[loop] = pool
+            return pool
+    
+    def pools(self) -> List[httpx.AsyncHTTPTransport]:
+        """The pools of the loops still alive."""
+        with self._lock:
+            return list(self._pools.values())
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._pool().handle_async_request(request)
+    
+    async def aclose(self) -> None:
+        """Close the running loop's pool (the others close with their loops)."""
+        with self._lock:
+            pool = self._pools.pop(asyncio.get_running_loop(), None)
+        if pool is not None:
+            await pool.aclose()
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Return the process-wide HTTP client used for synchronous LLM calls.
+    
+    Returns:
+        httpx.Client: Shared client with keep-alive connection pooling
+    """
+    global _http_client
+    with _lock:
+        if _http_client is None:
+            _http_client = httpx.Client(**_http_client_options())
+            logger.info("Created shared HTTP connection pool "
+                        f"(max connections: {settings.HTTP_MAX_CONNECTIONS}, "
+                        f"http2: {settings.HTTP2_ENABLED and HTTP2_SUPPORT})")
+        return _http_client
+
+
+def get_http_async_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide HTTP client used for asynchronous LLM calls.
+    
+    The client can be used from any event loop: its LoopBoundTransport
+    keeps a keep-alive pool per loop.
+    
+    Returns:
+        httpx.AsyncClient: Shared async client with keep-alive connection pooling
+    """
+    global _http_async_client
+    with _lock:
+        if _http_async_client is None:
+            options = _http_client_options()
+            transport = LoopBoundTransport(limits=options.pop("limits"), http2=options.pop("http2"))
+            _http_async_client = httpx.AsyncClient(transport=transport, **options)
+        return _http_async_client
 
 
-def get_chat_llm():
+def get_chat_llm(temperature: Optional[float] = None) -> AzureChatOpenAI:
     """
-    Create and return a LangChain Azure OpenAI chat client for agents.
+    Return the shared LangChain Azure OpenAI chat client for agents.
+    
+    Clients are keyed by endpoint, deployment, API version and temperature,
+    so all agents and sessions with the same settings reuse one instance.
+    
+    Args:
+        temperature: Sampling temperature (defaults to settings.TEMPERATURE)
     
     Returns:
         AzureChatOpenAI: Configured LLM instance for chat
     """
-    return AzureChatOpenAI(
-        azure_endpoint=settings.OPENAI_ENDPOINT,
-        azure_deployment=settings.OPENAI_DEPLOYMENT_NAME,
-        api_version=settings.OPENAI_API_VERSION,
-        api_key=settings.OPENAI_API_KEY,
-        temperature=settings.TEMPERATURE,
+    if temperature is None:
+        temperature = settings.TEMPERATURE
+    
+    key = (
+        settings.OPENAI_ENDPOINT,
+        settings.OPENAI_DEPLOYMENT_NAME,
+        settings.OPENAI_API_VERSION,
+        temperature,
     )
+    http_client = get_http_client()
+    http_async_client = get_http_async_client()
+    
+    with _lock:
+        _registry_stats["requests"] += 1
+        llm = _chat_clients.get(key)
+        if llm is None:
+            llm = AzureChatOpenAI(
+                azure_endpoint=settings.OPENAI_ENDPOINT,
+                azure_deployment=settings.OPENAI_DEPLOYMENT_NAME,
+                api_version=settings.OPENAI_API_VERSION,
+                api_key=settings.OPENAI_API_KEY,
+                temperature=temperature,
+                http_client=http_client,
+                http_async_client=http_async_client,
+                # Retries are coordinated by the process-wide rate limiter
+                max_retries=0,
+            )
+            _chat_clients[key] = llm
+            _registry_stats["created"] += 1
+            logger.debug(f"Created chat client for deployment {settings.OPENAI_DEPLOYMENT_NAME} "
+                         f"(temperature: {temperature})")
+        return llm
 
 
-def get_embedding_client():
+def get_embedding_client() -> AzureOpenAIEmbeddings:
     """
-    Create and return an Azure OpenAI embeddings client configured for LangChain.
+    Return the shared Azure OpenAI embeddings client configured for LangChain.
     Useful for future RAG/vector search features.
     
     Returns:
         AzureOpenAIEmbeddings: A configured embedding client
     """
-    return AzureOpenAIEmbeddings(
-        azure_endpoint=settings.OPENAI_ENDPOINT,
-        api_key=settings.OPENAI_API_KEY,
-        api_version=settings.OPENAI_API_VERSION,
-        deployment=settings.OPENAI_EMBED_DEPLOYMENT_NAME,
-        model=settings.OPENAI_EMBED_DEPLOYMENT_NAME,
+    key = (
+        settings.OPENAI_ENDPOINT,
+        settings.OPENAI_EMBED_DEPLOYMENT_NAME,
+        settings.OPENAI_API_VERSION,
     )
+    http_client = get_http_client()
+    http_async_client = get_http_async_client()
+    
+    with _lock:
+        client = _embedding_clients.get(key)
+        if client is None:
+            client = AzureOpenAIEmbeddings(
+                azure_endpoint=settings.OPENAI_ENDPOINT,
+                api_key=settings.OPENAI_API_KEY,
+                api_version=settings.OPENAI_API_VERSION,
+                deployment=settings.OPENAI_EMBED_DEPLOYMENT_NAME,
+                model=settings.OPENAI_EMBED_DEPLOYMENT_NAME,
+                http_client=http_client,
+                http_async_client=http_async_client,
+            )
+            _embedding_clients[key] = client
+        return client
+
+
+def _pool_stats(client) -> Dict[str, Any]:
+    """
+    Summarize the connections held by an httpx client's pool (all of its
+    per-loop pools for the async client).
+    
+    Relies on httpcore internals, so it degrades to an empty dict if the
+    transport does not expose a connection pool.
+    """
+    if client is None:
+        return {}
+    transport = client._transport
+    transports = transport.pools() if isinstance(transport, LoopBoundTransport) else [transport]
+    try:
+        connections = [connection for pool in transports for connection in pool._pool.connections]
+    except AttributeError:
+        return {}
+    idle = sum(1 for connection in connections if connection.is_idle())
+    return {
+        "connections": len(connections),
+        "idle": idle,
+        "active": len(connections) - idle,
+    }
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """
+    Get statistics for the shared client registry and connection pools.
+    
+    Returns:
+        Dict with client counts, registry reuse and per-pool connection counts
+    """
+    with _lock:
+        return {
+            "chat_clients": len(_chat_clients),
+            "embedding_clients": len(_embedding_clients),
+            "client_requests": _registry_stats["requests"],
+            "client_reuses": _registry_stats["requests"] - _registry_stats["created"],
+            "http2": settings.HTTP2_ENABLED and HTTP2_SUPPORT,
+            "max_connections": settings.HTTP_MAX_CONNECTIONS,
+            "max_keepalive_connections": settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            "sync_pool": _pool_stats(_http_client),
+            "async_pool": _pool_stats(_http_async_client),
+        }
+
 
+def close_clients() -> None:
+    """Close the shared HTTP pools and forget all pooled clients."""
+    global _http_client, _http_async_client
+    with _lock:
+        if _http_client is not None:
+            _http_client.close()
+        _http_client = None
+        # Async pools are bound to the event loops that used them; drop the
+        # client and let each loop's shutdown close its sockets.
+        _http_async_client = None
+        _chat_clients.clear()
+        _embedding_clients.clear()
+        _registry_stats.update(requests=0, created=0)
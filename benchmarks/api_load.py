@@ -0,0 +1,233 @@
+"""
+Load test: the ASGI interview service against a local fake LLM.
+
+Starts the fake Azure OpenAI server and --workers interview service
+processes (server.py's app, one uvicorn worker each) sharing a session
+store, then drives --sessions full interviews at once through the REST
+endpoints (or the WebSocket with --websocket) and reports requests/s and
+p50/p99 latency of the steps, the answers and, over the WebSocket, the
+first question token. REST requests are spread over the workers round
+robin, like a load balancer without sticky sessions.
+
+Usage:
+    python benchmarks/api_load.py --sessions 50 --latency 0.2
+    python benchmarks/api_load.py --sessions 50 --latency 0.2 --websocket
+    python benchmarks/api_load.py --sessions 50 --workers 2 --store redis
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+ANSWER = "I would profile the service first, then cache the expensive lookups."
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Interview service load test")
+    parser.add_argument("--sessions", type=int, default=50, help="Interviews run at once")
+    parser.add_argument("--latency", type=float, default=0.2, help="Fake LLM seconds per call")
+    parser.add_argument("--max-steps", type=int, default=64, help="API_MAX_CONCURRENT_STEPS of the service")
+    parser.add_argument("--websocket", action="store_true", help="Drive interviews over the WebSocket")
+    parser.add_argument("--workers", type=int, default=1, help="Service processes behind the round robin")
+    parser.add_argument("--store", choices=["sqlite", "redis", "memory"], default="sqlite",
+                        help="Session store shared by the workers (redis uses a local stand-in)")
+    parser.add_argument("--port", type=int, default=8021, help="Port of the first worker")
+    parser.add_argument("--llm-port", type=int, default=8011, help="Fake LLM server port")
+    return parser.parse_args()
+
+
+def serve(port: int):
+    """Run the interview service (child process entry point)."""
+    import uvicorn
+    from config.logging_config import setup_logging
+    from src.api import create_app
+    
+    setup_logging(log_to_file=False)
+    uvicorn.run(create_app(), host="127.0.0.1", port=port, log_level="warning")
+
+
+def start_service(port: int, timeout: float = 30.0) -> multiprocessing.Process:
+    """Start the service in a child process and wait until it answers."""
+    process = multiprocessing.Process(target=serve, args=(port,), daemon=True)
+    process.start()
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/health")
+            return process
+        except httpx.TransportError:
+            if time.monotonic() > deadline or not process.is_alive():
+                process.terminate()
+                raise RuntimeError(f"Interview service did not start on port {port}")
+            time.sleep(0.1)
+
+
+class Latencies:
+    """Collects request latencies by kind."""
+    
+    def __init__(self):
+        self.samples = {}
+        self.errors = 0
+    
+    def add(self, kind: str, seconds: float):
+        self.samples.setdefault(kind, []).append(seconds)
+    
+    @property
+    def requests(self) -> int:
+        return sum(len(samples) for kind, samples in self.samples.items() if kind != "first token")
+
+
+async def timed(latencies: Latencies, kind: str, request):
+    """Await a request, recording its latency."""
+    start = time.perf_counter()
+    response = await request
+    latencies.add(kind, time.perf_counter() - start)
+    if response.status_code >= 400:
+        latencies.errors += 1
+    return response.json()
+
+
+class RoundRobin:
+    """Hands out the workers' base URLs in turn."""
+    
+    def __init__(self, urls: list):
+        self.urls = urls
+        self.next = 0
+    
+    def __call__(self) -> str:
+        url = self.urls[self.next % len(self.urls)]
+        self.next += 1
+        return url
+
+
+async def rest_interview(client: httpx.AsyncClient, workers: RoundRobin, latencies: Latencies, i: int):
+    """Run one interview through the REST endpoints, each request on the next worker."""
+    profile = {"candidate_name": f"Candidate {i}", "job_role": "Backend Developer", "experience_level": "Junior"}
+    interview = await timed(latencies, "create", client.post(f"{workers()}/interviews", json=profile))
+    interview_id = interview["interview_id"]
+    while not interview["is_complete"]:
+        interview = await timed(latencies, "step", client.post(f"{workers()}/interviews/{interview_id}/step"))
+        if interview.get("current_question"):
+            answer = client.post(f"{workers()}/interviews/{interview_id}/answer", json={"answer": ANSWER})
+            await timed(latencies, "answer", answer)
+
+
+async def websocket_interview(client: httpx.AsyncClient, workers: RoundRobin, latencies: Latencies, i: int):
+    """Run one interview over a WebSocket to one worker (created on another)."""
+    import websockets
+    
+    profile = {"candidate_name": f"Candidate {i}", "job_role": "Backend Developer", "experience_level": "Junior"}
+    interview = await timed(latencies, "create", client.post(f"{workers()}/interviews", json=profile))
+    uri = f"{workers().replace('http', 'ws', 1)}/interviews/{interview['interview_id']}/stream"
+    async with websockets.connect(uri) as websocket:
+        request = {"type": "step"}
+        while True:
+            start = time.perf_counter()
+            await websocket.send(json.dumps(request))
+            message = json.loads(await websocket.recv())
+            if message["type"] == "token":
+                latencies.add("first token", time.perf_counter() - start)
+            while message["type"] == "token":
+                message = json.loads(await websocket.recv())
+            latencies.add("step", time.perf_counter() - start)
+            if message["type"] == "error":
+                latencies.errors += 1
+                return
+            if message["interview"]["is_complete"]:
+                return
+            request = {"type": "answer", "answer": ANSWER}
+
+
+async def run_load(args) -> tuple:
+    """Run every interview at once and return (latencies, elapsed seconds)."""
+    latencies = Latencies()
+    limits = httpx.Limits(max_connections=args.sessions, max_keepalive_connections=args.sessions)
+    workers = RoundRobin([f"http://127.0.0.1:{args.port + n}" for n in range(args.workers)])
+    async with httpx.AsyncClient(limits=limits, timeout=120) as client:
+        start = time.perf_counter()
+        interview = websocket_interview if args.websocket else rest_interview
+        sessions = (interview(client, workers, latencies, i) for i in range(args.sessions))
+        await asyncio.gather(*sessions)
+        return latencies, time.perf_counter() - start
+
+
+def percentile(samples: list, fraction: float) -> float:
+    """Value below which the given fraction of samples fall."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main():
+    args = parse_args()
+    if args.store == "memory" and args.workers > 1:
+        sys.exit("The memory session store cannot be shared by several workers")
+    
+    from benchmarks.fake_llm_server import FakeLLMServer
+    from benchmarks.fake_redis_server import FakeRedisServer
+    server = FakeLLMServer(latency=args.latency, port=args.llm_port).start()
+    redis = FakeRedisServer().start() if args.store == "redis" else None
+    
+    with tempfile.TemporaryDirectory() as directory:
+        # The service processes inherit these: the real Azure client stack
+        # pointed at the fake server, no response cache, a shared session
+        # store and throwaway checkpoints (one database per worker, as on
+        # separate nodes)
+        os.environ.update({
+            "OPENAI_API_KEY": "benchmark-key",
+            "OPENAI_ENDPOINT": server.endpoint,
+            "OPENAI_CHAT_DEPLOYMENT_NAME": "benchmark-deployment",
+            "API_VERSION": "2024-02-01",
+            "LLM_CACHE_ENABLED": "false",
+            "SESSION_STORE": args.store,
+            "SESSION_DB_PATH": os.path.join(directory, "sessions.db"),
+            "SESSION_REDIS_URL": redis.url if redis else "",
+            "API_MAX_CONCURRENT_STEPS": str(args.max_steps),
+            "HTTP_MAX_CONNECTIONS": str(max(100, 2 * args.sessions)),
+            "HTTP_MAX_KEEPALIVE_CONNECTIONS": str(max(20, 2 * args.sessions)),
+        })
+        services = []
+        try:
+            for n in range(args.workers):
+                os.environ["CHECKPOINT_DB_PATH"] = os.path.join(directory, f"checkpoints-{n}.db")
+                services.append(start_service(args.port + n))
+            before = server.requests
+            latencies, elapsed = asyncio.run(run_load(args))
+            llm_calls = server.requests - before
+        finally:
+            for service in services:
+                service.terminate()
+                service.join(timeout=5)
+            server.stop()
+            if redis:
+                redis.stop()
+    
+    print("=" * 64)
+    print(f"Interview service load test ({'WebSocket' if args.websocket else 'REST'})")
+    print(f"Sessions: {args.sessions}  LLM latency: {args.latency}s  Step slots: {args.max_steps}  "
+          f"Workers: {args.workers}  Store: {args.store}")
+    print("=" * 64)
+    print(f"Elapsed: {elapsed:.2f}s  requests: {latencies.requests}  errors: {latencies.errors}  "
+          f"LLM calls: {llm_calls}")
+    print(f"Throughput: {latencies.requests / elapsed:.1f} requests/s  "
+          f"{args.sessions / elapsed:.2f} interviews/s")
+    print("-" * 64)
+    print(f"{'latency ms':<12} {'count':>7} {'p50':>9} {'p99':>9} {'mean':>9}")
+    for kind, samples in latencies.samples.items():
+        print(f"{kind:<12} {len(samples):>7} {percentile(samples, 0.5) * 1000:>9.1f} "
+              f"{percentile(samples, 0.99) * 1000:>9.1f} {statistics.mean(samples) * 1000:>9.1f}")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Concurrency benchmark: sync thread-per-session vs async event loop.
+
+Drives many full interviews against a local fake Azure OpenAI server with
+configurable latency, once with the synchronous API on a bounded thread
+pool (one blocked caller thread per in-flight session) and once with
+arun_step and aprocess_answer on a single event loop. Interviews use the
+configured EVALUATION_MODE (incremental by default), so the background
+answer assessments are part of the measured work. The fake server runs in a
+child process; results are reported per CPU core.
+
+Usage:
+    python benchmarks/concurrency.py --sessions 40 --latency 1.0 --threads 8
+"""
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Sessions-per-core benchmark")
+    parser.add_argument("--sessions", type=int, default=40, help="Interviews to run")
+    parser.add_argument("--latency", type=float, default=1.0, help="Fake LLM seconds per call")
+    parser.add_argument("--threads", type=int, default=8, help="Thread pool size for the sync run")
+    parser.add_argument("--port", type=int, default=8011, help="Fake LLM server port")
+    return parser.parse_args()
+
+
+class InFlight:
+    """Tracks the peak number of interviews in progress at once."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+    
+    def __enter__(self):
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+    
+    def __exit__(self, *exc):
+        with self._lock:
+            self.current -= 1
+
+
+def run_sync(workflow, create_initial_state, sessions, threads):
+    """Run interviews with the blocking API on a thread pool."""
+    in_flight = InFlight()
+    
+    def interview(i):
+        with in_flight:
+            state = create_initial_state(f"Candidate {i}", "Backend Developer", "Junior")
+            while not state["is_complete"]:
+                state = workflow.run_step(state)
+                if state["current_question"]:
+                    state = workflow.process_answer(state, "A benchmark answer.")
+    
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(interview, range(sessions)))
+    return time.perf_counter() - start, in_flight.peak
+
+
+def run_async(workflow, create_initial_state, sessions):
+    """Run interviews with arun_step and aprocess_answer on a single event loop."""
+    in_flight = InFlight()
+    
+    async def interview(i):
+        with in_flight:
+            state = create_initial_state(f"Candidate {i}", "Backend Developer", "Junior")
+            while not state["is_complete"]:
+                state = await workflow.arun_step(state)
+                if state["current_question"]:
+                    state = await workflow.aprocess_answer(state, "A benchmark answer.")
+    
+    async def run_all():
+        await asyncio.gather(*(interview(i) for i in range(sessions)))
+    
+    start = time.perf_counter()
+    asyncio.run(run_all())
+    return time.perf_counter() - start, in_flight.peak
+
+
+def main():
+    """Run both modes and print a comparison."""
+    args = parse_args()
+    
+    from benchmarks.fake_llm_server import FakeLLMServer
+    server = FakeLLMServer(latency=args.latency, port=args.port).start()
+    
+    # Point the real Azure client stack at the fake server
+    os.environ["OPENAI_API_KEY"] = "benchmark-key"
+    os.environ["OPENAI_ENDPOINT"] = server.endpoint
+    os.environ["OPENAI_CHAT_DEPLOYMENT_NAME"] = "benchmark-deployment"
+    os.environ["API_VERSION"] = "2024-02-01"
+    os.environ.setdefault("HTTP_MAX_CONNECTIONS", str(max(args.sessions, args.threads)))
+    os.environ.setdefault("HTTP_MAX_KEEPALIVE_CONNECTIONS", str(max(args.sessions, args.threads)))
+    
+    from config import settings
+    from src.graph.state import create_initial_state
+    from src.graph.workflow import InterviewWorkflow
+    
+    workflow = InterviewWorkflow()
+    
+    print("=" * 60)
+    print("Concurrency benchmark: sync threads vs async event loop")
+    print(f"Sessions: {args.sessions}  LLM latency: {args.latency}s  Sync threads: {args.threads}  "
+          f"Evaluation mode: {settings.EVALUATION_MODE}")
+    print("=" * 60)
+    
+    results = {}
+    for mode in ("sync", "async"):
+        before = server.requests
+        if mode == "sync":
+            elapsed, peak = run_sync(workflow, create_initial_state, args.sessions, args.threads)
+        else:
+            elapsed, peak = run_async(workflow, create_initial_state, args.sessions)
+        calls = server.requests - before
+        results[mode] = args.sessions / elapsed
+        print(f"{mode:>5}: {elapsed:7.2f}s  {args.sessions / elapsed:8.2f} sessions/s  "
+              f"{calls / elapsed:8.1f} LLM calls/s  peak in-flight sessions: {peak}")
+    
+    cores = os.cpu_count() or 1
+    print("-" * 60)
+    print(f"CPU cores: {cores}  sessions/s per core: sync {results['sync'] / cores:.2f}, "
+          f"async {results['async'] / cores:.2f}")
+    print(f"Speedup (async vs sync): {results['async'] / results['sync']:.1f}x")
+    print("=" * 60)
+    
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+DOCX extraction benchmark: python-docx DOM vs streaming iterparse.
+
+Builds a synthetic large resume (paragraphs plus a skills table) and runs
+each extractor in a fresh child process, reporting CPU time, peak RSS growth
+and characters extracted. RSS is used instead of tracemalloc because
+python-docx allocates its DOM inside lxml.
+
+Usage:
+    python benchmarks/docx_extraction.py --paragraphs 20000 --table-rows 2000
+"""
+import argparse
+import io
+import multiprocessing
+import os
+import resource
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Dummy Azure settings; config.settings requires them but no model is called
+os.environ.setdefault("OPENAI_API_KEY", "benchmark-key")
+os.environ.setdefault("OPENAI_ENDPOINT", "http://127.0.0.1:9")
+os.environ.setdefault("OPENAI_CHAT_DEPLOYMENT_NAME", "benchmark-deployment")
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="DOCX extraction benchmark")
+    parser.add_argument("--paragraphs", type=int, default=20000, help="Body paragraphs")
+    parser.add_argument("--table-rows", type=int, default=2000, help="Skills table rows")
+    parser.add_argument("--max-chars", type=int, default=4000, help="Character budget")
+    return parser.parse_args()
+
+
+def python_docx_text(data, max_chars=None):
+    """The previous extractor: full DOM, body paragraphs only."""
+    import docx
+    doc = docx.Document(io.BytesIO(data))
+    return "\n".join(paragraph.text for paragraph in doc.paragraphs).strip()
+
+
+def streaming_text(data, max_chars=None):
+    """The streaming extractor."""
+    from src.resume.extraction import extract_text_from_docx
+    return extract_text_from_docx(data, max_chars)[0]
+
+
+def run_child(extract, data, max_chars, results):
+    """Measure one extraction in a fresh process."""
+    # Import parsers before measuring so only the parse itself is counted
+    import docx  # noqa: F401
+    import src.resume.extraction  # noqa: F401
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.process_time()
+    text = extract(data, max_chars)
+    seconds = time.process_time() - start
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results.put((seconds, (rss_after - rss_before) * 1024, len(text)))
+
+
+def measure(extract, data, max_chars):
+    """Return (CPU seconds, peak RSS growth in bytes, characters)."""
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target=run_child, args=(extract, data, max_chars, results))
+    process.start()
+    process.join()
+    if process.exitcode != 0:
+        raise RuntimeError(f"{extract.__name__} failed in the child process")
+    return results.get()
+
+
+def main():
+    """Run the benchmark and print a comparison."""
+    args = parse_args()
+    from benchmarks.sample_documents import sample_docx
+    
+    data = sample_docx(args.paragraphs, args.table_rows)
+    print(f"DOCX: {args.paragraphs} paragraphs, {args.table_rows} table rows, {len(data) / 1024:.0f} KiB")
+    
+    runs = [
+        ("python-docx", python_docx_text, None),
+        ("streaming", streaming_text, None),
+        (f"stream {args.max_chars}", streaming_text, args.max_chars),
+    ]
+    for name, extract, max_chars in runs:
+        seconds, rss, chars = measure(extract, data, max_chars)
+        print(f"{name:>14}: {seconds * 1000:8.1f} ms CPU  {rss / 1024 / 1024:7.1f} MiB peak RSS growth  {chars:8d} chars")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Deterministic fake chat model for benchmarks and tests.
+
+Behaves like AzureChatOpenAI from the agents' point of view (invoke, stream),
+counts every completion and can simulate network latency, so interviews can
+be driven end to end without calling Azure OpenAI.
+"""
+import asyncio
+import re
+import threading
+import time
+from typing import Any, Iterator, List, Optional
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import PrivateAttr
+
+
+FAKE_QUESTION = (
+    "Can you walk me through a project where you had to make a difficult "
+    "trade-off, and explain how you decided between the options?"
+)
+
+FAKE_EVALUATION = """SCORE: 78
+
+STRENGTHS:
+- Clear and structured answers
+- Good grasp of fundamentals
+
+WEAKNESSES:
+- Could go deeper on system design
+
+SUGGESTIONS:
+- Practice explaining trade-offs with concrete numbers
+
+OVERALL FEEDBACK:
+A solid interview with room to grow in depth.
+"""
+
+FAKE_RESUME_DIGEST = """SKILLS: Python, PostgreSQL, Kafka, Kubernetes
+ROLES: Senior Software Engineer, Example Corp (2019-2024); Software Engineer, Startup Inc (2016-2019)
+YEARS OF EXPERIENCE: 8
+NOTABLE PROJECTS:
+- Migrated a monolith to event-driven services, cutting deploy time by 80%
+- Built a billing pipeline processing 2M events per day
+EDUCATION: BSc Computer Science, State University
+"""
+
+
+class FakeInterviewLLM(BaseChatModel):
+    """Chat model stand-in that returns canned interview text."""
+    
+    latency: float = 0.0
+    question: str = FAKE_QUESTION
+    evaluation: str = FAKE_EVALUATION
+    digest: str = FAKE_RESUME_DIGEST
+    
+    _calls: int = PrivateAttr(default=0)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    
+    @property
+    def _llm_type(self) -> str:
+        return "fake-interview-llm"
+    
+    @property
+    def calls(self) -> int:
+        """Number of completions served so far."""
+        return self._calls
+    
+    def reset(self) -> None:
+        """Reset the call counter."""
+        with self._lock:
+            self._calls = 0
+    
+    def _respond(self, messages: List[BaseMessage]) -> str:
+        """Pick the canned response for a prompt and count the call."""
+        with self._lock:
+            self._calls += 1
+        prompt = messages[-1].content if messages else ""
+        if "SCORE:" in prompt:
+            return self.evaluation
+        if "NOTABLE PROJECTS:" in prompt:
+            return self.digest
+        return self.question
+    
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.latency:
+            time.sleep(self.latency)
+        message = AIMessage(content=self._respond(messages))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+    
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        message = AIMessage(content=self._respond(messages))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+    
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        if self.latency:
+            time.sleep(self.latency)
+        text = self._respond(messages)
+        for token in re.split(r"(\s+)", text):
+            if not token:
+                continue
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager:
+                run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+
+
+def install_fake_llm(workflow, llm: BaseChatModel, cache=None) -> None:
+    """
+    Point every agent of a workflow at the given chat model.
+    
+    Fake responses must not leak into the process-wide response cache, so
+    the agents use the given cache instead (none by default).
+    
+    Args:
+        workflow: InterviewWorkflow instance
+        llm: Chat model to use for all agents
+        cache: Optional LLMResponseCache for the agents
+    """
+    for agent in (
+        workflow.technical_agent,
+        workflow.hr_agent,
+        workflow.manager_agent,
+        workflow.evaluation_agent,
+        workflow.resume_digest_agent,
+    ):
+        agent.llm = llm
+        agent.cache = cache
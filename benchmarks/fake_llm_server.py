@@ -0,0 +1,181 @@
+"""
+Local fake Azure OpenAI server with configurable latency.
+
+Serves the Azure chat completions route that AzureChatOpenAI calls, so the
+real client stack (connection pool, serialization, streaming) can be
+exercised without credentials or network access.
+
+Usage:
+    python benchmarks/fake_llm_server.py --port 8011 --latency 0.2
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import time
+import uuid
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from benchmarks.fake_llm import FAKE_EVALUATION, FAKE_QUESTION
+
+
+def create_app(latency: float = 0.1) -> FastAPI:
+    """
+    Create the fake Azure OpenAI application.
+    
+    Args:
+        latency: Seconds to wait before answering each completion
+        
+    Returns:
+        FastAPI: ASGI application
+    """
+    app = FastAPI()
+    app.state.latency = latency
+    app.state.requests = 0
+    
+    @app.post("/openai/deployments/{deployment}/chat/completions")
+    async def chat_completions(deployment: str, request: Request):
+        body = await request.json()
+        app.state.requests += 1
+        await asyncio.sleep(app.state.latency)
+        
+        prompt = body["messages"][-1]["content"] if body.get("messages") else ""
+        text = FAKE_EVALUATION if "SCORE:" in prompt else FAKE_QUESTION
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        prompt_tokens = max(1, len(prompt) // 4)
+        completion_tokens = max(1, len(text) // 4)
+        
+        if body.get("stream"):
+            return StreamingResponse(
+                _stream_chunks(completion_id, deployment, text),
+                media_type="text/event-stream",
+            )
+        
+        return JSONResponse({
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": deployment,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        })
+    
+    @app.get("/stats")
+    async def stats():
+        return {"requests": app.state.requests, "latency": app.state.latency}
+    
+    return app
+
+
+async def _stream_chunks(completion_id: str, deployment: str, text: str):
+    """Yield server-sent events for a streamed completion, one word at a time."""
+    words = text.split(" ")
+    for i, word in enumerate(words):
+        token = word if i == len(words) - 1 else word + " "
+        chunk = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": deployment,
+            "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}],
+        }
+        yield f"data: {json.dumps(chunk)}\n\n"
+        await asyncio.sleep(0)
+    final = {
+        "id": completion_id,
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": deployment,
+        "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+    }
+    yield f"data: {json.dumps(final)}\n\n"
+    yield "data: [DONE]\n\n"
+
+
+class FakeLLMServer:
+    """
+    Runs the fake Azure OpenAI app in a child process.
+    
+    A separate process keeps the server's CPU time out of the measured
+    process's GIL.
+    """
+    
+    def __init__(self, latency: float = 0.1, host: str = "127.0.0.1", port: int = 8011):
+        self.latency = latency
+        self.host = host
+        self.port = port
+        self._process = None
+    
+    @property
+    def endpoint(self) -> str:
+        """Base URL to use as OPENAI_ENDPOINT."""
+        return f"http://{self.host}:{self.port}"
+    
+    @property
+    def requests(self) -> int:
+        """Number of completions served."""
+        return httpx.get(f"{self.endpoint}/stats").json()["requests"]
+    
+    def start(self, timeout: float = 15.0) -> "FakeLLMServer":
+        """Start serving and wait until the server answers."""
+        self._process = multiprocessing.Process(
+            target=uvicorn.run,
+            args=(create_app(self.latency),),
+            kwargs={"host": self.host, "port": self.port, "log_level": "warning"},
+            daemon=True,
+        )
+        self._process.start()
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                httpx.get(f"{self.endpoint}/stats")
+                return self
+            except httpx.TransportError:
+                if time.monotonic() > deadline:
+                    self.stop()
+                    raise RuntimeError(f"Fake LLM server did not start on {self.endpoint}")
+                time.sleep(0.05)
+    
+    def stop(self) -> None:
+        """Stop serving."""
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join(timeout=5)
+            self._process = None
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    """Run the fake server in the foreground."""
+    parser = argparse.ArgumentParser(description="Fake Azure OpenAI server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8011)
+    parser.add_argument("--latency", type=float, default=0.1, help="Seconds per completion")
+    args = parser.parse_args()
+    uvicorn.run(create_app(args.latency), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
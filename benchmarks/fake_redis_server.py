@@ -0,0 +1,229 @@
+"""
+Local stand-in for a Redis server.
+
+Speaks enough of RESP for RedisSessionStore (hashes, expiry and
+WATCH/MULTI/EXEC transactions), so the Redis session store can be tested
+and benchmarked without a Redis installation. Keys live in memory; every
+write bumps a per-key revision that WATCH checks at EXEC time, as Redis does.
+
+Usage:
+    python benchmarks/fake_redis_server.py --port 6399
+"""
+import argparse
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class FakeRedis:
+    """Keyspace and command handling of the stand-in."""
+    
+    def __init__(self):
+        self.hashes: Dict[bytes, Dict[bytes, bytes]] = {}
+        self.expiry: Dict[bytes, float] = {}
+        self.revisions: Dict[bytes, int] = {}
+        self.commands = 0
+        self.clients = set()
+    
+    def _alive(self, key: bytes) -> bool:
+        """Whether a key exists, dropping it once expired."""
+        deadline = self.expiry.get(key)
+        if deadline is not None and deadline <= time.monotonic():
+            self._drop(key)
+        return key in self.hashes
+    
+    def _drop(self, key: bytes) -> None:
+        self.hashes.pop(key, None)
+        self.expiry.pop(key, None)
+        self._touch(key)
+    
+    def _touch(self, key: bytes) -> None:
+        self.revisions[key] = self.revisions.get(key, 0) + 1
+    
+    def revision(self, key: bytes) -> int:
+        self._alive(key)
+        return self.revisions.get(key, 0)
+    
+    def run(self, name: str, args: List[bytes]) -> Any:
+        """Run a data command, returning its reply (an Exception for errors)."""
+        self.commands += 1
+        if name == "PING":
+            return "PONG"
+        if name == "SELECT":
+            return "OK"
+        if name == "HGET":
+            key, field = args
+            return self.hashes[key].get(field) if self._alive(key) else None
+        if name == "HSET":
+            key, pairs = args[0], args[1:]
+            self._alive(key)
+            fields = self.hashes.setdefault(key, {})
+            added = sum(1 for field in pairs[::2] if field not in fields)
+            fields.update(zip(pairs[::2], pairs[1::2]))
+            self._touch(key)
+            return added
+        if name == "EXPIRE":
+            key, seconds = args
+            if not self._alive(key):
+                return 0
+            self.expiry[key] = time.monotonic() + int(seconds)
+            self._touch(key)
+            return 1
+        if name == "DEL":
+            deleted = 0
+            for key in args:
+                if self._alive(key):
+                    self._drop(key)
+                    deleted += 1
+            return deleted
+        return Exception(f"ERR unknown command '{name}'")
+
+
+def _encode(reply: Any) -> bytes:
+    """Encode a reply in RESP."""
+    if reply is None:
+        return b"$-1\r\n"
+    if isinstance(reply, Exception):
+        return b"-%s\r\n" % str(reply).encode("utf-8")
+    if isinstance(reply, str):
+        return b"+%s\r\n" % reply.encode("utf-8")
+    if isinstance(reply, int):
+        return b":%d\r\n" % reply
+    if isinstance(reply, bytes):
+        return b"$%d\r\n%s\r\n" % (len(reply), reply)
+    return b"*%d\r\n" % len(reply) + b"".join(_encode(item) for item in reply)
+
+
+async def _read_command(reader: asyncio.StreamReader) -> Optional[List[bytes]]:
+    """Read one command (a RESP array of bulk strings), or None at EOF."""
+    line = await reader.readline()
+    if not line:
+        return None
+    count = int(line[1:-2])
+    args = []
+    for _ in range(count):
+        length = int((await reader.readline())[1:-2])
+        args.append((await reader.readexactly(length + 2))[:-2])
+    return args
+
+
+async def _serve_client(redis: FakeRedis, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Serve one connection, keeping its WATCH and MULTI state."""
+    redis.clients.add(writer)
+    watched: Dict[bytes, int] = {}
+    queued: Optional[List[Tuple[str, List[bytes]]]] = None
+    try:
+        while True:
+            command = await _read_command(reader)
+            if command is None:
+                return
+            name, args = command[0].decode("utf-8").upper(), command[1:]
+            if name == "WATCH":
+                watched.update((key, redis.revision(key)) for key in args)
+                reply = "OK"
+            elif name == "UNWATCH":
+                watched.clear()
+                reply = "OK"
+            elif name == "MULTI":
+                queued = []
+                reply = "OK"
+            elif name == "DISCARD":
+                queued = None
+                watched.clear()
+                reply = "OK"
+            elif name == "EXEC":
+                if queued is None:
+                    reply = Exception("ERR EXEC without MULTI")
+                elif any(redis.revision(key) != revision for key, revision in watched.items()):
+                    reply = None
+                else:
+                    reply = [redis.run(queued_name, queued_args) for queued_name, queued_args in queued]
+                queued = None
+                watched.clear()
+            elif queued is not None:
+                queued.append((name, args))
+                reply = "QUEUED"
+            else:
+                reply = redis.run(name, args)
+            writer.write(_encode(reply))
+            await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        redis.clients.discard(writer)
+        writer.close()
+
+
+class FakeRedisServer:
+    """
+    Runs the stand-in on an event loop in a background thread.
+    
+    Commands are handled one at a time on that loop, so transactions are
+    atomic as on a real server.
+    """
+    
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.host = host
+        self.port = port
+        self.redis = FakeRedis()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server = None
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def url(self) -> str:
+        """URL to use as SESSION_REDIS_URL."""
+        return f"redis://{self.host}:{self.port}/0"
+    
+    def start(self) -> "FakeRedisServer":
+        """Start serving (on a free port if none was given)."""
+        self._loop = asyncio.new_event_loop()
+        self._server = self._loop.run_until_complete(asyncio.start_server(
+            lambda reader, writer: _serve_client(self.redis, reader, writer), self.host, self.port
+        ))
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._thread = threading.Thread(target=self._loop.run_forever, name="fake-redis", daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        """Stop serving."""
+        if self._loop is None:
+            return
+        
+        async def shutdown():
+            self._server.close()
+            for writer in list(self.redis.clients):
+                writer.close()
+            await self._server.wait_closed()
+        
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
+        self._loop = None
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    """Run the stand-in in the foreground."""
+    parser = argparse.ArgumentParser(description="Redis stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6399)
+    args = parser.parse_args()
+    server = FakeRedisServer(args.host, args.port).start()
+    print(f"Serving {server.url}")
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Regression benchmark: LLM invocations per full interview.
+
+Drives a complete interview through InterviewWorkflow with a counting fake
+LLM and reports how many completions each step made. With one agent node per
+step the expected total is one call per question plus the evaluation calls:
+one in "single" mode, one per round in "parallel" mode, and one per answer
+in "incremental" mode (made in the background as answers are submitted).
+
+Usage:
+    python benchmarks/llm_call_count.py
+"""
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Dummy Azure settings so the workflow can be built without credentials
+os.environ.setdefault("OPENAI_API_KEY", "benchmark-key")
+os.environ.setdefault("OPENAI_ENDPOINT", "http://127.0.0.1:9")
+os.environ.setdefault("OPENAI_CHAT_DEPLOYMENT_NAME", "benchmark-deployment")
+os.environ.setdefault("API_VERSION", "2024-02-01")
+
+from config import settings
+from src.graph.state import create_initial_state
+from src.graph.workflow import InterviewWorkflow
+from benchmarks.fake_llm import FakeInterviewLLM, install_fake_llm
+
+
+def total_questions() -> int:
+    """Questions asked in a full interview."""
+    return (
+        settings.MAX_TECHNICAL_QUESTIONS
+        + settings.MAX_HR_QUESTIONS
+        + settings.MAX_MANAGER_QUESTIONS
+    )
+
+
+def expected_evaluation_calls() -> int:
+    """Completions made to evaluate the interview."""
+    if settings.EVALUATION_MODE == "incremental":
+        return total_questions()
+    return 3 if settings.EVALUATION_MODE == "parallel" else 1
+
+
+def expected_llm_calls() -> int:
+    """One completion per question plus the evaluation calls."""
+    return total_questions() + expected_evaluation_calls()
+
+
+def count_interview_llm_calls(workflow=None, llm=None, verbose=False):
+    """
+    Run a full interview and count LLM invocations.
+    
+    Args:
+        workflow: Optional InterviewWorkflow to drive (a new one by default)
+        llm: Optional FakeInterviewLLM to count with
+        verbose: Print the per-step breakdown
+        
+    Returns:
+        tuple: (total_calls, list of (agent, calls) per step)
+    """
+    workflow = workflow or InterviewWorkflow()
+    llm = llm or FakeInterviewLLM()
+    install_fake_llm(workflow, llm)
+    
+    state = create_initial_state("Benchmark Candidate", "Backend Developer", "Junior")
+    steps = []
+    
+    while not state["is_complete"]:
+        before = llm.calls
+        state = workflow.run_step(state)
+        steps.append((state["current_agent"], llm.calls - before))
+        if verbose:
+            print(f"  step {len(steps):>2} {state['current_agent']:<10} llm calls: {llm.calls - before}")
+        if state["current_question"]:
+            state = workflow.process_answer(state, "A benchmark answer.")
+    
+    return llm.calls, steps
+
+
+def main():
+    """Run the benchmark and print a summary."""
+    print("=" * 60)
+    print("LLM invocations per full interview")
+    print("=" * 60)
+    
+    start = time.perf_counter()
+    total, steps = count_interview_llm_calls(verbose=True)
+    elapsed = time.perf_counter() - start
+    expected = expected_llm_calls()
+    
+    print("-" * 60)
+    print(f"Evaluation mode:    {settings.EVALUATION_MODE}")
+    print(f"Steps:              {len(steps)}")
+    print(f"LLM calls:          {total}")
+    print(f"Expected:           {expected}")
+    print(f"Wall time:          {elapsed:.3f}s")
+    print("=" * 60)
+    
+    return 0 if total == expected else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
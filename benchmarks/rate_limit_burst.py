@@ -0,0 +1,145 @@
+"""
+Burst benchmark: client-side rate limiting vs. retries alone.
+
+Fires a burst of concurrent LLM calls at a simulated deployment that
+enforces a requests-per-minute quota the way Azure OpenAI does (a rolling
+window, answering 429 with Retry-After once it is full). The burst runs once
+with the OpenAI client's own behaviour (each call retried twice, honouring
+Retry-After), once with the limiter's retries but no quota, and once with the
+limiter sized to the quota. Reports failed calls, 429s and latency
+percentiles for each.
+
+Usage:
+    python benchmarks/rate_limit_burst.py --calls 400 --rpm 1200 --threads 64
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("OPENAI_API_KEY", "benchmark-key")
+os.environ.setdefault("OPENAI_ENDPOINT", "http://127.0.0.1:9")
+os.environ.setdefault("OPENAI_CHAT_DEPLOYMENT_NAME", "benchmark-deployment")
+
+import httpx
+import openai
+
+from src.llm.rate_limit import RateLimiter, retry_after_seconds
+
+# Seconds over which the simulated deployment enforces its quota
+QUOTA_WINDOW = 1.0
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Rate limiter burst benchmark")
+    parser.add_argument("--calls", type=int, default=400, help="Calls in the burst")
+    parser.add_argument("--rpm", type=int, default=1200, help="Deployment requests per minute")
+    parser.add_argument("--threads", type=int, default=64, help="Concurrent callers")
+    parser.add_argument("--latency", type=float, default=0.2, help="Seconds per successful call")
+    return parser.parse_args()
+
+
+class QuotaDeployment:
+    """Simulated deployment that rejects requests beyond its quota with 429."""
+    
+    def __init__(self, rpm: int, latency: float):
+        self.window = QUOTA_WINDOW
+        self.allowed = int(rpm * self.window / 60)
+        self.latency = latency
+        self.accepted = deque()
+        self.rejected = 0
+        self._lock = threading.Lock()
+    
+    def __call__(self) -> str:
+        with self._lock:
+            now = time.monotonic()
+            while self.accepted and self.accepted[0] <= now - self.window:
+                self.accepted.popleft()
+            if len(self.accepted) >= self.allowed:
+                self.rejected += 1
+                retry_after = self.accepted[0] + self.window - now
+                request = httpx.Request("POST", "http://deployment/chat/completions")
+                response = httpx.Response(
+                    429, headers={"retry-after-ms": str(int(retry_after * 1000))}, request=request
+                )
+                raise openai.RateLimitError("Too Many Requests", response=response, body=None)
+            self.accepted.append(now)
+        time.sleep(self.latency)
+        return "question"
+
+
+class ClientRetries:
+    """Per-call retries as done by the OpenAI client, without coordination."""
+    
+    def __init__(self, max_retries: int = 2):
+        self.max_retries = max_retries
+    
+    def run(self, call, estimated_tokens, measure):
+        for attempt in range(self.max_retries + 1):
+            try:
+                return call()
+            except openai.RateLimitError as e:
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(retry_after_seconds(e) or 0.5 * 2 ** attempt)
+    
+    def stats(self):
+        return {"max_queue_depth": 0}
+
+
+def percentile(values, fraction):
+    """Get a percentile of a list of numbers."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def run_burst(name, limiter, args):
+    """Fire the burst through a limiter and print the outcome."""
+    deployment = QuotaDeployment(args.rpm, args.latency)
+    latencies = []
+    failures = 0
+    lock = threading.Lock()
+    
+    def call(_):
+        nonlocal failures
+        start = time.monotonic()
+        try:
+            limiter.run(deployment, 500, lambda result: 500)
+        except openai.RateLimitError:
+            with lock:
+                failures += 1
+            return
+        with lock:
+            latencies.append(time.monotonic() - start)
+    
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        list(pool.map(call, range(args.calls)))
+    elapsed = time.monotonic() - start
+    
+    stats = limiter.stats()
+    latencies = latencies or [0.0]
+    print(f"{name:<18} failed {failures:>4}/{args.calls}  429s {deployment.rejected:>5}  "
+          f"p50 {percentile(latencies, 0.5):6.2f}s  p95 {percentile(latencies, 0.95):6.2f}s  "
+          f"max {max(latencies):6.2f}s  max queue {stats['max_queue_depth']:>3}  "
+          f"total {elapsed:6.2f}s")
+
+
+def main():
+    args = parse_args()
+    print(f"Burst of {args.calls} calls from {args.threads} threads against {args.rpm} RPM "
+          f"({int(args.rpm * QUOTA_WINDOW / 60)} per {QUOTA_WINDOW:g}s window)\n")
+    run_burst("client retries", ClientRetries(), args)
+    run_burst("limiter retries", RateLimiter(max_retries=6), args)
+    run_burst("limiter + quota", RateLimiter(requests_per_minute=args.rpm, max_retries=6), args)
+
+
+if __name__ == "__main__":
+    main()
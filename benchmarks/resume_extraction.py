@@ -0,0 +1,68 @@
+"""
+Resume extraction benchmark: whole-document vs budget-limited PDF parsing.
+
+Builds a synthetic multi-page portfolio and measures CPU time and peak
+Python memory (tracemalloc) for a full extraction and for one that stops at
+the prompt budget.
+
+Usage:
+    python benchmarks/resume_extraction.py --pages 60 --max-chars 4000
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Dummy Azure settings; config.settings requires them but no model is called
+os.environ.setdefault("OPENAI_API_KEY", "benchmark-key")
+os.environ.setdefault("OPENAI_ENDPOINT", "http://127.0.0.1:9")
+os.environ.setdefault("OPENAI_CHAT_DEPLOYMENT_NAME", "benchmark-deployment")
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Budget-aware resume extraction benchmark")
+    parser.add_argument("--pages", type=int, default=60, help="Pages in the synthetic PDF")
+    parser.add_argument("--max-chars", type=int, default=4000, help="Character budget")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement")
+    return parser.parse_args()
+
+
+def measure(extract, data, max_chars, repeat):
+    """Return (best CPU seconds, peak traced bytes, characters) for an extraction."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        text, _ = extract(data, max_chars)
+        best = min(best, time.process_time() - start)
+    
+    tracemalloc.start()
+    extract(data, max_chars)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, len(text)
+
+
+def main():
+    """Run the benchmark and print a comparison."""
+    args = parse_args()
+    from benchmarks.sample_documents import make_pdf, sample_pages
+    from src.resume.extraction import extract_text_from_pdf
+    
+    data = make_pdf(sample_pages(args.pages))
+    print(f"PDF: {args.pages} pages, {len(data) / 1024:.0f} KiB")
+    
+    full = measure(extract_text_from_pdf, data, None, args.repeat)
+    budget = measure(extract_text_from_pdf, data, args.max_chars, args.repeat)
+    
+    for name, (seconds, peak, chars) in (("full", full), (f"budget {args.max_chars}", budget)):
+        print(f"{name:>12}: {seconds * 1000:8.1f} ms CPU  {peak / 1024:8.0f} KiB peak  {chars:7d} chars")
+    print(f"Speedup: {full[0] / budget[0]:.1f}x CPU, {full[1] / budget[1]:.1f}x peak memory")
+
+
+if __name__ == "__main__":
+    main()
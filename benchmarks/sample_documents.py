@@ -0,0 +1,129 @@
+"""
+Synthetic resume documents for benchmarks and tests.
+
+Builds PDF and DOCX bytes in memory without extra dependencies, so the
+extraction paths can be exercised on realistic page counts.
+"""
+import io
+import zipfile
+from typing import List, Optional
+from xml.sax.saxutils import escape
+
+import docx
+
+
+SAMPLE_LINES = [
+    "Senior Software Engineer, Example Corp (2019 - present)",
+    "Designed and operated Python services handling 20k requests per second.",
+    "Led the migration of a monolith to event-driven microservices.",
+    "Mentored four engineers and ran the team's interview loop.",
+    "Skills: Python, Go, PostgreSQL, Kafka, Kubernetes, AWS.",
+]
+
+
+def sample_pages(count: int, lines_per_page: int = 40) -> List[str]:
+    """Generate page texts for a long portfolio-style resume."""
+    pages = []
+    for page in range(count):
+        lines = [f"Page {page + 1}"]
+        lines.extend(SAMPLE_LINES[i % len(SAMPLE_LINES)] for i in range(lines_per_page))
+        pages.append("\n".join(lines))
+    return pages
+
+
+def _escape(text: str) -> str:
+    """Escape a string for a PDF literal."""
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(pages: List[str]) -> bytes:
+    """Build a PDF with one page per entry, one text line per line."""
+    font_id = 3
+    page_ids = [4 + 2 * i for i in range(len(pages))]
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: ("<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            " ".join(f"{page_id} 0 R" for page_id in page_ids), len(pages))).encode(),
+        font_id: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    for page_id, text in zip(page_ids, pages):
+        operations = ["BT", "/F1 10 Tf", "12 TL", "40 800 Td"]
+        for line in text.splitlines():
+            operations.append(f"({_escape(line)}) Tj T*")
+        operations.append("ET")
+        stream = "\n".join(operations).encode("latin-1", "replace")
+        objects[page_id] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {page_id + 1} 0 R >>"
+        ).encode()
+        objects[page_id + 1] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+    
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = {}
+    for object_id in sorted(objects):
+        offsets[object_id] = out.tell()
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (object_id, objects[object_id]))
+    xref = out.tell()
+    size = max(objects) + 1
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % size)
+    for object_id in range(1, size):
+        out.write(b"%010d 00000 n \n" % offsets[object_id])
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, xref))
+    return out.getvalue()
+
+
+def make_docx(
+    paragraphs: List[str],
+    table_rows: Optional[List[List[str]]] = None,
+    header: Optional[str] = None,
+    footer: Optional[str] = None,
+) -> bytes:
+    """Build a DOCX with one paragraph per entry, plus an optional table, header and footer."""
+    document = docx.Document()
+    for paragraph in paragraphs:
+        document.add_paragraph(paragraph)
+    if table_rows:
+        table = document.add_table(rows=len(table_rows), cols=len(table_rows[0]))
+        for row, values in zip(table.rows, table_rows):
+            for cell, value in zip(row.cells, values):
+                cell.text = value
+    if header:
+        document.sections[0].header.paragraphs[0].text = header
+    if footer:
+        document.sections[0].footer.paragraphs[0].text = footer
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def sample_docx(paragraph_count: int, table_rows: int = 0) -> bytes:
+    """
+    Build a large resume DOCX with a skills table.
+    
+    python-docx appends paragraphs in quadratic time, so the body XML is
+    written directly into a small python-docx template.
+    """
+    template = make_docx([], header="Jane Doe - jane@example.com")
+    body = []
+    for i in range(paragraph_count):
+        line = escape(SAMPLE_LINES[i % len(SAMPLE_LINES)])
+        body.append(f"<w:p><w:r><w:t>{line}</w:t></w:r></w:p>")
+    if table_rows:
+        body.append("<w:tbl>")
+        for i in range(table_rows):
+            cells = (f"Skill {i}", "Expert", f"{i % 10 + 1} years")
+            body.append("<w:tr>" + "".join(
+                f"<w:tc><w:p><w:r><w:t>{cell}</w:t></w:r></w:p></w:tc>" for cell in cells
+            ) + "</w:tr>")
+        body.append("</w:tbl>")
+    
+    output = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(template)) as source, \
+            zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as target:
+        for item in source.infolist():
+            content = source.read(item.filename)
+            if item.filename == "word/document.xml":
+                content = content.replace(b"<w:body>", ("<w:body>" + "".join(body)).encode(), 1)
+            target.writestr(item, content)
+    return output.getvalue()
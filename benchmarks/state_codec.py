@@ -0,0 +1,132 @@
+"""
+Benchmark: transcript records and the state codec vs. pydantic and JSON.
+
+Builds the state of a long interview twice, once with the slotted transcript
+records and once with the pydantic models the state used before, and
+compares:
+
+- construction time and memory of the transcript
+- persist (encode_state vs. model_dump + json.dumps) and restore
+  (decode_state vs. json.loads + model_validate) time and size
+
+Usage:
+    python benchmarks/state_codec.py --questions 50 --rounds 200
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Dummy Azure settings so the state module can be imported without credentials
+os.environ.setdefault("OPENAI_API_KEY", "benchmark-key")
+os.environ.setdefault("OPENAI_ENDPOINT", "http://127.0.0.1:9")
+os.environ.setdefault("OPENAI_CHAT_DEPLOYMENT_NAME", "benchmark-deployment")
+os.environ.setdefault("API_VERSION", "2024-02-01")
+
+from src.graph.codec import decode_state, encode_state
+from src.graph.state import (
+    Message,
+    MessageModel,
+    QuestionAnswer,
+    QuestionAnswerModel,
+    create_initial_state,
+)
+
+QUESTION = "Can you walk me through a system you designed, and the trade-offs you made along the way?"
+ANSWER = (
+    "I would start by profiling the service to find where the time goes, then "
+    "cache the expensive lookups and batch the writes to the database. "
+) * 3
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="State codec benchmark")
+    parser.add_argument("--questions", type=int, default=50, help="Questions in the interview")
+    parser.add_argument("--rounds", type=int, default=200, help="Persist/restore rounds to time")
+    return parser.parse_args()
+
+
+def build_state(questions: int, message_type, qa_type):
+    """Build the state of an interview with the given transcript types."""
+    state = create_initial_state("Benchmark Candidate", "Backend Developer", "Senior")
+    for n in range(questions):
+        agent_type = ("technical", "hr", "manager")[n * 3 // questions]
+        state["conversation_history"].append(message_type(role="agent", content=QUESTION, agent_type=agent_type))
+        state["conversation_history"].append(message_type(role="user", content=ANSWER))
+        state["qa_pairs"].append(qa_type(question=QUESTION, answer=ANSWER, agent_type=agent_type))
+        state["answer_assessments"].append({"score": 78, "feedback": "Clear and structured."})
+    state["technical_questions_asked"] = questions
+    return state
+
+
+def dump_json(state) -> str:
+    """Persist a pydantic-model state as JSON."""
+    return json.dumps({
+        **state,
+        "conversation_history": [m.model_dump() for m in state["conversation_history"]],
+        "qa_pairs": [qa.model_dump() for qa in state["qa_pairs"]],
+    })
+
+
+def load_json(data: str):
+    """Restore a pydantic-model state from JSON."""
+    state = json.loads(data)
+    state["conversation_history"] = [MessageModel.model_validate(m) for m in state["conversation_history"]]
+    state["qa_pairs"] = [QuestionAnswerModel.model_validate(qa) for qa in state["qa_pairs"]]
+    return state
+
+
+def timed(function, rounds: int) -> float:
+    """Average seconds per call."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        function()
+    return (time.perf_counter() - start) / rounds
+
+
+def transcript_memory(questions: int, message_type, qa_type) -> int:
+    """Bytes allocated for the transcript of an interview."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    state = build_state(questions, message_type, qa_type)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del state
+    return used
+
+
+def main():
+    args = parse_args()
+    models = build_state(args.questions, MessageModel, QuestionAnswerModel)
+    records = build_state(args.questions, Message, QuestionAnswer)
+    as_json = dump_json(models)
+    as_codec = encode_state(records)
+    assert decode_state(as_codec)["qa_pairs"] == records["qa_pairs"]
+    
+    rows = [
+        ("build", timed(lambda: build_state(args.questions, MessageModel, QuestionAnswerModel), args.rounds),
+         timed(lambda: build_state(args.questions, Message, QuestionAnswer), args.rounds)),
+        ("persist", timed(lambda: dump_json(models), args.rounds), timed(lambda: encode_state(records), args.rounds)),
+        ("restore", timed(lambda: load_json(as_json), args.rounds), timed(lambda: decode_state(as_codec), args.rounds)),
+    ]
+    
+    print("=" * 64)
+    print(f"Interview state, {args.questions} questions ({args.rounds} rounds)")
+    print("=" * 64)
+    print(f"{'':<10} {'pydantic + JSON':>18} {'records + codec':>18} {'speedup':>10}")
+    for name, baseline, codec in rows:
+        print(f"{name + ' ms':<10} {baseline * 1000:>18.3f} {codec * 1000:>18.3f} {baseline / codec:>9.1f}x")
+    print(f"{'bytes':<10} {len(as_json.encode('utf-8')):>18,} {len(as_codec):>18,}")
+    print(f"{'memory':<10} {transcript_memory(args.questions, MessageModel, QuestionAnswerModel):>18,} "
+          f"{transcript_memory(args.questions, Message, QuestionAnswer):>18,}")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Benchmark: state serialization per step over a long interview.
+
+Drives an interview of --questions questions through InterviewWorkflow with
+a fake LLM and a SQLite checkpointer, and reports for each step how much
+was serialized and how long it took:
+
+- full state: serializing the whole InterviewState, which is what every
+  step wrote when nodes returned (and the graph checkpointed) the entire
+  state
+- rewritten: the bytes written by the checkpointer, and the time spent in
+  it, when every changed list channel is stored in full
+- delta: the same with appended transcript items linked to the previous
+  version, as the checkpointer stores them
+
+Usage:
+    python benchmarks/state_serialization.py --questions 50
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Dummy Azure settings so the workflow can be built without credentials
+os.environ.setdefault("OPENAI_API_KEY", "benchmark-key")
+os.environ.setdefault("OPENAI_ENDPOINT", "http://127.0.0.1:9")
+os.environ.setdefault("OPENAI_CHAT_DEPLOYMENT_NAME", "benchmark-deployment")
+os.environ.setdefault("API_VERSION", "2024-02-01")
+
+from config import settings
+from src.graph import checkpoint
+from src.graph.checkpoint import SQLiteCheckpointSaver
+from src.graph.state import create_initial_state
+from src.graph.workflow import InterviewWorkflow
+from benchmarks.fake_llm import FakeInterviewLLM, install_fake_llm
+
+ANSWER = (
+    "I would start by profiling the service to find where the time goes, then "
+    "cache the expensive lookups and batch the writes to the database. "
+) * 4
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="State serialization benchmark")
+    parser.add_argument("--questions", type=int, default=50, help="Questions in the interview")
+    return parser.parse_args()
+
+
+class TimedSaver(SQLiteCheckpointSaver):
+    """Checkpointer that adds up the time spent saving."""
+    
+    def __init__(self, db_path: str):
+        super().__init__(db_path)
+        self.seconds = 0.0
+    
+    def put(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return super().put(*args, **kwargs)
+        finally:
+            self.seconds += time.perf_counter() - start
+    
+    def put_writes(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return super().put_writes(*args, **kwargs)
+        finally:
+            self.seconds += time.perf_counter() - start
+
+
+def written_bytes(saver: SQLiteCheckpointSaver) -> int:
+    """Bytes of checkpoint payloads stored so far."""
+    with saver._lock:
+        return saver._db.execute(
+            "SELECT (SELECT COALESCE(SUM(LENGTH(value)), 0) FROM channel_values)"
+            " + (SELECT COALESCE(SUM(LENGTH(checkpoint) + LENGTH(metadata)), 0) FROM checkpoints)"
+        ).fetchone()[0]
+
+
+def run_interview(db_path: str):
+    """
+    Run an interview and measure the serialization of every step.
+    
+    Returns:
+        list: (question or "eval", full-state bytes, full-state seconds,
+        checkpoint bytes, checkpoint seconds) per step
+    """
+    saver = TimedSaver(db_path)
+    workflow = InterviewWorkflow(checkpointer=saver)
+    install_fake_llm(workflow, FakeInterviewLLM())
+    serde = saver.serde
+    
+    state = create_initial_state("Benchmark Candidate", "Backend Developer", "Senior")
+    rows = []
+    while not state["is_complete"]:
+        before_bytes, before_seconds = written_bytes(saver), saver.seconds
+        state = workflow.run_step(state)
+        if state["current_question"]:
+            state = workflow.process_answer(state, ANSWER)
+        checkpoint_bytes = written_bytes(saver) - before_bytes
+        checkpoint_seconds = saver.seconds - before_seconds
+        
+        start = time.perf_counter()
+        full_bytes = len(serde.dumps_typed(dict(state))[1])
+        full_seconds = time.perf_counter() - start
+        label = "eval" if state["is_complete"] else len(state["qa_pairs"])
+        rows.append((label, full_bytes, full_seconds, checkpoint_bytes, checkpoint_seconds))
+    
+    saver.close()
+    return rows
+
+
+def main():
+    args = parse_args()
+    settings.EVALUATION_MODE = "parallel"
+    settings.PREFETCH_OPENERS = False
+    settings.MAX_TECHNICAL_QUESTIONS = args.questions - 2 * (args.questions // 3)
+    settings.MAX_HR_QUESTIONS = args.questions // 3
+    settings.MAX_MANAGER_QUESTIONS = args.questions // 3
+    
+    with tempfile.TemporaryDirectory() as directory:
+        linked_length = checkpoint.MAX_CHAIN_LENGTH
+        checkpoint.MAX_CHAIN_LENGTH = 0
+        rewritten = run_interview(os.path.join(directory, "rewritten.db"))
+        checkpoint.MAX_CHAIN_LENGTH = linked_length
+        delta = run_interview(os.path.join(directory, "delta.db"))
+    
+    print("=" * 80)
+    print(f"State serialization per step, {args.questions}-question interview")
+    print("=" * 80)
+    print(f"{'question':>8}  {'full state':>11} {'ms':>6}  {'rewritten':>11} {'ms':>6}  {'delta':>11} {'ms':>6}")
+    shown = {1, 10, 25, args.questions, "eval"}
+    for full, linked in zip(rewritten, delta):
+        if full[0] in shown:
+            print(f"{full[0]:>8}  {full[1]:>11,} {full[2] * 1000:>6.2f}  {full[3]:>11,} {full[4] * 1000:>6.2f}  "
+                  f"{linked[3]:>11,} {linked[4] * 1000:>6.2f}")
+    print("-" * 80)
+    print(f"{'total':>8}  {sum(r[1] for r in rewritten):>11,} {sum(r[2] for r in rewritten) * 1000:>6.1f}  "
+          f"{sum(r[3] for r in rewritten):>11,} {sum(r[4] for r in rewritten) * 1000:>6.1f}  "
+          f"{sum(r[3] for r in delta):>11,} {sum(r[4] for r in delta) * 1000:>6.1f}")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -39,6 +39,160 @@ MAX_TECHNICAL_QUESTIONS = int(os.getenv("MAX_TECHNICAL_QUESTIONS", "6"))
 MAX_HR_QUESTIONS = int(os.getenv("MAX_HR_QUESTIONS", "3"))
 MAX_MANAGER_QUESTIONS = int(os.getenv("MAX_MANAGER_QUESTIONS", "2"))
 
+# Background Work Configuration
+# Generate each round's opening question in the background at interview start
+PREFETCH_OPENERS = os.getenv("PREFETCH_OPENERS", "true").lower() == "true"
+# Seconds a step waits for an in-flight prefetch before generating live
+PREFETCH_WAIT_SECONDS = float(os.getenv("PREFETCH_WAIT_SECONDS", "5"))
+# Interviews whose prefetched openers and background assessments are kept
+# before the least recent is dropped (abandoned interviews never evaluate)
+BACKGROUND_MAX_INTERVIEWS = int(os.getenv("BACKGROUND_MAX_INTERVIEWS", "256"))
+
+# Evaluation Configuration
+# "single": one prompt for the whole interview
+# "parallel": one concurrent prompt per round, merged into one report
+# "incremental": each answer is assessed in the background as soon as it is
+#                submitted; the final report only aggregates the assessments
+EVALUATION_MODE = os.getenv("EVALUATION_MODE", "incremental").lower()
+
+# Candidate Profile Options
+JOB_ROLES = [
+    "Software Engineer",
+    "Data Engineer",
+    "Data Scientist",
+    "Machine Learning Engineer",
+    "DevOps Engineer",
+    "Frontend Developer",
+    "Backend Developer",
+    "Full Stack Developer",
+    "Product Manager",
+    "System Architect",
+    "PowerBI Analyst",
+    "Google Looker Analyst",
+    "Business Intelligence Analyst",
+    "Other (Specify)"
+]
+EXPERIENCE_LEVELS = ["Junior", "Mid-Level", "Senior"]
+
+# Question Bank Configuration
+# Pre-generated opening questions, built with `python -m src.prompts.question_bank`
+QUESTION_BANK_PATH = os.getenv("QUESTION_BANK_PATH", "data/question_bank.json.gz")
+QUESTION_BANK_TEMPERATURE = float(os.getenv("QUESTION_BANK_TEMPERATURE", "0.9"))
+
 # Model Configuration
 TEMPERATURE = float(os.getenv("TEMPERATURE", "0.7"))
 
+
+# HTTP Connection Pool Configuration (shared by all agents and sessions)
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "60"))
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "true").lower() == "true"
+
+# LLM Response Cache Configuration
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1024"))
+LLM_CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_SECONDS", "86400"))
+# SQLite file shared by all worker processes; leave unset for memory only
+LLM_CACHE_DB_PATH = os.getenv("LLM_CACHE_DB_PATH") or None
+# Responses kept in the SQLite tier before the oldest are pruned
+LLM_CACHE_DB_MAX_ENTRIES = int(os.getenv("LLM_CACHE_DB_MAX_ENTRIES", "20000"))
+# Responses kept per prompt when temperature > 0, so cached questions vary
+LLM_CACHE_SAMPLE_POOL_SIZE = int(os.getenv("LLM_CACHE_SAMPLE_POOL_SIZE", "3"))
+
+# LLM Rate Limit Configuration (process-wide, shared by all sessions)
+# Size these from the deployment's quota (0 for no client-side limit). Each
+# call reserves its prompt tokens plus LLM_RATE_LIMIT_COMPLETION_TOKENS up
+# front and is reconciled against the actual usage afterwards
+LLM_RPM_LIMIT = int(os.getenv("LLM_RPM_LIMIT", "0"))
+LLM_TPM_LIMIT = int(os.getenv("LLM_TPM_LIMIT", "0"))
+LLM_RATE_LIMIT_COMPLETION_TOKENS = int(os.getenv("LLM_RATE_LIMIT_COMPLETION_TOKENS", "300"))
+# Retries of 429s, timeouts and 5xx errors, with jittered exponential backoff
+# (Retry-After from the service takes precedence)
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "6"))
+LLM_RETRY_BASE_DELAY = float(os.getenv("LLM_RETRY_BASE_DELAY", "0.5"))
+LLM_RETRY_MAX_DELAY = float(os.getenv("LLM_RETRY_MAX_DELAY", "30"))
+
+# Resume Extraction Configuration
+RESUME_CACHE_MAX_ENTRIES = int(os.getenv("RESUME_CACHE_MAX_ENTRIES", "128"))
+# Directory for the on-disk tier; leave unset for memory only
+RESUME_CACHE_DIR = os.getenv("RESUME_CACHE_DIR") or None
+# Stop extracting once this much resume text is available (0 for no limit);
+# matches the resume digest input so the whole digest input is extracted
+RESUME_EXTRACT_MAX_CHARS = int(os.getenv("RESUME_EXTRACT_MAX_CHARS", "12000"))
+RESUME_EXTRACT_MAX_TOKENS = int(os.getenv("RESUME_EXTRACT_MAX_TOKENS", "0"))
+# Extract the rest of a budget-limited resume on a background thread
+RESUME_FULL_EXTRACT_IN_BACKGROUND = os.getenv("RESUME_FULL_EXTRACT_IN_BACKGROUND", "false").lower() == "true"
+# Uploads larger than this are rejected before parsing
+RESUME_MAX_UPLOAD_MB = float(os.getenv("RESUME_MAX_UPLOAD_MB", "10"))
+
+# Resume Parsing Sandbox Configuration
+# Parse uploads in separate worker processes with time and memory limits
+RESUME_SANDBOX_ENABLED = os.getenv("RESUME_SANDBOX_ENABLED", "true").lower() == "true"
+RESUME_SANDBOX_WORKERS = int(os.getenv("RESUME_SANDBOX_WORKERS", "2"))
+RESUME_PARSE_TIMEOUT = float(os.getenv("RESUME_PARSE_TIMEOUT", "10"))
+RESUME_PARSE_MEMORY_MB = int(os.getenv("RESUME_PARSE_MEMORY_MB", "512"))
+# Replace a worker after this many parses (0 to keep workers for good)
+RESUME_SANDBOX_MAX_JOBS_PER_WORKER = int(os.getenv("RESUME_SANDBOX_MAX_JOBS_PER_WORKER", "50"))
+
+# Resume Store Configuration (bulk ingestion, see src/resume/ingest.py)
+RESUME_STORE_PATH = os.getenv("RESUME_STORE_PATH", "data/resumes.db")
+RESUME_INGEST_WORKERS = int(os.getenv("RESUME_INGEST_WORKERS", str(os.cpu_count() or 2)))
+
+# Resume Digest Configuration
+# Summarize the resume once per interview instead of sending raw text to every prompt
+RESUME_DIGEST_ENABLED = os.getenv("RESUME_DIGEST_ENABLED", "true").lower() == "true"
+RESUME_DIGEST_INPUT_CHARS = int(os.getenv("RESUME_DIGEST_INPUT_CHARS", "12000"))
+
+# Resume Retrieval Configuration
+# Send the resume chunks most relevant to each round instead of a fixed prefix;
+# uses OPENAI_EMBED_DEPLOYMENT_NAME if set, otherwise local hashing embeddings
+RESUME_RETRIEVAL_ENABLED = os.getenv("RESUME_RETRIEVAL_ENABLED", "true").lower() == "true"
+RESUME_RETRIEVAL_TOP_K = int(os.getenv("RESUME_RETRIEVAL_TOP_K", "3"))
+RESUME_CHUNK_CHARS = int(os.getenv("RESUME_CHUNK_CHARS", "300"))
+RESUME_RETRIEVAL_MAX_INTERVIEWS = int(os.getenv("RESUME_RETRIEVAL_MAX_INTERVIEWS", "256"))
+
+# Conversation Context Configuration
+# Messages from the agent's own round included in each prompt
+CONTEXT_WINDOW_TECHNICAL = int(os.getenv("CONTEXT_WINDOW_TECHNICAL", "6"))
+CONTEXT_WINDOW_HR = int(os.getenv("CONTEXT_WINDOW_HR", "4"))
+CONTEXT_WINDOW_MANAGER = int(os.getenv("CONTEXT_WINDOW_MANAGER", "4"))
+
+# Token Budget Configuration
+# Prompts are counted with TOKEN_ENCODING (tiktoken; falls back to ~4 chars
+# per token when the encoding is unavailable) and question prompts are trimmed
+# to PROMPT_TOKEN_BUDGET. Past INTERVIEW_TOKEN_SOFT_RATIO of the per-interview
+# budget the per-call budget is halved; once the budget is spent the remaining
+# rounds are skipped and the interview goes straight to evaluation (0 = no limit)
+TOKEN_ENCODING = os.getenv("TOKEN_ENCODING", "o200k_base")
+PROMPT_TOKEN_BUDGET = int(os.getenv("PROMPT_TOKEN_BUDGET", "3000"))
+PROMPT_RESUME_MAX_TOKENS = int(os.getenv("PROMPT_RESUME_MAX_TOKENS", "500"))
+INTERVIEW_TOKEN_BUDGET = int(os.getenv("INTERVIEW_TOKEN_BUDGET", "0"))
+INTERVIEW_TOKEN_SOFT_RATIO = float(os.getenv("INTERVIEW_TOKEN_SOFT_RATIO", "0.8"))
+
+# Checkpoint Configuration
+# Every interview step is saved under the interview id so sessions survive
+# restarts and can be resumed (python main.py --resume <id>, or ?interview=<id>)
+CHECKPOINTS_ENABLED = os.getenv("CHECKPOINTS_ENABLED", "true").lower() == "true"
+CHECKPOINT_DB_PATH = os.getenv("CHECKPOINT_DB_PATH", "data/checkpoints.db")
+
+# Session Store Configuration
+# Where the latest state of every interview is kept, so any worker can serve
+# its next step: "memory" (this process only), "sqlite" (SESSION_DB_PATH,
+# shared by the processes of a host) or "redis" (SESSION_REDIS_URL)
+SESSION_STORE = os.getenv("SESSION_STORE", "sqlite").lower()
+SESSION_DB_PATH = os.getenv("SESSION_DB_PATH", "data/sessions.db")
+SESSION_REDIS_URL = os.getenv("SESSION_REDIS_URL", "redis://127.0.0.1:6379/0")
+# Redis expiry of an interview after its last save (0 to keep until deleted)
+SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", "604800"))
+
+# API Service Configuration (python server.py, see src/api)
+# Interview steps running at once per worker process; further requests wait
+# up to API_QUEUE_TIMEOUT seconds for a slot, then get 503 Service Unavailable
+API_MAX_CONCURRENT_STEPS = int(os.getenv("API_MAX_CONCURRENT_STEPS", "64"))
+API_QUEUE_TIMEOUT = float(os.getenv("API_QUEUE_TIMEOUT", "10"))
+# Wait for an answer's background assessment before the answer request
+# returns, so it is saved with the interview for whichever worker evaluates
+# it ("auto": only when the session store is shared between processes)
+API_WAIT_FOR_ASSESSMENTS = os.getenv("API_WAIT_FOR_ASSESSMENTS", "auto").lower()
@@ -0,0 +1,16 @@
+"""
+Pytest configuration.
+
+Provides dummy Azure OpenAI settings so modules that import config.settings
+can be loaded in tests; tests that need a model use benchmarks.fake_llm.
+"""
+import os
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+os.environ.setdefault("OPENAI_ENDPOINT", "http://127.0.0.1:9")
+os.environ.setdefault("OPENAI_CHAT_DEPLOYMENT_NAME", "test-deployment")
+os.environ.setdefault("API_VERSION", "2024-02-01")
+# Nothing listens on the dummy endpoint; don't spend long retrying it
+os.environ.setdefault("LLM_MAX_RETRIES", "2")
+os.environ.setdefault("CHECKPOINT_DB_PATH", ":memory:")
+os.environ.setdefault("SESSION_STORE", "memory")
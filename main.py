@@ -1,6 +1,7 @@
 """
 Main application entry point for the AI Interviewer.
 """
+import argparse
 import sys
 import os
 
@@ -9,7 +10,9 @@ sys.path.insert(0, os.path.dirname(__file__))
 
 from config import settings
 from src.graph.state import create_initial_state, Message
-from src.graph.workflow import InterviewWorkflow
+from src.graph.workflow import get_workflow
+from src.llm.rate_limit import StreamInterruptedError
+from src.sessions import SessionConflictError, get_session_store
 from colorama import Fore, Style, init
 
 # Initialize colorama
@@ -40,12 +43,22 @@ def print_agent_header(agent_type: str):
     print(headers.get(agent_type, ""))
 
 
+def print_question_header(question_num: int, max_questions: int):
+    """Print the question number line."""
+    print(f"\n{Fore.YELLOW}Question {question_num}/{max_questions}:{Style.RESET_ALL}")
+
+
 def print_question(question: str, question_num: int, max_questions: int):
     """Print a question."""
-    print(f"\n{Fore.YELLOW}Question {question_num}/{max_questions}:{Style.RESET_ALL}")
+    print_question_header(question_num, max_questions)
     print(f"{question}\n")
 
 
+def print_question_token(token: str):
+    """Print part of a question as it is streamed."""
+    print(token, end="", flush=True)
+
+
 def print_completion_message():
     """Print interview completion message."""
     print(f"\n{Fore.GREEN}{'='*50}")
@@ -113,17 +126,41 @@ def get_candidate_info() -> tuple[str, str, str]:
 
 
 
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="AI Interviewer")
+    parser.add_argument("--resume", metavar="INTERVIEW_ID", help="Resume a saved interview")
+    return parser.parse_args()
+
+
 def run_interview():
     """Main function to run the interview."""
+    args = parse_args()
     try:
-        # Get candidate information
-        candidate_name, job_role, experience_level = get_candidate_info()
+        workflow = get_workflow()
+        store = get_session_store()
         
-        # Initialize state
-        state = create_initial_state(candidate_name, job_role, experience_level)
+        if args.resume:
+            # Pick up a saved interview where it stopped
+            state = store.load(args.resume) or workflow.load_state(args.resume)
+            if state is None:
+                print_error(f"No saved interview with ID {args.resume}.")
+                sys.exit(1)
+            print_banner()
+            print_info(f"Resuming interview for {state['candidate_name']} "
+                       f"({state['experience_level']} {state['job_role']}).\n")
+        else:
+            # Get candidate information
+            candidate_name, job_role, experience_level = get_candidate_info()
+            
+            # Initialize state and start generating each round's opener
+            state = create_initial_state(candidate_name, job_role, experience_level)
+            workflow.prefetch_openers(state)
+            state = store.save(state)
         
-        # Create workflow
-        workflow = InterviewWorkflow()
+        if workflow.checkpointer is not None or settings.SESSION_STORE != "memory":
+            print_info(f"Interview ID: {state['interview_id']} "
+                       f"(resume with: python main.py --resume {state['interview_id']})")
         
         # Track current agent for UI
         current_agent_type = None
@@ -131,34 +168,48 @@ def run_interview():
         # Run interview loop
         while not state["is_complete"]:
             # Check if agent changed
-            if state["current_agent"] != current_agent_type:
-                current_agent_type = state["current_agent"]
-                if current_agent_type != "complete":
+            next_agent = workflow.next_agent(state)
+            if next_agent != current_agent_type:
+                current_agent_type = next_agent
+                if current_agent_type != "evaluation":
                     print_agent_header(current_agent_type)
             
             # Clear last answer before getting new question
             state["last_answer"] = None
             
-            # Get next question from workflow
-            state = workflow.run_step(state)
+            if next_agent == "evaluation":
+                print_info("🤖 Evaluating your interview performance...")
+                state = store.save(workflow.run_step(state))
+                continue
+            
+            # Determine question number and max for current agent
+            if next_agent == "technical":
+                q_num = state["technical_questions_asked"] + 1
+                max_q = settings.MAX_TECHNICAL_QUESTIONS
+            elif next_agent == "hr":
+                q_num = state["hr_questions_asked"] + 1
+                max_q = settings.MAX_HR_QUESTIONS
+            else:  # manager
+                q_num = state["manager_questions_asked"] + 1
+                max_q = settings.MAX_MANAGER_QUESTIONS
+            
+            # Stream the next question from the workflow as it is generated
+            print_question_header(q_num, max_q)
+            try:
+                for event, payload in workflow.stream_step(state):
+                    if event == "token":
+                        print_question_token(payload)
+                    else:
+                        state = payload
+            except StreamInterruptedError as e:
+                # Nothing was saved; the question is asked again from scratch
+                print("\n")
+                print_error(f"The question was cut off ({e.__cause__ or e}). Asking again...")
+                continue
+            state = store.save(state)
+            print("\n")
             
-            # Display the question
             if state["current_question"]:
-                agent_type = state["current_agent"]
-                
-                # Determine question number and max for current agent
-                if agent_type == "technical":
-                    q_num = state["technical_questions_asked"]
-                    max_q = settings.MAX_TECHNICAL_QUESTIONS
-                elif agent_type == "hr":
-                    q_num = state["hr_questions_asked"]
-                    max_q = settings.MAX_HR_QUESTIONS
-                else:  # manager
-                    q_num = state["manager_questions_asked"]
-                    max_q = settings.MAX_MANAGER_QUESTIONS
-                
-                print_question(state["current_question"], q_num, max_q)
-                
                 # Get candidate's answer
                 print_answer_prompt()
                 answer = input().strip()
@@ -170,7 +221,7 @@ def run_interview():
                     answer = input().strip()
                 
                 # Process the answer
-                state = workflow.process_answer(state, answer)
+                state = store.save(workflow.process_answer(state, answer))
                 print()  # Add spacing
         
         # Interview completed
@@ -189,6 +240,9 @@ def run_interview():
         print_info("Interview interrupted by user.")
         print("=" * 60)
         sys.exit(0)
+    except SessionConflictError as e:
+        print_error(str(e))
+        sys.exit(1)
     except Exception as e:
         print_error(f"An unexpected error occurred: {str(e)}")
         import traceback
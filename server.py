@@ -0,0 +1,39 @@
+"""
+ASGI service entry point for the AI Interviewer.
+
+Serves the REST and WebSocket interview API (see src/api) with uvicorn.
+"""
+import argparse
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+import uvicorn
+
+from config.logging_config import setup_logging
+from src.api import create_app
+
+setup_logging(log_to_file=False)
+
+app = create_app()
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="AI Interviewer API service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (any worker serves any interview through the session store)")
+    return parser.parse_args()
+
+
+def main():
+    """Run the service."""
+    args = parse_args()
+    uvicorn.run("server:app", host=args.host, port=args.port, workers=args.workers, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ from .technical_agent import TechnicalAgent
 from .hr_agent import HRAgent
 from .manager_agent import ManagerAgent
 from .evaluation_agent import EvaluationAgent
+from .resume_digest_agent import ResumeDigestAgent
 
 __all__ = [
     "BaseAgent",
@@ -11,4 +12,5 @@ __all__ = [
     "HRAgent",
     "ManagerAgent",
     "EvaluationAgent",
+    "ResumeDigestAgent",
 ]
@@ -1,8 +1,40 @@
 """
 Base agent class for interview agents.
 """
-from typing import Dict, Any
+from contextvars import ContextVar
+from typing import Dict, Any, Optional
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.tracers.context import register_configure_hook
 from azure_clients import get_chat_llm
+from config import settings
+from config.logging_config import get_logger
+from src.llm.cache import get_llm_cache, make_cache_key
+from src.llm.rate_limit import StreamInterruptedError, get_rate_limiter
+from src.llm.tokens import DEGRADED, budget_status, count_tokens, get_token_ledger
+from src.prompts.context import ConversationContextBuilder
+from src.prompts.question_bank import get_question_bank
+from src.prompts.templates import PROMPT_TEMPLATE_VERSION
+
+logger = get_logger(__name__)
+
+
+class _StreamWatcher(BaseCallbackHandler):
+    """Notes whether the LLM call it is attached to has streamed any text."""
+    
+    run_inline = True
+    
+    def __init__(self):
+        self.streamed = False
+    
+    def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
+        if token:
+            self.streamed = True
+
+
+# Attaches the current call's watcher to the LangChain runs started under it,
+# alongside the callbacks of the graph step (e.g. LangGraph's token streaming)
+_stream_watcher: ContextVar[Optional[_StreamWatcher]] = ContextVar("stream_watcher", default=None)
+register_configure_hook(_stream_watcher, inheritable=True)
 
 
 class BaseAgent:
@@ -11,17 +43,230 @@ class BaseAgent:
     def __init__(self):
         """Initialize the base agent."""
         self.llm = get_chat_llm()
+        self.cache = get_llm_cache()
+        self.rate_limiter = get_rate_limiter()
+        # ResumeRetriever attached by the workflow for question agents
+        self.retriever = None
+        # Replaced by the workflow's shared builder
+        self.context_builder = ConversationContextBuilder()
     
-    def generate_question(self, prompt: str) -> str:
+    def generate_question(self, prompt: str, interview_id: Optional[str] = None) -> str:
         """
         Generate a question using the LLM.
         
         Args:
             prompt: The prompt to use for generation
+            interview_id: Interview whose token usage the call counts towards
             
         Returns:
             str: Generated question
         """
-        response = self.llm.invoke(prompt)
+        return self._complete(prompt, interview_id)
+    
+    async def agenerate_question(self, prompt: str, interview_id: Optional[str] = None) -> str:
+        """
+        Generate a question using the LLM without blocking the event loop.
+        
+        Args:
+            prompt: The prompt to use for generation
+            interview_id: Interview whose token usage the call counts towards
+            
+        Returns:
+            str: Generated question
+        """
+        return await self._acomplete(prompt, interview_id)
+    
+    def bank_opener(self, state: Dict[str, Any]) -> Optional[str]:
+        """
+        Get a pre-generated opening question from the question bank.
+        
+        Only context-free prompts are served from the bank: the agent's first
+        question when no resume was uploaded.
+        
+        Args:
+            state: Current interview state
+            
+        Returns:
+            str or None: Banked question, or None to generate one live
+        """
+        agent_type = getattr(self, "agent_type", None)
+        if agent_type is None or state.get("resume_text"):
+            return None
+        if state[f"{agent_type}_questions_asked"] != 0:
+            return None
+        bank = get_question_bank()
+        if bank is None:
+            return None
+        question = bank.pick(agent_type, state["job_role"], state["experience_level"],
+                             state["candidate_name"])
+        if question:
+            logger.debug(f"Serving {agent_type} opener from the question bank")
+        return question
+    
+    def resume_excerpts(self, state: Dict[str, Any]) -> str:
+        """
+        Get the resume excerpts most relevant to this agent's next question.
+        
+        Args:
+            state: Current interview state
+            
+        Returns:
+            str: Excerpts separated by blank lines, or "" when there are none
+        """
+        if self.retriever is None or not settings.RESUME_RETRIEVAL_ENABLED:
+            return ""
+        return "\n\n".join(self.retriever.retrieve(state, getattr(self, "agent_type", None)))
+    
+    async def abuild_prompt(self, state: Dict[str, Any]) -> str:
+        """
+        Build the agent's prompt, fetching resume excerpts without blocking.
+        
+        Args:
+            state: Current interview state
+            
+        Returns:
+            str: Formatted prompt
+        """
+        if self.retriever is not None and settings.RESUME_RETRIEVAL_ENABLED:
+            await self.retriever.aretrieve(state, getattr(self, "agent_type", None))
+        return self.build_prompt(state)
+    
+    def prompt_budget(self, state: Dict[str, Any]) -> Optional[int]:
+        """
+        Get the token budget for the agent's next prompt.
+        
+        The budget is halved once the interview is past the soft limit of
+        its token budget.
+        
+        Args:
+            state: Current interview state
+            
+        Returns:
+            int or None: Maximum prompt tokens, or None for no limit
+        """
+        budget = settings.PROMPT_TOKEN_BUDGET
+        if budget <= 0:
+            return None
+        usage = get_token_ledger().sync(state["interview_id"], state.get("token_usage")) \
+            if state.get("interview_id") else state.get("token_usage")
+        if budget_status(usage) == DEGRADED:
+            budget //= 2
+        return budget
+    
+    @property
+    def _temperature(self) -> float:
+        """Sampling temperature of the agent's LLM."""
+        temperature = getattr(self.llm, "temperature", None)
+        return settings.TEMPERATURE if temperature is None else temperature
+    
+    def _cache_key(self, prompt: str) -> Optional[str]:
+        """Get the response cache key for a prompt, or None when caching is off."""
+        if self.cache is None:
+            return None
+        return make_cache_key(
+            settings.OPENAI_DEPLOYMENT_NAME,
+            self._temperature,
+            PROMPT_TEMPLATE_VERSION,
+            prompt
+        )
+    
+    def _estimate_tokens(self, prompt: str) -> int:
+        """Tokens to reserve with the rate limiter for a prompt."""
+        return count_tokens(prompt) + settings.LLM_RATE_LIMIT_COMPLETION_TOKENS
+    
+    def _record_usage(self, interview_id: Optional[str], prompt: str, response) -> int:
+        """
+        Count an LLM call towards the interview's token usage.
+        
+        Returns:
+            int: Prompt plus completion tokens used by the call
+        """
+        usage = getattr(response, "usage_metadata", None)
+        if usage:
+            prompt_tokens, completion_tokens = usage["input_tokens"], usage["output_tokens"]
+        else:
+            prompt_tokens, completion_tokens = count_tokens(prompt), count_tokens(response.content)
+        get_token_ledger().record(interview_id, prompt_tokens, completion_tokens)
+        return prompt_tokens + completion_tokens
+    
+    def _invoke(self, prompt: str):
+        """
+        Make one LLM call, refusing a retry once it has streamed text.
+        
+        In a streamed graph step each token reaches the candidate as it
+        arrives, so a call that fails after that is raised as
+        StreamInterruptedError, which the rate limiter does not retry.
+        """
+        watcher = _StreamWatcher()
+        reset = _stream_watcher.set(watcher)
+        try:
+            return self.llm.invoke(prompt)
+        except Exception as e:
+            if watcher.streamed:
+                raise StreamInterruptedError(f"LLM call failed after streaming part of its response: {e}") from e
+            raise
+        finally:
+            _stream_watcher.reset(reset)
+    
+    async def _ainvoke(self, prompt: str):
+        """Async version of _invoke."""
+        watcher = _StreamWatcher()
+        reset = _stream_watcher.set(watcher)
+        try:
+            return await self.llm.ainvoke(prompt)
+        except Exception as e:
+            if watcher.streamed:
+                raise StreamInterruptedError(f"LLM call failed after streaming part of its response: {e}") from e
+            raise
+        finally:
+            _stream_watcher.reset(reset)
+    
+    def _complete(self, prompt: str, interview_id: Optional[str] = None) -> str:
+        """
+        Get the LLM's response to a prompt, served from the cache when possible.
+        
+        Cached responses cost no tokens. Live calls wait for quota in the
+        rate limiter, are retried when throttled (unless they already
+        streamed text) and are recorded in the token ledger under
+        interview_id.
+        
+        Args:
+            prompt: Fully rendered prompt
+            interview_id: Interview whose token usage the call counts towards
+            
+        Returns:
+            str: Response text
+        """
+        cache_key = self._cache_key(prompt)
+        if cache_key:
+            cached = self.cache.get(cache_key, self._temperature)
+            if cached is not None:
+                return cached
+        
+        response = self.rate_limiter.run(
+            lambda: self._invoke(prompt),
+            self._estimate_tokens(prompt),
+            lambda result: self._record_usage(interview_id, prompt, result)
+        )
+        
+        if cache_key:
+            self.cache.put(cache_key, response.content, self._temperature)
+        return response.content
+    
+    async def _acomplete(self, prompt: str, interview_id: Optional[str] = None) -> str:
+        """Async version of _complete."""
+        cache_key = self._cache_key(prompt)
+        if cache_key:
+            cached = self.cache.get(cache_key, self._temperature)
+            if cached is not None:
+                return cached
+        
+        response = await self.rate_limiter.arun(
+            lambda: self._ainvoke(prompt),
+            self._estimate_tokens(prompt),
+            lambda result: self._record_usage(interview_id, prompt, result)
+        )
+        
+        if cache_key:
+            self.cache.put(cache_key, response.content, self._temperature)
         return response.content
-
@@ -1,9 +1,26 @@
 """
 Evaluation Agent for providing comprehensive interview feedback.
 """
-from typing import Dict, Any
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+from config import settings
 from src.agents.base_agent import BaseAgent
-from src.prompts.templates import EVALUATION_AGENT_SYSTEM_PROMPT
+from src.prompts.templates import (
+    ANSWER_ASSESSMENT_PROMPT,
+    EVALUATION_AGENT_SYSTEM_PROMPT,
+    EVALUATION_ROUND_PROMPT,
+)
+
+# Interview rounds as (agent type, round name, round focus)
+ROUNDS = [
+    ("technical", "Technical Round", "coding skills, system design and problem-solving"),
+    ("hr", "HR Round", "cultural fit, communication and soft skills"),
+    ("manager", "Managerial Round", "leadership, strategic thinking and career vision"),
+]
+
+# Maximum items kept per section when round evaluations are merged
+MERGED_SECTION_LIMITS = {"strengths": 5, "weaknesses": 4, "suggestions": 4}
 
 
 class EvaluationAgent(BaseAgent):
@@ -13,36 +30,330 @@ class EvaluationAgent(BaseAgent):
         """Initialize the Evaluation Agent."""
         super().__init__()
     
-    def generate_evaluation(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    def build_prompt(self, state: Dict[str, Any]) -> str:
         """
-        Generate comprehensive evaluation based on the entire interview.
+        Build the evaluation prompt for the entire interview.
         
         Args:
             state: Current interview state with all Q&A pairs
             
         Returns:
-            Dict containing score, strengths, weaknesses, and suggestions
+            str: Formatted evaluation prompt
         """
         # Build the interview summary
         interview_summary = self._build_interview_summary(state)
         
         # Create the evaluation prompt
-        prompt = EVALUATION_AGENT_SYSTEM_PROMPT.format(
+        return EVALUATION_AGENT_SYSTEM_PROMPT.format(
             candidate_name=state["candidate_name"],
             job_role=state["job_role"],
             experience_level=state["experience_level"],
             interview_summary=interview_summary
         )
+    
+    def generate_evaluation(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Generate comprehensive evaluation based on the entire interview.
+        
+        In "incremental" mode the per-answer assessments are aggregated; in
+        "parallel" mode each round is scored concurrently and the results are
+        merged; in "single" mode one prompt covers the whole interview.
+        
+        Args:
+            state: Current interview state with all Q&A pairs
+            
+        Returns:
+            Dict containing score, strengths, weaknesses, and suggestions
+        """
+        if settings.EVALUATION_MODE == "incremental":
+            return self.generate_incremental_evaluation(state)
+        if settings.EVALUATION_MODE == "parallel":
+            return self.generate_parallel_evaluation(state)
         
         # Get evaluation from LLM
-        response = self.llm.invoke(prompt)
-        evaluation_text = response.content
+        evaluation_text = self._complete(self.build_prompt(state), state.get("interview_id"))
         
         # Parse the evaluation (expecting structured format)
         evaluation = self._parse_evaluation(evaluation_text)
         
         return evaluation
     
+    async def agenerate_evaluation(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async version of generate_evaluation.
+        
+        Args:
+            state: Current interview state with all Q&A pairs
+            
+        Returns:
+            Dict containing score, strengths, weaknesses, and suggestions
+        """
+        if settings.EVALUATION_MODE == "incremental":
+            return await self.agenerate_incremental_evaluation(state)
+        if settings.EVALUATION_MODE == "parallel":
+            return await self.agenerate_parallel_evaluation(state)
+        
+        evaluation_text = await self._acomplete(self.build_prompt(state), state.get("interview_id"))
+        return self._parse_evaluation(evaluation_text)
+    
+    def build_round_prompt(self, state: Dict[str, Any], agent_type: str) -> str:
+        """
+        Build the evaluation prompt for a single interview round.
+        
+        Args:
+            state: Current interview state with all Q&A pairs
+            agent_type: Round to evaluate ("technical", "hr" or "manager")
+            
+        Returns:
+            str: Formatted round evaluation prompt
+        """
+        _, round_name, round_focus = next(r for r in ROUNDS if r[0] == agent_type)
+        round_qa = [qa for qa in state.get("qa_pairs", []) if qa.agent_type == agent_type]
+        
+        return EVALUATION_ROUND_PROMPT.format(
+            candidate_name=state["candidate_name"],
+            job_role=state["job_role"],
+            experience_level=state["experience_level"],
+            round_name=round_name,
+            round_focus=round_focus,
+            round_summary="\n".join(self._format_round(round_qa))
+        )
+    
+    def _answered_rounds(self, state: Dict[str, Any]) -> List[str]:
+        """Get the rounds that have at least one question-answer pair."""
+        asked = {qa.agent_type for qa in state.get("qa_pairs", [])}
+        return [agent_type for agent_type, _, _ in ROUNDS if agent_type in asked]
+    
+    def generate_round_evaluation(self, state: Dict[str, Any], agent_type: str) -> Dict[str, Any]:
+        """
+        Evaluate a single interview round.
+        
+        Args:
+            state: Current interview state with all Q&A pairs
+            agent_type: Round to evaluate
+            
+        Returns:
+            Dict containing score, strengths, weaknesses, and suggestions for the round
+        """
+        prompt = self.build_round_prompt(state, agent_type)
+        return self._parse_evaluation(self._complete(prompt, state.get("interview_id")))
+    
+    async def agenerate_round_evaluation(self, state: Dict[str, Any], agent_type: str) -> Dict[str, Any]:
+        """Async version of generate_round_evaluation."""
+        prompt = self.build_round_prompt(state, agent_type)
+        return self._parse_evaluation(await self._acomplete(prompt, state.get("interview_id")))
+    
+    def generate_parallel_evaluation(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Evaluate every round concurrently and merge the results.
+        
+        Args:
+            state: Current interview state with all Q&A pairs
+            
+        Returns:
+            Dict containing score, strengths, weaknesses, and suggestions
+        """
+        rounds = self._answered_rounds(state)
+        if not rounds:
+            return self._parse_evaluation("No interview data available.")
+        
+        with ThreadPoolExecutor(max_workers=len(rounds)) as pool:
+            results = list(pool.map(
+                lambda agent_type: self.generate_round_evaluation(state, agent_type),
+                rounds
+            ))
+        
+        return self.merge_evaluations(state, dict(zip(rounds, results)))
+    
+    async def agenerate_parallel_evaluation(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Async version of generate_parallel_evaluation."""
+        rounds = self._answered_rounds(state)
+        if not rounds:
+            return self._parse_evaluation("No interview data available.")
+        
+        results = await asyncio.gather(*(
+            self.agenerate_round_evaluation(state, agent_type) for agent_type in rounds
+        ))
+        
+        return self.merge_evaluations(state, dict(zip(rounds, results)))
+    
+    def build_answer_prompt(self, state: Dict[str, Any], qa) -> str:
+        """
+        Build the assessment prompt for a single answer.
+        
+        Args:
+            state: Interview state (only the candidate profile and
+                interview_id are used)
+            qa: Question-answer pair to assess
+            
+        Returns:
+            str: Formatted answer assessment prompt
+        """
+        _, round_name, round_focus = next(r for r in ROUNDS if r[0] == qa.agent_type)
+        return ANSWER_ASSESSMENT_PROMPT.format(
+            candidate_name=state["candidate_name"],
+            job_role=state["job_role"],
+            experience_level=state["experience_level"],
+            round_name=round_name,
+            round_focus=round_focus,
+            question=qa.question,
+            answer=qa.answer or "No answer provided"
+        )
+    
+    def assess_answer(self, state: Dict[str, Any], qa) -> Dict[str, Any]:
+        """
+        Assess a single answer.
+        
+        Args:
+            state: Interview state (only the candidate profile and
+                interview_id are used)
+            qa: Question-answer pair to assess
+            
+        Returns:
+            Dict containing score, strengths, weaknesses, and suggestions for the answer
+        """
+        prompt = self.build_answer_prompt(state, qa)
+        return self._parse_evaluation(self._complete(prompt, state.get("interview_id")))
+    
+    async def aassess_answer(self, state: Dict[str, Any], qa) -> Dict[str, Any]:
+        """Async version of assess_answer."""
+        prompt = self.build_answer_prompt(state, qa)
+        return self._parse_evaluation(await self._acomplete(prompt, state.get("interview_id")))
+    
+    def generate_incremental_evaluation(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the evaluation from the per-answer assessments in the state.
+        
+        Answers without an assessment (e.g. when a background assessment was
+        lost) are assessed now, concurrently.
+        
+        Args:
+            state: Interview state with qa_pairs and answer_assessments
+            
+        Returns:
+            Dict containing score, strengths, weaknesses, and suggestions
+        """
+        assessments = self._collect_assessments(state)
+        missing = [i for i, assessment in enumerate(assessments) if assessment is None]
+        if missing:
+            qa_pairs = state["qa_pairs"]
+            with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+                results = pool.map(lambda i: self.assess_answer(state, qa_pairs[i]), missing)
+                for i, assessment in zip(missing, results):
+                    assessments[i] = assessment
+        return self.aggregate_assessments(state, assessments)
+    
+    async def agenerate_incremental_evaluation(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Async version of generate_incremental_evaluation."""
+        assessments = self._collect_assessments(state)
+        missing = [i for i, assessment in enumerate(assessments) if assessment is None]
+        if missing:
+            qa_pairs = state["qa_pairs"]
+            results = await asyncio.gather(*(self.aassess_answer(state, qa_pairs[i]) for i in missing))
+            for i, assessment in zip(missing, results):
+                assessments[i] = assessment
+        return self.aggregate_assessments(state, assessments)
+    
+    def _collect_assessments(self, state: Dict[str, Any]) -> List[Optional[Dict[str, Any]]]:
+        """Get one assessment slot per Q&A pair, None where none is available."""
+        stored = list(state.get("answer_assessments") or [])
+        qa_count = len(state.get("qa_pairs", []))
+        return (stored + [None] * qa_count)[:qa_count]
+    
+    def aggregate_assessments(
+        self, state: Dict[str, Any], assessments: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Combine per-answer assessments into one interview evaluation.
+        
+        Answers are first rolled up per round (mean score, pooled feedback)
+        and the rounds are then merged like parallel round evaluations.
+        
+        Args:
+            state: Interview state
+            assessments: Assessment per Q&A pair, aligned with state["qa_pairs"]
+            
+        Returns:
+            Dict with score, strengths, weaknesses, suggestions and overall_feedback
+        """
+        qa_pairs = state.get("qa_pairs", [])
+        if not qa_pairs:
+            return self._parse_evaluation("No interview data available.")
+        
+        round_evaluations = {}
+        for agent_type, round_name, _ in ROUNDS:
+            round_assessments = [
+                assessment for qa, assessment in zip(qa_pairs, assessments)
+                if qa.agent_type == agent_type
+            ]
+            if not round_assessments:
+                continue
+            score = round(sum(a["score"] for a in round_assessments) / len(round_assessments))
+            round_evaluations[agent_type] = {
+                "score": score,
+                "strengths": [item for a in round_assessments for item in a["strengths"]],
+                "weaknesses": [item for a in round_assessments for item in a["weaknesses"]],
+                "suggestions": [item for a in round_assessments for item in a["suggestions"]],
+                "overall_feedback": f"Averaged {score}/100 across {len(round_assessments)} "
+                                    f"answer{'s' if len(round_assessments) != 1 else ''}.",
+            }
+        
+        return self.merge_evaluations(state, round_evaluations)
+    
+    def merge_evaluations(
+        self, state: Dict[str, Any], round_evaluations: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Combine per-round evaluations into one interview evaluation.
+        
+        The score is the average of the round scores weighted by the number of
+        questions in each round. List sections take items from each round in
+        turn so every round is represented, without duplicates.
+        
+        Args:
+            state: Interview state
+            round_evaluations: Parsed evaluation per round, keyed by agent type
+            
+        Returns:
+            Dict with score, strengths, weaknesses, suggestions and overall_feedback
+        """
+        qa_pairs = state.get("qa_pairs", [])
+        weights = {
+            agent_type: max(1, sum(1 for qa in qa_pairs if qa.agent_type == agent_type))
+            for agent_type in round_evaluations
+        }
+        total_weight = sum(weights.values())
+        
+        evaluation = {
+            "score": round(sum(
+                round_evaluations[agent_type]["score"] * weight
+                for agent_type, weight in weights.items()
+            ) / total_weight) if total_weight else 0,
+            "strengths": [],
+            "weaknesses": [],
+            "suggestions": [],
+            "overall_feedback": ""
+        }
+        
+        # Interleave list items round by round
+        for section, limit in MERGED_SECTION_LIMITS.items():
+            columns = [round_evaluations[agent_type][section] for agent_type in round_evaluations]
+            for row in range(max((len(column) for column in columns), default=0)):
+                for column in columns:
+                    if row < len(column) and column[row] not in evaluation[section]:
+                        evaluation[section].append(column[row])
+            evaluation[section] = evaluation[section][:limit]
+        
+        # One line of feedback per round
+        round_names = {agent_type: round_name for agent_type, round_name, _ in ROUNDS}
+        evaluation["overall_feedback"] = " ".join(
+            f"{round_names[agent_type]}: {round_evaluation['overall_feedback'].strip()}"
+            for agent_type, round_evaluation in round_evaluations.items()
+            if round_evaluation["overall_feedback"].strip()
+        )
+        
+        return evaluation
+    
     def _build_interview_summary(self, state: Dict[str, Any]) -> str:
         """
         Build a comprehensive summary of the interview.
@@ -60,34 +371,32 @@ class EvaluationAgent(BaseAgent):
         
         summary_parts = []
         
-        # Group by agent type
-        technical_qa = [qa for qa in qa_pairs if qa.agent_type == "technical"]
-        hr_qa = [qa for qa in qa_pairs if qa.agent_type == "hr"]
-        manager_qa = [qa for qa in qa_pairs if qa.agent_type == "manager"]
-        
-        # Technical Round
-        if technical_qa:
-            summary_parts.append("=== TECHNICAL ROUND ===")
-            for i, qa in enumerate(technical_qa, 1):
-                summary_parts.append(f"\nQ{i}: {qa.question}")
-                summary_parts.append(f"A{i}: {qa.answer or 'No answer provided'}\n")
-        
-        # HR Round
-        if hr_qa:
-            summary_parts.append("\n=== HR ROUND ===")
-            for i, qa in enumerate(hr_qa, 1):
-                summary_parts.append(f"\nQ{i}: {qa.question}")
-                summary_parts.append(f"A{i}: {qa.answer or 'No answer provided'}\n")
-        
-        # Manager Round
-        if manager_qa:
-            summary_parts.append("\n=== MANAGERIAL ROUND ===")
-            for i, qa in enumerate(manager_qa, 1):
-                summary_parts.append(f"\nQ{i}: {qa.question}")
-                summary_parts.append(f"A{i}: {qa.answer or 'No answer provided'}\n")
+        # Group by round
+        for agent_type, round_name, _ in ROUNDS:
+            round_qa = [qa for qa in qa_pairs if qa.agent_type == agent_type]
+            if round_qa:
+                header = f"=== {round_name.upper()} ==="
+                summary_parts.append(header if not summary_parts else "\n" + header)
+                summary_parts.extend(self._format_round(round_qa))
         
         return "\n".join(summary_parts)
     
+    def _format_round(self, round_qa: list) -> List[str]:
+        """
+        Format the question-answer pairs of one round.
+        
+        Args:
+            round_qa: Question-answer pairs from a single round
+            
+        Returns:
+            List[str]: Summary lines for the round
+        """
+        lines = []
+        for i, qa in enumerate(round_qa, 1):
+            lines.append(f"\nQ{i}: {qa.question}")
+            lines.append(f"A{i}: {qa.answer or 'No answer provided'}\n")
+        return lines
+    
     def _parse_evaluation(self, evaluation_text: str) -> Dict[str, Any]:
         """
         Parse the LLM's evaluation response into structured data.
@@ -3,7 +3,7 @@ Manager Agent for conducting managerial interviews.
 """
 from typing import Dict, Any
 from .base_agent import BaseAgent
-from src.prompts.templates import get_agent_prompt
+from src.prompts.templates import format_resume_digest, get_agent_prompt
 from src.graph.state import InterviewState
 from config import settings
 
@@ -17,26 +17,24 @@ class ManagerAgent(BaseAgent):
         self.agent_type = "manager"
         self.max_questions = settings.MAX_MANAGER_QUESTIONS
     
-    def ask_question(self, state: InterviewState) -> str:
+    def build_prompt(self, state: InterviewState) -> str:
         """
-        Generate and ask a managerial question.
+        Build the prompt for the next managerial question.
         
         Args:
             state: Current interview state
             
         Returns:
-            str: Generated managerial question
+            str: Formatted prompt
         """
         question_number = state["manager_questions_asked"] + 1
         is_first = question_number == 1
         
         # Build conversation history for context
-        conversation_history = self._build_conversation_history(
-            state["conversation_history"]
-        )
+        conversation_history = self.context_builder.messages(state, self.agent_type)
         
         # Get the appropriate prompt
-        prompt = get_agent_prompt(
+        return get_agent_prompt(
             agent_type=self.agent_type,
             candidate_name=state["candidate_name"],
             job_role=state["job_role"],
@@ -44,31 +42,34 @@ class ManagerAgent(BaseAgent):
             question_number=question_number,
             conversation_history=conversation_history,
             is_first_question=is_first,
-            resume_text=state.get("resume_text")
+            resume_text=state.get("resume_text"),
+            resume_digest=format_resume_digest(state.get("resume_digest")),
+            resume_excerpts=self.resume_excerpts(state),
+            max_tokens=self.prompt_budget(state)
         )
-        
-        # Generate the question
-        question = self.generate_question(prompt)
-        return question
     
-    def _build_conversation_history(self, messages: list) -> str:
+    def ask_question(self, state: InterviewState) -> str:
         """
-        Build a formatted conversation history string.
+        Generate and ask a managerial question.
         
         Args:
-            messages: List of conversation messages
+            state: Current interview state
             
         Returns:
-            str: Formatted conversation history
+            str: Generated managerial question
         """
-        if not messages:
-            return "No previous conversation."
-        
-        # Get last 5 messages for context
-        recent_messages = messages[-5:]
-        history = []
-        for msg in recent_messages:
-            role = "Interviewer" if msg.role == "agent" else "Candidate"
-            history.append(f"{role}: {msg.content}")
+        return self.bank_opener(state) or self.generate_question(self.build_prompt(state), state.get("interview_id"))
+    
+    async def aask_question(self, state: InterviewState) -> str:
+        """
+        Async version of ask_question.
         
-        return "\n".join(history)
+        Args:
+            state: Current interview state
+            
+        Returns:
+            str: Generated managerial question
+        """
+        return self.bank_opener(state) or await self.agenerate_question(
+            await self.abuild_prompt(state), state.get("interview_id")
+        )
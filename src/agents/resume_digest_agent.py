@@ -0,0 +1,105 @@
+"""
+Resume Digest Agent for summarizing a resume once per interview.
+"""
+import re
+from typing import Dict, Any
+from .base_agent import BaseAgent
+from src.prompts.templates import RESUME_DIGEST_PROMPT
+from config import settings
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class ResumeDigestAgent(BaseAgent):
+    """Agent that turns a resume into a compact structured profile."""
+    
+    def __init__(self):
+        """Initialize the Resume Digest Agent."""
+        super().__init__()
+    
+    def build_prompt(self, state: Dict[str, Any]) -> str:
+        """
+        Build the digest prompt for the interview's resume.
+        
+        Args:
+            state: Current interview state
+            
+        Returns:
+            str: Formatted prompt
+        """
+        resume_text = state.get("resume_text") or ""
+        return RESUME_DIGEST_PROMPT.format(
+            resume_text=resume_text[:settings.RESUME_DIGEST_INPUT_CHARS]
+        )
+    
+    def generate_digest(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Summarize the resume into skills, roles, years and notable projects.
+        
+        Args:
+            state: Current interview state
+            
+        Returns:
+            Dict with skills, roles, years_experience, projects and education
+        """
+        logger.info("Resume Digest Agent: Summarizing resume")
+        return self._parse_digest(self._complete(self.build_prompt(state), state.get("interview_id")))
+    
+    async def agenerate_digest(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async version of generate_digest.
+        
+        Args:
+            state: Current interview state
+            
+        Returns:
+            Dict with skills, roles, years_experience, projects and education
+        """
+        logger.info("Resume Digest Agent: Summarizing resume")
+        return self._parse_digest(await self._acomplete(self.build_prompt(state), state.get("interview_id")))
+    
+    def _parse_digest(self, digest_text: str) -> Dict[str, Any]:
+        """
+        Parse the LLM's digest response into structured data.
+        
+        Args:
+            digest_text: Raw digest text from LLM
+            
+        Returns:
+            Dict with skills, roles, years_experience, projects and education
+        """
+        digest = {
+            "skills": [],
+            "roles": [],
+            "years_experience": None,
+            "projects": [],
+            "education": ""
+        }
+        
+        in_projects = False
+        for line in digest_text.strip().split('\n'):
+            line = line.strip()
+            label, _, value = line.partition(":")
+            label = label.strip().upper()
+            value = value.strip()
+            
+            if label == "SKILLS":
+                digest["skills"] = [skill.strip() for skill in value.split(",") if skill.strip()]
+            elif label == "ROLES":
+                digest["roles"] = [role.strip() for role in value.split(";") if role.strip()]
+            elif label == "YEARS OF EXPERIENCE":
+                years_match = re.search(r'\d+(?:\.\d+)?', value)
+                if years_match:
+                    digest["years_experience"] = float(years_match.group(0))
+            elif label == "EDUCATION":
+                digest["education"] = value
+            elif label == "NOTABLE PROJECTS":
+                in_projects = True
+                continue
+            elif in_projects and line.startswith(('-', '•', '*')):
+                digest["projects"].append(line.lstrip('-•* ').strip())
+                continue
+            in_projects = False
+        
+        return digest
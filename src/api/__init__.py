@@ -0,0 +1,18 @@
+"""ASGI service exposing the interview workflow over HTTP and WebSocket."""
+from .service import (
+    AnswerRequest,
+    CreateInterviewRequest,
+    InterviewResponse,
+    InterviewService,
+    InterviewTranscript,
+    create_app,
+)
+
+__all__ = [
+    "AnswerRequest",
+    "CreateInterviewRequest",
+    "InterviewResponse",
+    "InterviewService",
+    "InterviewTranscript",
+    "create_app",
+]
@@ -0,0 +1,420 @@
+"""
+Async ASGI service for running interviews over HTTP.
+
+REST endpoints create an interview, run its next step and record answers;
+a WebSocket runs the same steps and streams each question as it is
+generated. Every session of a worker runs on its event loop through one
+shared InterviewWorkflow, and the steps in progress at once are bounded by
+settings.API_MAX_CONCURRENT_STEPS.
+
+Run it with:
+    python server.py --port 8000
+"""
+import asyncio
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from pydantic import BaseModel, Field, ValidationError
+
+from config import settings
+from config.logging_config import get_logger
+from src.graph.state import InterviewState, MessageModel, QuestionAnswerModel, create_initial_state
+from src.graph.workflow import InterviewWorkflow, get_workflow
+from src.llm.rate_limit import StreamInterruptedError
+from src.sessions import SessionConflictError, SessionStore, get_session_store
+
+logger = get_logger(__name__)
+
+
+class CreateInterviewRequest(BaseModel):
+    """Candidate profile to start an interview for."""
+    candidate_name: str = Field(min_length=1)
+    job_role: str = Field(min_length=1)
+    experience_level: str = Field(min_length=1)
+    resume_text: Optional[str] = None
+    candidate_id: Optional[str] = None
+
+
+class AnswerRequest(BaseModel):
+    """Candidate's answer to the pending question."""
+    answer: str = Field(min_length=1)
+
+
+class InterviewResponse(BaseModel):
+    """Progress of an interview, as returned after every call."""
+    interview_id: str
+    candidate_name: str
+    job_role: str
+    experience_level: str
+    current_agent: str
+    current_question: Optional[str] = None
+    questions_asked: int
+    total_questions: int
+    is_complete: bool
+    evaluation: Optional[Dict[str, Any]] = None
+    token_usage: Dict[str, int]
+    version: int
+    
+    @classmethod
+    def from_state(cls, state: InterviewState) -> "InterviewResponse":
+        """Build the response for an interview state."""
+        return cls(
+            interview_id=state["interview_id"],
+            candidate_name=state["candidate_name"],
+            job_role=state["job_role"],
+            experience_level=state["experience_level"],
+            current_agent=state["current_agent"],
+            current_question=state["current_question"],
+            questions_asked=len(state["qa_pairs"]) + (1 if state["current_question"] else 0),
+            total_questions=(
+                settings.MAX_TECHNICAL_QUESTIONS + settings.MAX_HR_QUESTIONS + settings.MAX_MANAGER_QUESTIONS
+            ),
+            is_complete=state["is_complete"],
+            evaluation=state["evaluation"],
+            token_usage=state["token_usage"],
+            version=state.get("version", 0),
+        )
+
+
+class InterviewTranscript(InterviewResponse):
+    """Progress of an interview with its full transcript."""
+    conversation_history: List[MessageModel]
+    qa_pairs: List[QuestionAnswerModel]
+    
+    @classmethod
+    def from_state(cls, state: InterviewState) -> "InterviewTranscript":
+        """Build the transcript for an interview state."""
+        return cls(
+            **InterviewResponse.from_state(state).model_dump(),
+            conversation_history=[message.to_model() for message in state["conversation_history"]],
+            qa_pairs=[qa.to_model() for qa in state["qa_pairs"]],
+        )
+
+
+class InterviewService:
+    """
+    Runs interview sessions on the event loop of a worker.
+    
+    The worker keeps no interview in memory between requests: every request
+    loads the interview from the session store and saves it back, so any
+    worker behind a load balancer can serve any step. A save over a version
+    another worker saved in the meantime fails with 409. Interviews only
+    checkpointed (started before the session store was used) are resumed
+    from their checkpoint. The steps of one interview run one at a time per
+    worker; across interviews at most max_concurrent_steps run at once and
+    the rest queue for a slot.
+    """
+    
+    def __init__(
+        self,
+        workflow: Optional[InterviewWorkflow] = None,
+        store: Optional[SessionStore] = None,
+        max_concurrent_steps: Optional[int] = None,
+        queue_timeout: Optional[float] = None,
+        wait_for_assessments: Optional[bool] = None
+    ):
+        """
+        Initialize the service.
+        
+        Args:
+            workflow: Workflow to run (defaults to the process-wide one)
+            store: Session store (defaults to the process-wide one)
+            max_concurrent_steps: Steps running at once (defaults to
+                settings.API_MAX_CONCURRENT_STEPS)
+            queue_timeout: Seconds a step waits for a slot before the request
+                fails with 503 (defaults to settings.API_QUEUE_TIMEOUT)
+            wait_for_assessments: Save each answer with its assessment (see
+                answer); defaults to settings.API_WAIT_FOR_ASSESSMENTS, where
+                "auto" waits when the store is shared between processes
+        """
+        self._workflow = workflow
+        self.store = store if store is not None else get_session_store()
+        self.max_concurrent_steps = max_concurrent_steps or settings.API_MAX_CONCURRENT_STEPS
+        self.queue_timeout = settings.API_QUEUE_TIMEOUT if queue_timeout is None else queue_timeout
+        if wait_for_assessments is None:
+            mode = settings.API_WAIT_FOR_ASSESSMENTS
+            wait_for_assessments = self.store.shared if mode == "auto" else mode == "true"
+        self.wait_for_assessments = wait_for_assessments
+        self._slots = asyncio.Semaphore(self.max_concurrent_steps)
+        # Held only while a request for the interview is in progress
+        self._locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+        self.steps_in_progress = 0
+    
+    @property
+    def workflow(self) -> InterviewWorkflow:
+        """Workflow running the interviews."""
+        if self._workflow is None:
+            self._workflow = get_workflow()
+        return self._workflow
+    
+    @asynccontextmanager
+    async def _slot(self):
+        """Hold one of the step slots, waiting up to queue_timeout for it."""
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"No step slot free within {self.queue_timeout}s, rejecting request")
+            raise HTTPException(503, "Too many interviews in progress", headers={"Retry-After": "1"})
+        self.steps_in_progress += 1
+        try:
+            yield
+        finally:
+            self.steps_in_progress -= 1
+            self._slots.release()
+    
+    def _lock(self, interview_id: str) -> asyncio.Lock:
+        """Lock serializing the requests of an interview on this worker."""
+        lock = self._locks.get(interview_id)
+        if lock is None:
+            lock = self._locks[interview_id] = asyncio.Lock()
+        return lock
+    
+    async def _save(self, state: InterviewState) -> InterviewState:
+        """
+        Save a state to the session store.
+        
+        Raises:
+            HTTPException: 409 if another worker saved the interview since
+                the state was loaded
+        """
+        try:
+            return await asyncio.to_thread(self.store.save, state)
+        except SessionConflictError as e:
+            logger.warning(str(e))
+            raise HTTPException(409, str(e))
+    
+    async def create(self, request: CreateInterviewRequest) -> InterviewState:
+        """
+        Start an interview and begin generating each round's opener.
+        
+        Args:
+            request: Candidate profile
+        
+        Returns:
+            InterviewState: Initial state (no question asked yet)
+        
+        Raises:
+            HTTPException: 404 if the candidate id is not in the resume store
+        """
+        try:
+            state = await asyncio.to_thread(
+                create_initial_state,
+                request.candidate_name,
+                request.job_role,
+                request.experience_level,
+                request.resume_text,
+                request.candidate_id,
+            )
+        except ValueError as e:
+            raise HTTPException(404, str(e))
+        self.workflow.prefetch_openers(state)
+        state = await self._save(state)
+        logger.info(f"Started interview {state['interview_id']} for {request.job_role}")
+        return state
+    
+    async def get(self, interview_id: str) -> InterviewState:
+        """
+        Get the current state of an interview.
+        
+        Args:
+            interview_id: Id of the interview
+        
+        Returns:
+            InterviewState: Current state
+        
+        Raises:
+            HTTPException: 404 if the interview is unknown
+        """
+        state = await asyncio.to_thread(self.store.load, interview_id)
+        if state is None:
+            state = await asyncio.to_thread(self.workflow.load_state, interview_id)
+            if state is None:
+                raise HTTPException(404, f"Interview {interview_id} not found")
+        return state
+    
+    async def step(self, interview_id: str) -> InterviewState:
+        """
+        Run the next step of an interview (ask a question or evaluate).
+        
+        Args:
+            interview_id: Id of the interview
+        
+        Returns:
+            InterviewState: State after the step
+        """
+        async with self._lock(interview_id):
+            state = await self.get(interview_id)
+            async with self._slot():
+                state = await self.workflow.arun_step(state)
+            return await self._save(state)
+    
+    async def stream_step(self, interview_id: str) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Run the next step of an interview, streaming the question text.
+        
+        Args:
+            interview_id: Id of the interview
+        
+        Yields:
+            tuple: ("token", str) for each chunk of question text, then
+            ("state", InterviewState) with the state after the step
+        
+        Raises:
+            HTTPException: 502 if the LLM call failed after tokens were
+                sent; nothing is saved, so the client discards them and
+                runs the step again
+        """
+        async with self._lock(interview_id):
+            state = await self.get(interview_id)
+            async with self._slot():
+                try:
+                    async for event, payload in self.workflow.astream_step(state):
+                        if event == "state":
+                            payload = await self._save(payload)
+                        yield event, payload
+                except StreamInterruptedError as e:
+                    logger.warning(f"Interview {interview_id}: {e}")
+                    raise HTTPException(502, "Question generation failed mid-stream; discard it and retry the step")
+    
+    async def answer(self, interview_id: str, answer: str) -> InterviewState:
+        """
+        Record the candidate's answer to the pending question.
+        
+        With wait_for_assessments, the answer is saved only once its
+        incremental assessment is done. This adds one LLM call to the
+        request's latency, but the assessment and its tokens are then part
+        of the stored interview, so a worker evaluating it doesn't assess the
+        answer again. Otherwise the assessment runs in the background on
+        this worker and only this worker can use it.
+        
+        Args:
+            interview_id: Id of the interview
+            answer: Candidate's answer
+        
+        Returns:
+            InterviewState: State with the answer recorded
+        
+        Raises:
+            HTTPException: 409 if no question is waiting for an answer
+        """
+        async with self._lock(interview_id):
+            state = await self.get(interview_id)
+            if state["is_complete"] or not state["current_question"]:
+                raise HTTPException(409, "No question is waiting for an answer")
+            state = await self.workflow.aprocess_answer(state, answer, self.wait_for_assessments)
+            return await self._save(state)
+    
+    async def discard(self, interview_id: str) -> bool:
+        """
+        Remove an interview from the session store (its checkpoint is kept).
+        
+        The workflow also drops this worker's background work and caches for
+        the interview; other workers evict theirs as they fill up.
+        
+        Returns:
+            bool: Whether the interview was stored
+        """
+        self.workflow.discard(interview_id)
+        return await asyncio.to_thread(self.store.delete, interview_id)
+
+
+def create_app(service: Optional[InterviewService] = None) -> FastAPI:
+    """
+    Create the interview service application.
+    
+    Args:
+        service: Service running the interviews (a new one on the
+            process-wide workflow by default)
+    
+    Returns:
+        FastAPI: ASGI application
+    """
+    service = service or InterviewService()
+    
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Compile the workflow before the first request instead of during it
+        await asyncio.to_thread(lambda: service.workflow)
+        yield
+    
+    app = FastAPI(title="AI Interviewer", lifespan=lifespan)
+    app.state.service = service
+    
+    @app.get("/health")
+    async def health():
+        return {
+            "status": "ok",
+            "steps_in_progress": service.steps_in_progress,
+            "max_concurrent_steps": service.max_concurrent_steps,
+        }
+    
+    @app.post("/interviews", response_model=InterviewResponse, status_code=201)
+    async def create_interview(request: CreateInterviewRequest):
+        return InterviewResponse.from_state(await service.create(request))
+    
+    @app.get("/interviews/{interview_id}", response_model=InterviewTranscript)
+    async def get_interview(interview_id: str):
+        return InterviewTranscript.from_state(await service.get(interview_id))
+    
+    @app.post("/interviews/{interview_id}/step", response_model=InterviewResponse)
+    async def run_step(interview_id: str):
+        return InterviewResponse.from_state(await service.step(interview_id))
+    
+    @app.post("/interviews/{interview_id}/answer", response_model=InterviewResponse)
+    async def process_answer(interview_id: str, request: AnswerRequest):
+        return InterviewResponse.from_state(await service.answer(interview_id, request.answer))
+    
+    @app.delete("/interviews/{interview_id}", status_code=204)
+    async def discard_interview(interview_id: str):
+        if not await service.discard(interview_id):
+            raise HTTPException(404, f"Interview {interview_id} not found")
+    
+    @app.websocket("/interviews/{interview_id}/stream")
+    async def stream_interview(websocket: WebSocket, interview_id: str):
+        """
+        Run an interview over a WebSocket.
+        
+        The client sends {"type": "step"} to get the next question, or
+        {"type": "answer", "answer": ...} to answer the pending one and get
+        the next. Each question arrives as {"type": "token", "content": ...}
+        messages followed by {"type": "state", "interview": ...}; failures
+        are sent as {"type": "error", "status": ..., "detail": ...}. A 502
+        error after tokens means the question was cut off: the tokens are to
+        be discarded and {"type": "step"} sent again. The socket is closed
+        once the interview is complete.
+        """
+        await websocket.accept()
+        try:
+            while True:
+                message = await websocket.receive_json()
+                try:
+                    if message.get("type") == "answer":
+                        answer = AnswerRequest(answer=message.get("answer") or "").answer
+                        await service.answer(interview_id, answer)
+                    elif message.get("type") != "step":
+                        raise HTTPException(400, f"Unknown message type: {message.get('type')!r}")
+                    async for event, payload in service.stream_step(interview_id):
+                        if event == "token":
+                            await websocket.send_json({"type": "token", "content": payload})
+                        else:
+                            state = payload
+                except HTTPException as e:
+                    await websocket.send_json({"type": "error", "status": e.status_code, "detail": e.detail})
+                    continue
+                except ValidationError as e:
+                    await websocket.send_json({"type": "error", "status": 422, "detail": e.errors()})
+                    continue
+                
+                await websocket.send_json({
+                    "type": "state",
+                    "interview": InterviewResponse.from_state(state).model_dump(mode="json"),
+                })
+                if state["is_complete"]:
+                    await websocket.close()
+                    return
+        except WebSocketDisconnect:
+            logger.debug(f"WebSocket for interview {interview_id} disconnected")
+    
+    return app
@@ -1,9 +1,22 @@
 """Graph module for workflow orchestration."""
-from .state import InterviewState, Message, QuestionAnswer, create_initial_state
+from .state import (
+    InterviewState,
+    Message,
+    MessageModel,
+    QuestionAnswer,
+    QuestionAnswerModel,
+    create_initial_state,
+)
+from .codec import StateCodecError, decode_state, encode_state
 
 __all__ = [
     "InterviewState",
     "Message",
+    "MessageModel",
     "QuestionAnswer",
+    "QuestionAnswerModel",
+    "StateCodecError",
     "create_initial_state",
+    "decode_state",
+    "encode_state",
 ]
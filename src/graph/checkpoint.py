@@ -0,0 +1,502 @@
+"""
+SQLite checkpointer for the interview graph.
+
+Every step of an interview is checkpointed under its interview id (the
+LangGraph thread id), so an interview survives a restart and can be resumed
+by id from either front end.
+
+Checkpoints are stored per channel, so writes are cheap. A checkpoint row
+holds only the channel versions and metadata. Each channel version that
+LangGraph reports as new, and each pending write of a node, is stored as a
+reference to its serialized value. Values are content-addressed per
+interview, so a channel whose value did not change (the resume text, the
+candidate profile) adds a small row and no payload.
+
+List channels that only grow (the transcript) are stored as links: a new
+version that extends the version last saved or loaded for the interview is
+written as the appended items plus a reference to that version, so a step
+writes what it added rather than the whole transcript. Every
+MAX_CHAIN_LENGTH links the full list is written again to bound reads.
+"""
+import asyncio
+import hashlib
+import random
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+
+from config import settings
+from config.logging_config import get_logger
+from src.graph.codec import StateSerializer
+
+logger = get_logger(__name__)
+
+# Links stored before a list value is written in full again
+MAX_CHAIN_LENGTH = 64
+
+# Interviews whose latest list values are remembered for linking
+MAX_CACHED_THREADS = 256
+
+
+class SQLiteCheckpointSaver(BaseCheckpointSaver[str]):
+    """Thread-safe LangGraph checkpointer storing changed channels in SQLite."""
+    
+    def __init__(self, db_path: str, serde=None):
+        """
+        Open (or create) a checkpoint database.
+        
+        Args:
+            db_path: SQLite database file (":memory:" for a private in-memory database)
+            serde: Serializer for checkpoints and channel values (defaults to
+                the interview state codec)
+        """
+        super().__init__(serde=serde or StateSerializer())
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        # Latest list value per interview and channel: (digest, items, chain length)
+        self._lists: "OrderedDict[str, Dict[str, Tuple[str, tuple, int]]]" = OrderedDict()
+        self._db = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints ("
+            "thread_id TEXT, checkpoint_ns TEXT, checkpoint_id TEXT, parent_checkpoint_id TEXT, "
+            "type TEXT, checkpoint BLOB, metadata_type TEXT, metadata BLOB, "
+            "PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id))"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS channel_versions ("
+            "thread_id TEXT, checkpoint_ns TEXT, channel TEXT, version TEXT, digest TEXT, "
+            "PRIMARY KEY (thread_id, checkpoint_ns, channel, version))"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS channel_values ("
+            "thread_id TEXT, digest TEXT, type TEXT, value BLOB, base TEXT, "
+            "PRIMARY KEY (thread_id, digest))"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS writes ("
+            "thread_id TEXT, checkpoint_ns TEXT, checkpoint_id TEXT, task_id TEXT, idx INTEGER, "
+            "channel TEXT, digest TEXT, task_path TEXT, "
+            "PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx))"
+        )
+        self._db.commit()
+    
+    def _dumps(self, value: Any) -> Tuple[str, str, bytes]:
+        """Serialize a value, returning its content digest, type and bytes."""
+        type_, data = self.serde.dumps_typed(value)
+        digest = hashlib.sha256(type_.encode("utf-8") + b"\0" + data).hexdigest()
+        return digest, type_, data
+    
+    def _dumps_channel(self, thread_id: str, channel: str, value: Any) -> Tuple[str, Optional[tuple], int]:
+        """
+        Serialize a channel value, linking a grown list to its previous version.
+        
+        Returns:
+            tuple: (digest, channel_values row or None if already stored,
+            links from the full list)
+        """
+        if not isinstance(value, list):
+            digest, type_, data = self._dumps(value)
+            return digest, (thread_id, digest, type_, data, None), 0
+        with self._lock:
+            previous = self._lists.get(thread_id, {}).get(channel)
+        if previous is not None:
+            base, items, length = previous
+            if (length < MAX_CHAIN_LENGTH and len(value) >= len(items)
+                    and all(new is old for new, old in zip(value, items))):
+                if len(value) == len(items):
+                    return base, None, length
+                type_, data = self.serde.dumps_typed(value[len(items):])
+                digest = hashlib.sha256(base.encode("utf-8") + b"\0" + type_.encode("utf-8") + b"\0" + data).hexdigest()
+                return digest, (thread_id, digest, type_, data, base), length + 1
+        digest, type_, data = self._dumps(value)
+        return digest, (thread_id, digest, type_, data, None), 0
+    
+    def _remember_list(self, thread_id: str, channel: str, digest: str, items: list, length: int) -> None:
+        """Remember the latest version of a list channel so the next one can link to it (lock held)."""
+        channels = self._lists.setdefault(thread_id, {})
+        self._lists.move_to_end(thread_id)
+        channels[channel] = (digest, tuple(items), length)
+        while len(self._lists) > MAX_CACHED_THREADS:
+            self._lists.popitem(last=False)
+    
+    def _load_digests(self, thread_id: str, digests: Sequence[str]) -> Dict[str, Tuple[Any, int]]:
+        """
+        Load stored values by digest, following list links (lock held).
+        
+        Returns:
+            Dict of digest to (value, links followed to the full list)
+        """
+        placeholders = ", ".join("?" for _ in digests)
+        rows = self._db.execute(
+            "WITH RECURSIVE chain(digest) AS ("
+            f"SELECT digest FROM channel_values WHERE thread_id = ? AND digest IN ({placeholders}) "
+            "UNION SELECT v.base FROM channel_values v JOIN chain c ON v.digest = c.digest "
+            "WHERE v.thread_id = ? AND v.base IS NOT NULL) "
+            "SELECT v.digest, v.type, v.value, v.base FROM channel_values v "
+            "JOIN chain c ON v.digest = c.digest WHERE v.thread_id = ?",
+            [thread_id, *digests, thread_id, thread_id]
+        ).fetchall()
+        stored = {digest: (type_, value, base) for digest, type_, value, base in rows}
+        loaded: Dict[str, Tuple[Any, int]] = {}
+        for digest in digests:
+            # Walk back to the full list, then append the links in order
+            path = []
+            while digest not in loaded and digest in stored:
+                path.append(digest)
+                digest = stored[digest][2]
+            for link in reversed(path):
+                type_, value, base = stored[link]
+                value = self.serde.loads_typed((type_, value))
+                if base is None:
+                    loaded[link] = (value, 0)
+                else:
+                    items, length = loaded[base]
+                    loaded[link] = (items + value, length + 1)
+        return loaded
+    
+    def _load_values(self, thread_id: str, checkpoint_ns: str, versions: ChannelVersions) -> Dict[str, Any]:
+        """Load the channel values at the given versions (lock held)."""
+        if not versions:
+            return {}
+        pairs = list(versions.items())
+        placeholders = ", ".join("(?, ?)" for _ in pairs)
+        rows = self._db.execute(
+            "SELECT channel, digest FROM channel_versions "
+            f"WHERE thread_id = ? AND checkpoint_ns = ? AND (channel, version) IN ({placeholders}) "
+            "AND digest IS NOT NULL",
+            [thread_id, checkpoint_ns] + [str(part) for pair in pairs for part in pair]
+        ).fetchall()
+        loaded = self._load_digests(thread_id, list({digest for _, digest in rows}))
+        values = {}
+        for channel, digest in rows:
+            value, length = loaded[digest]
+            if isinstance(value, list):
+                # Each channel gets its own list; the next version links to it
+                value = list(value)
+                self._remember_list(thread_id, channel, digest, value, length)
+            values[channel] = value
+        return values
+    
+    def _load_writes(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> List[Tuple[str, str, Any]]:
+        """Load the pending writes of a checkpoint (lock held)."""
+        rows = self._db.execute(
+            "SELECT w.task_id, w.channel, b.type, b.value FROM writes w "
+            "JOIN channel_values b ON b.thread_id = w.thread_id AND b.digest = w.digest "
+            "WHERE w.thread_id = ? AND w.checkpoint_ns = ? AND w.checkpoint_id = ? "
+            "ORDER BY w.task_path, w.task_id, w.idx",
+            (thread_id, checkpoint_ns, checkpoint_id)
+        ).fetchall()
+        return [(task_id, channel, self.serde.loads_typed((type_, value))) for task_id, channel, type_, value in rows]
+    
+    def _to_tuple(self, thread_id: str, checkpoint_ns: str, row) -> CheckpointTuple:
+        """Build a checkpoint tuple from a checkpoints row (lock held)."""
+        checkpoint_id, parent_checkpoint_id, type_, checkpoint_blob, metadata_type, metadata_blob = row
+        checkpoint = self.serde.loads_typed((type_, checkpoint_blob))
+        checkpoint["channel_values"] = self._load_values(thread_id, checkpoint_ns, checkpoint["channel_versions"])
+        return CheckpointTuple(
+            config={"configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint_id,
+            }},
+            checkpoint=checkpoint,
+            metadata=self.serde.loads_typed((metadata_type, metadata_blob)),
+            parent_config={"configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": parent_checkpoint_id,
+            }} if parent_checkpoint_id else None,
+            pending_writes=self._load_writes(thread_id, checkpoint_ns, checkpoint_id),
+        )
+    
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """
+        Get a checkpoint, or the latest one of the thread if no id is given.
+        
+        Args:
+            config: Config with thread_id and optionally checkpoint_ns / checkpoint_id
+        
+        Returns:
+            CheckpointTuple or None if there is no matching checkpoint
+        """
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = get_checkpoint_id(config)
+        query = (
+            "SELECT checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata_type, metadata FROM checkpoints "
+            "WHERE thread_id = ? AND checkpoint_ns = ?"
+        )
+        params = [thread_id, checkpoint_ns]
+        if checkpoint_id:
+            query += " AND checkpoint_id = ?"
+            params.append(checkpoint_id)
+        else:
+            query += " ORDER BY checkpoint_id DESC LIMIT 1"
+        with self._lock:
+            row = self._db.execute(query, params).fetchone()
+            return self._to_tuple(thread_id, checkpoint_ns, row) if row else None
+    
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        """
+        List checkpoints, newest first.
+        
+        Args:
+            config: Config selecting the thread (None for all threads)
+            filter: Metadata values the checkpoints must have
+            before: Only list checkpoints older than this one
+            limit: Maximum number of checkpoints
+        
+        Yields:
+            CheckpointTuple: Matching checkpoints
+        """
+        query = (
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, "
+            "metadata_type, metadata "
+            "FROM checkpoints WHERE 1 = 1"
+        )
+        params: List[Any] = []
+        if config:
+            query += " AND thread_id = ?"
+            params.append(config["configurable"]["thread_id"])
+            if config["configurable"].get("checkpoint_ns") is not None:
+                query += " AND checkpoint_ns = ?"
+                params.append(config["configurable"]["checkpoint_ns"])
+            if get_checkpoint_id(config):
+                query += " AND checkpoint_id = ?"
+                params.append(get_checkpoint_id(config))
+        if before and get_checkpoint_id(before):
+            query += " AND checkpoint_id < ?"
+            params.append(get_checkpoint_id(before))
+        query += " ORDER BY checkpoint_id DESC"
+        
+        with self._lock:
+            rows = self._db.execute(query, params).fetchall()
+        for thread_id, checkpoint_ns, *row in rows:
+            if limit is not None and limit <= 0:
+                return
+            with self._lock:
+                checkpoint = self._to_tuple(thread_id, checkpoint_ns, row)
+            if filter and any(checkpoint.metadata.get(key) != value for key, value in filter.items()):
+                continue
+            if limit is not None:
+                limit -= 1
+            yield checkpoint
+    
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """
+        Save a checkpoint, writing only the channels that changed.
+        
+        Args:
+            config: Config of the parent checkpoint
+            checkpoint: Checkpoint to save
+            metadata: Checkpoint metadata
+            new_versions: Channels written since the parent checkpoint
+        
+        Returns:
+            RunnableConfig: Config of the saved checkpoint
+        """
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint = checkpoint.copy()
+        values = checkpoint.pop("channel_values")
+        
+        version_rows = []
+        value_rows = []
+        lists = []
+        for channel, version in new_versions.items():
+            digest = None
+            if channel in values:
+                digest, row, length = self._dumps_channel(thread_id, channel, values[channel])
+                if row is not None:
+                    value_rows.append(row)
+                if isinstance(values[channel], list):
+                    lists.append((channel, digest, length))
+            version_rows.append((thread_id, checkpoint_ns, channel, str(version), digest))
+        type_, checkpoint_blob = self.serde.dumps_typed(checkpoint)
+        metadata_type, metadata_blob = self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))
+        
+        with self._lock:
+            self._db.executemany("INSERT OR IGNORE INTO channel_values VALUES (?, ?, ?, ?, ?)", value_rows)
+            self._db.executemany("INSERT OR REPLACE INTO channel_versions VALUES (?, ?, ?, ?, ?)", version_rows)
+            self._db.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (thread_id, checkpoint_ns, checkpoint["id"], config["configurable"].get("checkpoint_id"),
+                 type_, checkpoint_blob, metadata_type, metadata_blob)
+            )
+            self._db.commit()
+            for channel, digest, length in lists:
+                self._remember_list(thread_id, channel, digest, values[channel], length)
+        return {"configurable": {
+            "thread_id": thread_id,
+            "checkpoint_ns": checkpoint_ns,
+            "checkpoint_id": checkpoint["id"],
+        }}
+    
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """
+        Save the writes of a task that ran on top of a checkpoint.
+        
+        Args:
+            config: Config of the checkpoint
+            writes: (channel, value) pairs written by the task
+            task_id: Task that produced the writes
+            task_path: Path of the task
+        """
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        rows = []
+        value_rows = []
+        for idx, (channel, value) in enumerate(writes):
+            digest, type_, blob = self._dumps(value)
+            value_rows.append((thread_id, digest, type_, blob, None))
+            rows.append((thread_id, checkpoint_ns, checkpoint_id, task_id, WRITES_IDX_MAP.get(channel, idx),
+                         channel, digest, task_path))
+        # Special writes (errors, interrupts) replace earlier ones; regular writes are kept
+        verb = "INSERT OR REPLACE" if all(channel in WRITES_IDX_MAP for channel, _ in writes) else "INSERT OR IGNORE"
+        with self._lock:
+            self._db.executemany("INSERT OR IGNORE INTO channel_values VALUES (?, ?, ?, ?, ?)", value_rows)
+            self._db.executemany(f"{verb} INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._db.commit()
+    
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete every checkpoint, write and value of a thread."""
+        with self._lock:
+            for table in ("checkpoints", "channel_versions", "channel_values", "writes"):
+                self._db.execute(f"DELETE FROM {table} WHERE thread_id = ?", (thread_id,))
+            self._db.commit()
+            self._lists.pop(thread_id, None)
+    
+    def get_next_version(self, current: Optional[str], channel: None = None) -> str:
+        """Get the next version of a channel (sortable strings, as in LangGraph's savers)."""
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+    
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """Async version of get_tuple."""
+        return await asyncio.to_thread(self.get_tuple, config)
+    
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        """Async version of list."""
+        checkpoints = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for checkpoint in checkpoints:
+            yield checkpoint
+    
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Async version of put."""
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+    
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Async version of put_writes."""
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+    
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Async version of delete_thread."""
+        await asyncio.to_thread(self.delete_thread, thread_id)
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the size of the checkpoint database.
+        
+        Returns:
+            Dict with row counts and the bytes of stored channel values
+        """
+        with self._lock:
+            counts = {
+                table: self._db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("checkpoints", "channel_versions", "channel_values", "writes")
+            }
+            counts["value_bytes"] = self._db.execute(
+                "SELECT COALESCE(SUM(LENGTH(value)), 0) FROM channel_values"
+            ).fetchone()[0]
+        return counts
+    
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
+
+
+_checkpointer: Optional[SQLiteCheckpointSaver] = None
+_checkpointer_lock = threading.Lock()
+
+
+def get_checkpointer() -> Optional[SQLiteCheckpointSaver]:
+    """
+    Get the process-wide checkpointer.
+    
+    Returns:
+        SQLiteCheckpointSaver at settings.CHECKPOINT_DB_PATH, or None when
+        checkpointing is disabled
+    """
+    global _checkpointer
+    if not settings.CHECKPOINTS_ENABLED:
+        return None
+    with _checkpointer_lock:
+        if _checkpointer is None:
+            _checkpointer = SQLiteCheckpointSaver(settings.CHECKPOINT_DB_PATH)
+            logger.info(f"Checkpointing interviews to {settings.CHECKPOINT_DB_PATH}")
+        return _checkpointer
@@ -0,0 +1,182 @@
+"""
+Compact binary encoding of interview state.
+
+Values are packed with msgpack. Transcript records are packed as arrays
+([role, content, agent_type] for a Message, [question, answer, agent_type]
+for a QuestionAnswer) in msgpack extension types, so they cost a few bytes
+more than their text and decode straight back into records.
+
+An encoded InterviewState starts with MAGIC and the codec version, followed
+by the state's fields as one array in STATE_FIELDS order. A state written by
+an older version is decoded with that version's field order and brought up
+to date by the MIGRATIONS registered for each version after it.
+
+The checkpointer stores channel values with StateSerializer, which uses this
+codec and falls back to LangGraph's serializer for anything else.
+"""
+from typing import Any, Callable, Dict, Tuple
+
+import ormsgpack
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.types import Overwrite
+
+from src.graph.state import InterviewState, Message, QuestionAnswer
+
+MAGIC = b"IV"
+CODEC_VERSION = 2
+
+# Field order of an encoded state, per codec version
+STATE_FIELDS: Dict[int, Tuple[str, ...]] = {
+    1: (
+        "interview_id", "candidate_name", "job_role", "experience_level", "resume_text", "candidate_id",
+        "resume_digest", "current_agent", "technical_questions_asked", "hr_questions_asked",
+        "manager_questions_asked", "conversation_history", "qa_pairs", "is_complete", "current_question",
+        "last_answer", "evaluation", "answer_assessments", "token_usage",
+    ),
+}
+# 2: session store version
+STATE_FIELDS[2] = STATE_FIELDS[1] + ("version",)
+
+# Upgrades of a decoded state from a version to the next one, by version
+MIGRATIONS: Dict[int, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    1: lambda state: {**state, "version": 0},
+}
+
+# Type name of codec payloads in checkpoints
+TYPE_NAME = "interview"
+
+# msgpack extension types
+MESSAGE_EXT = 1
+QUESTION_ANSWER_EXT = 2
+OVERWRITE_EXT = 3
+
+# Types outside the state schema are not packed, so they keep their type
+# through the fallback serializer instead of decaying into dicts and lists
+PACK_OPTIONS = (
+    ormsgpack.OPT_NON_STR_KEYS
+    | ormsgpack.OPT_PASSTHROUGH_DATACLASS
+    | ormsgpack.OPT_PASSTHROUGH_DATETIME
+    | ormsgpack.OPT_PASSTHROUGH_ENUM
+    | ormsgpack.OPT_PASSTHROUGH_SUBCLASS
+    | ormsgpack.OPT_PASSTHROUGH_TUPLE
+    | ormsgpack.OPT_PASSTHROUGH_UUID
+)
+
+
+class StateCodecError(ValueError):
+    """Encoded state that cannot be decoded (not a state, or from a newer version)."""
+
+
+def _pack_record(value: Any) -> ormsgpack.Ext:
+    """Pack the record types of the state schema (ormsgpack default hook)."""
+    if isinstance(value, Message):
+        return ormsgpack.Ext(MESSAGE_EXT, ormsgpack.packb([value.role, value.content, value.agent_type]))
+    if isinstance(value, QuestionAnswer):
+        return ormsgpack.Ext(
+            QUESTION_ANSWER_EXT, ormsgpack.packb([value.question, value.answer, value.agent_type])
+        )
+    if isinstance(value, Overwrite):
+        return ormsgpack.Ext(OVERWRITE_EXT, encode_value(value.value))
+    raise TypeError(f"Type is not part of the interview state: {type(value).__name__}")
+
+
+def _unpack_record(code: int, data: bytes) -> Any:
+    """Unpack the record types of the state schema (ormsgpack ext hook)."""
+    if code == MESSAGE_EXT:
+        role, content, agent_type = ormsgpack.unpackb(data)
+        return Message(role=role, content=content, agent_type=agent_type)
+    if code == QUESTION_ANSWER_EXT:
+        question, answer, agent_type = ormsgpack.unpackb(data)
+        return QuestionAnswer(question=question, answer=answer, agent_type=agent_type)
+    if code == OVERWRITE_EXT:
+        return Overwrite(decode_value(data))
+    raise StateCodecError(f"Unknown record type {code}")
+
+
+def encode_value(value: Any) -> bytes:
+    """
+    Pack a state value.
+    
+    Args:
+        value: Value built from state types (records, dicts, lists, scalars)
+    
+    Returns:
+        bytes: The packed value
+    
+    Raises:
+        TypeError: If the value holds a type outside the state schema
+    """
+    return ormsgpack.packb(value, default=_pack_record, option=PACK_OPTIONS)
+
+
+def decode_value(data: bytes) -> Any:
+    """Unpack a value packed by encode_value."""
+    return ormsgpack.unpackb(data, ext_hook=_unpack_record, option=ormsgpack.OPT_NON_STR_KEYS)
+
+
+def encode_state(state: InterviewState) -> bytes:
+    """
+    Encode an interview state.
+    
+    Args:
+        state: State to encode (fields outside the schema are not kept)
+    
+    Returns:
+        bytes: The versioned encoding
+    """
+    fields = STATE_FIELDS[CODEC_VERSION]
+    return MAGIC + bytes([CODEC_VERSION]) + encode_value([state.get(field) for field in fields])
+
+
+def decode_state(data: bytes) -> InterviewState:
+    """
+    Decode an interview state, migrating it from the version it was written with.
+    
+    Args:
+        data: Bytes produced by encode_state
+    
+    Returns:
+        InterviewState: The decoded state
+    
+    Raises:
+        StateCodecError: If the data is not an encoded state or was written
+            by a newer version
+    """
+    if data[:len(MAGIC)] != MAGIC or len(data) <= len(MAGIC):
+        raise StateCodecError("Not an encoded interview state")
+    version = data[len(MAGIC)]
+    if version not in STATE_FIELDS or version > CODEC_VERSION:
+        raise StateCodecError(f"Unsupported interview state version {version} (current is {CODEC_VERSION})")
+    
+    state = dict(zip(STATE_FIELDS[version], decode_value(data[len(MAGIC) + 1:])))
+    for from_version in range(version, CODEC_VERSION):
+        state = MIGRATIONS[from_version](state)
+    return state
+
+
+class StateSerializer:
+    """Checkpoint serializer packing state values with the interview codec."""
+    
+    def __init__(self, fallback=None):
+        """
+        Initialize the serializer.
+        
+        Args:
+            fallback: Serializer for values outside the state schema
+                (defaults to LangGraph's JsonPlusSerializer)
+        """
+        self.fallback = fallback or JsonPlusSerializer()
+    
+    def dumps_typed(self, obj: Any) -> Tuple[str, bytes]:
+        """Serialize a value, returning its type name and bytes."""
+        try:
+            return TYPE_NAME, encode_value(obj)
+        except TypeError:
+            return self.fallback.dumps_typed(obj)
+    
+    def loads_typed(self, data: Tuple[str, bytes]) -> Any:
+        """Deserialize a value serialized by dumps_typed."""
+        type_, payload = data
+        if type_ == TYPE_NAME:
+            return decode_value(payload)
+        return self.fallback.loads_typed(data)
@@ -1,23 +1,127 @@
 """
 State management for the AI Interviewer using LangGraph.
 Defines the state structure for the interview workflow.
+
+The transcript channels are append-only: nodes return only what they add
+(the new message, the new Q&A pair) and the channel reducers merge it into
+the state, so a step never rewrites the whole interview.
 """
-from typing import TypedDict, List, Dict, Literal, Optional
-from pydantic import BaseModel, Field
+import operator
+import uuid
+from typing import Annotated, Any, TypedDict, List, Dict, Literal, Optional, Union
+from langgraph.types import Overwrite
+from pydantic import BaseModel
+
+from src.llm.tokens import empty_usage
+from src.resume.store import get_resume_store
+
+
+AgentType = Literal["technical", "hr", "manager"]
 
+# State channels whose updates are appended
+APPEND_ONLY_CHANNELS = ("conversation_history", "qa_pairs")
+
+
+class Message:
+    """
+    Represents a single message in the interview.
+    
+    A plain slotted record, built on every step without validation; use
+    to_model() for a validated MessageModel at API boundaries.
+    """
+    
+    __slots__ = ("role", "content", "agent_type")
+    
+    def __init__(self, role: Literal["agent", "user"], content: str, agent_type: Optional[AgentType] = None):
+        self.role = role
+        self.content = content
+        self.agent_type = agent_type
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Message):
+            return NotImplemented
+        return (self.role, self.content, self.agent_type) == (other.role, other.content, other.agent_type)
+    
+    def __repr__(self) -> str:
+        return f"Message(role={self.role!r}, content={self.content!r}, agent_type={self.agent_type!r})"
+    
+    def to_model(self) -> "MessageModel":
+        """Get the message as a validated pydantic model."""
+        return MessageModel(role=self.role, content=self.content, agent_type=self.agent_type)
 
-class Message(BaseModel):
-    """Represents a single message in the interview."""
+
+class QuestionAnswer:
+    """
+    Represents a question-answer pair.
+    
+    A plain slotted record; use to_model() for a validated
+    QuestionAnswerModel at API boundaries.
+    """
+    
+    __slots__ = ("question", "answer", "agent_type")
+    
+    def __init__(self, question: str, agent_type: AgentType, answer: Optional[str] = None):
+        self.question = question
+        self.answer = answer
+        self.agent_type = agent_type
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, QuestionAnswer):
+            return NotImplemented
+        return (self.question, self.answer, self.agent_type) == (other.question, other.answer, other.agent_type)
+    
+    def __repr__(self) -> str:
+        return (f"QuestionAnswer(question={self.question!r}, answer={self.answer!r}, "
+                f"agent_type={self.agent_type!r})")
+    
+    def to_model(self) -> "QuestionAnswerModel":
+        """Get the Q&A pair as a validated pydantic model."""
+        return QuestionAnswerModel(question=self.question, answer=self.answer, agent_type=self.agent_type)
+
+
+class MessageModel(BaseModel):
+    """Validated form of a Message, for data crossing an API boundary."""
     role: Literal["agent", "user"]
     content: str
-    agent_type: Optional[Literal["technical", "hr", "manager"]] = None
+    agent_type: Optional[AgentType] = None
+    
+    def to_record(self) -> Message:
+        """Get the message as a state record."""
+        return Message(role=self.role, content=self.content, agent_type=self.agent_type)
 
 
-class QuestionAnswer(BaseModel):
-    """Represents a question-answer pair."""
+class QuestionAnswerModel(BaseModel):
+    """Validated form of a QuestionAnswer, for data crossing an API boundary."""
     question: str
     answer: Optional[str] = None
-    agent_type: Literal["technical", "hr", "manager"]
+    agent_type: AgentType
+    
+    def to_record(self) -> QuestionAnswer:
+        """Get the Q&A pair as a state record."""
+        return QuestionAnswer(question=self.question, answer=self.answer, agent_type=self.agent_type)
+
+
+def merge_assessments(
+    current: List[Optional[Dict]], update: Union[List[Optional[Dict]], Dict[int, Optional[Dict]]]
+) -> List[Optional[Dict]]:
+    """
+    Reducer for answer_assessments.
+    
+    Args:
+        current: Assessments so far
+        update: A list of assessments to append, or a dict of assessments
+            by Q&A index to fill in
+        
+    Returns:
+        list: The merged assessments
+    """
+    if isinstance(update, dict):
+        merged = list(current)
+        for index, assessment in update.items():
+            merged.extend([None] * (index + 1 - len(merged)))
+            merged[index] = assessment
+        return merged
+    return current + update
 
 
 class InterviewState(TypedDict):
@@ -25,42 +129,62 @@ class InterviewState(TypedDict):
     State for the interview workflow.
     
     Attributes:
+        interview_id: Unique identifier for this interview session
         candidate_name: Name of the candidate
         job_role: Job role being interviewed for
         experience_level: Experience level (Junior/Mid-Level/Senior)
         resume_text: Optional resume text extracted from uploaded file
+        candidate_id: Resume store id the resume was loaded from, if any
+        resume_digest: Structured profile summarized from the resume once at
+            interview start (skills, roles, years_experience, projects,
+            education); None until generated, empty if it failed
         current_agent: Current agent conducting the interview
         technical_questions_asked: Number of technical questions asked
         hr_questions_asked: Number of HR questions asked
         manager_questions_asked: Number of manager questions asked
         conversation_history: List of all messages in the interview
-        qa_pairs: List of question-answer pairs
+            (append-only: updates are appended)
+        qa_pairs: List of question-answer pairs (append-only)
         is_complete: Whether the interview is complete
         current_question: The current question being asked
         last_answer: The last answer provided by the candidate
         evaluation: AI-generated evaluation results (score, feedback, etc.)
+        answer_assessments: Per-answer assessments aligned with qa_pairs
+            (None while an assessment is still running in the background;
+            updates are merged by merge_assessments)
+        token_usage: Cumulative LLM token usage of the interview
+            (prompt_tokens, completion_tokens, calls)
+        version: Version of the state in the session store (0 until first
+            saved; see src.sessions)
     """
+    interview_id: str
     candidate_name: str
     job_role: str
     experience_level: str
     resume_text: Optional[str]
+    candidate_id: Optional[str]
+    resume_digest: Optional[Dict]
     current_agent: Literal["technical", "hr", "manager", "complete", "evaluation"]
     technical_questions_asked: int
     hr_questions_asked: int
     manager_questions_asked: int
-    conversation_history: List[Message]
-    qa_pairs: List[QuestionAnswer]
+    conversation_history: Annotated[List[Message], operator.add]
+    qa_pairs: Annotated[List[QuestionAnswer], operator.add]
     is_complete: bool
     current_question: Optional[str]
     last_answer: Optional[str]
     evaluation: Optional[Dict]
+    answer_assessments: Annotated[List[Optional[Dict]], merge_assessments]
+    token_usage: Dict[str, int]
+    version: int
 
 
 def create_initial_state(
     candidate_name: str, 
     job_role: str, 
     experience_level: str,
-    resume_text: Optional[str] = None
+    resume_text: Optional[str] = None,
+    candidate_id: Optional[str] = None
 ) -> InterviewState:
     """
     Create the initial state for an interview.
@@ -70,15 +194,29 @@ def create_initial_state(
         job_role: Job role being interviewed for
         experience_level: Experience level (Junior/Mid-Level/Senior)
         resume_text: Optional resume text extracted from uploaded file
+        candidate_id: Optional id of a resume in the resume store, loaded
+            when resume_text is not given (see src.resume.ingest)
         
     Returns:
         InterviewState: Initial state for the interview
+        
+    Raises:
+        ValueError: If candidate_id is not in the resume store
     """
+    if candidate_id and resume_text is None:
+        record = get_resume_store().get(candidate_id)
+        if record is None:
+            raise ValueError(f"No resume stored for candidate id '{candidate_id}'")
+        resume_text = record["text"]
+    
     return {
+        "interview_id": uuid.uuid4().hex,
         "candidate_name": candidate_name,
         "job_role": job_role,
         "experience_level": experience_level,
         "resume_text": resume_text,
+        "candidate_id": candidate_id,
+        "resume_digest": None,
         "current_agent": "technical",
         "technical_questions_asked": 0,
         "hr_questions_asked": 0,
@@ -89,4 +227,73 @@ def create_initial_state(
         "current_question": None,
         "last_answer": None,
         "evaluation": None,
+        "answer_assessments": [],
+        "token_usage": empty_usage(),
+        "version": 0,
     }
+
+
+def apply_update(state: InterviewState, update: Dict[str, Any]) -> InterviewState:
+    """
+    Apply an update to a state the way the graph's reducers do.
+    
+    Args:
+        state: State to update (left unchanged)
+        update: Update as returned by a node
+        
+    Returns:
+        InterviewState: A new state with the update applied
+    """
+    updated = dict(state)
+    for key, value in update.items():
+        if isinstance(value, Overwrite):
+            updated[key] = value.value
+        elif key in APPEND_ONLY_CHANNELS:
+            updated[key] = state[key] + value
+        elif key == "answer_assessments":
+            updated[key] = merge_assessments(state[key], value)
+        else:
+            updated[key] = value
+    return updated
+
+
+def state_delta(saved: Dict[str, Any], state: InterviewState) -> Dict[str, Any]:
+    """
+    Get the update that turns a saved state into the given one.
+    
+    Appended messages and Q&A pairs are sent on their own, changed
+    assessments by index and other fields only when their value changed.
+    A transcript that no longer extends the saved one replaces it.
+    
+    Args:
+        saved: State as last checkpointed
+        state: State as held by the caller
+        
+    Returns:
+        dict: Update for the graph (empty when nothing changed)
+    """
+    delta: Dict[str, Any] = {}
+    for key, value in state.items():
+        old = saved.get(key)
+        if value is old:
+            continue
+        if key in APPEND_ONLY_CHANNELS:
+            old = old or []
+            if value[:len(old)] != old:
+                delta[key] = Overwrite(value)
+            elif len(value) > len(old):
+                delta[key] = value[len(old):]
+        elif key == "answer_assessments":
+            old = old or []
+            if len(value) < len(old):
+                delta[key] = Overwrite(value)
+            else:
+                changed = {
+                    index: assessment for index, assessment in enumerate(value)
+                    if index >= len(old) or old[index] != assessment
+                }
+                if changed:
+                    delta[key] = changed
+        elif key not in saved or value != old:
+            delta[key] = value
+    return delta
@@ -1,26 +1,198 @@
 """
 LangGraph workflow for orchestrating the AI interview.
 """
-from typing import Dict, Any, Literal
+import asyncio
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, Any, AsyncIterator, Coroutine, Iterator, List, Literal, Optional, Tuple, TypeVar
 from langgraph.graph import StateGraph, END
 from config import settings
 from config.logging_config import get_logger
-from src.agents import TechnicalAgent, HRAgent, ManagerAgent, EvaluationAgent
-from src.graph.state import InterviewState, Message, QuestionAnswer
+from src.agents import TechnicalAgent, HRAgent, ManagerAgent, EvaluationAgent, ResumeDigestAgent
+from src.graph.checkpoint import get_checkpointer
+from src.graph.state import InterviewState, Message, QuestionAnswer, apply_update, state_delta
+from src.llm.tokens import EXHAUSTED, budget_status, get_token_ledger
+from src.prompts.context import ConversationContextBuilder
+from src.resume.retrieval import ResumeRetriever
 
 logger = get_logger(__name__)
 
+# Nodes whose LLM output is a question shown to the candidate
+QUESTION_NODES = ("technical", "hr", "manager")
 
-class InterviewWorkflow:
-    """Manages the interview workflow using LangGraph."""
+# Display names used in log messages
+AGENT_LABELS = {"technical": "Technical", "hr": "HR", "manager": "Manager"}
+
+T = TypeVar("T")
+
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the process-wide event loop for background LLM work and sync callers.
+    
+    The loop runs forever in a daemon thread. Prefetched openers and answer
+    assessments run on it as tasks, so any number can be in flight without
+    a thread each. The workflow is written against the async API; the sync
+    methods submit their async versions to this loop and wait for the result.
+    
+    Returns:
+        asyncio.AbstractEventLoop: Shared running event loop
+    """
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="interview-event-loop", daemon=True).start()
+            _background_loop = loop
+        return _background_loop
+
+
+def _check_not_on_background_loop(work) -> None:
+    """Refuse to block the background loop on work it must run itself."""
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    if running is _background_loop:
+        if asyncio.iscoroutine(work):
+            work.close()
+        raise RuntimeError("Sync workflow methods cannot be called from the workflow's event loop; "
+                           "await the async versions instead")
+
+
+def run_in_background(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine on the background loop and wait for its result.
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        The coroutine's result
+        
+    Raises:
+        RuntimeError: When called from the background loop itself
+    """
+    _check_not_on_background_loop(coro)
+    future = asyncio.run_coroutine_threadsafe(coro, get_background_loop())
+    try:
+        return future.result()
+    except BaseException:
+        # e.g. KeyboardInterrupt in the CLI: don't leave the step running
+        future.cancel()
+        raise
+
+
+def iterate_in_background(aiterator: AsyncIterator[T]) -> Iterator[T]:
+    """
+    Iterate an async iterator on the background loop from sync code.
+    
+    The iterator runs in a single task, so context variables set while it
+    runs (e.g. by LangGraph) stay in scope between items. Closing the
+    returned iterator early cancels the task.
+    
+    Args:
+        aiterator: Async iterator to consume
+        
+    Yields:
+        The items of aiterator
+    """
+    _check_not_on_background_loop(aiterator)
+    items: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+    
+    async def pump():
+        try:
+            async for item in aiterator:
+                items.put(("item", item))
+        except BaseException as e:
+            items.put(("error", e))
+            raise
+        items.put(("end", None))
+    
+    future = asyncio.run_coroutine_threadsafe(pump(), get_background_loop())
+    try:
+        while True:
+            kind, value = items.get()
+            if kind == "end":
+                return
+            if kind == "error":
+                raise value
+            yield value
+    finally:
+        future.cancel()
+
+
+class _Prefetch:
+    """An opener or resume digest being generated ahead of time."""
+    
+    __slots__ = ("future", "started")
     
     def __init__(self):
-        """Initialize the interview workflow."""
+        self.future: Optional[Future] = None
+        # Set once the generation's task is running on the loop
+        self.started = threading.Event()
+    
+    def cancel(self) -> None:
+        """Stop the generation if it is still running."""
+        self.future.cancel()
+
+
+class InterviewWorkflow:
+    """
+    Manages the interview workflow using LangGraph.
+    
+    The workflow holds no per-session state of its own: nodes read the state
+    they are given and return updates, and the per-interview caches are keyed
+    by interview id and locked. One instance (see get_workflow) can therefore
+    serve every session of a process concurrently.
+    
+    The graph's nodes are async. The sync methods (run_step, stream_step,
+    process_answer) run the async versions on the background loop, for
+    callers without an event loop of their own (the CLI and Streamlit).
+    """
+    
+    def __init__(self, checkpointer=None, max_interviews: int = settings.BACKGROUND_MAX_INTERVIEWS):
+        """
+        Initialize the interview workflow.
+        
+        Args:
+            checkpointer: LangGraph checkpointer that saves every step under the
+                interview id (defaults to the shared SQLite checkpointer, or
+                none when settings.CHECKPOINTS_ENABLED is off)
+            max_interviews: Interviews whose prefetched openers and background
+                assessments are kept before the least recent is dropped
+        """
         logger.info("Initializing Interview Workflow")
         self.technical_agent = TechnicalAgent()
         self.hr_agent = HRAgent()
         self.manager_agent = ManagerAgent()
         self.evaluation_agent = EvaluationAgent()
+        self.resume_digest_agent = ResumeDigestAgent()
+        # Resume chunks embedded once per interview, shared by the question agents
+        self.resume_retriever = ResumeRetriever()
+        # Conversation windows rendered incrementally, shared by the question agents
+        self.context_builder = ConversationContextBuilder()
+        for agent in (self.technical_agent, self.hr_agent, self.manager_agent):
+            agent.retriever = self.resume_retriever
+            agent.context_builder = self.context_builder
+        # Opening questions and resume digests being generated ahead of time, per
+        # interview; bounded, since interviews that are never evaluated never
+        # release theirs
+        self.max_interviews = max_interviews
+        self._prefetched_openers: "OrderedDict[str, Dict[str, _Prefetch]]" = OrderedDict()
+        self._prefetched_digests: "OrderedDict[str, _Prefetch]" = OrderedDict()
+        self._prefetch_lock = threading.Lock()
+        # Background answer assessments, per interview and Q&A index
+        self._pending_assessments: "OrderedDict[str, Dict[int, Future]]" = OrderedDict()
+        self._assessment_lock = threading.Lock()
+        # Token usage of every LLM call, per interview
+        self.token_ledger = get_token_ledger()
+        self.checkpointer = checkpointer if checkpointer is not None else get_checkpointer()
         self.graph = self._create_graph()
         logger.info("Interview Workflow initialized successfully")
     
@@ -34,52 +206,35 @@ class InterviewWorkflow:
         # Create the graph
         workflow = StateGraph(InterviewState)
         
-        # Add nodes for each agent
+        # Add nodes for each agent (async; the graph is only run with ainvoke/astream)
         workflow.add_node("technical", self._technical_node)
         workflow.add_node("hr", self._hr_node)
         workflow.add_node("manager", self._manager_node)
         workflow.add_node("evaluation", self._evaluation_node)
-        
-        # Add conditional edges to determine flow
-        workflow.add_conditional_edges(
-            "technical",
-            self._route_from_technical,
-            {
-                "hr": "hr",
-                "continue": "technical",
-                "end": END
-            }
-        )
-        
-        workflow.add_conditional_edges(
-            "hr",
-            self._route_from_hr,
-            {
-                "manager": "manager",
-                "continue": "hr",
-                "end": END
-            }
-        )
-        
-        workflow.add_conditional_edges(
-            "manager",
-            self._route_from_manager,
-            {
-                "evaluation": "evaluation",
-                "continue": "manager",
-                "end": END
-            }
-        )
-        
-        # Evaluation node always ends
+        workflow.add_node("resume_digest", self._resume_digest_node)
+        
+        # Each step enters through the router so exactly one agent node runs,
+        # preceded by the resume digest on the interview's first step
+        routes = {
+            "technical": "technical",
+            "hr": "hr",
+            "manager": "manager",
+            "evaluation": "evaluation",
+            "resume_digest": "resume_digest",
+            "end": END
+        }
+        workflow.set_conditional_entry_point(self._route_entry, routes)
+        workflow.add_conditional_edges("resume_digest", self._route_entry, routes)
+        
+        # Every node ends the step once it has produced its output
+        workflow.add_edge("technical", END)
+        workflow.add_edge("hr", END)
+        workflow.add_edge("manager", END)
         workflow.add_edge("evaluation", END)
         
-        # Set entry point
-        workflow.set_entry_point("technical")
-        
-        return workflow.compile()
+        return workflow.compile(checkpointer=self.checkpointer)
     
-    def _technical_node(self, state: InterviewState) -> InterviewState:
+    async def _technical_node(self, state: InterviewState) -> Dict[str, Any]:
         """
         Technical agent node - asks technical questions.
         
@@ -87,94 +242,319 @@ class InterviewWorkflow:
             state: Current interview state
             
         Returns:
-            InterviewState: Updated state
+            dict: State update with the new question
+        """
+        return await self._question_node(state, "technical", self.technical_agent)
+    
+    async def _hr_node(self, state: InterviewState) -> Dict[str, Any]:
         """
-        logger.info("Technical Agent: Generating question")
-        logger.debug(f"Current state - Questions asked: {state['technical_questions_asked']}")
+        HR agent node - asks HR questions.
         
-        # Generate question
-        question = self.technical_agent.ask_question(state)
-        logger.info(f"Technical Agent: Question generated (length: {len(question)} chars)")
+        Args:
+            state: Current interview state
+            
+        Returns:
+            dict: State update with the new question
+        """
+        return await self._question_node(state, "hr", self.hr_agent)
+    
+    async def _manager_node(self, state: InterviewState) -> Dict[str, Any]:
+        """
+        Manager agent node - asks managerial questions.
         
-        # Update state
-        state["current_question"] = question
-        # Don't increment here - we'll increment when answer is processed
+        Args:
+            state: Current interview state
+            
+        Returns:
+            dict: State update with the new question
+        """
+        return await self._question_node(state, "manager", self.manager_agent)
+    
+    async def _question_node(self, state: InterviewState, agent_type: str, agent) -> Dict[str, Any]:
+        """Ask the agent's next question, using a prefetched opener when there is one."""
+        logger.info(f"{AGENT_LABELS[agent_type]} Agent: Generating question")
+        logger.debug(f"Current state - Questions asked: {state[f'{agent_type}_questions_asked']}")
+        question = await self._take_prefetched_opener(state, agent_type)
+        if question is None:
+            question = await agent.aask_question(state)
+        return self._record_question(state, agent_type, question)
+    
+    async def _resume_digest_node(self, state: InterviewState) -> Dict[str, Any]:
+        """
+        Resume digest node - summarizes the resume once at interview start.
         
-        # Add to conversation history
-        message = Message(
-            role="agent",
-            content=question,
-            agent_type="technical"
+        Args:
+            state: Current interview state
+            
+        Returns:
+            dict: State update with the resume digest
+        """
+        digest = await self._take_prefetched_digest(state)
+        if digest is None:
+            try:
+                digest = await self.resume_digest_agent.agenerate_digest(state)
+            except Exception as e:
+                logger.warning(f"Resume digest failed ({e}), prompts will use the raw resume")
+                digest = {}
+        return {"resume_digest": digest, "token_usage": self._token_usage(state)}
+    
+    def _needs_digest(self, state: InterviewState) -> bool:
+        """Check whether the interview has a resume that still needs digesting."""
+        return (
+            settings.RESUME_DIGEST_ENABLED
+            and bool(state.get("resume_text"))
+            and state.get("resume_digest") is None
         )
-        state["conversation_history"].append(message)
+    
+    def prefetch_openers(self, state: InterviewState) -> InterviewState:
+        """
+        Start generating each round's opening question in the background.
+        
+        The opening prompts depend only on the candidate profile and resume,
+        so they can be generated concurrently as soon as the interview is
+        created. The agent nodes use a prefetched opener if it is ready within
+        settings.PREFETCH_WAIT_SECONDS, and generate it live otherwise.
+        When the resume still needs a digest, that is generated first and the
+        openers are built from it.
+        
+        Args:
+            state: Initial interview state
+            
+        Returns:
+            InterviewState: The same state, unchanged
+        """
+        if not settings.PREFETCH_OPENERS or not state.get("interview_id"):
+            return state
+        
+        agents = {
+            "technical": self.technical_agent,
+            "hr": self.hr_agent,
+            "manager": self.manager_agent,
+        }
+        # The agents only read the snapshot; the live state keeps changing
+        snapshot = {
+            **state,
+            "conversation_history": list(state["conversation_history"]),
+            "qa_pairs": list(state["qa_pairs"]),
+        }
+        # Generated as tasks on the background loop, so they never queue for
+        # a thread behind other background work
+        loop = get_background_loop()
+        digest = None
+        if self._needs_digest(state):
+            digest = _Prefetch()
+            digest.future = asyncio.run_coroutine_threadsafe(self._prefetch_digest(snapshot, digest), loop)
+        openers = {}
+        for agent_type, agent in agents.items():
+            if state[f"{agent_type}_questions_asked"] == 0:
+                opener = openers[agent_type] = _Prefetch()
+                opener.future = asyncio.run_coroutine_threadsafe(
+                    self._prefetch_opener(agent, snapshot, digest, opener), loop
+                )
+        with self._prefetch_lock:
+            self._prefetched_openers[state["interview_id"]] = openers
+            self._prefetched_openers.move_to_end(state["interview_id"])
+            if digest is not None:
+                self._prefetched_digests[state["interview_id"]] = digest
+                self._prefetched_digests.move_to_end(state["interview_id"])
+            dropped = self._drop_least_recent(self._prefetched_openers)
+            dropped += self._drop_least_recent(self._prefetched_digests)
+        for prefetch in dropped:
+            prefetch.cancel()
+        logger.info(f"Prefetching {len(openers)} opening questions for interview {state['interview_id']}")
         
         return state
     
-    def _hr_node(self, state: InterviewState) -> InterviewState:
+    async def _prefetch_digest(self, snapshot: InterviewState, prefetch: _Prefetch) -> Dict[str, Any]:
+        """Generate the resume digest from the snapshot."""
+        prefetch.started.set()
+        return await self.resume_digest_agent.agenerate_digest(snapshot)
+    
+    async def _prefetch_opener(
+        self, agent, snapshot: InterviewState, digest: Optional[_Prefetch], prefetch: _Prefetch
+    ) -> str:
+        """Generate an opener from the snapshot, once its resume digest is ready."""
+        prefetch.started.set()
+        if digest is not None:
+            # asyncio.wait doesn't raise, so a cancelled digest is just a missing one
+            await asyncio.wait([asyncio.wrap_future(digest.future)])
+            failed = digest.future.cancelled() or digest.future.exception() is not None
+            snapshot = {**snapshot, "resume_digest": {} if failed else digest.future.result()}
+        return await agent.aask_question(snapshot)
+    
+    async def _wait_for_prefetch(self, prefetch: _Prefetch, label: str) -> Optional[Future]:
         """
-        HR agent node - asks HR questions.
+        Wait a bounded time for a prefetch to finish.
+        
+        A prefetch whose task has not started yet (the loop is backed up) is
+        cancelled, since generating live is no slower; one in flight is given
+        settings.PREFETCH_WAIT_SECONDS before it is cancelled too.
         
         Args:
-            state: Current interview state
+            prefetch: Prefetch to wait for
+            label: What is being prefetched, for log messages
             
         Returns:
-            InterviewState: Updated state
+            Future or None: The finished future, or None when the caller
+            should generate live
         """
-        logger.info("HR Agent: Generating question")
-        logger.debug(f"Current state - Questions asked: {state['hr_questions_asked']}")
+        future = prefetch.future
+        if not future.done() and not prefetch.started.is_set():
+            logger.info(f"{label} not started yet, generating live")
+            prefetch.cancel()
+            return None
+        if not future.done():
+            await asyncio.wait([asyncio.wrap_future(future)], timeout=settings.PREFETCH_WAIT_SECONDS)
+        if not future.done():
+            logger.warning(f"{label} not ready after {settings.PREFETCH_WAIT_SECONDS}s, generating live")
+            prefetch.cancel()
+            return None
+        if future.cancelled():
+            return None
+        return future
+    
+    def _pop_prefetched_digest(self, state: InterviewState) -> Optional[_Prefetch]:
+        """Remove and return the prefetched resume digest, if any."""
+        with self._prefetch_lock:
+            return self._prefetched_digests.pop(state.get("interview_id"), None)
+    
+    async def _take_prefetched_digest(self, state: InterviewState) -> Optional[Dict[str, Any]]:
+        """
+        Get the prefetched resume digest, waiting a bounded time if necessary.
         
-        # Generate question
-        question = self.hr_agent.ask_question(state)
-        logger.info(f"HR Agent: Question generated (length: {len(question)} chars)")
+        Returns None when nothing was prefetched or it was not ready in time.
+        A failed prefetch gives an empty digest, matching what the prefetched
+        openers were built from.
+        """
+        prefetch = self._pop_prefetched_digest(state)
+        if prefetch is None:
+            return None
+        future = await self._wait_for_prefetch(prefetch, "Prefetched resume digest")
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            logger.warning(f"Prefetched resume digest failed ({e}), prompts will use the raw resume")
+            return {}
+    
+    def _pop_prefetched_opener(self, state: InterviewState, agent_type: str) -> Optional[_Prefetch]:
+        """Remove and return the prefetched opener for an agent, if any."""
+        if state[f"{agent_type}_questions_asked"] != 0:
+            return None
+        with self._prefetch_lock:
+            openers = self._prefetched_openers.get(state.get("interview_id"))
+            if not openers:
+                return None
+            opener = openers.pop(agent_type, None)
+            if not openers:
+                del self._prefetched_openers[state["interview_id"]]
+        return opener
+    
+    async def _take_prefetched_opener(self, state: InterviewState, agent_type: str) -> Optional[str]:
+        """
+        Get the prefetched opening question for an agent.
         
-        # Update state
-        state["current_question"] = question
-        # Don't increment here - we'll increment when answer is processed
-        state["current_agent"] = "hr"
+        Waits a bounded time for an opener that is still being generated.
+        Returns None when nothing was prefetched, it was not ready in time or
+        the prefetch failed, so the caller falls back to generating the
+        question live.
+        """
+        prefetch = self._pop_prefetched_opener(state, agent_type)
+        if prefetch is None:
+            return None
+        future = await self._wait_for_prefetch(prefetch, f"{AGENT_LABELS[agent_type]} Agent: Prefetched opener")
+        if future is None:
+            return None
+        try:
+            question = future.result()
+        except Exception as e:
+            logger.warning(f"{AGENT_LABELS[agent_type]} Agent: Prefetched opener failed ({e}), generating live")
+            return None
+        logger.info(f"{AGENT_LABELS[agent_type]} Agent: Using prefetched opening question")
+        return question
+    
+    def _drop_least_recent(self, futures_by_interview: "OrderedDict[str, Any]") -> List[Any]:
+        """
+        Drop the least recent interviews beyond max_interviews.
         
-        # Add to conversation history
-        message = Message(
-            role="agent",
-            content=question,
-            agent_type="hr"
-        )
-        state["conversation_history"].append(message)
+        The caller holds the map's lock and cancels the returned futures and
+        prefetches. A
+        dropped opener is generated live and a dropped assessment is redone
+        by the evaluation, so nothing is lost but the head start.
         
-        return state
+        Returns:
+            list: Futures and prefetches of the dropped interviews
+        """
+        dropped = []
+        while len(futures_by_interview) > self.max_interviews:
+            interview_id, entry = futures_by_interview.popitem(last=False)
+            dropped.extend(entry.values() if isinstance(entry, dict) else [entry])
+            logger.debug(f"Dropped background work of interview {interview_id}")
+        return dropped
     
-    def _manager_node(self, state: InterviewState) -> InterviewState:
+    def discard(self, interview_id: str) -> None:
         """
-        Manager agent node - asks managerial questions.
+        Drop everything the workflow holds for an interview.
+        
+        Cancels its prefetched openers and background assessments and forgets
+        its resume index, conversation window and token totals. Runs when an
+        interview is evaluated; front ends call it for interviews they abandon.
+        
+        Args:
+            interview_id: Id of the interview
+        """
+        with self._prefetch_lock:
+            futures = list(self._prefetched_openers.pop(interview_id, {}).values())
+            digest = self._prefetched_digests.pop(interview_id, None)
+        with self._assessment_lock:
+            futures.extend(self._pending_assessments.pop(interview_id, {}).values())
+        if digest is not None:
+            futures.append(digest)
+        for future in futures:
+            future.cancel()
+        state = {"interview_id": interview_id}
+        self.resume_retriever.discard(state)
+        self.context_builder.discard(state)
+        self.token_ledger.discard(interview_id)
+    
+    def _record_question(
+        self, state: InterviewState, agent_type: str, question: str
+    ) -> Dict[str, Any]:
+        """
+        Build the state update for a generated question.
         
         Args:
             state: Current interview state
+            agent_type: Agent that asked the question
+            question: Generated question
             
         Returns:
-            InterviewState: Updated state
+            dict: State update with the question appended to the history
         """
-        logger.info("Manager Agent: Generating question")
-        logger.debug(f"Current state - Questions asked: {state['manager_questions_asked']}")
-        
-        # Generate question
-        question = self.manager_agent.ask_question(state)
-        logger.info(f"Manager Agent: Question generated (length: {len(question)} chars)")
-        
-        # Update state
-        state["current_question"] = question
-        # Don't increment here - we'll increment when answer is processed
-        state["current_agent"] = "manager"
+        logger.info(f"{AGENT_LABELS[agent_type]} Agent: Question generated (length: {len(question)} chars)")
         
         # Add to conversation history
         message = Message(
             role="agent",
             content=question,
-            agent_type="manager"
+            agent_type=agent_type
         )
-        state["conversation_history"].append(message)
-        
-        return state
+        # Don't increment the counter here - we'll increment when the answer is processed
+        return {
+            "current_question": question,
+            "current_agent": agent_type,
+            "conversation_history": [message],
+            "token_usage": self._token_usage(state),
+        }
+        
+    def _token_usage(self, state: InterviewState) -> Dict[str, int]:
+        """Get the interview's token usage from the ledger, seeded from the state."""
+        if not state.get("interview_id"):
+            return state.get("token_usage")
+        return self.token_ledger.sync(state["interview_id"], state.get("token_usage"))
     
-    def _evaluation_node(self, state: InterviewState) -> InterviewState:
+    async def _evaluation_node(self, state: InterviewState) -> Dict[str, Any]:
         """
         Evaluation node - generates comprehensive feedback.
         
@@ -182,126 +562,229 @@ class InterviewWorkflow:
             state: Current interview state
             
         Returns:
-            InterviewState: Updated state with evaluation
+            dict: State update with the evaluation
         """
         logger.info("Evaluation Agent: Starting interview evaluation")
-        total_qa_pairs = len(state.get('qa_pairs', []))
-        logger.debug(f"Evaluating {total_qa_pairs} Q&A pairs")
+        logger.debug(f"Evaluating {len(state.get('qa_pairs', []))} Q&A pairs")
+        # Assessments are collected into a copy; the graph merges them from the update
+        state = {**state, "answer_assessments": list(state["answer_assessments"])}
+        collected = await self._acollect_assessments(state)
+        evaluation = await self.evaluation_agent.agenerate_evaluation(state)
+        return self._record_evaluation(state, evaluation, collected)
+    
+    def _submit_assessment(self, state: InterviewState, index: int) -> None:
+        """
+        Start assessing a Q&A pair in the background.
+        
+        Args:
+            state: Current interview state
+            index: Index of the Q&A pair in state["qa_pairs"]
+        """
+        # Only the candidate profile is needed to assess a single answer
+        profile = {
+            "interview_id": state["interview_id"],
+            "candidate_name": state["candidate_name"],
+            "job_role": state["job_role"],
+            "experience_level": state["experience_level"],
+        }
+        future = asyncio.run_coroutine_threadsafe(
+            self.evaluation_agent.aassess_answer(profile, state["qa_pairs"][index]), get_background_loop()
+        )
+        with self._assessment_lock:
+            self._pending_assessments.setdefault(state["interview_id"], {})[index] = future
+            self._pending_assessments.move_to_end(state["interview_id"])
+            dropped = self._drop_least_recent(self._pending_assessments)
+        for dropped_future in dropped:
+            dropped_future.cancel()
+        logger.debug(f"Assessing answer {index + 1} in the background")
+    
+    def _collect_assessments(self, state: InterviewState, wait: bool = False) -> Dict[int, Optional[Dict]]:
+        """
+        Move finished background assessments into the state.
         
-        # Generate evaluation using the evaluation agent
-        evaluation = self.evaluation_agent.generate_evaluation(state)
+        Args:
+            state: Current interview state
+            wait: Wait for assessments that are still running
+            
+        Returns:
+            dict: The collected assessments by Q&A index
+        """
+        with self._assessment_lock:
+            pending = self._pending_assessments.get(state.get("interview_id"), {})
+            futures = [
+                (index, future) for index, future in pending.items()
+                if wait or future.done()
+            ]
+            for index, _ in futures:
+                del pending[index]
+            if not pending:
+                self._pending_assessments.pop(state.get("interview_id"), None)
+        
+        if wait and futures:
+            logger.info(f"Waiting for {sum(not f.done() for _, f in futures)} background assessments")
+        collected = {}
+        for index, future in futures:
+            try:
+                collected[index] = state["answer_assessments"][index] = future.result()
+            except Exception as e:
+                # Left as None so the evaluation agent assesses it again
+                logger.warning(f"Background assessment of answer {index + 1} failed: {e}")
+        return collected
+    
+    async def _acollect_assessments(self, state: InterviewState) -> Dict[int, Optional[Dict]]:
+        """Async version of _collect_assessments(state, wait=True)."""
+        with self._assessment_lock:
+            futures = self._pending_assessments.get(state.get("interview_id"), {})
+            running = [future for future in futures.values() if not future.done()]
+        if running:
+            logger.info(f"Waiting for {len(running)} background assessments")
+            await asyncio.wait([asyncio.wrap_future(future) for future in running])
+        return self._collect_assessments(state, wait=True)
+    
+    def _record_evaluation(
+        self, state: InterviewState, evaluation: Dict[str, Any], assessments: Dict[int, Optional[Dict]]
+    ) -> Dict[str, Any]:
+        """
+        Build the state update that records the evaluation and completes the interview.
         
+        Args:
+            state: Current interview state
+            evaluation: Parsed evaluation results
+            assessments: Background assessments collected for the evaluation
+            
+        Returns:
+            dict: State update with the evaluation
+        """
         score = evaluation.get('score', 0)
         logger.info(f"Evaluation Agent: Completed - Score: {score}/100")
         logger.debug(f"Evaluation details - Strengths: {len(evaluation.get('strengths', []))}, "
                     f"Weaknesses: {len(evaluation.get('weaknesses', []))}, "
                     f"Suggestions: {len(evaluation.get('suggestions', []))}")
         
-        # Update state
-        state["evaluation"] = evaluation
-        state["is_complete"] = True
-        state["current_agent"] = "evaluation"
-        
-        return state
+        token_usage = self._token_usage(state)
+        self.discard(state.get("interview_id"))
+        
+        update = {
+            "evaluation": evaluation,
+            "is_complete": True,
+            "current_agent": "evaluation",
+            "token_usage": token_usage,
+        }
+        if assessments:
+            update["answer_assessments"] = assessments
+        return update
     
-    def _route_from_technical(
+    def _route_entry(
         self, state: InterviewState
-    ) -> Literal["hr", "continue", "end"]:
+    ) -> Literal["technical", "hr", "manager", "evaluation", "resume_digest", "end"]:
         """
-        Determine routing after technical questions.
+        Determine which node should run for this step.
+        
+        The interview resumes from the round given by the per-round
+        counters, so earlier rounds never run again once they are complete.
         
         Args:
             state: Current interview state
             
         Returns:
-            str: Next node to visit
+            str: Node to visit
         """
-        # If we've asked all technical questions, move to HR
-        if state["technical_questions_asked"] >= settings.MAX_TECHNICAL_QUESTIONS:
-            logger.info(f"Technical round complete ({state['technical_questions_asked']} questions) - Moving to HR")
-            return "hr"
+        # Nothing to do once the interview has been evaluated
+        if state["is_complete"]:
+            logger.debug("Interview already complete - nothing to run")
+            return "end"
         
-        # If we just asked a question (current_question is set), stop here
+        # If a question is already pending, wait for the answer
         if state.get("current_question"):
-            logger.debug("Technical Agent: Question ready, waiting for answer")
+            logger.debug(f"{state['current_agent']} question pending, waiting for answer")
             return "end"
         
-        # Otherwise continue with technical questions
-        logger.debug("Technical Agent: Continuing with more questions")
-        return "continue"
+        # Summarize the resume once before the first question that uses it
+        if self._needs_digest(state):
+            return "resume_digest"
+        
+        next_node = self.next_agent(state)
+        if next_node != state["current_agent"]:
+            logger.info(f"Moving from {state['current_agent']} to {next_node}")
+        
+        return next_node
     
-    def _route_from_hr(
+    def next_agent(
         self, state: InterviewState
-    ) -> Literal["manager", "continue", "end"]:
+    ) -> Literal["technical", "hr", "manager", "evaluation"]:
         """
-        Determine routing after HR questions.
+        Determine which agent asks the next question.
         
         Args:
             state: Current interview state
             
         Returns:
-            str: Next node to visit
+            str: Agent type for the next question, or "evaluation" when all
+            rounds are complete or the interview's token budget is spent
         """
-        # If we've asked all HR questions, move to Manager
-        if state["hr_questions_asked"] >= settings.MAX_HR_QUESTIONS:
-            logger.info(f"HR round complete ({state['hr_questions_asked']} questions) - Moving to Manager")
+        if state.get("interview_id"):
+            usage = self.token_ledger.sync(state["interview_id"], state.get("token_usage"))
+            if budget_status(usage) == EXHAUSTED:
+                logger.warning(f"Interview {state['interview_id']} has spent its token budget "
+                               f"({usage['prompt_tokens'] + usage['completion_tokens']} tokens), "
+                               f"skipping to evaluation")
+                return "evaluation"
+        if state["technical_questions_asked"] < settings.MAX_TECHNICAL_QUESTIONS:
+            return "technical"
+        if state["hr_questions_asked"] < settings.MAX_HR_QUESTIONS:
+            return "hr"
+        if state["manager_questions_asked"] < settings.MAX_MANAGER_QUESTIONS:
             return "manager"
-        
-        # If we just asked a question (current_question is set), stop here
-        if state.get("current_question"):
-            logger.debug("HR Agent: Question ready, waiting for answer")
-            return "end"
-        
-        # Otherwise continue with HR questions
-        logger.debug("HR Agent: Continuing with more questions")
-        return "continue"
+        return "evaluation"
     
-    def _route_from_manager(
-        self, state: InterviewState
-    ) -> Literal["evaluation", "continue", "end"]:
+    def process_answer(
+        self, state: InterviewState, answer: str, wait_for_assessment: bool = False
+    ) -> InterviewState:
         """
-        Determine routing after manager questions.
+        Process a candidate's answer.
+        
+        In incremental mode the answer is assessed in the background, and
+        the result is merged into a later state by this workflow. Processes
+        that share interviews with other workers should wait for it instead:
+        an assessment still running here is invisible to a worker that
+        evaluates the interview, which would assess the answer again.
         
         Args:
-            state: Current interview state
+            state: Current interview state (left unchanged)
+            answer: Candidate's answer
+            wait_for_assessment: Wait for the answer's assessment and include
+                it, and its tokens, in the returned state
             
         Returns:
-            str: Next node to visit
+            InterviewState: New state with the answer recorded
         """
-        # If we've asked all manager questions, go to evaluation
-        if state["manager_questions_asked"] >= settings.MAX_MANAGER_QUESTIONS:
-            logger.info(f"Manager round complete ({state['manager_questions_asked']} questions) - Moving to Evaluation")
-            return "evaluation"
-        
-        # If we just asked a question (current_question is set), stop here
-        if state.get("current_question"):
-            logger.debug("Manager Agent: Question ready, waiting for answer")
-            return "end"
-        
-        # Otherwise continue with manager questions
-        logger.debug("Manager Agent: Continuing with more questions")
-        return "continue"
+        return run_in_background(self.aprocess_answer(state, answer, wait_for_assessment))
     
-    def process_answer(self, state: InterviewState, answer: str) -> InterviewState:
+    async def aprocess_answer(
+        self, state: InterviewState, answer: str, wait_for_assessment: bool = False
+    ) -> InterviewState:
         """
-        Process a candidate's answer and update state.
+        Async version of process_answer; the checkpoint write doesn't block the loop.
         
         Args:
-            state: Current interview state
+            state: Current interview state (left unchanged)
             answer: Candidate's answer
+            wait_for_assessment: Wait for the answer's assessment and include
+                it, and its tokens, in the returned state
             
         Returns:
-            InterviewState: Updated state
+            InterviewState: New state with the answer recorded
         """
         logger.info(f"Processing answer for {state['current_agent']} agent (length: {len(answer)} chars)")
         
-        # Add answer to conversation history
+        # Add answer to conversation history, clear the current question so a
+        # new one will be generated, and set the last answer for routing
         message = Message(
             role="user",
             content=answer,
             agent_type=None
         )
-        state["conversation_history"].append(message)
+        update = {"conversation_history": [message], "current_question": None, "last_answer": answer}
         
         # Create QA pair and increment question count
         if state["current_question"]:
@@ -310,26 +793,87 @@ class InterviewWorkflow:
                 answer=answer,
                 agent_type=state["current_agent"]
             )
-            state["qa_pairs"].append(qa_pair)
+            index = len(state["qa_pairs"])
+            update["qa_pairs"] = [qa_pair]
+            update["answer_assessments"] = {index: None}
             
             # Increment the appropriate counter based on current agent
-            if state["current_agent"] == "technical":
-                state["technical_questions_asked"] += 1
-                logger.debug(f"Technical questions answered: {state['technical_questions_asked']}")
-            elif state["current_agent"] == "hr":
-                state["hr_questions_asked"] += 1
-                logger.debug(f"HR questions answered: {state['hr_questions_asked']}")
-            elif state["current_agent"] == "manager":
-                state["manager_questions_asked"] += 1
-                logger.debug(f"Manager questions answered: {state['manager_questions_asked']}")
-        
-        # Clear current question so a new one will be generated
-        state["current_question"] = None
-        
-        # Set last answer for routing
-        state["last_answer"] = answer
+            if state["current_agent"] in AGENT_LABELS:
+                counter = f"{state['current_agent']}_questions_asked"
+                update[counter] = state[counter] + 1
+                logger.debug(f"{AGENT_LABELS[state['current_agent']]} questions answered: {update[counter]}")
         
-        return state
+        updated = apply_update(state, update)
+        if state["current_question"]:
+            # Assess the answer while the candidate reads the next question
+            if settings.EVALUATION_MODE == "incremental":
+                self._submit_assessment(updated, index)
+            if wait_for_assessment:
+                collected = await self._acollect_assessments(updated)
+            else:
+                collected = self._collect_assessments(updated)
+            update["answer_assessments"].update(collected)
+            updated["token_usage"] = update["token_usage"] = self._token_usage(updated)
+        
+        await self._save_update(updated, update)
+        return updated
+    
+    def _config(self, interview_id: str) -> Dict[str, Any]:
+        """Graph config that checkpoints under the interview id."""
+        return {"configurable": {"thread_id": interview_id}}
+    
+    async def _save_update(self, state: InterviewState, update: Dict[str, Any]) -> None:
+        """Checkpoint an update made outside the graph (only its delta is written)."""
+        if self.checkpointer is None or not state.get("interview_id"):
+            return
+        config = self._config(state["interview_id"])
+        if await self.checkpointer.aget_tuple(config) is None:
+            # Never stepped through the graph: the whole state seeds the thread
+            update = state
+        await self.graph.aupdate_state(config, update)
+    
+    async def _step_input(self, state: InterviewState) -> Dict[str, Any]:
+        """
+        Get the graph input for a step.
+        
+        Without a checkpointer each step starts from the caller's state. With
+        one, the graph resumes from the interview's checkpoint, so only what
+        the caller changed since (usually nothing) is sent; sending the whole
+        state would append the transcript to itself.
+        
+        Args:
+            state: Current interview state
+            
+        Returns:
+            dict: Graph input for the step
+        """
+        if self.checkpointer is None:
+            return state
+        saved = await self.checkpointer.aget_tuple(self._config(state["interview_id"]))
+        if saved is None:
+            return state
+        return state_delta(saved.checkpoint["channel_values"], state)
+    
+    def load_state(self, interview_id: str) -> Optional[InterviewState]:
+        """
+        Load an interview from its latest checkpoint.
+        
+        Background work (prefetched openers, pending answer assessments) is
+        not restored; the interview regenerates whatever it still needs.
+        
+        Args:
+            interview_id: Id of the interview to resume
+            
+        Returns:
+            InterviewState or None if the interview was never checkpointed
+        """
+        if self.checkpointer is None:
+            return None
+        values = self.graph.get_state(self._config(interview_id)).values
+        if not values:
+            return None
+        logger.info(f"Resuming interview {interview_id}")
+        return values
     
     def run_step(self, state: InterviewState) -> InterviewState:
         """
@@ -341,6 +885,85 @@ class InterviewWorkflow:
         Returns:
             InterviewState: Updated state after one step
         """
-        # Invoke the graph for one step
-        result = self.graph.invoke(state)
-        return result
+        return run_in_background(self.arun_step(state))
+    
+    async def arun_step(self, state: InterviewState) -> InterviewState:
+        """
+        Run one step of the interview workflow without blocking a thread.
+        
+        Args:
+            state: Current interview state
+            
+        Returns:
+            InterviewState: Updated state after one step
+        """
+        # Invoke the graph for one step; nothing is returned when no node ran
+        result = await self.graph.ainvoke(await self._step_input(state), self._config(state["interview_id"]))
+        return result or state
+    
+    def stream_step(self, state: InterviewState) -> Iterator[Tuple[str, Any]]:
+        """
+        Run one step of the interview workflow, streaming the question text.
+        
+        Question tokens are yielded as the agent generates them; the updated
+        state is only yielded once the step has finished, so nothing is
+        committed to InterviewState until the stream ends.
+        
+        Args:
+            state: Current interview state
+            
+        Yields:
+            tuple: ("token", str) for each chunk of question text, then
+            ("state", InterviewState) with the updated state
+        """
+        yield from iterate_in_background(self.astream_step(state))
+    
+    async def astream_step(self, state: InterviewState) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Async version of stream_step.
+        
+        Args:
+            state: Current interview state
+            
+        Yields:
+            tuple: ("token", str) for each chunk of question text, then
+            ("state", InterviewState) with the updated state
+        """
+        final_state = state
+        streamed = False
+        
+        async for mode, payload in self.graph.astream(
+            await self._step_input(state), self._config(state["interview_id"]), stream_mode=["messages", "values"]
+        ):
+            if mode == "messages":
+                chunk, metadata = payload
+                if metadata.get("langgraph_node") in QUESTION_NODES and chunk.content:
+                    streamed = True
+                    yield "token", chunk.content
+            else:
+                final_state = payload
+        
+        # A question that was not generated by a streamed LLM call (e.g. one
+        # already pending) is sent in one piece so callers always see it
+        if not streamed and final_state.get("current_question"):
+            yield "token", final_state["current_question"]
+        
+        yield "state", final_state
+
+
+_workflow: Optional[InterviewWorkflow] = None
+_workflow_lock = threading.Lock()
+
+
+def get_workflow() -> InterviewWorkflow:
+    """
+    Get the process-wide interview workflow, compiling it on first use.
+    
+    Returns:
+        InterviewWorkflow: Workflow shared by every session of the process
+    """
+    global _workflow
+    with _workflow_lock:
+        if _workflow is None:
+            _workflow = InterviewWorkflow()
+        return _workflow
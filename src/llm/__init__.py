@@ -0,0 +1,18 @@
+"""LLM call infrastructure shared by all agents."""
+from .cache import LLMResponseCache, get_llm_cache, make_cache_key
+from .rate_limit import RateLimiter, StreamInterruptedError, get_rate_limit_stats, get_rate_limiter
+from .tokens import TokenLedger, count_tokens, get_token_ledger, truncate_to_tokens
+
+__all__ = [
+    "LLMResponseCache",
+    "RateLimiter",
+    "StreamInterruptedError",
+    "TokenLedger",
+    "count_tokens",
+    "get_llm_cache",
+    "get_rate_limit_stats",
+    "get_rate_limiter",
+    "get_token_ledger",
+    "make_cache_key",
+    "truncate_to_tokens",
+]
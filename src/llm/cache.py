@@ -0,0 +1,321 @@
+"""
+Content-addressed cache for LLM responses.
+
+Responses are keyed by a SHA-256 of the deployment, temperature, prompt
+template version and rendered prompt. Entries live in a bounded in-memory
+LRU with a per-entry TTL, and optionally in a SQLite file that survives
+restarts and is shared by every worker process on the machine. The SQLite
+tier drops expired responses and its oldest ones beyond a size bound as
+responses are added.
+
+For temperature > 0 each key keeps a "sample pool" of up to N responses:
+the first N lookups miss (so N distinct completions are collected) and later
+lookups return a random member of the pool, so cached questions don't all
+read the same.
+"""
+import hashlib
+import random
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from config import settings
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Puts between prunes of the SQLite tier when it is below its size bound
+_PRUNE_INTERVAL = 256
+
+
+def make_cache_key(deployment: str, temperature: float, template_version: str, prompt: str) -> str:
+    """
+    Build the content address for a prompt.
+    
+    Args:
+        deployment: Model deployment name
+        temperature: Sampling temperature
+        template_version: Version of the prompt templates
+        prompt: Fully rendered prompt
+        
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for part in (deployment or "", f"{temperature:.4f}", template_version, prompt):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class _Entry:
+    """Cached responses for one key."""
+    
+    __slots__ = ("responses", "expires_at")
+    
+    def __init__(self, responses: List[str], expires_at: Optional[float]):
+        self.responses = responses
+        self.expires_at = expires_at
+    
+    def expired(self, now: float) -> bool:
+        return self.expires_at is not None and now >= self.expires_at
+
+
+class LLMResponseCache:
+    """Thread-safe LRU cache of LLM responses with TTL and an optional SQLite tier."""
+    
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: Optional[float] = None,
+        db_path: Optional[str] = None,
+        sample_pool_size: int = 1,
+        max_disk_entries: int = settings.LLM_CACHE_DB_MAX_ENTRIES,
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum keys held in memory
+            ttl_seconds: Lifetime of an entry (None or 0 for no expiry)
+            db_path: SQLite file for the persistent tier (None for memory only)
+            sample_pool_size: Responses kept per key when temperature > 0
+            max_disk_entries: Responses kept in the SQLite tier
+        """
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.ttl_seconds = ttl_seconds or None
+        self.sample_pool_size = max(1, sample_pool_size)
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        # The LRU and the SQLite tier have separate locks so lookups served
+        # from memory never wait on a disk write; the database lock is
+        # always taken first when both are held
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._disk_rows: Optional[int] = None
+        self._puts_since_prune = 0
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+        self._db = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT NOT NULL, variant INTEGER NOT NULL, response TEXT NOT NULL, "
+                "expires_at REAL, PRIMARY KEY (key, variant))"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS llm_cache_expires_at ON llm_cache (expires_at)")
+            self._db.commit()
+    
+    def pool_size(self, temperature: float) -> int:
+        """Number of responses to collect per key at a given temperature."""
+        return self.sample_pool_size if temperature > 0 else 1
+    
+    def get(self, key: str, temperature: float = 0.0) -> Optional[str]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Cache key from make_cache_key
+            temperature: Sampling temperature the response is for
+            
+        Returns:
+            str or None: A cached response, or None when the caller should
+            generate a new one (nothing cached, expired, or the sample pool
+            is not yet full)
+        """
+        now = time.time()
+        pool_size = self.pool_size(temperature)
+        with self._lock:
+            entry = self._live_entry(key, now)
+            if entry is not None and len(entry.responses) >= pool_size:
+                return self._hit(key, entry, "memory_hits")
+            if self._db is None:
+                self._stats["misses"] += 1
+                return None
+        
+        # Other worker processes may have filled the entry on disk
+        with self._db_lock:
+            stored = self._load(key, now)
+        with self._lock:
+            entry = self._live_entry(key, now)
+            source = "memory_hits"
+            if stored is not None and (entry is None or len(stored.responses) > len(entry.responses)):
+                entry = stored
+                self._store(key, entry)
+                source = "disk_hits"
+            if entry is None or len(entry.responses) < pool_size:
+                self._stats["misses"] += 1
+                return None
+            return self._hit(key, entry, source)
+    
+    def put(self, key: str, response: str, temperature: float = 0.0) -> None:
+        """
+        Add a response to the cache.
+        
+        Args:
+            key: Cache key from make_cache_key
+            response: LLM response text
+            temperature: Sampling temperature the response was generated at
+        """
+        if not response:
+            return
+        now = time.time()
+        pool_size = self.pool_size(temperature)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expired(now):
+                expires_at = now + self.ttl_seconds if self.ttl_seconds else None
+                entry = _Entry([], expires_at)
+            if len(entry.responses) >= pool_size or response in entry.responses:
+                return
+            entry.responses.append(response)
+            self._store(key, entry)
+            expires_at = entry.expires_at
+        
+        if self._db is None:
+            return
+        with self._db_lock:
+            if (
+                self._disk_rows is None
+                or self._disk_rows >= self.max_disk_entries
+                or self._puts_since_prune >= _PRUNE_INTERVAL
+            ):
+                self._prune(now)
+            # The variant is numbered (and the pool checked) in the
+            # statement itself, so processes sharing the file add to the
+            # pool instead of overwriting each other's responses
+            self._disk_rows += self._db.execute(
+                "INSERT OR IGNORE INTO llm_cache (key, variant, response, expires_at) "
+                "SELECT ?, COALESCE(MAX(variant), -1) + 1, ?, ? FROM llm_cache WHERE key = ? "
+                "HAVING COUNT(*) < ? AND COALESCE(SUM(response = ?), 0) = 0",
+                (key, response, expires_at, key, pool_size, response),
+            ).rowcount
+            self._puts_since_prune += 1
+            self._db.commit()
+    
+    def _live_entry(self, key: str, now: float) -> Optional[_Entry]:
+        """Get an unexpired entry from the LRU, dropping an expired one. Lock held."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.expired(now):
+            del self._entries[key]
+            self._stats["expirations"] += 1
+            entry = None
+        return entry
+    
+    def _hit(self, key: str, entry: _Entry, source: str) -> str:
+        """Count a hit and pick a response from the entry. Lock held."""
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        self._stats[source] += 1
+        return random.choice(entry.responses)
+    
+    def _store(self, key: str, entry: _Entry) -> None:
+        """Insert an entry into the LRU, evicting the oldest if full. Lock held."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+    
+    def _prune(self, now: float) -> None:
+        """
+        Delete expired responses, and the oldest down to 90% of max_disk_entries.
+        
+        Runs when the tracked row count reaches the bound, and every
+        _PRUNE_INTERVAL puts to catch expiries and rows added by other
+        processes. Pruning below the bound keeps it from running on every put
+        once the tier is full. Database lock held.
+        """
+        expired = self._db.execute(
+            "DELETE FROM llm_cache WHERE expires_at <= ?", (now,)
+        ).rowcount
+        rows = self._db.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        excess = rows - (self.max_disk_entries - 1 - self.max_disk_entries // 10)
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM llm_cache WHERE rowid IN (SELECT rowid FROM llm_cache ORDER BY rowid LIMIT ?)",
+                (excess,),
+            )
+            rows -= excess
+        self._disk_rows = rows
+        self._puts_since_prune = 0
+        with self._lock:
+            self._stats["expirations"] += expired
+    
+    def _load(self, key: str, now: float) -> Optional[_Entry]:
+        """Read an entry from the SQLite tier. Database lock held."""
+        rows = self._db.execute(
+            "SELECT response, expires_at FROM llm_cache WHERE key = ? ORDER BY variant",
+            (key,),
+        ).fetchall()
+        if not rows:
+            return None
+        expires_at = rows[0][1]
+        if expires_at is not None and now >= expires_at:
+            self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            self._db.commit()
+            with self._lock:
+                self._stats["expirations"] += 1
+            return None
+        return _Entry([response for response, _ in rows], expires_at)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss counters and the current size.
+        
+        Returns:
+            Dict with hits, misses, hit rate, per-tier hits, evictions and size
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+    
+    def clear(self) -> None:
+        """Remove every entry from both tiers."""
+        with self._lock:
+            self._entries.clear()
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute("DELETE FROM llm_cache")
+                self._db.commit()
+                self._disk_rows = 0
+
+
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """
+    Get the process-wide LLM response cache.
+    
+    Returns:
+        LLMResponseCache or None: Shared cache, or None when caching is disabled
+    """
+    global _cache
+    if not settings.LLM_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMResponseCache(
+                max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+                ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+                db_path=settings.LLM_CACHE_DB_PATH,
+                sample_pool_size=settings.LLM_CACHE_SAMPLE_POOL_SIZE,
+            )
+            logger.info(f"LLM response cache enabled (max entries: {settings.LLM_CACHE_MAX_ENTRIES}, "
+                        f"disk tier: {settings.LLM_CACHE_DB_PATH or 'off'})")
+        return _cache
@@ -0,0 +1,429 @@
+"""
+Client-side rate limiting for the chat deployment.
+
+Azure OpenAI enforces a requests-per-minute and a tokens-per-minute quota
+per deployment and answers with 429 once either is exceeded. Every LLM call
+in the process goes through one RateLimiter, which keeps a token bucket for
+each quota (refilled continuously, allowing a burst of BURST_SECONDS worth
+of quota; Azure evaluates the per-minute limits over 1 to 10 second windows,
+so larger bursts are answered with 429):
+
+- A call reserves one request and its estimated tokens before it is sent,
+  waiting in FIFO order until both buckets can cover it.
+- Once the call returns, the reservation is reconciled against the tokens
+  actually used, refunding or charging the difference.
+- 429s, timeouts and 5xx errors are retried with jittered exponential
+  backoff. A Retry-After from the service is honoured, and pauses every
+  caller rather than just the one that was throttled.
+
+Under bursts calls queue up and latency grows instead of interviews failing.
+"""
+import asyncio
+import itertools
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+import openai
+
+from config import settings
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Seconds of quota that may be spent in one burst
+BURST_SECONDS = 1.0
+
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+
+class StreamInterruptedError(Exception):
+    """
+    An LLM call failed after part of its response was streamed.
+    
+    Never retried: the streamed text has already been shown to the
+    candidate, so a retry would show it twice.
+    """
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """
+    Get the delay the service asked for in an error response.
+    
+    Args:
+        error: Exception raised by the OpenAI client
+    
+    Returns:
+        float or None: Seconds from the retry-after-ms or retry-after header
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    for header, scale in (("retry-after-ms", 1000.0), ("retry-after", 1.0)):
+        value = headers.get(header)
+        if value is None:
+            continue
+        try:
+            return max(0.0, float(value) / scale)
+        except ValueError:
+            # HTTP-date form; fall back to our own backoff
+            continue
+    return None
+
+
+class _Bucket:
+    """Token bucket for one per-minute quota (unlimited when the quota is 0)."""
+    
+    __slots__ = ("capacity", "rate", "level", "updated")
+    
+    def __init__(self, per_minute: int, now: float):
+        self.rate = per_minute / 60.0
+        self.capacity = max(1.0, self.rate * BURST_SECONDS) if per_minute > 0 else 0.0
+        self.level = self.capacity
+        self.updated = now
+    
+    @property
+    def unlimited(self) -> bool:
+        return self.rate <= 0
+    
+    def refill(self, now: float) -> None:
+        if not self.unlimited:
+            self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def needed(self, amount: float) -> float:
+        """Amount to take for a reservation (large ones take a full bucket)."""
+        return 0.0 if self.unlimited else min(amount, self.capacity)
+    
+    def delay(self, amount: float) -> float:
+        """Seconds until the bucket holds amount."""
+        missing = self.needed(amount) - self.level
+        return 0.0 if missing <= 0 or self.unlimited else missing / self.rate
+
+
+class Reservation:
+    """Quota held by one LLM call."""
+    
+    __slots__ = ("tokens", "waited")
+    
+    def __init__(self, tokens: int, waited: float):
+        self.tokens = tokens
+        self.waited = waited
+
+
+class RateLimiter:
+    """Thread-safe FIFO limiter for requests and tokens per minute, usable from async code."""
+    
+    def __init__(
+        self,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        max_retries: int = 6,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+    ):
+        """
+        Initialize the limiter.
+        
+        Args:
+            requests_per_minute: Request quota (0 for no limit)
+            tokens_per_minute: Token quota (0 for no limit)
+            max_retries: Retries of a failed call before giving up
+            base_delay: Backoff before the first retry, doubled for each retry
+            max_delay: Upper bound of the exponential backoff
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        now = time.monotonic()
+        self._requests = _Bucket(requests_per_minute, now)
+        self._tokens = _Bucket(tokens_per_minute, now)
+        self._cond = threading.Condition()
+        # Callers are served in ticket order; abandoned tickets are skipped
+        self._next_ticket = 0
+        self._serving = 0
+        self._abandoned = set()
+        # Async callers sleeping until woken, by ticket: (their loop, event)
+        self._waiters: Dict[int, Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = {}
+        # Set from Retry-After: nobody is admitted before this time
+        self._paused_until = 0.0
+        self._stats = {
+            "calls": 0,
+            "max_queue_depth": 0,
+            "total_wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+            "retries": 0,
+            "rate_limited": 0,
+            "failures": 0,
+            "reserved_tokens": 0,
+            "used_tokens": 0,
+        }
+    
+    def _join_queue(self) -> int:
+        """Take a ticket (lock held)."""
+        ticket = self._next_ticket
+        self._next_ticket += 1
+        depth = self._next_ticket - self._serving - len(self._abandoned)
+        self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], depth)
+        return ticket
+    
+    def _advance(self) -> None:
+        """Serve the next ticket (lock held)."""
+        self._serving += 1
+        while self._serving in self._abandoned:
+            self._abandoned.remove(self._serving)
+            self._serving += 1
+        self._notify()
+    
+    def _notify(self) -> None:
+        """
+        Wake the callers waiting for quota or their turn (lock held).
+        
+        Threads wait on the condition. Only the async caller at the head of
+        the queue can be admitted, so only that one is woken.
+        """
+        self._cond.notify_all()
+        waiter = self._waiters.get(self._serving)
+        if waiter is not None:
+            loop, wakeup = waiter
+            loop.call_soon_threadsafe(wakeup.set)
+    
+    def _leave_queue(self, ticket: int) -> None:
+        """Give up a ticket that was never served (lock held)."""
+        if ticket == self._serving:
+            self._advance()
+        elif ticket > self._serving:
+            self._abandoned.add(ticket)
+    
+    def _try_acquire(self, ticket: int, tokens: int) -> Optional[float]:
+        """
+        Take quota for a ticket if it is its turn and the quota is there (lock held).
+        
+        Returns:
+            None once acquired, else the seconds to wait before trying again
+            (0 when the caller should wait for its turn)
+        """
+        if ticket != self._serving:
+            return 0.0
+        now = time.monotonic()
+        self._requests.refill(now)
+        self._tokens.refill(now)
+        delay = max(self._paused_until - now, self._requests.delay(1), self._tokens.delay(tokens))
+        if delay > 0:
+            return delay
+        self._requests.level -= self._requests.needed(1)
+        self._tokens.level -= self._tokens.needed(tokens)
+        self._advance()
+        return None
+    
+    def _admitted(self, tokens: int, started: float) -> Reservation:
+        """Record an acquired reservation (lock held)."""
+        waited = time.monotonic() - started
+        self._stats["calls"] += 1
+        self._stats["reserved_tokens"] += tokens
+        self._stats["total_wait_seconds"] += waited
+        self._stats["max_wait_seconds"] = max(self._stats["max_wait_seconds"], waited)
+        return Reservation(tokens, waited)
+    
+    def acquire(self, estimated_tokens: int) -> Reservation:
+        """
+        Wait until a call of estimated_tokens fits in the quota and reserve it.
+        
+        Args:
+            estimated_tokens: Prompt tokens plus expected completion tokens
+        
+        Returns:
+            Reservation: To be passed to reconcile once the call returns
+        """
+        started = time.monotonic()
+        with self._cond:
+            ticket = self._join_queue()
+            try:
+                while True:
+                    delay = self._try_acquire(ticket, estimated_tokens)
+                    if delay is None:
+                        return self._admitted(estimated_tokens, started)
+                    self._cond.wait(delay or None)
+            except BaseException:
+                self._leave_queue(ticket)
+                raise
+    
+    async def aacquire(self, estimated_tokens: int) -> Reservation:
+        """
+        Async version of acquire; waits without blocking the event loop.
+        
+        A caller behind others in the queue sleeps until woken at its turn;
+        the head of the queue sleeps until the quota refills or the
+        Retry-After pause ends, or until a refund wakes it earlier.
+        """
+        started = time.monotonic()
+        loop = asyncio.get_running_loop()
+        with self._cond:
+            ticket = self._join_queue()
+        try:
+            while True:
+                with self._cond:
+                    delay = self._try_acquire(ticket, estimated_tokens)
+                    if delay is None:
+                        return self._admitted(estimated_tokens, started)
+                    # Registered under the lock, so a wakeup is never missed
+                    wakeup = asyncio.Event()
+                    self._waiters[ticket] = (loop, wakeup)
+                timer = loop.call_later(delay, wakeup.set) if delay else None
+                try:
+                    await wakeup.wait()
+                finally:
+                    if timer is not None:
+                        timer.cancel()
+                    with self._cond:
+                        self._waiters.pop(ticket, None)
+        except BaseException:
+            with self._cond:
+                self._leave_queue(ticket)
+            raise
+    
+    def reconcile(self, reservation: Reservation, used_tokens: int) -> None:
+        """
+        Settle a reservation against the tokens the call actually used.
+        
+        Args:
+            reservation: Reservation returned by acquire
+            used_tokens: Prompt plus completion tokens used (0 if the call failed)
+        """
+        with self._cond:
+            self._stats["used_tokens"] += used_tokens
+            if self._tokens.unlimited:
+                return
+            # Overuse leaves the bucket in debt, delaying the next callers
+            self._tokens.level = min(
+                self._tokens.capacity,
+                self._tokens.level + self._tokens.needed(reservation.tokens) - used_tokens
+            )
+            self._notify()
+    
+    def retry_delay(self, error: BaseException, attempt: int) -> Optional[float]:
+        """
+        Decide whether and when a failed call should be retried.
+        
+        Args:
+            error: Exception raised by the call
+            attempt: Number of retries already made
+        
+        Returns:
+            float or None: Seconds to wait before retrying, or None to give up
+        """
+        if not isinstance(error, RETRYABLE_ERRORS):
+            return None
+        with self._cond:
+            if attempt >= self.max_retries:
+                self._stats["failures"] += 1
+                return None
+            self._stats["retries"] += 1
+            if isinstance(error, openai.RateLimitError):
+                self._stats["rate_limited"] += 1
+            retry_after = retry_after_seconds(error)
+            if retry_after is not None:
+                # The deployment is saturated: hold back every caller, not just this one
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+                self._notify()
+                return retry_after + random.uniform(0, self.base_delay)
+        backoff = min(self.max_delay, self.base_delay * 2 ** attempt)
+        return backoff / 2 + random.uniform(0, backoff / 2)
+    
+    def run(self, call: Callable[[], T], estimated_tokens: int, measure: Callable[[T], int]) -> T:
+        """
+        Make a rate-limited call, retrying it when it is throttled.
+        
+        Args:
+            call: Function making the LLM request
+            estimated_tokens: Tokens to reserve for the call
+            measure: Function giving the tokens a result actually used
+        
+        Returns:
+            The result of call
+        """
+        for attempt in itertools.count():
+            reservation = self.acquire(estimated_tokens)
+            try:
+                result = call()
+            except Exception as e:
+                self.reconcile(reservation, 0)
+                delay = self.retry_delay(e, attempt)
+                if delay is None:
+                    raise
+                logger.warning(f"LLM call failed ({type(e).__name__}), retrying in {delay:.1f}s "
+                               f"(retry {attempt + 1}/{self.max_retries})")
+                time.sleep(delay)
+                continue
+            self.reconcile(reservation, measure(result))
+            return result
+    
+    async def arun(
+        self, call: Callable[[], Awaitable[T]], estimated_tokens: int, measure: Callable[[T], int]
+    ) -> T:
+        """Async version of run."""
+        for attempt in itertools.count():
+            reservation = await self.aacquire(estimated_tokens)
+            try:
+                result = await call()
+            except Exception as e:
+                self.reconcile(reservation, 0)
+                delay = self.retry_delay(e, attempt)
+                if delay is None:
+                    raise
+                logger.warning(f"LLM call failed ({type(e).__name__}), retrying in {delay:.1f}s "
+                               f"(retry {attempt + 1}/{self.max_retries})")
+                await asyncio.sleep(delay)
+                continue
+            self.reconcile(reservation, measure(result))
+            return result
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get queueing and throttling statistics.
+        
+        Returns:
+            Dict with the current and maximum queue depth, wait times, retries,
+            429s, calls given up on and reserved vs. used tokens
+        """
+        with self._cond:
+            stats = dict(self._stats)
+            stats["queue_depth"] = self._next_ticket - self._serving - len(self._abandoned)
+        stats["mean_wait_seconds"] = (
+            stats["total_wait_seconds"] / stats["calls"] if stats["calls"] else 0.0
+        )
+        return stats
+
+
+_limiter: Optional[RateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the process-wide rate limiter, sized from settings."""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = RateLimiter(
+                    requests_per_minute=settings.LLM_RPM_LIMIT,
+                    tokens_per_minute=settings.LLM_TPM_LIMIT,
+                    max_retries=settings.LLM_MAX_RETRIES,
+                    base_delay=settings.LLM_RETRY_BASE_DELAY,
+                    max_delay=settings.LLM_RETRY_MAX_DELAY,
+                )
+    return _limiter
+
+
+def get_rate_limit_stats() -> Dict[str, Any]:
+    """Get the statistics of the process-wide rate limiter."""
+    return get_rate_limiter().stats()
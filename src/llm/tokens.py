@@ -0,0 +1,215 @@
+"""
+Token counting and per-interview token accounting.
+
+Prompts are counted with the tiktoken encoding named by TOKEN_ENCODING. When
+tiktoken is not installed or the encoding cannot be loaded (it is downloaded
+on first use), counts fall back to an estimate of CHARS_PER_TOKEN characters
+per token, which errs on the high side for English prose.
+
+Every LLM call made for an interview is recorded in the process-wide
+TokenLedger, including calls made by background workers (prefetched
+openers, incremental assessments), so the interview's budget covers them.
+"""
+import math
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from config import settings
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import tiktoken
+    TIKTOKEN_SUPPORT = True
+except ImportError:
+    TIKTOKEN_SUPPORT = False
+
+CHARS_PER_TOKEN = 4
+
+# Budget states reported by budget_status
+WITHIN_BUDGET = "ok"
+DEGRADED = "degraded"
+EXHAUSTED = "exhausted"
+
+_encoding = None
+_encoding_loaded = False
+_encoding_lock = threading.Lock()
+
+
+def get_encoding():
+    """
+    Get the configured tiktoken encoding, loading it on first use.
+    
+    Returns:
+        The encoding, or None when token counts are estimated
+    """
+    global _encoding, _encoding_loaded
+    if _encoding_loaded:
+        return _encoding
+    with _encoding_lock:
+        if not _encoding_loaded:
+            if TIKTOKEN_SUPPORT and settings.TOKEN_ENCODING:
+                try:
+                    _encoding = tiktoken.get_encoding(settings.TOKEN_ENCODING)
+                except Exception as e:
+                    logger.warning(f"Token encoding '{settings.TOKEN_ENCODING}' unavailable ({e}), "
+                                   f"estimating {CHARS_PER_TOKEN} characters per token")
+            _encoding_loaded = True
+    return _encoding
+
+
+def count_tokens(text: Optional[str]) -> int:
+    """
+    Count the tokens in a piece of text.
+    
+    Args:
+        text: Text to count (None counts as empty)
+    
+    Returns:
+        int: Number of tokens
+    """
+    if not text:
+        return 0
+    encoding = get_encoding()
+    if encoding is None:
+        return math.ceil(len(text) / CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Cut text down to at most max_tokens tokens.
+    
+    Args:
+        text: Text to truncate
+        max_tokens: Maximum number of tokens to keep
+    
+    Returns:
+        str: The text, or its longest prefix within the limit
+    """
+    if max_tokens <= 0 or not text:
+        return ""
+    encoding = get_encoding()
+    if encoding is None:
+        return text[:max_tokens * CHARS_PER_TOKEN]
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
+
+def empty_usage() -> Dict[str, int]:
+    """Token usage of an interview that has not called the LLM yet."""
+    return {"prompt_tokens": 0, "completion_tokens": 0, "calls": 0}
+
+
+def budget_status(usage: Optional[Dict[str, int]]) -> str:
+    """
+    Compare an interview's token usage against INTERVIEW_TOKEN_BUDGET.
+    
+    Args:
+        usage: Token usage as tracked by TokenLedger
+    
+    Returns:
+        str: WITHIN_BUDGET, DEGRADED (past the soft limit) or EXHAUSTED
+    """
+    budget = settings.INTERVIEW_TOKEN_BUDGET
+    if budget <= 0 or not usage:
+        return WITHIN_BUDGET
+    spent = usage["prompt_tokens"] + usage["completion_tokens"]
+    if spent >= budget:
+        return EXHAUSTED
+    if spent >= budget * settings.INTERVIEW_TOKEN_SOFT_RATIO:
+        return DEGRADED
+    return WITHIN_BUDGET
+
+
+class TokenLedger:
+    """Thread-safe running totals of token usage per interview."""
+    
+    def __init__(self, max_interviews: int = 1024):
+        """
+        Initialize the ledger.
+        
+        Args:
+            max_interviews: Interviews tracked before the least recent is dropped
+        """
+        self.max_interviews = max_interviews
+        self._usage: "OrderedDict[str, Dict[str, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _entry(self, interview_id: str) -> Dict[str, int]:
+        """Get an interview's totals, creating them if needed (lock held)."""
+        usage = self._usage.get(interview_id)
+        if usage is None:
+            usage = self._usage[interview_id] = empty_usage()
+            while len(self._usage) > self.max_interviews:
+                self._usage.popitem(last=False)
+        self._usage.move_to_end(interview_id)
+        return usage
+    
+    def record(self, interview_id: Optional[str], prompt_tokens: int, completion_tokens: int) -> None:
+        """
+        Add one LLM call to an interview's totals.
+        
+        Args:
+            interview_id: Interview the call was made for (None is not tracked)
+            prompt_tokens: Tokens sent
+            completion_tokens: Tokens received
+        """
+        if not interview_id:
+            return
+        with self._lock:
+            usage = self._entry(interview_id)
+            usage["prompt_tokens"] += prompt_tokens
+            usage["completion_tokens"] += completion_tokens
+            usage["calls"] += 1
+    
+    def usage(self, interview_id: Optional[str]) -> Dict[str, int]:
+        """Get a copy of an interview's totals."""
+        with self._lock:
+            usage = self._usage.get(interview_id)
+            return dict(usage) if usage else empty_usage()
+    
+    def sync(self, interview_id: str, known: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+        """
+        Get an interview's totals, seeding them from a saved copy if needed.
+        
+        An interview restored from elsewhere (another process, a saved
+        state) keeps counting from the usage it already had.
+        
+        Args:
+            interview_id: Interview to look up
+            known: Usage previously recorded in the interview's state
+        
+        Returns:
+            dict: Current totals (prompt_tokens, completion_tokens, calls)
+        """
+        with self._lock:
+            usage = self._entry(interview_id)
+            if known:
+                for field, value in known.items():
+                    if usage.get(field, 0) < value:
+                        usage[field] = value
+            return dict(usage)
+    
+    def discard(self, interview_id: Optional[str]) -> None:
+        """Forget an interview's totals."""
+        with self._lock:
+            self._usage.pop(interview_id, None)
+
+
+_ledger: Optional[TokenLedger] = None
+_ledger_lock = threading.Lock()
+
+
+def get_token_ledger() -> TokenLedger:
+    """Get the process-wide token ledger."""
+    global _ledger
+    if _ledger is None:
+        with _ledger_lock:
+            if _ledger is None:
+                _ledger = TokenLedger()
+    return _ledger
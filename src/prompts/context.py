@@ -0,0 +1,115 @@
+"""
+Incremental, round-scoped conversation context for agent prompts.
+
+Each message is rendered once, when it is first seen, into a rolling
+window for its interview round. A prompt's context is the agent's own round
+window, so building it costs O(window) regardless of interview length and
+the HR and manager agents are not shown the technical round's Q&A. Windows
+are handed to the prompt templates as lists of rendered messages, so the
+oldest can be dropped to fit a token budget.
+"""
+import threading
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Optional
+
+from config import settings
+
+NO_CONVERSATION = "No previous conversation."
+
+ROLE_LABELS = {"agent": "Interviewer", "user": "Candidate"}
+
+
+def window_sizes() -> Dict[str, int]:
+    """Messages kept in each round's context window."""
+    return {
+        "technical": settings.CONTEXT_WINDOW_TECHNICAL,
+        "hr": settings.CONTEXT_WINDOW_HR,
+        "manager": settings.CONTEXT_WINDOW_MANAGER,
+    }
+
+
+def _key(message) -> tuple:
+    """Identify a message by value."""
+    return (message.role, message.agent_type, message.content)
+
+
+class _InterviewContext:
+    """Rendered windows for one interview."""
+    
+    def __init__(self, sizes: Dict[str, int]):
+        self.seen = 0
+        # (role, agent_type, content) of the last message seen, to detect a
+        # replaced history
+        self.last: Optional[tuple] = None
+        self.round: Optional[str] = None
+        self.windows: Dict[str, Deque[str]] = {
+            agent_type: deque(maxlen=size) for agent_type, size in sizes.items()
+        }
+
+
+class ConversationContextBuilder:
+    """Conversation context shared by the question agents of a workflow."""
+    
+    def __init__(self, max_interviews: int = 256):
+        """
+        Initialize the builder.
+        
+        Args:
+            max_interviews: Interviews tracked before the least recent is dropped
+                (a dropped interview is rebuilt from its messages if it returns)
+        """
+        self.max_interviews = max_interviews
+        self._contexts: "OrderedDict[str, _InterviewContext]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def messages(self, state: Dict, agent_type: str) -> List[str]:
+        """
+        Get the rendered messages of an agent's round window.
+        
+        Args:
+            state: Current interview state
+            agent_type: Round whose window to return
+            
+        Returns:
+            list: Recent messages of the agent's round, oldest first
+        """
+        with self._lock:
+            return list(self._update(state).windows.get(agent_type, ()))
+    
+    def _update(self, state: Dict) -> _InterviewContext:
+        """Render any new messages of an interview (lock held)."""
+        messages: List = state["conversation_history"]
+        interview_id = state.get("interview_id", "")
+        context = self._contexts.get(interview_id)
+        # A shorter history, or one whose last seen message changed, is a
+        # different or rewound conversation (e.g. reloaded after a conflict)
+        if context is None or context.seen > len(messages) or (
+            context.seen and _key(messages[context.seen - 1]) != context.last
+        ):
+            context = _InterviewContext(window_sizes())
+            self._contexts[interview_id] = context
+            while len(self._contexts) > self.max_interviews:
+                self._contexts.popitem(last=False)
+        self._contexts.move_to_end(interview_id)
+        
+        for message in messages[context.seen:]:
+            self._add(context, message)
+        context.seen = len(messages)
+        if messages:
+            context.last = _key(messages[-1])
+        return context
+    
+    def _add(self, context: _InterviewContext, message) -> None:
+        """Render a message into its round's window."""
+        # Answers carry no agent type; they belong to the round that asked
+        if message.agent_type:
+            context.round = message.agent_type
+        window = context.windows.get(context.round)
+        if window is None:
+            return
+        window.append(f"{ROLE_LABELS.get(message.role, message.role)}: {message.content}")
+    
+    def discard(self, state: Dict) -> None:
+        """Forget an interview's context."""
+        with self._lock:
+            self._contexts.pop(state.get("interview_id", ""), None)
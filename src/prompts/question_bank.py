@@ -0,0 +1,289 @@
+"""
+Offline question bank of pre-generated opening questions.
+
+Opening questions without a resume depend only on the agent, job role and
+experience level, so they can be generated ahead of time for every
+combination of settings.JOB_ROLES x settings.EXPERIENCE_LEVELS and served
+instantly at interview time. The bank is a gzipped JSON index keyed by
+"agent|role|level".
+
+Build it with:
+    python -m src.prompts.question_bank --variants 8 --concurrency 8
+"""
+import argparse
+import gzip
+import json
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from config import settings
+from config.logging_config import get_logger
+from src.llm.rate_limit import RateLimiter, get_rate_limiter
+from src.llm.tokens import count_tokens
+from src.prompts.templates import PROMPT_TEMPLATE_VERSION, get_agent_prompt
+
+logger = get_logger(__name__)
+
+BANK_FORMAT_VERSION = 1
+
+# Stands in for the candidate's name in banked questions
+NAME_PLACEHOLDER = "{candidate_name}"
+
+# Agents whose opening questions are banked
+BANK_AGENT_TYPES = ("technical", "hr", "manager")
+
+# Questions whose word 3-gram overlap exceeds this are near duplicates
+NEAR_DUPLICATE_THRESHOLD = 0.6
+
+
+def bank_key(agent_type: str, job_role: str, experience_level: str) -> str:
+    """Get the index key for an agent, role and level."""
+    return f"{agent_type}|{job_role}|{experience_level}"
+
+
+def _shingles(text: str) -> Set[tuple]:
+    """Word 3-grams of the normalized text."""
+    words = re.findall(r"[a-z0-9']+", text.lower())
+    if len(words) < 3:
+        return {tuple(words)}
+    return {tuple(words[i:i + 3]) for i in range(len(words) - 2)}
+
+
+def is_near_duplicate(shingles: Set[tuple], existing: List[Set[tuple]]) -> bool:
+    """
+    Check whether a question overlaps too much with questions already kept.
+    
+    Args:
+        shingles: Shingles of the candidate question
+        existing: Shingles of the questions already kept
+        
+    Returns:
+        bool: True if the Jaccard similarity with any kept question exceeds
+        NEAR_DUPLICATE_THRESHOLD
+    """
+    for other in existing:
+        union = len(shingles | other)
+        if union and len(shingles & other) / union > NEAR_DUPLICATE_THRESHOLD:
+            return True
+    return False
+
+
+class QuestionBank:
+    """Index of pre-generated questions by agent, role and level."""
+    
+    def __init__(self, questions: Optional[Dict[str, List[str]]] = None,
+                 template_version: str = PROMPT_TEMPLATE_VERSION):
+        self.questions = questions or {}
+        self.template_version = template_version
+    
+    def __len__(self) -> int:
+        return sum(len(questions) for questions in self.questions.values())
+    
+    def pick(self, agent_type: str, job_role: str, experience_level: str,
+             candidate_name: str) -> Optional[str]:
+        """
+        Pick a banked opening question.
+        
+        Args:
+            agent_type: Agent asking the question
+            job_role: Job role being interviewed for
+            experience_level: Experience level
+            candidate_name: Name substituted into the question
+            
+        Returns:
+            str or None: A question, or None if the bank has none for this key
+        """
+        questions = self.questions.get(bank_key(agent_type, job_role, experience_level))
+        if not questions:
+            return None
+        return random.choice(questions).replace(NAME_PLACEHOLDER, candidate_name)
+    
+    def save(self, path: str) -> None:
+        """Write the bank as gzipped JSON."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "format_version": BANK_FORMAT_VERSION,
+            "template_version": self.template_version,
+            "questions": self.questions,
+        }
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+    
+    @classmethod
+    def load(cls, path: str) -> "QuestionBank":
+        """Read a bank written by save()."""
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            payload = json.load(f)
+        if payload.get("format_version") != BANK_FORMAT_VERSION:
+            raise ValueError(f"Unsupported question bank format: {payload.get('format_version')}")
+        return cls(payload["questions"], payload["template_version"])
+
+
+_bank: Optional[QuestionBank] = None
+_bank_loaded = False
+_bank_lock = threading.Lock()
+
+
+def get_question_bank() -> Optional[QuestionBank]:
+    """
+    Get the question bank configured by settings.QUESTION_BANK_PATH.
+    
+    The bank is loaded once per process. A missing file or a bank built
+    from older prompt templates disables the bank.
+    
+    Returns:
+        QuestionBank or None: Loaded bank, or None if unavailable
+    """
+    global _bank, _bank_loaded
+    with _bank_lock:
+        if _bank_loaded:
+            return _bank
+        _bank_loaded = True
+        path = settings.QUESTION_BANK_PATH
+        if not path or not Path(path).exists():
+            return None
+        try:
+            bank = QuestionBank.load(path)
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not load question bank {path}: {e}")
+            return None
+        if bank.template_version != PROMPT_TEMPLATE_VERSION:
+            logger.warning(f"Question bank {path} was built for prompt templates "
+                           f"v{bank.template_version}, current is v{PROMPT_TEMPLATE_VERSION} - ignoring it")
+            return None
+        _bank = bank
+        logger.info(f"Loaded question bank with {len(bank)} questions from {path}")
+        return _bank
+
+
+def build_question_bank(
+    llm,
+    job_roles: List[str],
+    experience_levels: List[str],
+    variants: int = 8,
+    concurrency: int = 8,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> QuestionBank:
+    """
+    Generate a deduplicated bank of opening questions.
+    
+    Calls go through the rate limiter like the agents' calls, so they share
+    its RPM/TPM quota and throttled calls are retried instead of leaving
+    holes in the bank.
+    
+    Args:
+        llm: Chat model used for generation
+        job_roles: Roles to cover
+        experience_levels: Levels to cover
+        variants: Generations per agent, role and level
+        concurrency: Maximum LLM calls in flight
+        rate_limiter: Limiter for the calls (the process-wide one by default)
+        
+    Returns:
+        QuestionBank: The generated bank
+    """
+    jobs = [
+        (agent_type, job_role, level)
+        for agent_type in BANK_AGENT_TYPES
+        for job_role in job_roles
+        for level in experience_levels
+        for _ in range(variants)
+    ]
+    rate_limiter = rate_limiter or get_rate_limiter()
+    tokens_used = 0
+    tokens_lock = threading.Lock()
+    
+    def measure(prompt: str, response) -> int:
+        nonlocal tokens_used
+        usage = getattr(response, "usage_metadata", None)
+        if usage:
+            tokens = usage["input_tokens"] + usage["output_tokens"]
+        else:
+            tokens = count_tokens(prompt) + count_tokens(response.content)
+        with tokens_lock:
+            tokens_used += tokens
+        return tokens
+    
+    def generate(agent_type: str, job_role: str, level: str) -> str:
+        prompt = get_agent_prompt(
+            agent_type=agent_type,
+            candidate_name=NAME_PLACEHOLDER,
+            job_role=job_role,
+            experience_level=level,
+            question_number=1,
+            conversation_history="No previous conversation.",
+            is_first_question=True,
+        )
+        response = rate_limiter.run(
+            lambda: llm.invoke(prompt),
+            count_tokens(prompt) + settings.LLM_RATE_LIMIT_COMPLETION_TOKENS,
+            lambda result: measure(prompt, result),
+        )
+        return response.content.strip()
+    
+    questions: Dict[str, List[str]] = {}
+    shingles: Dict[str, List[Set[tuple]]] = {}
+    duplicates = failures = 0
+    start = time.perf_counter()
+    
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = {pool.submit(generate, *job): job for job in jobs}
+        for done, future in enumerate(as_completed(futures), 1):
+            agent_type, job_role, level = futures[future]
+            key = bank_key(agent_type, job_role, level)
+            try:
+                question = future.result()
+            except Exception as e:
+                failures += 1
+                logger.warning(f"Generation failed for {key}: {e}")
+                continue
+            
+            question_shingles = _shingles(question)
+            if not question or is_near_duplicate(question_shingles, shingles.get(key, [])):
+                duplicates += 1
+            else:
+                questions.setdefault(key, []).append(question)
+                shingles.setdefault(key, []).append(question_shingles)
+            
+            if done % 50 == 0 or done == len(jobs):
+                logger.info(f"Generated {done}/{len(jobs)} questions "
+                            f"({time.perf_counter() - start:.1f}s)")
+    
+    bank = QuestionBank(questions)
+    logger.info(f"Question bank built: {len(bank)} questions for {len(questions)} keys, "
+                f"{duplicates} near duplicates dropped, {failures} failures, {tokens_used} tokens used")
+    return bank
+
+
+def main():
+    """Command-line entry point for building the question bank."""
+    from azure_clients import get_chat_llm
+    from config.logging_config import setup_logging
+    
+    parser = argparse.ArgumentParser(description="Build the offline opening question bank")
+    parser.add_argument("--out", default=settings.QUESTION_BANK_PATH, help="Output file")
+    parser.add_argument("--variants", type=int, default=8,
+                        help="Generations per agent, role and level")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent LLM calls")
+    args = parser.parse_args()
+    
+    setup_logging(log_to_file=False)
+    job_roles = [role for role in settings.JOB_ROLES if role != "Other (Specify)"]
+    bank = build_question_bank(
+        get_chat_llm(temperature=settings.QUESTION_BANK_TEMPERATURE),
+        job_roles,
+        settings.EXPERIENCE_LEVELS,
+        variants=args.variants,
+        concurrency=args.concurrency,
+    )
+    bank.save(args.out)
+    print(f"Wrote {len(bank)} questions to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
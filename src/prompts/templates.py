@@ -2,6 +2,14 @@
 Prompt templates for different interview agents.
 Each agent has a distinct personality and question style.
 """
+from typing import Any, Dict, List, Optional, Union
+
+from config import settings
+from src.llm.tokens import count_tokens, truncate_to_tokens
+from src.prompts.context import NO_CONVERSATION
+
+# Bump whenever a template changes so cached LLM responses are not reused
+PROMPT_TEMPLATE_VERSION = "1"
 
 TECHNICAL_AGENT_SYSTEM_PROMPT = """You are a Senior Technical Interviewer with 10+ years of experience in software engineering.
 
@@ -144,15 +152,198 @@ Remember to:
 """
 
 
+EVALUATION_ROUND_PROMPT = """You are an experienced Interview Evaluation Specialist assessing one round of {candidate_name}'s interview for the {experience_level} {job_role} position.
+
+This is the {round_name}, which focuses on {round_focus}.
+
+ROUND TRANSCRIPT:
+{round_summary}
+
+Evaluate ONLY this round, following this EXACT format:
+
+SCORE: [Provide a score from 0-100 for this round]
+
+STRENGTHS:
+- [List 1-3 key strengths demonstrated in this round]
+- [Be specific and reference actual answers when possible]
+
+WEAKNESSES:
+- [List 1-2 areas for improvement in this round]
+
+SUGGESTIONS:
+- [Provide 1-2 actionable recommendations related to this round]
+
+OVERALL FEEDBACK:
+[Provide a 1-2 sentence summary of the candidate's performance in this round]
+
+Consider the {experience_level} level when evaluating, balance criticism with encouragement, and be specific.
+"""
+
+
+ANSWER_ASSESSMENT_PROMPT = """You are an experienced Interview Evaluation Specialist assessing a single answer from {candidate_name}'s interview for the {experience_level} {job_role} position.
+
+This answer is from the {round_name}, which focuses on {round_focus}.
+
+QUESTION:
+{question}
+
+ANSWER:
+{answer}
+
+Assess ONLY this answer, following this EXACT format:
+
+SCORE: [Provide a score from 0-100 for this answer]
+
+STRENGTHS:
+- [At most one specific strength shown in this answer, or leave empty]
+
+WEAKNESSES:
+- [At most one specific weakness in this answer, or leave empty]
+
+SUGGESTIONS:
+- [At most one actionable suggestion, or leave empty]
+
+OVERALL FEEDBACK:
+[One sentence on this answer]
+
+Consider the {experience_level} level when assessing and be specific.
+"""
+
+
+RESUME_DIGEST_PROMPT = """You are preparing interviewers for a conversation with a candidate. Read the candidate's full resume and summarize it into a compact profile.
+
+RESUME:
+{resume_text}
+
+Respond following this EXACT format:
+
+SKILLS: [comma-separated technical and professional skills, most significant first]
+ROLES: [semicolon-separated "title, company (years)" entries, most recent first]
+YEARS OF EXPERIENCE: [total years of professional experience as a number]
+NOTABLE PROJECTS:
+- [One line per project (at most 4): what it was, the candidate's role, technologies and measurable outcomes]
+EDUCATION: [highest degree and institution, or "Not stated"]
+
+Cover the whole resume, keep every line short, and do not invent details that are not in the resume.
+"""
+
+
+def format_resume_digest(digest: Optional[Dict[str, Any]]) -> str:
+    """
+    Render a resume digest as compact prompt context.
+    
+    Args:
+        digest: Digest produced by ResumeDigestAgent (None or empty for none)
+        
+    Returns:
+        str: Rendered profile, or "" when the digest has no content
+    """
+    if not digest:
+        return ""
+    lines = []
+    if digest.get("skills"):
+        lines.append(f"Skills: {', '.join(digest['skills'])}")
+    if digest.get("roles"):
+        lines.append(f"Roles: {'; '.join(digest['roles'])}")
+    if digest.get("years_experience") is not None:
+        lines.append(f"Experience: {digest['years_experience']:g} years")
+    if digest.get("projects"):
+        lines.append("Projects:")
+        lines.extend(f"- {project}" for project in digest["projects"])
+    if digest.get("education"):
+        lines.append(f"Education: {digest['education']}")
+    return "\n".join(lines)
+
+
+RESUME_GUIDANCE = "Use this resume information to ask more personalized and relevant questions based on the candidate's actual experience and skills."
+
+
+class _AgentPromptParts:
+    """Sections of an agent prompt that can be trimmed to fit a token budget."""
+    
+    def __init__(
+        self,
+        template: str,
+        fields: Dict[str, Any],
+        history: List[str],
+        profile: str,
+        excerpts: List[str],
+        resume: str,
+        resume_cut: bool
+    ):
+        self.template = template
+        self.fields = fields
+        self.history = history
+        self.profile = profile
+        self.excerpts = excerpts
+        self.resume = resume
+        self.resume_cut = resume_cut
+        self.guidance = True
+    
+    def render(self) -> str:
+        """Render the prompt from the sections that are left."""
+        resume_context = ""
+        if self.profile:
+            resume_context += f"\n\nCANDIDATE PROFILE (summarized from the full resume):\n{self.profile}"
+        if self.excerpts:
+            resume_context += "\n\nRELEVANT RESUME EXCERPTS:\n" + "\n\n".join(self.excerpts)
+        if self.resume:
+            resume_context += f"\n\nCANDIDATE'S RESUME:\n{self.resume}\n{'...(resume continues)' if self.resume_cut else ''}"
+        if resume_context and self.guidance:
+            resume_context += f"\n\n{RESUME_GUIDANCE}"
+        
+        conversation_history = "\n".join(self.history) if self.history else NO_CONVERSATION
+        return self.template.format(conversation_history=conversation_history, **self.fields) + resume_context
+    
+    def fit(self, max_tokens: int) -> str:
+        """
+        Render the prompt, trimming sections until it fits in max_tokens.
+        
+        Sections go in priority order: old conversation history (the latest
+        exchange is kept), then resume context (lowest-ranked excerpts first,
+        then the raw resume and profile are shortened), then the extras (the
+        resume guidance and the latest exchange). A prompt whose fixed
+        template alone exceeds the budget is returned with everything trimmed.
+        """
+        prompt = self.render()
+        
+        while count_tokens(prompt) > max_tokens and len(self.history) > 2:
+            self.history.pop(0)
+            prompt = self.render()
+        
+        while count_tokens(prompt) > max_tokens and self.excerpts:
+            self.excerpts.pop()
+            prompt = self.render()
+        for section in ("resume", "profile"):
+            overflow = count_tokens(prompt) - max_tokens
+            text = getattr(self, section)
+            if overflow > 0 and text:
+                setattr(self, section, truncate_to_tokens(text, count_tokens(text) - overflow))
+                if section == "resume":
+                    self.resume_cut = True
+                prompt = self.render()
+        
+        if count_tokens(prompt) > max_tokens:
+            self.guidance = False
+            prompt = self.render()
+        while count_tokens(prompt) > max_tokens and self.history:
+            self.history.pop(0)
+            prompt = self.render()
+        return prompt
+
+
 def get_agent_prompt(
     agent_type: str,
     candidate_name: str,
     job_role: str,
     experience_level: str,
     question_number: int,
-    conversation_history: str,
+    conversation_history: Union[str, List[str]],
     is_first_question: bool = False,
-    resume_text: str = None
+    resume_text: str = None,
+    resume_digest: str = None,
+    resume_excerpts: str = None,
+    max_tokens: Optional[int] = None
 ) -> str:
     """
     Get the appropriate prompt for an agent.
@@ -163,9 +354,16 @@ def get_agent_prompt(
         job_role: Job role being interviewed for
         experience_level: Experience level (Junior/Mid-Level/Senior)
         question_number: Current question number for this agent
-        conversation_history: Recent conversation context
+        conversation_history: Recent conversation context, either rendered
+            or as a list of rendered messages (oldest first) so that old
+            messages can be dropped to fit max_tokens
         is_first_question: Whether this is the agent's first question
         resume_text: Optional resume text for personalized questions
+        resume_digest: Optional rendered resume digest (see
+            format_resume_digest); used instead of the raw resume text
+        resume_excerpts: Optional resume passages relevant to this round;
+            used with the digest, or instead of the raw resume text
+        max_tokens: Optional token budget; the prompt is trimmed to fit
         
     Returns:
         str: Formatted prompt for the agent
@@ -187,19 +385,31 @@ def get_agent_prompt(
     
     prompt_template = prompts[agent_type]["first" if is_first_question else "regular"]
     
-    # Add resume context if available
-    resume_context = ""
-    if resume_text:
-        # Limit resume text to first 2000 characters to avoid token limits
-        truncated_resume = resume_text[:2000]
-        resume_context = f"\n\nCANDIDATE'S RESUME:\n{truncated_resume}\n{'...(resume continues)' if len(resume_text) > 2000 else ''}\n\nUse this resume information to ask more personalized and relevant questions based on the candidate's actual experience and skills."
+    if isinstance(conversation_history, str):
+        history = [conversation_history] if conversation_history != NO_CONVERSATION else []
+    else:
+        history = list(conversation_history)
     
-    formatted_prompt = prompt_template.format(
-        candidate_name=candidate_name,
-        job_role=job_role,
-        experience_level=experience_level,
-        question_number=question_number,
-        conversation_history=conversation_history
-    )
+    # Resume context: the digest and excerpts, or else the start of the raw resume
+    excerpts = resume_excerpts.split("\n\n") if resume_excerpts else []
+    resume = ""
+    if resume_text and not (resume_digest or resume_excerpts):
+        resume = truncate_to_tokens(resume_text, settings.PROMPT_RESUME_MAX_TOKENS)
     
-    return formatted_prompt + resume_context
+    parts = _AgentPromptParts(
+        prompt_template,
+        {
+            "candidate_name": candidate_name,
+            "job_role": job_role,
+            "experience_level": experience_level,
+            "question_number": question_number,
+        },
+        history,
+        resume_digest or "",
+        excerpts,
+        resume,
+        resume_cut=len(resume) < len(resume_text or "")
+    )
+    if max_tokens:
+        return parts.fit(max_tokens)
+    return parts.render()
@@ -0,0 +1,16 @@
+"""Resume processing module."""
+from .extraction import (
+    DOCX_SUPPORT,
+    PDF_SUPPORT,
+    ResumeParseError,
+    extract_resume_text,
+    get_extraction_stats,
+)
+
+__all__ = [
+    "DOCX_SUPPORT",
+    "PDF_SUPPORT",
+    "ResumeParseError",
+    "extract_resume_text",
+    "get_extraction_stats",
+]
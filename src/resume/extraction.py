@@ -0,0 +1,401 @@
+"""
+Resume text extraction for PDF, DOCX and TXT uploads.
+
+Extracted text is cached by a SHA-256 of the file bytes, in a bounded
+in-process LRU plus an optional on-disk tier, so re-running the Streamlit
+script (every widget interaction) does not re-parse the same upload.
+Extraction is budget-aware: parsing stops once enough text for the prompts
+has been read, and the rest can optionally be extracted in the background.
+"""
+import hashlib
+import io
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+from config import settings
+from config.logging_config import get_logger
+from src.resume.docx_text import iter_docx_text
+
+logger = get_logger(__name__)
+
+# Document processing imports
+try:
+    import PyPDF2
+    PDF_SUPPORT = True
+except ImportError:
+    PDF_SUPPORT = False
+    logger.warning("PyPDF2 not installed - PDF resume upload disabled")
+
+# DOCX text is read with zipfile and iterparse from the standard library
+DOCX_SUPPORT = True
+
+# Parse failure reasons
+TIMEOUT = "timeout"
+TOO_LARGE = "too_large"
+CORRUPT = "corrupt"
+UNSUPPORTED = "unsupported"
+
+
+class ResumeParseError(Exception):
+    """A resume could not be parsed; reason is one of the failure reasons above."""
+    
+    MESSAGES = {
+        TIMEOUT: "Parsing your resume took too long.",
+        TOO_LARGE: "Your resume is too large to process.",
+        CORRUPT: "Your resume file appears to be damaged or unreadable.",
+        UNSUPPORTED: "This file type is not supported.",
+    }
+    
+    def __init__(self, reason: str, detail: str = ""):
+        super().__init__(f"{reason}: {detail}" if detail else reason)
+        self.reason = reason
+        self.detail = detail
+    
+    @property
+    def user_message(self) -> str:
+        """A short explanation suitable for showing to the candidate."""
+        return self.MESSAGES.get(self.reason, "Your resume could not be processed.")
+
+
+def iter_pdf_pages(data: bytes) -> Iterator[str]:
+    """
+    Yield the text of each PDF page lazily.
+    
+    PyPDF2 only parses a page's content stream when its text is requested,
+    so stopping the iteration early skips the remaining pages entirely.
+    """
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(data))
+    for page in pdf_reader.pages:
+        yield page.extract_text() or ""
+
+
+def join_within_budget(parts: Iterable[str], max_chars: Optional[int] = None) -> Tuple[str, bool]:
+    """
+    Join text parts, stopping once max_chars is filled.
+    
+    Args:
+        parts: Text parts (pages, paragraphs), consumed lazily
+        max_chars: Character budget (None or 0 for no limit)
+        
+    Returns:
+        tuple: (joined text, whether every part was consumed)
+    """
+    kept = []
+    total = 0
+    for part in parts:
+        kept.append(part)
+        total += len(part) + 1
+        if max_chars and total >= max_chars:
+            return "\n".join(kept), False
+    return "\n".join(kept), True
+
+
+def cut_to_budget(text: str, max_chars: Optional[int] = None) -> str:
+    """
+    Cut text after the line that fills max_chars.
+    
+    Parsers stop after the page or paragraph that fills the budget; cutting
+    their output by lines gives the same text as cutting the full document.
+    
+    Args:
+        text: Extracted text
+        max_chars: Character budget (None or 0 for no limit)
+        
+    Returns:
+        str: The text up to and including the line that fills the budget
+    """
+    return join_within_budget(text.split("\n"), max_chars)[0]
+
+
+def extract_text_from_pdf(data: bytes, max_chars: Optional[int] = None) -> Tuple[str, bool]:
+    """Extract text from PDF file bytes, stopping after the page that fills max_chars."""
+    if not PDF_SUPPORT:
+        raise ResumeParseError(UNSUPPORTED, "PyPDF2 is not installed")
+    
+    text, complete = join_within_budget(iter_pdf_pages(data), max_chars)
+    logger.info(f"Successfully extracted {len(text)} characters from PDF resume")
+    return text.strip(), complete
+
+
+def extract_text_from_docx(data: bytes, max_chars: Optional[int] = None) -> Tuple[str, bool]:
+    """Extract text from DOCX file bytes (body, tables, headers, footers), stopping once max_chars is filled."""
+    text, complete = join_within_budget(iter_docx_text(data), max_chars)
+    logger.info(f"Successfully extracted {len(text)} characters from DOCX resume")
+    return text.strip(), complete
+
+
+def extract_text_from_txt(data: bytes, max_chars: Optional[int] = None) -> Tuple[str, bool]:
+    """Extract text from TXT file bytes, up to max_chars characters."""
+    text = data.decode('utf-8')
+    complete = not max_chars or len(text) <= max_chars
+    if not complete:
+        text = text[:max_chars]
+    logger.info(f"Successfully extracted {len(text)} characters from TXT resume")
+    return text.strip(), complete
+
+
+# Rough characters per token, used to turn a token budget into a char budget
+CHARS_PER_TOKEN = 4
+
+EXTRACTORS = {
+    "pdf": extract_text_from_pdf,
+    "docx": extract_text_from_docx,
+    "doc": extract_text_from_docx,
+    "txt": extract_text_from_txt,
+}
+
+
+def file_format(filename: str) -> str:
+    """Get the lower-case extension of a file name."""
+    return filename.rsplit('.', 1)[-1].lower()
+
+
+class ResumeTextCache:
+    """Thread-safe LRU of extracted resume text with an optional disk tier."""
+    
+    def __init__(self, max_entries: int = 128, cache_dir: Optional[str] = None):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum resumes held in memory
+            cache_dir: Directory for the on-disk tier (None for memory only)
+        """
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    def get(self, key: str) -> Optional[str]:
+        """Get cached text for a content hash, or None."""
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+                return text
+        if self.cache_dir:
+            path = self.cache_dir / f"{key}.txt"
+            if path.exists():
+                text = path.read_text(encoding="utf-8")
+                self._remember(key, text)
+                return text
+        return None
+    
+    def put(self, key: str, text: str) -> None:
+        """Cache text for a content hash."""
+        self._remember(key, text)
+        if self.cache_dir:
+            # Write then rename so readers never see a partial file
+            tmp_path = self.cache_dir / f"{key}.tmp"
+            tmp_path.write_text(text, encoding="utf-8")
+            tmp_path.replace(self.cache_dir / f"{key}.txt")
+    
+    def _remember(self, key: str, text: str) -> None:
+        """Insert into the LRU, evicting the oldest entry when full."""
+        with self._lock:
+            self._entries[key] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Forget the in-memory entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+_cache = ResumeTextCache(settings.RESUME_CACHE_MAX_ENTRIES, settings.RESUME_CACHE_DIR)
+_stats: Dict[str, Dict[str, float]] = {}
+_stats_lock = threading.Lock()
+
+
+def _record(
+    file_type: str, seconds: float, cache_hit: bool, partial: bool = False, failed: bool = False
+) -> None:
+    """Record an extraction timing for a format."""
+    with _stats_lock:
+        stats = _stats.setdefault(file_type, {
+            "extractions": 0, "partial": 0, "failures": 0, "cache_hits": 0,
+            "total_seconds": 0.0, "max_seconds": 0.0,
+        })
+        if cache_hit:
+            stats["cache_hits"] += 1
+        else:
+            stats["extractions"] += 1
+            stats["partial"] += int(partial)
+            stats["failures"] += int(failed)
+            stats["total_seconds"] += seconds
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+
+
+def get_extraction_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Get per-format extraction metrics.
+    
+    Returns:
+        Dict keyed by format with extraction, partial (budget-limited),
+        failure and cache hit counts, total, mean and max parse time in seconds
+    """
+    with _stats_lock:
+        stats = {file_type: dict(values) for file_type, values in _stats.items()}
+    for values in stats.values():
+        extractions = values["extractions"]
+        values["mean_seconds"] = values["total_seconds"] / extractions if extractions else 0.0
+    return stats
+
+
+def char_budget(max_chars: Optional[int] = None, max_tokens: Optional[int] = None) -> Optional[int]:
+    """
+    Combine character and token budgets into one character budget.
+    
+    Args:
+        max_chars: Character budget (None or 0 for no limit)
+        max_tokens: Token budget (None or 0 for no limit)
+        
+    Returns:
+        int or None: The tighter of the two budgets, or None for no limit
+    """
+    budgets = [budget for budget in (max_chars, (max_tokens or 0) * CHARS_PER_TOKEN) if budget]
+    return min(budgets) if budgets else None
+
+
+def run_parser(file_type: str, data: bytes, max_chars: Optional[int] = None) -> Tuple[str, bool]:
+    """
+    Parse file bytes, in the sandboxed worker pool when it is enabled.
+    
+    Args:
+        file_type: Key into EXTRACTORS
+        data: Raw file bytes
+        max_chars: Character budget (None or 0 for the whole document)
+        
+    Returns:
+        tuple: (extracted text, whether the whole document was read)
+        
+    Raises:
+        ResumeParseError: If the file is too large, unreadable or too slow to parse
+    """
+    max_bytes = int(settings.RESUME_MAX_UPLOAD_MB * 1024 * 1024)
+    if len(data) > max_bytes:
+        raise ResumeParseError(TOO_LARGE, f"{len(data)} bytes exceeds {max_bytes}")
+    
+    if settings.RESUME_SANDBOX_ENABLED:
+        from src.resume.sandbox import get_parser_pool
+        return get_parser_pool().parse(file_type, data, max_chars)
+    
+    try:
+        return EXTRACTORS[file_type](data, max_chars)
+    except ResumeParseError:
+        raise
+    except MemoryError as e:
+        raise ResumeParseError(TOO_LARGE, str(e))
+    except Exception as e:
+        raise ResumeParseError(CORRUPT, f"{type(e).__name__}: {e}")
+
+
+_background_executor: Optional[ThreadPoolExecutor] = None
+_background_keys: Set[str] = set()
+_background_lock = threading.Lock()
+
+
+def _extract_full_in_background(key: str, data: bytes, file_type: str) -> None:
+    """Run an unbudgeted extraction off the request path and cache the result."""
+    global _background_executor
+    with _background_lock:
+        if key in _background_keys:
+            return
+        _background_keys.add(key)
+        if _background_executor is None:
+            _background_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="resume-extraction")
+    
+    def extract():
+        try:
+            start = time.perf_counter()
+            text, _ = run_parser(file_type, data)
+            _record(file_type, time.perf_counter() - start, cache_hit=False)
+            _cache.put(key, text)
+        except ResumeParseError as e:
+            logger.warning(f"Background resume extraction failed: {e}")
+        finally:
+            with _background_lock:
+                _background_keys.discard(key)
+    
+    _background_executor.submit(extract)
+
+
+def get_cached_full_text(data: bytes) -> Optional[str]:
+    """Get the fully extracted text of a file if it has been cached."""
+    return _cache.get(hashlib.sha256(data).hexdigest())
+
+
+def extract_resume_text(
+    data: bytes,
+    filename: str,
+    max_chars: Optional[int] = settings.RESUME_EXTRACT_MAX_CHARS,
+    max_tokens: Optional[int] = settings.RESUME_EXTRACT_MAX_TOKENS,
+    full_in_background: bool = settings.RESUME_FULL_EXTRACT_IN_BACKGROUND,
+) -> str:
+    """
+    Extract text from an uploaded resume, using the cache when possible.
+    
+    Extraction stops once the character/token budget is filled, so a long
+    portfolio only has its first pages parsed. Full text is cached under the
+    content hash and budget-limited text under the hash plus the budget. The
+    text is cut to the budget at a line boundary, whichever of the two was
+    cached, so an upload gives the same text before and after its full text
+    is extracted (use get_cached_full_text for the whole document).
+    
+    Args:
+        data: Raw file bytes
+        filename: Original file name (used to pick the parser)
+        max_chars: Character budget (None or 0 for the whole document)
+        max_tokens: Token budget (None or 0 for no token limit)
+        full_in_background: Also extract the whole document on a background
+            thread when the budget cut it short (see get_cached_full_text)
+        
+    Returns:
+        str: Extracted text
+        
+    Raises:
+        ResumeParseError: If the file type is unsupported or parsing failed
+    """
+    file_type = file_format(filename)
+    if file_type not in EXTRACTORS:
+        logger.warning(f"Unsupported file type: {file_type}")
+        raise ResumeParseError(UNSUPPORTED, file_type)
+    
+    budget = char_budget(max_chars, max_tokens)
+    key = hashlib.sha256(data).hexdigest()
+    partial_key = f"{key}-{budget}"
+    start = time.perf_counter()
+    text = _cache.get(key)
+    if text is None and budget:
+        text = _cache.get(partial_key)
+    if text is not None:
+        _record(file_type, time.perf_counter() - start, cache_hit=True)
+        logger.debug(f"Resume text cache hit for {filename}")
+        return cut_to_budget(text, budget)
+    
+    logger.info(f"Processing resume upload: {filename} (type: {file_type})")
+    try:
+        text, complete = run_parser(file_type, data, budget)
+    except ResumeParseError as e:
+        _record(file_type, time.perf_counter() - start, cache_hit=False, failed=True)
+        logger.error(f"Error extracting {file_type.upper()} text from {filename}: {e}")
+        raise
+    
+    elapsed = time.perf_counter() - start
+    _record(file_type, elapsed, cache_hit=False, partial=not complete)
+    logger.info(f"Extracted {file_type.upper()} resume in {elapsed * 1000:.1f} ms")
+    
+    if not complete:
+        text = cut_to_budget(text, budget)
+    _cache.put(key if complete else partial_key, text)
+    if not complete and full_in_background:
+        _extract_full_in_background(key, data, file_type)
+    return text
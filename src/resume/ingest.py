@@ -0,0 +1,278 @@
+"""
+Bulk resume ingestion.
+
+Extracts text from a directory or zip of PDF, DOCX and TXT resumes in the
+sandboxed parser pool and writes one row per candidate to the resume store,
+skipping duplicate content and files processed by an earlier run.
+
+Usage:
+    python -m src.resume.ingest resumes/ --workers 8
+    python -m src.resume.ingest batch.zip --store data/resumes.db
+"""
+import argparse
+import hashlib
+import os
+import sys
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from config import settings
+from config.logging_config import get_logger
+from src.resume.extraction import EXTRACTORS, ResumeParseError, file_format
+from src.resume.sandbox import ResumeParserPool
+from src.resume.store import ResumeStore, candidate_id_from_name
+
+logger = get_logger(__name__)
+
+# Commit to the store after this many processed files
+COMMIT_EVERY = 50
+
+
+class Source:
+    """One resume file in a directory or zip archive."""
+    
+    def __init__(self, name: str, size_bytes: int, mtime: float, read: Callable[[], bytes]):
+        self.name = name
+        self.size_bytes = size_bytes
+        self.mtime = mtime
+        self.read = read
+
+
+def iter_sources(path: str) -> Iterator[Source]:
+    """
+    List the resume files under a directory or inside a zip archive.
+    
+    Args:
+        path: Directory or .zip file
+        
+    Yields:
+        Source: Files with a supported extension, in sorted order
+    """
+    if zipfile.is_zipfile(path):
+        archive_mtime = os.path.getmtime(path)
+        with zipfile.ZipFile(path) as archive:
+            members = sorted(
+                (info for info in archive.infolist()
+                 if not info.is_dir() and file_format(info.filename) in EXTRACTORS),
+                key=lambda info: info.filename,
+            )
+        for info in members:
+            yield Source(
+                f"{path}!{info.filename}",
+                info.file_size,
+                archive_mtime,
+                lambda member=info.filename: _read_member(path, member),
+            )
+        return
+    
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for filename in sorted(files):
+            if file_format(filename) not in EXTRACTORS:
+                continue
+            file_path = os.path.join(root, filename)
+            stat = os.stat(file_path)
+            yield Source(
+                file_path,
+                stat.st_size,
+                stat.st_mtime,
+                lambda file_path=file_path: _read_file(file_path),
+            )
+
+
+def _read_file(file_path: str) -> bytes:
+    """Read a file's bytes."""
+    with open(file_path, "rb") as handle:
+        return handle.read()
+
+
+def _read_member(archive_path: str, member: str) -> bytes:
+    """Read one member of a zip archive (each call opens its own handle)."""
+    with zipfile.ZipFile(archive_path) as archive:
+        return archive.read(member)
+
+
+class IngestStats:
+    """Counters and throughput for an ingestion run."""
+    
+    def __init__(self, total: int):
+        self.total = total
+        self.processed = 0
+        self.ingested = 0
+        self.duplicates = 0
+        self.skipped = 0
+        self.failed: Dict[str, int] = {}
+        self.bytes_read = 0
+        self.started = time.perf_counter()
+    
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+    
+    @property
+    def files_per_second(self) -> float:
+        return self.processed / self.elapsed if self.elapsed else 0.0
+    
+    @property
+    def mb_per_second(self) -> float:
+        return self.bytes_read / 1024 / 1024 / self.elapsed if self.elapsed else 0.0
+    
+    def progress_line(self) -> str:
+        """One-line progress summary."""
+        return (
+            f"[{self.processed}/{self.total}] {self.ingested} ingested, "
+            f"{self.duplicates} duplicate, {self.skipped} skipped, "
+            f"{sum(self.failed.values())} failed | "
+            f"{self.files_per_second:.1f} files/s, {self.mb_per_second:.2f} MB/s"
+        )
+    
+    def summary(self) -> str:
+        """Multi-line end-of-run summary."""
+        failures = ", ".join(f"{reason}={count}" for reason, count in sorted(self.failed.items()))
+        return "\n".join([
+            f"Files:      {self.processed} of {self.total}",
+            f"Ingested:   {self.ingested}",
+            f"Duplicates: {self.duplicates}",
+            f"Skipped:    {self.skipped} (already ingested)",
+            f"Failed:     {sum(self.failed.values())}" + (f" ({failures})" if failures else ""),
+            f"Elapsed:    {self.elapsed:.1f}s",
+            f"Throughput: {self.files_per_second:.1f} files/s, {self.mb_per_second:.2f} MB/s",
+        ])
+
+
+def _process(
+    source: Source, store: ResumeStore, pool: ResumeParserPool, max_chars: Optional[int]
+) -> Tuple[str, str, Optional[Tuple[str, bool]], Optional[str]]:
+    """
+    Read, hash and (unless already stored) parse one file on a worker thread.
+    
+    Returns:
+        tuple: (outcome, content hash, (text, complete) or None, failure reason or None)
+    """
+    data = source.read()
+    content_hash = hashlib.sha256(data).hexdigest()
+    if store.candidate_for_hash(content_hash):
+        return "duplicate", content_hash, None, None
+    try:
+        return "parsed", content_hash, pool.parse(file_format(source.name), data, max_chars), None
+    except ResumeParseError as e:
+        logger.warning(f"Failed to parse {source.name}: {e}")
+        return "failed", content_hash, None, e.reason
+
+
+def ingest(
+    path: str,
+    store: ResumeStore,
+    workers: int = settings.RESUME_INGEST_WORKERS,
+    max_chars: Optional[int] = None,
+    progress: Optional[Callable[[IngestStats], None]] = None,
+    pool: Optional[ResumeParserPool] = None,
+) -> IngestStats:
+    """
+    Ingest every resume under a directory or zip archive into a store.
+    
+    Args:
+        path: Directory or .zip file
+        store: Destination store
+        workers: Parser processes (and reader threads) to run
+        max_chars: Character budget per resume (None for the whole document)
+        progress: Called with the running stats after each file
+        pool: Parser pool to use (default: a new pool sized to workers)
+        
+    Returns:
+        IngestStats: Counters and throughput for the run
+    """
+    sources: List[Source] = list(iter_sources(path))
+    stats = IngestStats(len(sources))
+    pending = []
+    for source in sources:
+        if store.is_source_done(source.name, source.size_bytes, source.mtime):
+            stats.skipped += 1
+            stats.processed += 1
+        else:
+            pending.append(source)
+    
+    own_pool = pool is None
+    if own_pool:
+        pool = ResumeParserPool(
+            workers=workers,
+            timeout=settings.RESUME_PARSE_TIMEOUT,
+            memory_limit_mb=settings.RESUME_PARSE_MEMORY_MB,
+            max_jobs_per_worker=settings.RESUME_SANDBOX_MAX_JOBS_PER_WORKER,
+        )
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="resume-ingest") as executor:
+            futures = {
+                executor.submit(_process, source, store, pool, max_chars): source
+                for source in pending
+            }
+            for future in as_completed(futures):
+                source = futures[future]
+                outcome, content_hash, result, reason = future.result()
+                stats.processed += 1
+                stats.bytes_read += source.size_bytes
+                
+                if outcome == "failed":
+                    stats.failed[reason] = stats.failed.get(reason, 0) + 1
+                elif outcome == "duplicate" or store.candidate_for_hash(content_hash):
+                    # Identical files parsed concurrently are caught here
+                    stats.duplicates += 1
+                else:
+                    text, complete = result
+                    store.add(
+                        candidate_id_from_name(source.name),
+                        content_hash,
+                        text,
+                        source=source.name,
+                        file_type=file_format(source.name),
+                        size_bytes=source.size_bytes,
+                        complete=complete,
+                    )
+                    stats.ingested += 1
+                # Failed files are recorded too, so a resumed run does not retry them
+                store.record_source(source.name, source.size_bytes, source.mtime, content_hash)
+                
+                if stats.processed % COMMIT_EVERY == 0:
+                    store.commit()
+                if progress:
+                    progress(stats)
+    finally:
+        store.commit()
+        if own_pool:
+            pool.close()
+    
+    logger.info(f"Resume ingestion finished: {stats.progress_line()}")
+    return stats
+
+
+def main():
+    """Command-line entry point for bulk resume ingestion."""
+    from config.logging_config import setup_logging
+    
+    parser = argparse.ArgumentParser(description="Ingest a directory or zip of resumes")
+    parser.add_argument("path", help="Directory or .zip file of PDF, DOCX and TXT resumes")
+    parser.add_argument("--store", default=settings.RESUME_STORE_PATH, help="Resume store database")
+    parser.add_argument("--workers", type=int, default=settings.RESUME_INGEST_WORKERS,
+                        help="Parallel parser processes")
+    parser.add_argument("--max-chars", type=int, default=0,
+                        help="Character budget per resume (0 for the whole document)")
+    args = parser.parse_args()
+    
+    setup_logging(log_to_file=False)
+    store = ResumeStore(args.store)
+    
+    def report(stats: IngestStats):
+        sys.stderr.write("\r" + stats.progress_line())
+        sys.stderr.flush()
+    
+    stats = ingest(args.path, store, workers=args.workers, max_chars=args.max_chars or None, progress=report)
+    sys.stderr.write("\n")
+    print(stats.summary())
+    print(f"Store {args.store} holds {len(store)} candidates")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+"""
+Embedding-backed retrieval of resume excerpts.
+
+Each interview's resume is chunked and embedded once into a normalized
+NumPy matrix. For every question the agent's round focus (plus the
+candidate's last answer) is embedded and the top-k chunks are found with a
+single matrix-vector product, so only the relevant parts of the resume go
+into the prompt.
+"""
+import asyncio
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from config import settings
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# What each round's questions draw on from a resume
+ROUND_QUERIES = {
+    "technical": "projects built, technical stack, programming languages, frameworks, "
+                 "databases, cloud infrastructure, system design and architecture",
+    "hr": "teamwork, collaboration, communication, cross-functional work, conflict "
+          "resolution, volunteering, values and motivation",
+    "manager": "leadership, mentoring, managing people, ownership, strategy, "
+               "stakeholders, business impact and career goals",
+}
+
+_TOKEN = re.compile(r"[a-z0-9+#]+")
+
+
+class HashingEmbeddings(Embeddings):
+    """
+    Deterministic local embeddings using the hashing trick.
+    
+    Words are hashed into a fixed number of signed buckets, so texts that
+    share vocabulary get similar vectors. Used when no Azure embedding
+    deployment is configured, and as a stand-in in tests.
+    """
+    
+    def __init__(self, dimensions: int = 512):
+        self.dimensions = dimensions
+    
+    def _embed(self, text: str) -> List[float]:
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for token in _TOKEN.findall(text.lower()):
+            digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            vector[value % self.dimensions] += 1.0 if value >> 63 else -1.0
+        norm = np.linalg.norm(vector)
+        return (vector / norm if norm else vector).tolist()
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self._embed(text) for text in texts]
+    
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed(text)
+
+
+def get_embeddings() -> Embeddings:
+    """Get the Azure embedding client, or local hashing embeddings if none is configured."""
+    if settings.OPENAI_EMBED_DEPLOYMENT_NAME:
+        from azure_clients import get_embedding_client
+        return get_embedding_client()
+    return HashingEmbeddings()
+
+
+def chunk_resume(text: str, chunk_chars: int) -> List[str]:
+    """
+    Split resume text into chunks of about chunk_chars on line boundaries.
+    
+    Args:
+        text: Resume text
+        chunk_chars: Target chunk size in characters
+        
+    Returns:
+        List[str]: Non-empty chunks in document order
+    """
+    chunks = []
+    current: List[str] = []
+    size = 0
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        # Lines longer than a chunk are split on word boundaries
+        while len(line) > chunk_chars:
+            cut = line.rfind(" ", 0, chunk_chars)
+            cut = cut if cut > 0 else chunk_chars
+            pieces, line = line[:cut], line[cut:].strip()
+            if current:
+                chunks.append("\n".join(current))
+                current, size = [], 0
+            chunks.append(pieces)
+        if current and size + len(line) > chunk_chars:
+            chunks.append("\n".join(current))
+            current, size = [], 0
+        if line:
+            current.append(line)
+            size += len(line) + 1
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    """Scale rows (or a vector) to unit length."""
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+
+class ResumeIndex:
+    """Chunks of one resume and their unit-length embedding matrix."""
+    
+    def __init__(self, chunks: List[str], vectors: List[List[float]]):
+        self.chunks = chunks
+        self.matrix = _normalize(np.asarray(vectors, dtype=np.float32))
+    
+    def top_k(self, query: np.ndarray, k: int) -> List[str]:
+        """
+        Find the k chunks most similar to a query vector.
+        
+        Args:
+            query: Query embedding
+            k: Number of chunks
+            
+        Returns:
+            List[str]: Matching chunks, in document order
+        """
+        if not self.chunks:
+            return []
+        scores = self.matrix @ _normalize(query.astype(np.float32))
+        k = min(k, len(self.chunks))
+        best = np.argpartition(-scores, k - 1)[:k]
+        return [self.chunks[i] for i in sorted(best)]
+
+
+class ResumeRetriever:
+    """Per-interview resume indexes shared by the question agents."""
+    
+    def __init__(
+        self,
+        embeddings: Optional[Embeddings] = None,
+        top_k: int = settings.RESUME_RETRIEVAL_TOP_K,
+        chunk_chars: int = settings.RESUME_CHUNK_CHARS,
+        max_interviews: int = settings.RESUME_RETRIEVAL_MAX_INTERVIEWS,
+    ):
+        """
+        Initialize the retriever.
+        
+        Args:
+            embeddings: Embedding model (default: get_embeddings())
+            top_k: Chunks returned per question
+            chunk_chars: Target chunk size in characters
+            max_interviews: Indexes kept before the least recent is dropped
+        """
+        self.embeddings = embeddings or get_embeddings()
+        self.top_k = top_k
+        self.chunk_chars = chunk_chars
+        self.max_interviews = max_interviews
+        self._indexes: "OrderedDict[str, Future]" = OrderedDict()
+        self._round_vectors: Dict[str, np.ndarray] = {}
+        # Last result per interview, so async prefetching serves build_prompt
+        self._last: Dict[str, Tuple[Tuple[str, str], List[str]]] = {}
+        self._lock = threading.Lock()
+    
+    def _claim_index(self, state: Dict) -> Tuple[Future, bool]:
+        """Get the interview's index future, and whether the caller must build it."""
+        interview_id = state["interview_id"]
+        with self._lock:
+            future = self._indexes.get(interview_id)
+            if future is not None:
+                self._indexes.move_to_end(interview_id)
+                return future, False
+            future = Future()
+            self._indexes[interview_id] = future
+            while len(self._indexes) > self.max_interviews:
+                dropped, _ = self._indexes.popitem(last=False)
+                self._last.pop(dropped, None)
+            return future, True
+    
+    def _index(self, state: Dict) -> Optional[ResumeIndex]:
+        """Get the interview's resume index, embedding the resume on first use."""
+        future, owner = self._claim_index(state)
+        if owner:
+            try:
+                chunks = chunk_resume(state["resume_text"], self.chunk_chars)
+                future.set_result(ResumeIndex(chunks, self.embeddings.embed_documents(chunks)))
+                logger.info(f"Embedded {len(chunks)} resume chunks for interview {state['interview_id']}")
+            except Exception as e:
+                logger.warning(f"Resume embedding failed ({e}), prompts will not include excerpts")
+                future.set_result(None)
+            except BaseException:
+                self._abandon_index(state, future)
+                raise
+        return future.result()
+    
+    async def _aindex(self, state: Dict) -> Optional[ResumeIndex]:
+        """Async version of _index."""
+        future, owner = self._claim_index(state)
+        if owner:
+            try:
+                chunks = chunk_resume(state["resume_text"], self.chunk_chars)
+                vectors = await self.embeddings.aembed_documents(chunks)
+                future.set_result(ResumeIndex(chunks, vectors))
+                logger.info(f"Embedded {len(chunks)} resume chunks for interview {state['interview_id']}")
+            except Exception as e:
+                logger.warning(f"Resume embedding failed ({e}), prompts will not include excerpts")
+                future.set_result(None)
+            except BaseException:
+                # Cancelled, e.g. by a client disconnecting mid-step
+                self._abandon_index(state, future)
+                raise
+        return await asyncio.wrap_future(future)
+    
+    def _abandon_index(self, state: Dict, future: Future) -> None:
+        """
+        Release an index whose owner was interrupted before building it.
+        
+        Callers already waiting go without excerpts this time; the claim is
+        dropped so the next call builds the index again.
+        """
+        with self._lock:
+            if self._indexes.get(state["interview_id"]) is future:
+                del self._indexes[state["interview_id"]]
+        future.set_result(None)
+    
+    def _round_vector(self, agent_type: str) -> np.ndarray:
+        """Embedding of a round's focus (shared across interviews)."""
+        vector = self._round_vectors.get(agent_type)
+        if vector is None:
+            vector = np.asarray(self.embeddings.embed_query(ROUND_QUERIES[agent_type]), dtype=np.float32)
+            self._round_vectors[agent_type] = vector
+        return vector
+    
+    def _query_key(self, state: Dict, agent_type: str) -> Tuple[str, str]:
+        return agent_type, state.get("last_answer") or ""
+    
+    def _query(self, round_vector: np.ndarray, answer_vector: Optional[np.ndarray]) -> np.ndarray:
+        """Blend the round focus with the last answer, weighting each equally."""
+        query = _normalize(round_vector)
+        if answer_vector is not None:
+            query = query + _normalize(answer_vector)
+        return query
+    
+    def retrieve(self, state: Dict, agent_type: str) -> List[str]:
+        """
+        Get the resume chunks most relevant to the agent's next question.
+        
+        Args:
+            state: Current interview state
+            agent_type: Agent asking the question ("technical", "hr" or "manager")
+            
+        Returns:
+            List[str]: Up to top_k chunks in document order ([] without a resume)
+        """
+        if not state.get("resume_text") or agent_type not in ROUND_QUERIES:
+            return []
+        key = self._query_key(state, agent_type)
+        last = self._last.get(state["interview_id"])
+        if last and last[0] == key:
+            return last[1]
+        
+        index = self._index(state)
+        if index is None:
+            return []
+        try:
+            answer = state.get("last_answer")
+            answer_vector = np.asarray(self.embeddings.embed_query(answer), dtype=np.float32) if answer else None
+            chunks = index.top_k(self._query(self._round_vector(agent_type), answer_vector), self.top_k)
+        except Exception as e:
+            logger.warning(f"Resume retrieval failed ({e}), prompt will not include excerpts")
+            return []
+        self._last[state["interview_id"]] = (key, chunks)
+        return chunks
+    
+    async def aretrieve(self, state: Dict, agent_type: str) -> List[str]:
+        """Async version of retrieve; later retrieve calls for the same query reuse the result."""
+        if not state.get("resume_text") or agent_type not in ROUND_QUERIES:
+            return []
+        key = self._query_key(state, agent_type)
+        last = self._last.get(state["interview_id"])
+        if last and last[0] == key:
+            return last[1]
+        
+        index = await self._aindex(state)
+        if index is None:
+            return []
+        try:
+            if agent_type not in self._round_vectors:
+                self._round_vectors[agent_type] = np.asarray(
+                    await self.embeddings.aembed_query(ROUND_QUERIES[agent_type]), dtype=np.float32
+                )
+            answer = state.get("last_answer")
+            answer_vector = (
+                np.asarray(await self.embeddings.aembed_query(answer), dtype=np.float32) if answer else None
+            )
+            chunks = index.top_k(self._query(self._round_vectors[agent_type], answer_vector), self.top_k)
+        except Exception as e:
+            logger.warning(f"Resume retrieval failed ({e}), prompt will not include excerpts")
+            return []
+        self._last[state["interview_id"]] = (key, chunks)
+        return chunks
+    
+    def discard(self, state: Dict) -> None:
+        """Drop an interview's index once it is no longer needed."""
+        with self._lock:
+            self._indexes.pop(state.get("interview_id"), None)
+            self._last.pop(state.get("interview_id"), None)
@@ -0,0 +1,251 @@
+"""
+Sandboxed worker processes for resume parsing.
+
+PyPDF2 and python-docx run untrusted uploads. Parsing happens in a small
+pool of worker processes with a wall-clock timeout per job, an address
+space limit and a per-job CPU limit set through `resource`, so a malformed
+or adversarial file can only take down its own worker. Workers are
+replaced after a timeout or crash and recycled after a configurable number
+of jobs.
+"""
+import atexit
+import math
+import multiprocessing
+import queue
+import signal
+import threading
+from typing import Optional, Tuple
+
+from config import settings
+from config.logging_config import get_logger
+from src.resume.extraction import (
+    CORRUPT,
+    EXTRACTORS,
+    TIMEOUT,
+    TOO_LARGE,
+    ResumeParseError,
+)
+
+logger = get_logger(__name__)
+
+try:
+    import resource
+    RESOURCE_LIMITS = True
+except ImportError:
+    RESOURCE_LIMITS = False
+
+
+def _apply_limits(memory_limit_mb: int) -> None:
+    """Cap this process's address space."""
+    if not RESOURCE_LIMITS:
+        return
+    # RLIMIT_RSS is not enforced on Linux; the address space cap is the
+    # limit the kernel actually applies to allocations
+    if memory_limit_mb:
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _limit_next_job_cpu(cpu_seconds: int) -> None:
+    """
+    Allow the next job cpu_seconds of CPU time.
+    
+    RLIMIT_CPU counts the whole life of the process, so the soft limit is
+    moved past the CPU time earlier jobs used; otherwise a recycled worker
+    would be killed part way through a valid file.
+    """
+    if not RESOURCE_LIMITS or not cpu_seconds:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft = math.ceil(usage.ru_utime + usage.ru_stime) + cpu_seconds
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _worker_main(conn, memory_limit_mb: int, cpu_seconds: int) -> None:
+    """Serve parse jobs from the parent until the pipe closes."""
+    _apply_limits(memory_limit_mb)
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        if job is None:
+            return
+        
+        _limit_next_job_cpu(cpu_seconds)
+        file_type, data, max_chars = job
+        try:
+            reply = ("ok", EXTRACTORS[file_type](data, max_chars))
+        except ResumeParseError as e:
+            reply = (e.reason, e.detail)
+        except MemoryError:
+            reply = (TOO_LARGE, "memory limit exceeded while parsing")
+        except Exception as e:
+            reply = (CORRUPT, f"{type(e).__name__}: {e}")
+        # Drop references before the next job so peak memory resets
+        job = data = None
+        conn.send(reply)
+
+
+class _Worker:
+    """One sandboxed parser process and the parent's end of its pipe."""
+    
+    def __init__(self, context, memory_limit_mb: int, cpu_seconds: int):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, memory_limit_mb, cpu_seconds),
+            name="resume-parser",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.jobs = 0
+    
+    def stop(self, kill: bool = False) -> None:
+        """Stop the process, killing it if it may be stuck."""
+        if not kill and self.process.is_alive():
+            try:
+                self.conn.send(None)
+                self.process.join(timeout=1)
+            except (BrokenPipeError, OSError):
+                pass
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class ResumeParserPool:
+    """Bounded pool of sandboxed resume parser processes."""
+    
+    def __init__(
+        self,
+        workers: int = 2,
+        timeout: float = 10.0,
+        memory_limit_mb: int = 512,
+        max_jobs_per_worker: int = 50,
+        start_method: str = "spawn",
+    ):
+        """
+        Initialize the pool. Worker processes start on first use.
+        
+        Args:
+            workers: Maximum parses running at once
+            timeout: Wall-clock seconds allowed per parse
+            memory_limit_mb: Address space limit per worker (0 for none)
+            max_jobs_per_worker: Jobs before a worker is replaced (0 for never)
+            start_method: multiprocessing start method for workers
+        """
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.max_jobs_per_worker = max_jobs_per_worker
+        # Per-job CPU limit, backstopping the wall-clock timeout if the parent is busy
+        self.cpu_seconds = max(1, int(timeout * 2))
+        self._context = multiprocessing.get_context(start_method)
+        # Each slot holds a running worker or None until one is needed
+        self._slots: "queue.Queue[Optional[_Worker]]" = queue.Queue()
+        for _ in range(workers):
+            self._slots.put(None)
+        self._size = workers
+        self.restarts = 0
+    
+    def parse(self, file_type: str, data: bytes, max_chars: Optional[int] = None) -> Tuple[str, bool]:
+        """
+        Parse file bytes in a worker process.
+        
+        Args:
+            file_type: Key into EXTRACTORS
+            data: Raw file bytes
+            max_chars: Character budget (None or 0 for the whole document)
+            
+        Returns:
+            tuple: (extracted text, whether the whole document was read)
+            
+        Raises:
+            ResumeParseError: With reason timeout, too_large or corrupt
+        """
+        worker = self._slots.get()
+        try:
+            if worker is None or not worker.process.is_alive():
+                worker = self._start_worker(worker)
+            
+            job = (file_type, data, max_chars)
+            try:
+                worker.conn.send(job)
+            except OSError:
+                # The worker died after the liveness check; the file is not to blame
+                logger.warning("Resume parser worker exited before receiving the job; replacing it")
+                worker = self._start_worker(worker)
+                try:
+                    worker.conn.send(job)
+                except OSError as e:
+                    worker.stop(kill=True)
+                    worker = None
+                    raise ResumeParseError(CORRUPT, f"parser worker unreachable ({e})")
+            if not worker.conn.poll(self.timeout):
+                logger.warning(f"Resume parse timed out after {self.timeout}s; killing worker")
+                worker.stop(kill=True)
+                worker = None
+                raise ResumeParseError(TIMEOUT, f"no result after {self.timeout}s")
+            
+            try:
+                status, payload = worker.conn.recv()
+            except (EOFError, OSError):
+                worker.process.join(timeout=1)
+                exitcode = worker.process.exitcode
+                worker.stop(kill=True)
+                worker = None
+                if exitcode == -signal.SIGXCPU:
+                    raise ResumeParseError(TIMEOUT, f"CPU limit of {self.cpu_seconds}s exceeded")
+                if exitcode == -signal.SIGKILL:
+                    raise ResumeParseError(TOO_LARGE, f"worker killed (exit code {exitcode})")
+                raise ResumeParseError(CORRUPT, f"worker crashed (exit code {exitcode})")
+            
+            worker.jobs += 1
+            if self.max_jobs_per_worker and worker.jobs >= self.max_jobs_per_worker:
+                worker.stop()
+                worker = None
+            
+            if status != "ok":
+                raise ResumeParseError(status, payload)
+            return payload
+        finally:
+            self._slots.put(worker)
+    
+    def _start_worker(self, previous: Optional[_Worker]) -> _Worker:
+        """Start a worker, cleaning up the one it replaces."""
+        if previous is not None:
+            previous.stop(kill=True)
+            self.restarts += 1
+        return _Worker(self._context, self.memory_limit_mb, self.cpu_seconds)
+    
+    def close(self) -> None:
+        """Stop every worker; the pool cannot be used afterwards."""
+        for _ in range(self._size):
+            worker = self._slots.get()
+            if worker is not None:
+                worker.stop()
+
+
+_pool: Optional[ResumeParserPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_parser_pool() -> ResumeParserPool:
+    """Get the process-wide resume parser pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ResumeParserPool(
+                workers=settings.RESUME_SANDBOX_WORKERS,
+                timeout=settings.RESUME_PARSE_TIMEOUT,
+                memory_limit_mb=settings.RESUME_PARSE_MEMORY_MB,
+                max_jobs_per_worker=settings.RESUME_SANDBOX_MAX_JOBS_PER_WORKER,
+            )
+            atexit.register(_pool.close)
+            logger.info(f"Started resume parser pool with {settings.RESUME_SANDBOX_WORKERS} workers")
+        return _pool
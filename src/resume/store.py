@@ -0,0 +1,181 @@
+"""
+SQLite store of ingested resumes, one row per candidate.
+
+Text is zlib-compressed next to its metadata and keyed by a candidate id
+derived from the file name. Content hashes are unique, so the same resume
+is only stored once, and processed source files are recorded so an
+interrupted ingestion run can resume where it stopped.
+"""
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from config import settings
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def candidate_id_from_name(name: str) -> str:
+    """Turn a file name into a candidate id: 'Jane Doe CV.pdf' -> 'jane-doe-cv'."""
+    stem = Path(name).name.rsplit(".", 1)[0]
+    slug = re.sub(r"[^a-z0-9]+", "-", stem.lower()).strip("-")
+    return slug or "candidate"
+
+
+class ResumeStore:
+    """Compact, thread-safe store of resume text plus metadata."""
+    
+    def __init__(self, db_path: str):
+        """
+        Open (or create) a store.
+        
+        Args:
+            db_path: SQLite database file
+        """
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS resumes ("
+            "candidate_id TEXT PRIMARY KEY, content_hash TEXT UNIQUE NOT NULL, "
+            "source TEXT, file_type TEXT, size_bytes INTEGER, chars INTEGER, "
+            "complete INTEGER, text BLOB, ingested_at REAL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS sources ("
+            "source TEXT PRIMARY KEY, size_bytes INTEGER, mtime REAL, content_hash TEXT)"
+        )
+        self._db.commit()
+    
+    def candidate_for_hash(self, content_hash: str) -> Optional[str]:
+        """Get the candidate id already stored for a content hash, or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT candidate_id FROM resumes WHERE content_hash = ?", (content_hash,)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def is_source_done(self, source: str, size_bytes: int, mtime: float) -> bool:
+        """Check whether a source file was processed and has not changed since."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT size_bytes, mtime FROM sources WHERE source = ?", (source,)
+            ).fetchone()
+        return row is not None and row[0] == size_bytes and row[1] == mtime
+    
+    def add(
+        self,
+        candidate_id: str,
+        content_hash: str,
+        text: str,
+        source: str = "",
+        file_type: str = "",
+        size_bytes: int = 0,
+        complete: bool = True,
+    ) -> str:
+        """
+        Store a resume; call commit() to persist.
+        
+        Args:
+            candidate_id: Preferred candidate id (a hash suffix is added on collision)
+            content_hash: SHA-256 of the file bytes
+            text: Extracted text
+            source: Where the file came from
+            file_type: File extension
+            size_bytes: Size of the original file
+            complete: Whether the text covers the whole document
+            
+        Returns:
+            str: The candidate id the resume was stored under
+        """
+        with self._lock:
+            taken = self._db.execute(
+                "SELECT 1 FROM resumes WHERE candidate_id = ?", (candidate_id,)
+            ).fetchone()
+            if taken:
+                candidate_id = f"{candidate_id}-{content_hash[:8]}"
+            self._db.execute(
+                "INSERT INTO resumes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (candidate_id, content_hash, source, file_type, size_bytes, len(text),
+                 int(complete), zlib.compress(text.encode("utf-8")), time.time()),
+            )
+        return candidate_id
+    
+    def record_source(self, source: str, size_bytes: int, mtime: float, content_hash: str) -> None:
+        """Mark a source file as processed; call commit() to persist."""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?)",
+                (source, size_bytes, mtime, content_hash),
+            )
+    
+    def commit(self) -> None:
+        """Persist pending writes."""
+        with self._lock:
+            self._db.commit()
+    
+    def get(self, candidate_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a stored resume.
+        
+        Args:
+            candidate_id: Candidate id
+            
+        Returns:
+            dict or None: Text and metadata, or None if the id is unknown
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT candidate_id, content_hash, source, file_type, size_bytes, chars, "
+                "complete, text, ingested_at FROM resumes WHERE candidate_id = ?",
+                (candidate_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "candidate_id": row[0],
+            "content_hash": row[1],
+            "source": row[2],
+            "file_type": row[3],
+            "size_bytes": row[4],
+            "chars": row[5],
+            "complete": bool(row[6]),
+            "text": zlib.decompress(row[7]).decode("utf-8"),
+            "ingested_at": row[8],
+        }
+    
+    def candidate_ids(self) -> List[str]:
+        """List stored candidate ids."""
+        with self._lock:
+            rows = self._db.execute("SELECT candidate_id FROM resumes ORDER BY candidate_id").fetchall()
+        return [row[0] for row in rows]
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+    
+    def close(self) -> None:
+        """Commit and close the database."""
+        with self._lock:
+            self._db.commit()
+            self._db.close()
+
+
+_stores: Dict[str, ResumeStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_resume_store(db_path: Optional[str] = None) -> ResumeStore:
+    """Get the shared store for a database path (default RESUME_STORE_PATH)."""
+    db_path = db_path or settings.RESUME_STORE_PATH
+    with _stores_lock:
+        if db_path not in _stores:
+            _stores[db_path] = ResumeStore(db_path)
+        return _stores[db_path]
@@ -0,0 +1,20 @@
+"""Session stores keeping interview state where every worker can reach it."""
+from .store import (
+    MemorySessionStore,
+    SQLiteSessionStore,
+    SessionConflictError,
+    SessionStore,
+    create_session_store,
+    get_session_store,
+)
+from .redis_store import RedisSessionStore
+
+__all__ = [
+    "MemorySessionStore",
+    "RedisSessionStore",
+    "SQLiteSessionStore",
+    "SessionConflictError",
+    "SessionStore",
+    "create_session_store",
+    "get_session_store",
+]
@@ -0,0 +1,191 @@
+"""
+Session store on a Redis-protocol server (Redis, Valkey, KeyDB, ...).
+
+Talks RESP over plain sockets, so it needs no client library. Each
+interview is a hash holding its version and packed state. Saves use
+Redis' optimistic transactions: the key is WATCHed while its version is
+checked, and the write in MULTI/EXEC is dropped by the server if anyone
+else wrote the key in between. Commands are pipelined, so a save takes two
+round trips and a load one.
+"""
+import queue
+import socket
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional, Sequence
+from urllib.parse import urlparse
+
+from config.logging_config import get_logger
+from src.sessions.store import SessionStore
+
+logger = get_logger(__name__)
+
+# Prefix of the interview keys
+KEY_PREFIX = "interview:"
+
+
+class RedisError(Exception):
+    """Error reply from the server."""
+
+
+class RespConnection:
+    """A connection to a Redis-protocol server."""
+    
+    def __init__(self, host: str, port: int, db: int = 0, password: Optional[str] = None, timeout: float = 10.0):
+        """
+        Connect (and authenticate and select the database, if given).
+        
+        Args:
+            host: Server host
+            port: Server port
+            db: Database index
+            password: Password for AUTH
+            timeout: Socket timeout in seconds
+        """
+        self._socket = socket.create_connection((host, port), timeout=timeout)
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._socket.makefile("rb")
+        if password:
+            self.execute("AUTH", password)
+        if db:
+            self.execute("SELECT", db)
+    
+    @staticmethod
+    def _encode(args: Sequence[Any]) -> bytes:
+        """Encode a command as a RESP array of bulk strings."""
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if not isinstance(arg, bytes):
+                arg = str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        return b"".join(parts)
+    
+    def _read_reply(self) -> Any:
+        """Read one reply; error replies are returned as RedisError."""
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Connection closed by the server")
+        kind, body = line[:1], line[1:-2]
+        if kind == b"+":
+            return body.decode("utf-8")
+        if kind == b"-":
+            return RedisError(body.decode("utf-8"))
+        if kind == b":":
+            return int(body)
+        if kind == b"$":
+            length = int(body)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            length = int(body)
+            if length < 0:
+                return None
+            return [self._read_reply() for _ in range(length)]
+        raise ConnectionError(f"Unexpected reply from the server: {line[:20]!r}")
+    
+    def pipeline(self, *commands: Sequence[Any]) -> List[Any]:
+        """
+        Send several commands at once and read their replies.
+        
+        Returns:
+            list: One reply per command
+        
+        Raises:
+            RedisError: If any command failed
+        """
+        self._socket.sendall(b"".join(self._encode(command) for command in commands))
+        replies = [self._read_reply() for _ in commands]
+        for reply in replies:
+            if isinstance(reply, RedisError):
+                raise reply
+        return replies
+    
+    def execute(self, *args: Any) -> Any:
+        """Send a command and return its reply."""
+        return self.pipeline(args)[0]
+    
+    def close(self) -> None:
+        """Close the connection."""
+        try:
+            self._reader.close()
+            self._socket.close()
+        except OSError:
+            pass
+
+
+class RedisSessionStore(SessionStore):
+    """Session store on a Redis-protocol server, shared by every worker."""
+    
+    shared = True
+    
+    def __init__(self, url: str, ttl_seconds: int = 0, max_idle_connections: int = 16):
+        """
+        Configure the store (connections are opened on demand).
+        
+        Args:
+            url: Server URL, redis://[:password@]host[:port][/db]
+            ttl_seconds: Expiry of an interview after its last save (0 to
+                keep interviews until deleted)
+            max_idle_connections: Connections kept open for reuse
+        """
+        parsed = urlparse(url)
+        if parsed.scheme != "redis":
+            raise ValueError(f"Unsupported session store URL '{url}' (expected redis://host:port/db)")
+        self.host = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port or 6379
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self._password = parsed.password
+        self.ttl_seconds = ttl_seconds
+        # Connections hold WATCH state, so each one serves a single caller at a time
+        self._idle: "queue.LifoQueue[RespConnection]" = queue.LifoQueue(maxsize=max_idle_connections)
+    
+    @contextmanager
+    def _connection(self) -> Iterator[RespConnection]:
+        """Borrow a connection; one that failed is closed rather than reused."""
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            connection = RespConnection(self.host, self.port, self.db, self._password)
+        try:
+            yield connection
+        except BaseException:
+            connection.close()
+            raise
+        try:
+            self._idle.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+    
+    def _key(self, interview_id: str) -> str:
+        return KEY_PREFIX + interview_id
+    
+    def _read(self, interview_id: str) -> Optional[bytes]:
+        with self._connection() as connection:
+            return connection.execute("HGET", self._key(interview_id), "state")
+    
+    def _write(self, interview_id: str, expected: int, version: int, data: bytes) -> bool:
+        key = self._key(interview_id)
+        with self._connection() as connection:
+            _, stored = connection.pipeline(("WATCH", key), ("HGET", key, "version"))
+            if stored is not None and int(stored) != expected:
+                connection.execute("UNWATCH")
+                return False
+            commands = [("MULTI",), ("HSET", key, "version", version, "state", data)]
+            if self.ttl_seconds:
+                commands.append(("EXPIRE", key, self.ttl_seconds))
+            commands.append(("EXEC",))
+            # EXEC replies nil when the watched key was written in between
+            return connection.pipeline(*commands)[-1] is not None
+    
+    def delete(self, interview_id: str) -> bool:
+        with self._connection() as connection:
+            return connection.execute("DEL", self._key(interview_id)) > 0
+    
+    def close(self) -> None:
+        """Close the idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
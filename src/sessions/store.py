@@ -0,0 +1,269 @@
+"""
+Session stores holding the latest state of every interview.
+
+Front ends keep an interview's state in a SessionStore rather than in the
+memory of the process that started it, so any worker can load the state,
+run the next step and save it back. Saves are optimistic: every stored
+state carries a version, a save only succeeds if the stored version is
+still the one the state was loaded with, and the saved state comes back
+with the next version. A worker saving a stale copy gets a
+SessionConflictError instead of overwriting the newer state.
+
+States are stored compactly: encoded with the interview state codec and
+zlib-compressed.
+"""
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from config import settings
+from config.logging_config import get_logger
+from src.graph.codec import decode_state, encode_state
+from src.graph.state import InterviewState
+
+logger = get_logger(__name__)
+
+# zlib level of stored states (fast; transcripts still shrink to about a third)
+COMPRESSION_LEVEL = 1
+
+
+class SessionConflictError(Exception):
+    """Raised when a state is saved over a newer version of the interview."""
+    
+    def __init__(self, interview_id: str, version: int):
+        super().__init__(
+            f"Interview {interview_id} was updated elsewhere since version {version}; load it again"
+        )
+        self.interview_id = interview_id
+        self.version = version
+
+
+def pack_state(state: InterviewState) -> bytes:
+    """Serialize a state for storage."""
+    return zlib.compress(encode_state(state), COMPRESSION_LEVEL)
+
+
+def unpack_state(data: bytes) -> InterviewState:
+    """Deserialize a state stored by pack_state."""
+    return decode_state(zlib.decompress(data))
+
+
+class SessionStore:
+    """
+    Base class of the session stores.
+    
+    Backends implement _read, _write and delete; load and save add the
+    serialization and versioning on top.
+    """
+    
+    # Whether other processes may load interviews this process saves
+    shared = False
+    
+    def load(self, interview_id: str) -> Optional[InterviewState]:
+        """
+        Load the latest state of an interview.
+        
+        Args:
+            interview_id: Id of the interview
+        
+        Returns:
+            InterviewState or None if the interview is not stored
+        """
+        data = self._read(interview_id)
+        return None if data is None else unpack_state(data)
+    
+    def save(self, state: InterviewState) -> InterviewState:
+        """
+        Save a state over the version it was loaded with.
+        
+        A state is saved if the stored version equals its version, or if
+        nothing is stored for the interview yet.
+        
+        Args:
+            state: State to save (left unchanged)
+        
+        Returns:
+            InterviewState: The saved state, with the next version
+        
+        Raises:
+            SessionConflictError: If the interview was saved by someone
+                else since the state was loaded
+        """
+        version = state.get("version", 0)
+        saved = {**state, "version": version + 1}
+        if not self._write(state["interview_id"], version, saved["version"], pack_state(saved)):
+            raise SessionConflictError(state["interview_id"], version)
+        return saved
+    
+    def delete(self, interview_id: str) -> bool:
+        """
+        Remove an interview from the store.
+        
+        Returns:
+            bool: Whether the interview was stored
+        """
+        raise NotImplementedError
+    
+    def close(self) -> None:
+        """Release the store's resources."""
+    
+    def _read(self, interview_id: str) -> Optional[bytes]:
+        """Get the stored data of an interview, or None."""
+        raise NotImplementedError
+    
+    def _write(self, interview_id: str, expected: int, version: int, data: bytes) -> bool:
+        """
+        Store data as the given version of an interview.
+        
+        Args:
+            interview_id: Id of the interview
+            expected: Version that must still be stored (ignored if the
+                interview is not stored yet)
+            version: Version of the new data
+            data: Packed state
+        
+        Returns:
+            bool: Whether the data was stored (False on a version conflict)
+        """
+        raise NotImplementedError
+
+
+class MemorySessionStore(SessionStore):
+    """Session store in the memory of this process (one worker only)."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, Tuple[int, bytes]] = {}
+    
+    def _read(self, interview_id: str) -> Optional[bytes]:
+        with self._lock:
+            stored = self._sessions.get(interview_id)
+        return None if stored is None else stored[1]
+    
+    def _write(self, interview_id: str, expected: int, version: int, data: bytes) -> bool:
+        with self._lock:
+            stored = self._sessions.get(interview_id)
+            if stored is not None and stored[0] != expected:
+                return False
+            self._sessions[interview_id] = (version, data)
+            return True
+    
+    def delete(self, interview_id: str) -> bool:
+        with self._lock:
+            return self._sessions.pop(interview_id, None) is not None
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+
+class SQLiteSessionStore(SessionStore):
+    """Session store in a SQLite file, shared by the worker processes of a host."""
+    
+    def __init__(self, db_path: str):
+        """
+        Open (or create) a session database.
+        
+        Args:
+            db_path: SQLite database file (":memory:" for a private in-memory database)
+        """
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self.shared = db_path != ":memory:"
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "interview_id TEXT PRIMARY KEY, version INTEGER NOT NULL, state BLOB NOT NULL, updated_at REAL)"
+        )
+        self._db.commit()
+    
+    def _read(self, interview_id: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT state FROM sessions WHERE interview_id = ?", (interview_id,)
+            ).fetchone()
+        return None if row is None else row[0]
+    
+    def _write(self, interview_id: str, expected: int, version: int, data: bytes) -> bool:
+        now = time.time()
+        with self._lock:
+            # The version check and the write are one statement, so they are
+            # atomic across processes sharing the file
+            written = self._db.execute(
+                "UPDATE sessions SET version = ?, state = ?, updated_at = ? WHERE interview_id = ? AND version = ?",
+                (version, data, now, interview_id, expected),
+            ).rowcount
+            if not written:
+                written = self._db.execute(
+                    "INSERT OR IGNORE INTO sessions (interview_id, version, state, updated_at) VALUES (?, ?, ?, ?)",
+                    (interview_id, version, data, now),
+                ).rowcount
+            self._db.commit()
+        return bool(written)
+    
+    def delete(self, interview_id: str) -> bool:
+        with self._lock:
+            deleted = self._db.execute("DELETE FROM sessions WHERE interview_id = ?", (interview_id,)).rowcount
+            self._db.commit()
+        return bool(deleted)
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+    
+    def close(self) -> None:
+        """Commit and close the database."""
+        with self._lock:
+            self._db.commit()
+            self._db.close()
+
+
+def create_session_store(backend: Optional[str] = None) -> SessionStore:
+    """
+    Create a session store.
+    
+    Args:
+        backend: "memory", "sqlite" (SESSION_DB_PATH) or "redis"
+            (SESSION_REDIS_URL); defaults to settings.SESSION_STORE
+    
+    Returns:
+        SessionStore: The new store
+    
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    backend = (backend or settings.SESSION_STORE).lower()
+    if backend == "memory":
+        return MemorySessionStore()
+    if backend == "sqlite":
+        return SQLiteSessionStore(settings.SESSION_DB_PATH)
+    if backend == "redis":
+        from src.sessions.redis_store import RedisSessionStore
+        return RedisSessionStore(settings.SESSION_REDIS_URL, ttl_seconds=settings.SESSION_TTL_SECONDS)
+    raise ValueError(f"Unknown session store '{backend}' (expected memory, sqlite or redis)")
+
+
+_session_store: Optional[SessionStore] = None
+_session_store_lock = threading.Lock()
+
+
+def get_session_store() -> SessionStore:
+    """
+    Get the process-wide session store, creating it on first use.
+    
+    Returns:
+        SessionStore: Store configured by settings.SESSION_STORE
+    """
+    global _session_store
+    with _session_store_lock:
+        if _session_store is None:
+            _session_store = create_session_store()
+            logger.info(f"Session store: {type(_session_store).__name__}")
+        return _session_store
@@ -0,0 +1,211 @@
+"""
+Tests for the ASGI interview service, using a fake LLM.
+"""
+import asyncio
+import sys
+import os
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from config import settings
+from src.api import CreateInterviewRequest, InterviewService, create_app
+from src.graph.checkpoint import SQLiteCheckpointSaver
+from src.graph.workflow import InterviewWorkflow
+from src.sessions import MemorySessionStore, SQLiteSessionStore
+from benchmarks.fake_llm import FAKE_QUESTION, FakeInterviewLLM, install_fake_llm
+from benchmarks.llm_call_count import total_questions
+from test_workflow import DroppingLLM
+
+CANDIDATE = {"candidate_name": "Test Candidate", "job_role": "Backend Developer", "experience_level": "Junior"}
+
+
+def make_service(llm=None, store=None, **kwargs) -> InterviewService:
+    """Service on a fresh workflow answering from a fake LLM."""
+    workflow = InterviewWorkflow(checkpointer=SQLiteCheckpointSaver(":memory:"))
+    install_fake_llm(workflow, llm or FakeInterviewLLM())
+    return InterviewService(workflow, store if store is not None else MemorySessionStore(), **kwargs)
+
+
+def test_rest_interview_runs_to_evaluation(monkeypatch):
+    """An interview can be driven end to end through the REST endpoints."""
+    monkeypatch.setattr(settings, "PREFETCH_OPENERS", False)
+    with TestClient(create_app(make_service())) as client:
+        interview = client.post("/interviews", json=CANDIDATE).json()
+        interview_id = interview["interview_id"]
+        assert interview["current_question"] is None
+        
+        while not interview["is_complete"]:
+            interview = client.post(f"/interviews/{interview_id}/step").json()
+            if interview["current_question"]:
+                assert interview["current_question"] == FAKE_QUESTION
+                response = client.post(f"/interviews/{interview_id}/answer", json={"answer": "An answer."})
+                assert response.status_code == 200
+        
+        transcript = client.get(f"/interviews/{interview_id}").json()
+    
+    assert interview["evaluation"]["score"] == 78
+    assert interview["questions_asked"] == total_questions()
+    assert len(transcript["qa_pairs"]) == total_questions()
+    assert transcript["qa_pairs"][0] == {"question": FAKE_QUESTION, "answer": "An answer.", "agent_type": "technical"}
+    assert len(transcript["conversation_history"]) == 2 * total_questions()
+
+
+def test_rest_errors(monkeypatch, tmp_path):
+    """Unknown interviews are 404s; answers without a pending question are 409s."""
+    monkeypatch.setattr(settings, "PREFETCH_OPENERS", False)
+    monkeypatch.setattr(settings, "RESUME_STORE_PATH", str(tmp_path / "resumes.db"))
+    with TestClient(create_app(make_service())) as client:
+        interview_id = client.post("/interviews", json=CANDIDATE).json()["interview_id"]
+        
+        assert client.post("/interviews/unknown/step").status_code == 404
+        assert client.post(f"/interviews/{interview_id}/answer", json={"answer": "Early."}).status_code == 409
+        assert client.post(f"/interviews/{interview_id}/answer", json={"answer": ""}).status_code == 422
+        assert client.post("/interviews", json={**CANDIDATE, "candidate_id": "missing"}).status_code == 404
+        assert client.delete(f"/interviews/{interview_id}").status_code == 204
+
+
+def test_answers_assessed_on_one_worker_are_evaluated_on_another(monkeypatch, tmp_path):
+    """With a shared store, assessments are saved with the answers, so the evaluating worker reuses them."""
+    monkeypatch.setattr(settings, "PREFETCH_OPENERS", False)
+    monkeypatch.setattr(settings, "EVALUATION_MODE", "incremental")
+    store = SQLiteSessionStore(str(tmp_path / "sessions.db"))
+    answering_llm, evaluating_llm = FakeInterviewLLM(latency=0.05), FakeInterviewLLM()
+    answering, evaluating = make_service(answering_llm, store), make_service(evaluating_llm, store)
+    
+    async def run():
+        state = await answering.create(CreateInterviewRequest(**CANDIDATE))
+        interview_id = state["interview_id"]
+        for _ in range(total_questions()):
+            await answering.step(interview_id)
+            await answering.answer(interview_id, "An answer.")
+        return await evaluating.step(interview_id)
+    
+    state = asyncio.run(run())
+    
+    assert answering.wait_for_assessments
+    assert evaluating_llm.calls == 0
+    assert all(assessment is not None for assessment in state["answer_assessments"])
+    assert state["token_usage"]["calls"] == 2 * total_questions()
+    assert state["evaluation"]["score"] == 78
+
+
+def test_delete_releases_the_workflows_interview_state():
+    """Deleting an interview drops its prefetched openers and conversation window."""
+    service = make_service()
+    with TestClient(create_app(service)) as client:
+        interview_id = client.post("/interviews", json=CANDIDATE).json()["interview_id"]
+        client.post(f"/interviews/{interview_id}/step")
+        client.post(f"/interviews/{interview_id}/answer", json={"answer": "An answer."})
+        client.post(f"/interviews/{interview_id}/step")
+        assert interview_id in service.workflow._prefetched_openers
+        assert interview_id in service.workflow.context_builder._contexts
+        
+        assert client.delete(f"/interviews/{interview_id}").status_code == 204
+    
+    assert interview_id not in service.workflow._prefetched_openers
+    assert interview_id not in service.workflow.context_builder._contexts
+
+
+def test_websocket_streams_question_tokens(monkeypatch):
+    """The WebSocket sends a question as tokens, then the updated interview."""
+    monkeypatch.setattr(settings, "PREFETCH_OPENERS", False)
+    with TestClient(create_app(make_service())) as client:
+        interview_id = client.post("/interviews", json=CANDIDATE).json()["interview_id"]
+        
+        with client.websocket_connect(f"/interviews/{interview_id}/stream") as websocket:
+            websocket.send_json({"type": "step"})
+            tokens = []
+            message = websocket.receive_json()
+            while message["type"] == "token":
+                tokens.append(message["content"])
+                message = websocket.receive_json()
+            
+            assert len(tokens) > 1
+            assert "".join(tokens) == FAKE_QUESTION
+            assert message["interview"]["current_question"] == FAKE_QUESTION
+            
+            websocket.send_json({"type": "answer", "answer": "An answer."})
+            message = websocket.receive_json()
+            while message["type"] == "token":
+                message = websocket.receive_json()
+            assert message["interview"]["questions_asked"] == 2
+            
+            websocket.send_json({"type": "answer", "answer": ""})
+            assert websocket.receive_json()["status"] == 422
+
+
+def test_websocket_reports_a_question_cut_off_mid_stream(monkeypatch):
+    """A failure after tokens were sent is reported as a 502 and the step can be rerun."""
+    monkeypatch.setattr(settings, "PREFETCH_OPENERS", False)
+    with TestClient(create_app(make_service(DroppingLLM()))) as client:
+        interview_id = client.post("/interviews", json=CANDIDATE).json()["interview_id"]
+        
+        with client.websocket_connect(f"/interviews/{interview_id}/stream") as websocket:
+            websocket.send_json({"type": "step"})
+            message = websocket.receive_json()
+            while message["type"] == "token":
+                message = websocket.receive_json()
+            
+            assert message["type"] == "error" and message["status"] == 502
+            
+            websocket.send_json({"type": "step"})
+            tokens = []
+            message = websocket.receive_json()
+            while message["type"] == "token":
+                tokens.append(message["content"])
+                message = websocket.receive_json()
+            assert "".join(tokens) == FAKE_QUESTION
+            assert message["interview"]["current_question"] == FAKE_QUESTION
+
+
+def test_steps_beyond_the_limit_wait_then_fail(monkeypatch):
+    """Steps queue for a free slot and fail with 503 when none frees up in time."""
+    monkeypatch.setattr(settings, "PREFETCH_OPENERS", False)
+    service = make_service(FakeInterviewLLM(latency=0.3), max_concurrent_steps=1, queue_timeout=0.05)
+    
+    async def run():
+        first, second = [await service.create(CreateInterviewRequest(**CANDIDATE)) for _ in range(2)]
+        return await asyncio.gather(
+            service.step(first["interview_id"]), service.step(second["interview_id"]), return_exceptions=True
+        )
+    
+    results = asyncio.run(run())
+    
+    assert sum(isinstance(result, dict) and result["current_question"] == FAKE_QUESTION for result in results) == 1
+    rejected = [result for result in results if isinstance(result, HTTPException)]
+    assert len(rejected) == 1 and rejected[0].status_code == 503
+
+
+def test_any_worker_can_serve_any_step(monkeypatch, tmp_path):
+    """Workers sharing a session store take turns on one interview; stale saves are refused."""
+    monkeypatch.setattr(settings, "PREFETCH_OPENERS", False)
+    store = SQLiteSessionStore(str(tmp_path / "sessions.db"))
+    workers = [TestClient(create_app(make_service(store=store))) for _ in range(2)]
+    
+    interview = workers[0].post("/interviews", json=CANDIDATE).json()
+    interview_id = interview["interview_id"]
+    requests = 0
+    while not interview["is_complete"]:
+        worker = workers[requests % 2]
+        interview = worker.post(f"/interviews/{interview_id}/step").json()
+        requests += 1
+        if interview["current_question"]:
+            response = workers[requests % 2].post(f"/interviews/{interview_id}/answer", json={"answer": "An answer."})
+            assert response.status_code == 200
+            requests += 1
+    
+    assert interview["evaluation"]["score"] == 78
+    assert interview["version"] == requests + 1
+    assert len(store.load(interview_id)["qa_pairs"]) == total_questions()
+    
+    stale = store.load(interview_id)
+    store.save(stale)
+    service = workers[0].app.state.service
+    with pytest.raises(HTTPException) as conflict:
+        asyncio.run(service._save(stale))
+    assert conflict.value.status_code == 409
@@ -0,0 +1,54 @@
+"""
+Tests for the pooled Azure OpenAI client registry.
+"""
+import sys
+import os
+import asyncio
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+import azure_clients
+from benchmarks.fake_llm_server import FakeLLMServer
+from src.graph.workflow import InterviewWorkflow
+
+
+def test_agents_and_sessions_share_one_client():
+    """All agents across workflows reuse one chat client and HTTP pool."""
+    first = InterviewWorkflow()
+    second = InterviewWorkflow()
+    
+    assert first.technical_agent.llm is second.manager_agent.llm
+    assert first.hr_agent.llm.http_client is azure_clients.get_http_client()
+
+
+def test_distinct_settings_get_distinct_clients():
+    """Clients are keyed by their settings."""
+    assert azure_clients.get_chat_llm(0.0) is not azure_clients.get_chat_llm(0.9)
+    assert azure_clients.get_chat_llm(0.0) is azure_clients.get_chat_llm(0.0)
+
+
+def test_pool_stats_report_reuse():
+    """Pool statistics count how often a pooled client was reused."""
+    azure_clients.close_clients()
+    InterviewWorkflow()
+    
+    stats = azure_clients.get_pool_stats()
+    
+    # Five agents share one client
+    assert stats["chat_clients"] == 1
+    assert stats["client_reuses"] == 4
+    assert stats["sync_pool"]["connections"] == 0
+
+
+def test_async_client_works_across_event_loops():
+    """Successive event loops each get their own pool from the shared async client."""
+    client = azure_clients.get_http_async_client()
+    
+    with FakeLLMServer(latency=0, port=8029) as server:
+        async def fetch():
+            return (await client.get(f"{server.endpoint}/stats")).status_code
+        
+        assert [asyncio.run(fetch()) for _ in range(3)] == [200, 200, 200]
+    
+    assert azure_clients.get_http_async_client() is client
@@ -0,0 +1,96 @@
+"""
+Tests for the incremental, round-scoped conversation context builder.
+"""
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from config import settings
+from src.graph.state import create_initial_state, Message
+from src.agents import HRAgent
+from src.prompts.context import ConversationContextBuilder
+
+
+def add_exchange(state, agent_type, number):
+    """Append one question and its answer to the state."""
+    state["conversation_history"].append(Message(role="agent", content=f"{agent_type} q{number}", agent_type=agent_type))
+    state["conversation_history"].append(Message(role="user", content=f"{agent_type} a{number}"))
+
+
+def test_windows_are_scoped_to_the_round(monkeypatch):
+    """Each agent sees only its own round, trimmed to its window size."""
+    monkeypatch.setattr(settings, "CONTEXT_WINDOW_TECHNICAL", 4)
+    builder = ConversationContextBuilder()
+    state = create_initial_state("Test", "Software Engineer", "Junior")
+    for number in range(3):
+        add_exchange(state, "technical", number)
+    
+    assert builder.messages(state, "technical") == [
+        "Interviewer: technical q1", "Candidate: technical a1", "Interviewer: technical q2", "Candidate: technical a2"
+    ]
+    assert builder.messages(state, "hr") == []
+    
+    add_exchange(state, "hr", 0)
+    
+    assert builder.messages(state, "hr") == ["Interviewer: hr q0", "Candidate: hr a0"]
+
+
+def test_messages_are_rendered_once():
+    """Only messages added since the last call are rendered."""
+    builder = ConversationContextBuilder()
+    state = create_initial_state("Test", "Software Engineer", "Junior")
+    add_exchange(state, "technical", 0)
+    
+    first = builder.messages(state, "technical")
+    first.append("Interviewer: not in the window")
+    
+    assert builder.messages(state, "technical") == ["Interviewer: technical q0", "Candidate: technical a0"]
+    state["conversation_history"][0] = Message(role="agent", content="changed", agent_type="technical")
+    add_exchange(state, "technical", 1)
+    # Already rendered messages are not re-read
+    assert builder.messages(state, "technical")[0] == "Interviewer: technical q0"
+
+
+def test_rewound_history_is_rebuilt():
+    """A history shorter than what was seen is rendered from scratch."""
+    builder = ConversationContextBuilder()
+    state = create_initial_state("Test", "Software Engineer", "Junior")
+    add_exchange(state, "technical", 0)
+    add_exchange(state, "technical", 1)
+    builder.messages(state, "technical")
+    
+    state["conversation_history"] = state["conversation_history"][:2]
+    
+    assert builder.messages(state, "technical") == ["Interviewer: technical q0", "Candidate: technical a0"]
+
+
+def test_replaced_history_is_rebuilt():
+    """A different history at least as long as the one seen is rendered from scratch."""
+    builder = ConversationContextBuilder()
+    state = create_initial_state("Test", "Software Engineer", "Junior")
+    add_exchange(state, "technical", 0)
+    builder.messages(state, "technical")
+    
+    state["conversation_history"] = []
+    add_exchange(state, "technical", 5)
+    add_exchange(state, "technical", 6)
+    
+    assert builder.messages(state, "technical") == [
+        "Interviewer: technical q5", "Candidate: technical a5", "Interviewer: technical q6", "Candidate: technical a6"
+    ]
+
+
+def test_agent_prompts_use_the_round_window():
+    """Follow-up question prompts carry the agent's round window and not the other rounds."""
+    agent = HRAgent()
+    state = create_initial_state("Test", "Software Engineer", "Junior")
+    add_exchange(state, "technical", 0)
+    add_exchange(state, "hr", 0)
+    state["hr_questions_asked"] = 1
+    
+    prompt = agent.build_prompt(state)
+    
+    assert "Interviewer: hr q0\nCandidate: hr a0" in prompt
+    assert "technical q0" not in prompt
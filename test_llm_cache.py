@@ -0,0 +1,129 @@
+"""
+Tests for the LLM response cache.
+"""
+import sys
+import os
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from src.graph.state import create_initial_state
+from src.graph.workflow import InterviewWorkflow
+from src.llm.cache import LLMResponseCache, make_cache_key
+from benchmarks.fake_llm import FakeInterviewLLM, install_fake_llm
+
+
+def test_key_depends_on_every_component():
+    """Changing any part of the address changes the key."""
+    base = make_cache_key("gpt", 0.7, "1", "prompt")
+    
+    assert base == make_cache_key("gpt", 0.7, "1", "prompt")
+    assert base != make_cache_key("gpt-2", 0.7, "1", "prompt")
+    assert base != make_cache_key("gpt", 0.0, "1", "prompt")
+    assert base != make_cache_key("gpt", 0.7, "2", "prompt")
+    assert base != make_cache_key("gpt", 0.7, "1", "prompt!")
+
+
+def test_lru_eviction_and_counters():
+    """The least recently used key is evicted and lookups are counted."""
+    cache = LLMResponseCache(max_entries=2)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    cache.get("a")
+    cache.put("c", "C")
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (3, 1, 1)
+
+
+def test_ttl_expiry():
+    """Entries stop being served once their TTL has passed."""
+    cache = LLMResponseCache(ttl_seconds=0.05)
+    cache.put("a", "A")
+    
+    assert cache.get("a") == "A"
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_sample_pool_collects_variants_before_hitting():
+    """At temperature > 0 a key misses until its sample pool is full."""
+    cache = LLMResponseCache(sample_pool_size=2)
+    
+    assert cache.get("q", temperature=0.7) is None
+    cache.put("q", "first", temperature=0.7)
+    assert cache.get("q", temperature=0.7) is None
+    cache.put("q", "second", temperature=0.7)
+    
+    assert {cache.get("q", temperature=0.7) for _ in range(50)} == {"first", "second"}
+    assert cache.get("q", temperature=0.0) in {"first", "second"}
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    """A new cache on the same SQLite file serves earlier responses."""
+    db_path = str(tmp_path / "llm_cache.db")
+    LLMResponseCache(db_path=db_path).put("a", "A")
+    
+    restarted = LLMResponseCache(db_path=db_path)
+    
+    assert restarted.get("a") == "A"
+    assert restarted.stats()["disk_hits"] == 1
+
+
+def test_disk_tier_pools_variants_across_processes(tmp_path):
+    """Caches sharing a SQLite file add to one sample pool instead of overwriting it."""
+    db_path = str(tmp_path / "llm_cache.db")
+    first = LLMResponseCache(db_path=db_path, sample_pool_size=2)
+    second = LLMResponseCache(db_path=db_path, sample_pool_size=2)
+    
+    first.put("q", "first", temperature=0.7)
+    second.put("q", "second", temperature=0.7)
+    
+    restarted = LLMResponseCache(db_path=db_path, sample_pool_size=2)
+    assert {restarted.get("q", temperature=0.7) for _ in range(50)} == {"first", "second"}
+
+
+def test_disk_tier_is_pruned_on_put(tmp_path):
+    """Expired and excess responses are deleted from the SQLite tier."""
+    db_path = str(tmp_path / "llm_cache.db")
+    cache = LLMResponseCache(db_path=db_path, ttl_seconds=0.05, max_disk_entries=2)
+    cache.put("expired", "E")
+    time.sleep(0.06)
+    
+    for key in ("a", "b", "c"):
+        cache.put(key, key.upper())
+    
+    keys = [row[0] for row in cache._db.execute("SELECT key FROM llm_cache ORDER BY rowid")]
+    assert keys == ["b", "c"]
+
+
+def test_disk_tier_is_not_pruned_on_every_put(tmp_path):
+    """Below the size bound the SQLite tier is only pruned every few hundred puts."""
+    cache = LLMResponseCache(db_path=str(tmp_path / "llm_cache.db"), max_disk_entries=1000)
+    statements = []
+    cache._db.set_trace_callback(statements.append)
+    
+    for i in range(50):
+        cache.put(f"key-{i}", f"response {i}")
+    
+    assert sum(s.startswith("SELECT COUNT(*)") for s in statements) == 1
+    assert cache._db.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0] == 50
+
+
+def test_agents_reuse_cached_openers():
+    """A second interview with the same profile reuses the cached opener."""
+    cache = LLMResponseCache(sample_pool_size=1)
+    llm = FakeInterviewLLM()
+    workflow = InterviewWorkflow()
+    install_fake_llm(workflow, llm, cache=cache)
+    
+    for _ in range(2):
+        workflow.run_step(create_initial_state("Sam", "Backend Developer", "Junior"))
+    
+    assert llm.calls == 1
+    assert cache.stats()["hits"] == 1
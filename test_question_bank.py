@@ -0,0 +1,73 @@
+"""
+Tests for the offline opening question bank.
+"""
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from src.agents import TechnicalAgent
+from src.llm.rate_limit import RateLimiter
+from src.graph.state import create_initial_state
+from src.prompts.question_bank import QuestionBank, build_question_bank, is_near_duplicate, _shingles
+from benchmarks.fake_llm import FakeInterviewLLM
+from test_rate_limit import rate_limit_error
+
+
+def test_near_duplicates_are_detected():
+    """Rewordings with the same content count as near duplicates."""
+    kept = [_shingles("Can you explain how a hash map handles collisions in practice?")]
+    
+    assert is_near_duplicate(_shingles("Can you explain how a hash map handles collisions?"), kept)
+    assert not is_near_duplicate(_shingles("Tell me about a time you disagreed with a teammate."), kept)
+
+
+def test_build_deduplicates_and_round_trips(tmp_path):
+    """Identical generations collapse to one question per key."""
+    llm = FakeInterviewLLM()
+    bank = build_question_bank(llm, ["Data Engineer"], ["Junior", "Senior"], variants=3, concurrency=4)
+    path = str(tmp_path / "bank.json.gz")
+    bank.save(path)
+    
+    loaded = QuestionBank.load(path)
+    
+    assert llm.calls == 3 * 2 * 3
+    assert len(loaded) == 3 * 2
+    assert loaded.questions == bank.questions
+
+
+def test_build_retries_throttled_calls():
+    """Throttled generations are retried by the rate limiter instead of being dropped."""
+    throttled = []
+    
+    class ThrottledLLM(FakeInterviewLLM):
+        def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+            if len(throttled) < 2:
+                throttled.append(messages)
+                raise rate_limit_error({"retry-after-ms": "10"})
+            return super()._generate(messages, stop, run_manager, **kwargs)
+    
+    llm = ThrottledLLM()
+    limiter = RateLimiter(max_retries=3, base_delay=0.01)
+    bank = build_question_bank(llm, ["Data Engineer"], ["Junior"], variants=1, concurrency=1,
+                               rate_limiter=limiter)
+    
+    assert len(bank) == 3
+    assert limiter.stats()["retries"] == 2
+
+
+def test_agent_serves_bank_opener_without_resume(monkeypatch):
+    """Context-free openers come from the bank; resume interviews go live."""
+    bank = QuestionBank({"technical|Data Engineer|Junior": ["Hi {candidate_name}, what is a join?"]})
+    monkeypatch.setattr("src.agents.base_agent.get_question_bank", lambda: bank)
+    agent = TechnicalAgent()
+    agent.llm = FakeInterviewLLM()
+    agent.cache = None
+    
+    banked = agent.ask_question(create_initial_state("Ada", "Data Engineer", "Junior"))
+    live = agent.ask_question(create_initial_state("Ada", "Data Engineer", "Junior", resume_text="SQL"))
+    
+    assert banked == "Hi Ada, what is a join?"
+    assert live == agent.llm.question
+    assert agent.llm.calls == 1
@@ -0,0 +1,161 @@
+"""
+Tests for the client-side RPM/TPM rate limiter.
+"""
+import asyncio
+import sys
+import os
+import threading
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+import httpx
+import openai
+import pytest
+
+from src.llm.rate_limit import RateLimiter, retry_after_seconds
+
+
+def rate_limit_error(headers=None):
+    """Build the error the OpenAI client raises for a 429."""
+    request = httpx.Request("POST", "http://127.0.0.1:9/chat/completions")
+    response = httpx.Response(429, headers=headers or {}, request=request)
+    return openai.RateLimitError("Too Many Requests", response=response, body=None)
+
+
+class FlakyCall:
+    """Call that is throttled a number of times before it succeeds."""
+    
+    def __init__(self, failures, error=None):
+        self.failures = failures
+        self.error = error or rate_limit_error({"retry-after-ms": "50"})
+        self.calls = 0
+    
+    def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        return "ok"
+
+
+def test_token_bucket_waits_and_reconciles():
+    """A spent bucket delays the next call; refunded tokens are available again."""
+    # 1000 tokens per second, burst of 1000
+    limiter = RateLimiter(tokens_per_minute=60000)
+    
+    limiter.reconcile(limiter.acquire(1000), 200)
+    assert limiter.acquire(800).waited < 0.05
+    
+    waited = limiter.acquire(300).waited
+    assert 0.2 < waited < 1.0
+    
+    stats = limiter.stats()
+    assert stats["calls"] == 3
+    assert stats["queue_depth"] == 0
+    assert stats["max_wait_seconds"] == pytest.approx(waited)
+
+
+def test_concurrent_callers_are_queued_in_order():
+    """Callers beyond the request burst queue up and are admitted one by one."""
+    # 20 requests per second, burst of 20
+    limiter = RateLimiter(requests_per_minute=1200)
+    for _ in range(20):
+        limiter.acquire(0)
+    
+    admitted = []
+    
+    def worker(number):
+        limiter.acquire(0)
+        admitted.append(number)
+    
+    threads = []
+    for number in range(5):
+        threads.append(threading.Thread(target=worker, args=(number,)))
+        threads[-1].start()
+        time.sleep(0.01)
+    for thread in threads:
+        thread.join(timeout=5)
+    
+    assert admitted == list(range(5))
+    assert limiter.stats()["max_queue_depth"] >= 2
+
+
+def test_retry_honours_retry_after():
+    """Throttled calls are retried after the delay the service asked for."""
+    limiter = RateLimiter(max_retries=3, base_delay=0.01)
+    call = FlakyCall(failures=2)
+    
+    start = time.monotonic()
+    assert limiter.run(call, 10, lambda result: 10) == "ok"
+    
+    assert time.monotonic() - start >= 0.1
+    assert call.calls == 3
+    stats = limiter.stats()
+    assert stats["retries"] == 2 and stats["rate_limited"] == 2
+    assert stats["used_tokens"] == 10
+
+
+def test_gives_up_after_max_retries_and_on_other_errors():
+    """Retries are bounded, and errors that aren't transient are raised at once."""
+    limiter = RateLimiter(max_retries=2, base_delay=0.001)
+    call = FlakyCall(failures=10, error=rate_limit_error())
+    with pytest.raises(openai.RateLimitError):
+        limiter.run(call, 10, len)
+    assert call.calls == 3
+    assert limiter.stats()["failures"] == 1
+    
+    call = FlakyCall(failures=1, error=ValueError("bad prompt"))
+    with pytest.raises(ValueError):
+        limiter.run(call, 10, len)
+    assert call.calls == 1
+
+
+def test_async_run_retries_without_blocking():
+    """arun retries throttled coroutines."""
+    limiter = RateLimiter(requests_per_minute=6000, max_retries=3, base_delay=0.01)
+    call = FlakyCall(failures=1)
+    
+    async def acall():
+        return call()
+    
+    async def main():
+        return await asyncio.gather(*(limiter.arun(acall, 10, lambda result: 10) for _ in range(3)))
+    
+    assert asyncio.run(main()) == ["ok"] * 3
+    assert limiter.stats()["calls"] == 4
+
+
+def test_queued_async_callers_wait_without_polling(monkeypatch):
+    """Queued coroutines are woken at their turn instead of checking on a timer."""
+    limiter = RateLimiter(requests_per_minute=1200)
+    checks = []
+    try_acquire = limiter._try_acquire
+    
+    def counting_try_acquire(ticket, tokens):
+        checks.append(ticket)
+        return try_acquire(ticket, tokens)
+    
+    monkeypatch.setattr(limiter, "_try_acquire", counting_try_acquire)
+    admitted = []
+    
+    async def call(n):
+        await limiter.aacquire(10)
+        admitted.append(n)
+    
+    async def main():
+        await asyncio.gather(*(call(n) for n in range(30)))
+    
+    asyncio.run(main())
+    
+    # 20 fit the burst, the other 10 refill over about half a second
+    assert admitted == list(range(30))
+    assert len(checks) <= 30 * 3
+
+
+def test_retry_after_header_parsing():
+    """retry-after-ms takes precedence; dates fall back to our own backoff."""
+    assert retry_after_seconds(rate_limit_error({"retry-after-ms": "1500", "retry-after": "9"})) == 1.5
+    assert retry_after_seconds(rate_limit_error({"retry-after": "2"})) == 2.0
+    assert retry_after_seconds(rate_limit_error({"retry-after": "Wed, 21 Oct 2026 07:28:00 GMT"})) is None
+    assert retry_after_seconds(ValueError()) is None
@@ -0,0 +1,263 @@
+"""
+Tests for resume text extraction and its content-hash cache.
+"""
+import sys
+import os
+import io
+import time
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from config import settings
+from src.resume import extraction
+from src.resume.extraction import (
+    ResumeParseError,
+    ResumeTextCache,
+    extract_resume_text,
+    get_cached_full_text,
+    get_extraction_stats,
+)
+from src.resume.docx_text import iter_docx_text, iter_part_text
+from src.resume.sandbox import ResumeParserPool
+from benchmarks.sample_documents import make_docx, make_pdf, sample_docx, sample_pages
+
+
+def test_same_bytes_are_parsed_once(monkeypatch):
+    """A second upload of identical content is served from the cache."""
+    monkeypatch.setattr(settings, "RESUME_SANDBOX_ENABLED", False)
+    monkeypatch.setattr(extraction, "_cache", ResumeTextCache(max_entries=4))
+    calls = []
+    original = extraction.EXTRACTORS["docx"]
+    monkeypatch.setitem(extraction.EXTRACTORS, "docx", lambda data, budget: calls.append(1) or original(data, budget))
+    data = make_docx(["Jane Doe", "Python developer"])
+    
+    first = extract_resume_text(data, "resume.docx")
+    second = extract_resume_text(data, "renamed.docx")
+    
+    assert first == second == "Jane Doe\nPython developer"
+    assert len(calls) == 1
+    assert get_extraction_stats()["docx"]["cache_hits"] >= 1
+
+
+def test_lru_evicts_and_disk_tier_survives(tmp_path):
+    """Evicted entries are reloaded from the disk tier."""
+    cache = ResumeTextCache(max_entries=1, cache_dir=str(tmp_path))
+    cache.put("a", "first")
+    cache.put("b", "second")
+    
+    assert list(cache._entries) == ["b"]
+    assert cache.get("a") == "first"
+    assert ResumeTextCache(max_entries=1).get("a") is None
+
+
+def test_unsupported_and_corrupt_files():
+    """Unknown extensions and unreadable files fail with a structured reason."""
+    with pytest.raises(ResumeParseError) as unsupported:
+        extract_resume_text(b"data", "resume.odt")
+    with pytest.raises(ResumeParseError) as corrupt:
+        extract_resume_text(b"not a pdf", "resume.pdf")
+    
+    assert unsupported.value.reason == "unsupported"
+    assert corrupt.value.reason == "corrupt"
+    assert extract_resume_text("Plain text".encode(), "resume.txt") == "Plain text"
+
+
+def test_pdf_extraction_stops_at_budget(monkeypatch):
+    """Only the pages needed to fill the budget are parsed."""
+    monkeypatch.setattr(settings, "RESUME_SANDBOX_ENABLED", False)
+    monkeypatch.setattr(extraction, "_cache", ResumeTextCache(max_entries=4))
+    pages = sample_pages(30)
+    data = make_pdf(pages)
+    parsed = []
+    original = extraction.iter_pdf_pages
+    
+    def counting_pages(pdf_bytes):
+        for page_text in original(pdf_bytes):
+            parsed.append(page_text)
+            yield page_text
+    
+    monkeypatch.setattr(extraction, "iter_pdf_pages", counting_pages)
+    page_length = len(next(original(data))) + 1
+    text = extract_resume_text(data, "portfolio.pdf", max_chars=page_length * 3, full_in_background=False)
+    
+    assert len(parsed) == 3
+    assert text.startswith("Page 1") and "Page 3" in text and "Page 4" not in text
+    assert get_cached_full_text(data) is None
+    
+    parsed.clear()
+    full = extract_resume_text(data, "portfolio.pdf", max_chars=0)
+    
+    assert len(parsed) == 30
+    assert "Page 30" in full
+    assert get_cached_full_text(data) == full
+
+
+def test_token_budget_converts_to_characters():
+    """The tighter of the character and token budgets wins."""
+    assert extraction.char_budget(4000, 500) == 2000
+    assert extraction.char_budget(1000, 500) == 1000
+    assert extraction.char_budget(0, 0) is None
+
+
+def test_full_text_is_extracted_in_background(monkeypatch):
+    """A budget-limited extraction can complete the document off-thread."""
+    monkeypatch.setattr(settings, "RESUME_SANDBOX_ENABLED", False)
+    monkeypatch.setattr(extraction, "_cache", ResumeTextCache(max_entries=4))
+    data = make_pdf(sample_pages(5))
+    
+    partial = extract_resume_text(data, "portfolio.pdf", max_chars=100, full_in_background=True)
+    extraction._background_executor.submit(lambda: None).result()
+    full = get_cached_full_text(data)
+    
+    assert "Page 5" not in partial
+    assert full is not None and "Page 5" in full
+    assert extract_resume_text(data, "portfolio.pdf", max_chars=100) == partial
+    assert extract_resume_text(data, "portfolio.pdf", max_chars=0) == full
+
+
+def test_docx_includes_tables_headers_and_footers():
+    """Streaming DOCX extraction keeps the text python-docx paragraphs miss."""
+    data = make_docx(
+        ["Jane Doe", "Backend engineer"],
+        table_rows=[["Python", "Expert"], ["Kafka", ""]],
+        header="jane@example.com",
+        footer="Page footer",
+    )
+    
+    assert list(iter_docx_text(data)) == [
+        "jane@example.com", "Jane Doe", "Backend engineer", "Python | Expert", "Kafka", "Page footer",
+    ]
+
+
+def test_docx_text_boxes_are_not_duplicated():
+    """Text box content is read once, skipping the legacy VML fallback copy."""
+    xml = b"""<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+        xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"><w:body>
+        <w:p><w:r><w:t>Summary</w:t></w:r><w:r><mc:AlternateContent>
+            <mc:Choice><w:txbxContent><w:p><w:r><w:t>Skills: Go</w:t></w:r></w:p></w:txbxContent></mc:Choice>
+            <mc:Fallback><w:txbxContent><w:p><w:r><w:t>Skills: Go</w:t></w:r></w:p></w:txbxContent></mc:Fallback>
+        </mc:AlternateContent></w:r></w:p>
+        </w:body></w:document>"""
+    
+    assert list(iter_part_text(io.BytesIO(xml))) == ["Skills: Go", "Summary"]
+
+
+def test_docx_extraction_stops_at_budget(monkeypatch):
+    """Only enough of a large DOCX to fill the budget is read."""
+    monkeypatch.setattr(settings, "RESUME_SANDBOX_ENABLED", False)
+    monkeypatch.setattr(extraction, "_cache", ResumeTextCache(max_entries=4))
+    data = sample_docx(5000, table_rows=100)
+    
+    text = extract_resume_text(data, "resume.docx", max_chars=1000, full_in_background=False)
+    
+    assert text.startswith("Jane Doe - jane@example.com")
+    assert 1000 <= len(text) < 1200
+    assert get_extraction_stats()["docx"]["partial"] >= 1
+
+
+def slow_parser(data, max_chars=None):
+    """Parser that never finishes in time."""
+    time.sleep(30)
+
+
+def greedy_parser(data, max_chars=None):
+    """Parser that allocates far more memory than the sandbox allows."""
+    return bytearray(1024 * 1024 * 1024), True
+
+
+def pid_parser(data, max_chars=None):
+    """Parser that reports which worker ran it."""
+    return str(os.getpid()), True
+
+
+def busy_parser(data, max_chars=None):
+    """Parser that spends a little over half a second of CPU time."""
+    deadline = time.process_time() + 0.6
+    while time.process_time() < deadline:
+        pass
+    return "parsed", True
+
+
+def spinning_parser(data, max_chars=None):
+    """Parser that never stops using CPU."""
+    while True:
+        pass
+
+
+def test_sandbox_timeout_and_memory_limit(monkeypatch):
+    """Slow and memory-hungry parses fail without affecting the pool."""
+    monkeypatch.setitem(extraction.EXTRACTORS, "slow", slow_parser)
+    monkeypatch.setitem(extraction.EXTRACTORS, "greedy", greedy_parser)
+    pool = ResumeParserPool(workers=1, timeout=1.0, memory_limit_mb=256, start_method="fork")
+    try:
+        with pytest.raises(ResumeParseError) as timeout:
+            pool.parse("slow", b"")
+        with pytest.raises(ResumeParseError) as too_large:
+            pool.parse("greedy", b"")
+        
+        assert timeout.value.reason == "timeout"
+        assert too_large.value.reason == "too_large"
+        assert pool.parse("txt", b"still working") == ("still working", True)
+    finally:
+        pool.close()
+
+
+def test_sandbox_recycles_workers(monkeypatch):
+    """Workers are replaced after the configured number of jobs."""
+    monkeypatch.setitem(extraction.EXTRACTORS, "pid", pid_parser)
+    pool = ResumeParserPool(workers=1, max_jobs_per_worker=2, start_method="fork")
+    try:
+        pids = [pool.parse("pid", b"")[0] for _ in range(4)]
+    finally:
+        pool.close()
+    
+    assert pids[0] == pids[1] != pids[2] == pids[3]
+
+
+def test_sandbox_cpu_limit_applies_per_job(monkeypatch):
+    """A recycled worker is not killed for CPU time its earlier jobs used."""
+    monkeypatch.setitem(extraction.EXTRACTORS, "busy", busy_parser)
+    pool = ResumeParserPool(workers=1, timeout=1.0, start_method="fork")
+    try:
+        # Four jobs add up to more CPU time than one job may use
+        results = [pool.parse("busy", b"") for _ in range(4)]
+    finally:
+        pool.close()
+    
+    assert results == [("parsed", True)] * 4
+    assert pool.restarts == 0
+
+
+def test_sandbox_cpu_limit_is_reported_as_timeout(monkeypatch):
+    """A worker killed by its CPU limit fails the parse as a timeout, not as too large."""
+    monkeypatch.setitem(extraction.EXTRACTORS, "spin", spinning_parser)
+    pool = ResumeParserPool(workers=1, timeout=30.0, start_method="fork")
+    pool.cpu_seconds = 1
+    try:
+        with pytest.raises(ResumeParseError) as error:
+            pool.parse("spin", b"")
+    finally:
+        pool.close()
+    
+    assert error.value.reason == "timeout"
+    assert "CPU limit" in error.value.detail
+
+
+def test_sandbox_replaces_workers_that_died_idle(monkeypatch):
+    """A worker that died after its liveness check is replaced, not surfaced as OSError."""
+    pool = ResumeParserPool(workers=1, start_method="fork")
+    try:
+        pool.parse("txt", b"warm up")
+        worker = pool._slots.get()
+        worker.process.kill()
+        worker.process.join()
+        monkeypatch.setattr(worker.process, "is_alive", lambda: True)
+        pool._slots.put(worker)
+        
+        assert pool.parse("txt", b"still working") == ("still working", True)
+        assert pool.restarts == 1
+    finally:
+        pool.close()
@@ -0,0 +1,77 @@
+"""
+Tests for bulk resume ingestion and the resume store.
+"""
+import sys
+import os
+import zipfile
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from config import settings
+from src.graph.state import create_initial_state
+from src.resume.ingest import ingest
+from src.resume.store import ResumeStore, candidate_id_from_name
+from benchmarks.sample_documents import make_docx, make_pdf, sample_pages
+
+
+def write_resumes(directory):
+    """Write a small batch of resumes, including a duplicate and a corrupt file."""
+    directory.mkdir()
+    (directory / "Jane Doe.pdf").write_bytes(make_pdf(sample_pages(2)))
+    (directory / "john_smith.docx").write_bytes(make_docx(["John Smith", "Data engineer"]))
+    (directory / "ana.txt").write_text("Ana Lopez\nFrontend developer")
+    (directory / "ana-copy.txt").write_text("Ana Lopez\nFrontend developer")
+    (directory / "broken.pdf").write_bytes(b"%PDF-1.4 not really")
+    (directory / "notes.md").write_text("ignored")
+
+
+def test_ingest_directory_dedupes_and_resumes(tmp_path):
+    """Files are ingested once, duplicates and failures counted, re-runs skipped."""
+    write_resumes(tmp_path / "batch")
+    store = ResumeStore(str(tmp_path / "resumes.db"))
+    
+    stats = ingest(str(tmp_path / "batch"), store, workers=2)
+    
+    assert (stats.total, stats.ingested, stats.duplicates) == (5, 3, 1)
+    assert stats.failed == {"corrupt": 1}
+    assert len(store) == 3
+    assert {"jane-doe", "john-smith"} <= set(store.candidate_ids())
+    assert store.get("john-smith")["text"] == "John Smith\nData engineer"
+    assert store.get("jane-doe")["file_type"] == "pdf"
+    
+    rerun = ingest(str(tmp_path / "batch"), store, workers=2)
+    
+    assert (rerun.skipped, rerun.ingested) == (5, 0)
+
+
+def test_ingest_zip_and_load_by_candidate_id(tmp_path, monkeypatch):
+    """Resumes in a zip can be loaded into an interview by candidate id."""
+    archive = tmp_path / "batch.zip"
+    with zipfile.ZipFile(archive, "w") as handle:
+        handle.writestr("resumes/Ana Lopez.txt", "Ana Lopez\nFrontend developer")
+    monkeypatch.setattr(settings, "RESUME_STORE_PATH", str(tmp_path / "resumes.db"))
+    store = ResumeStore(settings.RESUME_STORE_PATH)
+    
+    stats = ingest(str(archive), store, workers=1)
+    state = create_initial_state("Ana", "Frontend Developer", "Junior", candidate_id="ana-lopez")
+    
+    assert stats.ingested == 1
+    assert state["resume_text"] == "Ana Lopez\nFrontend developer"
+    assert state["candidate_id"] == "ana-lopez"
+    with pytest.raises(ValueError):
+        create_initial_state("Bob", "Frontend Developer", "Junior", candidate_id="bob")
+
+
+def test_candidate_id_collisions_get_hash_suffix(tmp_path):
+    """Different resumes with the same file name get distinct ids."""
+    store = ResumeStore(str(tmp_path / "resumes.db"))
+    
+    first = store.add(candidate_id_from_name("a/Jane Doe.pdf"), "1" * 64, "first")
+    second = store.add(candidate_id_from_name("b/jane_doe.txt"), "2" * 64, "second")
+    
+    assert first == "jane-doe"
+    assert second == "jane-doe-22222222"
+    assert store.get(second)["text"] == "second"
@@ -0,0 +1,149 @@
+"""
+Tests for embedding-backed resume retrieval, using local hashing embeddings.
+"""
+import asyncio
+import sys
+import os
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from src.graph.state import create_initial_state
+from src.graph.workflow import InterviewWorkflow
+from src.resume.retrieval import HashingEmbeddings, ResumeRetriever, chunk_resume
+from benchmarks.fake_llm import FakeInterviewLLM, install_fake_llm
+
+
+RESUME = "\n".join([
+    "Built a payments platform in Python and Go on PostgreSQL databases with Kafka streams.",
+    "Designed the system architecture and cloud infrastructure for a frameworks migration.",
+    "Known for teamwork and collaboration, improving communication in cross-functional work.",
+    "Resolved conflict between teams and led volunteering for a coding club.",
+    "Leadership: mentoring five engineers, managing people and owning the team strategy.",
+    "Worked with stakeholders on business impact and career goals for the group.",
+])
+
+
+class CountingEmbeddings(HashingEmbeddings):
+    """Hashing embeddings that count document and query calls."""
+    
+    def __init__(self):
+        super().__init__()
+        self.document_calls = 0
+        self.query_calls = 0
+    
+    def embed_documents(self, texts):
+        self.document_calls += 1
+        return super().embed_documents(texts)
+    
+    def embed_query(self, text):
+        self.query_calls += 1
+        return super().embed_query(text)
+
+
+def make_retriever(embeddings=None):
+    """Retriever with one chunk per resume line."""
+    return ResumeRetriever(embeddings or HashingEmbeddings(), top_k=2, chunk_chars=100)
+
+
+def test_chunks_follow_lines_and_size():
+    """Chunks keep whole lines, stay near the size limit and cover the text."""
+    chunks = chunk_resume(RESUME + "\n" + "word " * 100, 100)
+    
+    assert chunks[0] == RESUME.splitlines()[0]
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert sum(chunk.count("word") for chunk in chunks) == 100
+
+
+def test_hashing_embeddings_are_deterministic_unit_vectors():
+    """The local stand-in gives the same unit vector for the same text."""
+    embeddings = HashingEmbeddings()
+    first, second = embeddings.embed_query("Python and Go"), HashingEmbeddings().embed_query("Python and Go")
+    
+    assert first == second
+    assert abs(np.linalg.norm(first) - 1) < 1e-6
+
+
+def test_each_round_retrieves_its_focus():
+    """Technical, HR and manager rounds draw on different parts of the resume."""
+    retriever = make_retriever()
+    state = create_initial_state("Test", "Backend Developer", "Senior", resume_text=RESUME)
+    lines = RESUME.splitlines()
+    
+    assert retriever.retrieve(state, "technical") == lines[0:2]
+    assert retriever.retrieve(state, "hr") == lines[2:4]
+    assert retriever.retrieve(state, "manager") == lines[4:6]
+
+
+def test_last_answer_steers_retrieval_and_resume_is_embedded_once():
+    """The last answer shifts the query; the resume is only embedded once."""
+    embeddings = CountingEmbeddings()
+    retriever = make_retriever(embeddings)
+    state = create_initial_state("Test", "Backend Developer", "Senior", resume_text=RESUME)
+    state["last_answer"] = "I volunteered to run a coding club and resolved conflict between teams."
+    
+    chunks = retriever.retrieve(state, "technical")
+    retriever.retrieve(state, "hr")
+    
+    assert RESUME.splitlines()[3] in chunks
+    assert embeddings.document_calls == 1
+
+
+def test_async_retrieval_is_reused_by_build_prompt():
+    """Excerpts fetched asynchronously are served to the sync prompt builder."""
+    embeddings = CountingEmbeddings()
+    retriever = make_retriever(embeddings)
+    state = create_initial_state("Test", "Backend Developer", "Senior", resume_text=RESUME)
+    
+    chunks = asyncio.run(retriever.aretrieve(state, "manager"))
+    queries = embeddings.query_calls
+    
+    assert retriever.retrieve(state, "manager") == chunks
+    assert embeddings.query_calls == queries
+
+
+class StallingEmbeddings(HashingEmbeddings):
+    """Hashing embeddings whose first async document call never finishes."""
+    
+    def __init__(self):
+        super().__init__()
+        self.stalled = False
+    
+    async def aembed_documents(self, texts):
+        if not self.stalled:
+            self.stalled = True
+            await asyncio.Event().wait()
+        return self.embed_documents(texts)
+
+
+def test_cancelled_indexing_does_not_block_later_calls():
+    """Cancelling the call that builds an index releases it for the next call."""
+    retriever = make_retriever(StallingEmbeddings())
+    state = create_initial_state("Test", "Backend Developer", "Senior", resume_text=RESUME)
+    
+    async def interview():
+        first = asyncio.create_task(retriever.aretrieve(state, "technical"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        return await asyncio.wait_for(retriever.aretrieve(state, "technical"), timeout=5)
+    
+    assert asyncio.run(interview())
+    assert retriever.retrieve(state, "technical")
+
+
+def test_prompts_carry_round_excerpts():
+    """Question prompts include the excerpts for their round."""
+    workflow = InterviewWorkflow()
+    install_fake_llm(workflow, FakeInterviewLLM())
+    workflow.resume_retriever = make_retriever()
+    workflow.hr_agent.retriever = workflow.resume_retriever
+    state = create_initial_state("Test", "Backend Developer", "Senior", resume_text=RESUME)
+    
+    prompt = workflow.hr_agent.build_prompt(state)
+    
+    assert "RELEVANT RESUME EXCERPTS" in prompt
+    assert RESUME.splitlines()[2] in prompt
+    assert RESUME.splitlines()[0] not in prompt
@@ -0,0 +1,123 @@
+"""
+Tests for the session stores, the Redis one against a local stand-in.
+"""
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pytest
+
+from src.graph.codec import encode_state
+from src.graph.state import create_initial_state, Message, QuestionAnswer
+from src.sessions import (
+    MemorySessionStore,
+    RedisSessionStore,
+    SQLiteSessionStore,
+    SessionConflictError,
+    create_session_store,
+)
+from src.sessions.store import pack_state
+from benchmarks.fake_redis_server import FakeRedisServer
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def store(request, tmp_path):
+    """Each session store backend."""
+    if request.param == "memory":
+        yield MemorySessionStore()
+    elif request.param == "sqlite":
+        store = SQLiteSessionStore(str(tmp_path / "sessions.db"))
+        yield store
+        store.close()
+    else:
+        with FakeRedisServer() as server:
+            store = RedisSessionStore(server.url, ttl_seconds=60)
+            yield store
+            store.close()
+
+
+def build_state():
+    """A state with a short transcript."""
+    state = create_initial_state("Test Candidate", "Backend Developer", "Senior")
+    state["conversation_history"] = [
+        Message(role="agent", content="Tell me about Kafka.", agent_type="technical"),
+        Message(role="user", content="We used it for events."),
+    ]
+    state["qa_pairs"] = [QuestionAnswer(question="Tell me about Kafka.", answer="We used it.", agent_type="technical")]
+    state["technical_questions_asked"] = 1
+    return state
+
+
+def test_saves_are_versioned(store):
+    """Each save returns the next version; loading gives back the saved state."""
+    state = build_state()
+    
+    first = store.save(state)
+    second = store.save(first)
+    
+    assert state["version"] == 0
+    assert (first["version"], second["version"]) == (1, 2)
+    assert store.load(state["interview_id"]) == second
+    assert store.load("unknown") is None
+
+
+def test_stale_saves_conflict(store):
+    """A state saved over a newer version is refused and the newer one kept."""
+    loaded = store.save(build_state())
+    newer = store.save({**loaded, "current_question": "What is a partition?"})
+    
+    with pytest.raises(SessionConflictError):
+        store.save({**loaded, "current_question": "Something else?"})
+    
+    assert store.load(loaded["interview_id"]) == newer
+    assert store.delete(loaded["interview_id"])
+    assert not store.delete(loaded["interview_id"])
+    assert store.load(loaded["interview_id"]) is None
+
+
+def test_concurrent_updates_are_not_lost(store):
+    """Workers retrying on conflict never overwrite each other's updates."""
+    interview_id = store.save(build_state())["interview_id"]
+    
+    def append(n):
+        while True:
+            state = store.load(interview_id)
+            message = Message(role="user", content=f"Answer {n}")
+            try:
+                return store.save({**state, "conversation_history": state["conversation_history"] + [message]})
+            except SessionConflictError:
+                continue
+    
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(append, range(24)))
+    
+    final = store.load(interview_id)
+    assert final["version"] == 25
+    assert sorted(m.content for m in final["conversation_history"][2:]) == sorted(f"Answer {n}" for n in range(24))
+
+
+def test_states_are_stored_compressed():
+    """Transcripts are stored in a fraction of their encoded size."""
+    state = build_state()
+    state["conversation_history"] = state["conversation_history"] * 50
+    
+    assert len(pack_state(state)) < len(encode_state(state)) / 3
+
+
+def test_redis_keys_expire_after_the_last_save():
+    """The Redis store sets the configured expiry on every save."""
+    with FakeRedisServer() as server:
+        store = RedisSessionStore(server.url, ttl_seconds=60)
+        state = store.save(build_state())
+        store.close()
+        
+        assert list(server.redis.expiry) == [f"interview:{state['interview_id']}".encode("utf-8")]
+
+
+def test_unknown_backend_is_rejected():
+    """Only the known backends can be configured."""
+    with pytest.raises(ValueError):
+        create_session_store("postgres")
@@ -0,0 +1,98 @@
+"""
+Tests for the transcript records and the binary state codec.
+"""
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pytest
+from langgraph.types import Overwrite
+
+from src.graph import codec
+from src.graph.codec import StateCodecError, StateSerializer, decode_state, decode_value, encode_state, encode_value
+from src.graph.state import create_initial_state, Message, MessageModel, QuestionAnswer
+
+
+def build_state():
+    """A state with every kind of value the schema holds."""
+    state = create_initial_state("Zoë", "Backend Developer", "Senior", resume_text="Python, Go — 8 years")
+    state["conversation_history"] = [
+        Message(role="agent", content="Tell me about Kafka.", agent_type="technical"),
+        Message(role="user", content="We used it for événements."),
+    ]
+    state["qa_pairs"] = [QuestionAnswer(question="Tell me about Kafka.", answer="We used it.", agent_type="technical")]
+    state["answer_assessments"] = [{"score": 78, "strengths": ["clear"]}, None]
+    state["resume_digest"] = {"skills": ["Python"], "years_experience": 8}
+    state["technical_questions_asked"] = 1
+    return state
+
+
+def test_state_round_trip():
+    """A state decodes to an equal state, records included."""
+    state = build_state()
+    
+    data = encode_state(state)
+    
+    assert data.startswith(codec.MAGIC + bytes([codec.CODEC_VERSION]))
+    assert decode_state(data) == state
+    assert isinstance(decode_state(data)["conversation_history"][0], Message)
+
+
+def test_values_outside_the_schema_use_the_fallback():
+    """Unknown types are refused by the codec and kept intact by the serializer."""
+    update = {"conversation_history": Overwrite([Message(role="user", content="hi")]), "answer_assessments": {3: None}}
+    assert decode_value(encode_value(update)) == update
+    
+    with pytest.raises(TypeError):
+        encode_value({"seen": {"technical"}})
+    serde = StateSerializer()
+    type_, data = serde.dumps_typed({"seen": {"technical"}})
+    assert type_ != codec.TYPE_NAME
+    assert serde.loads_typed((type_, data)) == {"seen": {"technical"}}
+
+
+def test_older_states_are_migrated(monkeypatch):
+    """A state written by an earlier version gains the fields added since."""
+    old = encode_state(build_state())
+    monkeypatch.setattr(codec, "CODEC_VERSION", codec.CODEC_VERSION + 1)
+    monkeypatch.setitem(
+        codec.STATE_FIELDS, codec.CODEC_VERSION, codec.STATE_FIELDS[codec.CODEC_VERSION - 1] + ("notes",)
+    )
+    monkeypatch.setitem(codec.MIGRATIONS, codec.CODEC_VERSION - 1, lambda state: {**state, "notes": []})
+    
+    migrated = decode_state(old)
+    
+    assert migrated["notes"] == []
+    assert migrated["qa_pairs"] == build_state()["qa_pairs"]
+    assert decode_state(encode_state(migrated)) == migrated
+
+
+def test_version_one_states_start_at_session_version_zero():
+    """States encoded before the session store existed decode as never saved."""
+    state = build_state()
+    old = codec.MAGIC + bytes([1]) + encode_value([state.get(field) for field in codec.STATE_FIELDS[1]])
+    
+    assert decode_state(old) == state
+    assert decode_state(old)["version"] == 0
+
+
+def test_unknown_data_is_rejected(monkeypatch):
+    """Data that is not a state, or comes from a newer version, raises StateCodecError."""
+    with pytest.raises(StateCodecError):
+        decode_state(b"not a state")
+    with pytest.raises(StateCodecError):
+        decode_state(codec.MAGIC + bytes([codec.CODEC_VERSION + 1]) + encode_value([]))
+
+
+def test_records_convert_to_validated_models():
+    """Records become pydantic models at API boundaries and back."""
+    message = Message(role="agent", content="Hello", agent_type="hr")
+    
+    model = message.to_model()
+    
+    assert isinstance(model, MessageModel)
+    assert model.to_record() == message
+    with pytest.raises(ValueError):
+        MessageModel(role="robot", content="Hello")
@@ -0,0 +1,115 @@
+"""
+Tests for token counting, prompt budgets and per-interview token accounting.
+"""
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pytest
+
+from config import settings
+from src.graph.state import create_initial_state
+from src.graph.workflow import InterviewWorkflow
+from src.llm import tokens
+from src.llm.tokens import TokenLedger, count_tokens, truncate_to_tokens
+from src.prompts.templates import get_agent_prompt
+from benchmarks.fake_llm import FakeInterviewLLM, install_fake_llm
+
+
+@pytest.fixture(autouse=True)
+def estimated_tokens(monkeypatch):
+    """Count with the character estimate so results don't depend on tiktoken downloads."""
+    monkeypatch.setattr(tokens, "_encoding", None)
+    monkeypatch.setattr(tokens, "_encoding_loaded", True)
+
+
+def build_prompt(max_tokens=None, history=None, resume_excerpts=None):
+    """Render a regular technical prompt with a resume digest."""
+    return get_agent_prompt(
+        agent_type="technical",
+        candidate_name="Test",
+        job_role="Software Engineer",
+        experience_level="Senior",
+        question_number=4,
+        conversation_history=history or [f"Interviewer: old question {n} " + "x" * 400 for n in range(4)]
+        + ["Interviewer: latest question", "Candidate: latest answer"],
+        resume_digest="Skills: Python, Kafka\nRoles: Staff Engineer, Acme (2019-2024)",
+        resume_excerpts=resume_excerpts if resume_excerpts is not None else "\n\n".join(
+            f"excerpt {n} " + "y" * 400 for n in range(3)
+        ),
+        max_tokens=max_tokens
+    )
+
+
+def test_count_and_truncate():
+    """Estimated counts round up and truncation keeps a prefix within the limit."""
+    assert count_tokens("") == 0
+    assert count_tokens("abcde") == 2
+    assert truncate_to_tokens("abcdefghij", 2) == "abcdefgh"
+    assert truncate_to_tokens("abc", 5) == "abc"
+    assert truncate_to_tokens("abc", 0) == ""
+
+
+def test_prompt_is_trimmed_in_priority_order():
+    """Old history goes first, then excerpts; the latest exchange and profile survive."""
+    untrimmed = build_prompt()
+    assert build_prompt(max_tokens=count_tokens(untrimmed)) == untrimmed
+    
+    without_history = build_prompt(max_tokens=count_tokens(untrimmed) - 300)
+    assert "old question 0" not in without_history
+    assert "excerpt 2" in without_history
+    assert count_tokens(without_history) <= count_tokens(untrimmed) - 300
+    
+    budget = count_tokens(build_prompt(history=["Interviewer: latest question", "Candidate: latest answer"],
+                                       resume_excerpts=""))
+    trimmed = build_prompt(max_tokens=budget)
+    assert count_tokens(trimmed) <= budget
+    assert "old question" not in trimmed
+    assert "excerpt" not in trimmed
+    assert "Candidate: latest answer" in trimmed
+    assert "Skills: Python, Kafka" in trimmed
+
+
+def test_raw_resume_is_truncated_by_tokens(monkeypatch):
+    """The raw resume fallback is capped at PROMPT_RESUME_MAX_TOKENS."""
+    monkeypatch.setattr(settings, "PROMPT_RESUME_MAX_TOKENS", 10)
+    prompt = get_agent_prompt("technical", "Test", "Software Engineer", "Junior", 1, [],
+                              is_first_question=True, resume_text="r" * 100)
+    
+    assert "r" * 40 + "\n...(resume continues)" in prompt
+    assert "r" * 41 not in prompt
+
+
+def test_ledger_sync_keeps_restored_usage():
+    """Usage saved in a state is not lost when the ledger has never seen the interview."""
+    ledger = TokenLedger()
+    ledger.record("a", 10, 5)
+    ledger.record(None, 100, 100)
+    
+    assert ledger.usage("a") == {"prompt_tokens": 10, "completion_tokens": 5, "calls": 1}
+    assert ledger.sync("b", {"prompt_tokens": 40, "completion_tokens": 20, "calls": 2})["prompt_tokens"] == 40
+    ledger.record("b", 1, 1)
+    assert ledger.usage("b") == {"prompt_tokens": 41, "completion_tokens": 21, "calls": 3}
+
+
+def test_interview_tracks_usage_and_stops_at_budget(monkeypatch):
+    """Every call is counted in the state, and a spent budget skips to evaluation."""
+    monkeypatch.setattr(settings, "EVALUATION_MODE", "parallel")
+    workflow = InterviewWorkflow()
+    install_fake_llm(workflow, FakeInterviewLLM())
+    state = workflow.run_step(create_initial_state("Test", "Software Engineer", "Junior"))
+    
+    usage = state["token_usage"]
+    assert usage["calls"] == 1
+    assert usage["prompt_tokens"] > 0 and usage["completion_tokens"] > 0
+    
+    state = workflow.process_answer(state, "An answer.")
+    monkeypatch.setattr(settings, "INTERVIEW_TOKEN_BUDGET", usage["prompt_tokens"] + usage["completion_tokens"])
+    assert workflow.next_agent(state) == "evaluation"
+    
+    state = workflow.run_step(state)
+    assert state["is_complete"]
+    assert state["technical_questions_asked"] == 1
+    assert state["token_usage"]["calls"] > usage["calls"]
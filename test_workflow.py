@@ -0,0 +1,414 @@
+"""
+Tests for the interview workflow routing, using a fake LLM.
+"""
+import asyncio
+import sys
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import httpx
+import openai
+import pytest
+from pydantic import PrivateAttr
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from config import settings
+from src.graph.state import create_initial_state
+from src.graph.workflow import InterviewWorkflow, _Prefetch, run_in_background
+from src.llm.rate_limit import RateLimiter, StreamInterruptedError
+from benchmarks.fake_llm import FAKE_QUESTION, FakeInterviewLLM, install_fake_llm
+from benchmarks.llm_call_count import (
+    count_interview_llm_calls,
+    expected_evaluation_calls,
+    expected_llm_calls,
+    total_questions,
+)
+
+
+def test_each_step_makes_one_llm_call(monkeypatch):
+    """Every step runs exactly one agent node, in every round."""
+    # Incremental assessments run in the background between steps
+    monkeypatch.setattr(settings, "EVALUATION_MODE", "parallel")
+    total, steps = count_interview_llm_calls()
+    
+    assert total == expected_llm_calls()
+    assert all(calls == 1 for agent, calls in steps if agent != "evaluation")
+    assert steps[-1] == ("evaluation", expected_evaluation_calls())
+    assert [agent for agent, _ in steps] == (
+        ["technical"] * settings.MAX_TECHNICAL_QUESTIONS
+        + ["hr"] * settings.MAX_HR_QUESTIONS
+        + ["manager"] * settings.MAX_MANAGER_QUESTIONS
+        + ["evaluation"]
+    )
+
+
+def test_no_discarded_questions_in_history():
+    """Conversation history only holds questions that were actually asked."""
+    workflow = InterviewWorkflow()
+    install_fake_llm(workflow, FakeInterviewLLM())
+    state = create_initial_state("Test Candidate", "Data Engineer", "Senior")
+    
+    while not state["is_complete"]:
+        state = workflow.run_step(state)
+        if state["current_question"]:
+            state = workflow.process_answer(state, "An answer.")
+    
+    agent_messages = [m for m in state["conversation_history"] if m.role == "agent"]
+    assert len(agent_messages) == len(state["qa_pairs"])
+    assert state["evaluation"]["score"] == 78
+
+
+def test_pending_question_is_not_regenerated():
+    """Running a step while a question is pending leaves the state alone."""
+    workflow = InterviewWorkflow()
+    llm = FakeInterviewLLM()
+    install_fake_llm(workflow, llm)
+    state = workflow.run_step(create_initial_state("Test", "Software Engineer", "Junior"))
+    
+    state = workflow.run_step(state)
+    
+    assert llm.calls == 1
+    assert len(state["conversation_history"]) == 1
+
+
+def test_stream_step_yields_tokens_then_state():
+    """Streamed tokens add up to the question committed in the final state."""
+    workflow = InterviewWorkflow()
+    install_fake_llm(workflow, FakeInterviewLLM())
+    state = create_initial_state("Test", "Frontend Developer", "Mid-Level")
+    
+    events = list(workflow.stream_step(state))
+    tokens = [payload for event, payload in events if event == "token"]
+    final_event, final_state = events[-1]
+    
+    assert len(tokens) > 1
+    assert final_event == "state"
+    assert "".join(tokens) == final_state["current_question"]
+    assert all(event == "token" for event, _ in events[:-1])
+
+
+class DroppingLLM(FakeInterviewLLM):
+    """Fake LLM whose first stream fails with a retryable error after a few tokens."""
+    
+    tokens_before_drop: int = 2
+    _dropped: bool = PrivateAttr(default=False)
+    
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        chunks = super()._stream(messages, stop, run_manager, **kwargs)
+        if not self._dropped:
+            self._dropped = True
+            for _ in range(self.tokens_before_drop):
+                yield next(chunks)
+            raise openai.APIConnectionError(request=httpx.Request("POST", "http://127.0.0.1:9/"))
+        yield from chunks
+
+
+def test_stream_step_is_not_retried_after_tokens_were_sent():
+    """A call that fails mid-stream surfaces the error instead of streaming the question twice."""
+    workflow = InterviewWorkflow()
+    llm = DroppingLLM()
+    install_fake_llm(workflow, llm)
+    workflow.technical_agent.rate_limiter = RateLimiter(max_retries=3, base_delay=0.01)
+    state = create_initial_state("Test", "Frontend Developer", "Mid-Level")
+    
+    tokens = []
+    with pytest.raises(StreamInterruptedError):
+        for event, payload in workflow.stream_step(state):
+            tokens.append(payload)
+    
+    assert len(tokens) == 2 and llm.calls == 1
+    # Nothing was committed, so the step can simply be run again
+    events = list(workflow.stream_step(state))
+    assert "".join(payload for event, payload in events if event == "token") == FAKE_QUESTION
+
+
+def test_stream_step_retries_failures_before_the_first_token():
+    """A call that fails before streaming anything is retried transparently."""
+    workflow = InterviewWorkflow()
+    llm = DroppingLLM(tokens_before_drop=0)
+    install_fake_llm(workflow, llm)
+    limiter = workflow.technical_agent.rate_limiter = RateLimiter(max_retries=3, base_delay=0.01)
+    
+    events = list(workflow.stream_step(create_initial_state("Test", "Frontend Developer", "Mid-Level")))
+    
+    assert "".join(payload for event, payload in events if event == "token") == FAKE_QUESTION
+    assert limiter.stats()["retries"] == 1
+
+
+def test_arun_step_runs_full_interview():
+    """The async API drives a full interview with one LLM call per step."""
+    workflow = InterviewWorkflow()
+    llm = FakeInterviewLLM()
+    install_fake_llm(workflow, llm)
+    
+    async def interview():
+        state = create_initial_state("Test", "DevOps Engineer", "Senior")
+        while not state["is_complete"]:
+            state = await workflow.arun_step(state)
+            if state["current_question"]:
+                state = await workflow.aprocess_answer(state, "An answer.")
+        return state
+    
+    state = asyncio.run(interview())
+    
+    assert llm.calls == expected_llm_calls()
+    assert state["evaluation"]["score"] == 78
+
+
+def test_prefetched_openers_replace_live_generation(monkeypatch):
+    """Prefetched openers are used by each round without extra LLM calls."""
+    monkeypatch.setattr(settings, "EVALUATION_MODE", "parallel")
+    workflow = InterviewWorkflow()
+    llm = FakeInterviewLLM()
+    install_fake_llm(workflow, llm)
+    state = workflow.prefetch_openers(create_initial_state("Test", "Data Scientist", "Junior"))
+    for prefetch in workflow._prefetched_openers[state["interview_id"]].values():
+        prefetch.future.result()
+    live_openers = []
+    
+    while not state["is_complete"]:
+        before = llm.calls
+        state = workflow.run_step(state)
+        if state["current_question"]:
+            if state[f"{state['current_agent']}_questions_asked"] == 0:
+                live_openers.append(llm.calls - before)
+            state = workflow.process_answer(state, "An answer.")
+    
+    assert live_openers == [0, 0, 0]
+    assert llm.calls == expected_llm_calls()
+    assert workflow._prefetched_openers == {}
+
+
+def test_slow_prefetch_falls_back_to_live_generation(monkeypatch):
+    """An opener still generating after PREFETCH_WAIT_SECONDS is cancelled and asked live."""
+    monkeypatch.setattr(settings, "PREFETCH_WAIT_SECONDS", 0.1)
+    workflow = InterviewWorkflow()
+    install_fake_llm(workflow, FakeInterviewLLM(latency=30))
+    state = workflow.prefetch_openers(create_initial_state("Test", "Data Scientist", "Junior"))
+    time.sleep(0.1)
+    prefetched = workflow._prefetched_openers[state["interview_id"]]["technical"]
+    live = FakeInterviewLLM()
+    install_fake_llm(workflow, live)
+    
+    start = time.perf_counter()
+    state = workflow.run_step(state)
+    
+    assert time.perf_counter() - start < 5
+    assert state["current_question"] and live.calls == 1
+    assert prefetched.started.is_set() and prefetched.future.cancelled()
+    workflow.discard(state["interview_id"])
+
+
+def test_unstarted_prefetch_is_cancelled_and_generated_live():
+    """A prefetch that never got to run is not waited for."""
+    workflow = InterviewWorkflow()
+    llm = FakeInterviewLLM()
+    install_fake_llm(workflow, llm)
+    state = create_initial_state("Test", "Data Scientist", "Junior")
+    prefetch = _Prefetch()
+    prefetch.future = Future()
+    workflow._prefetched_openers[state["interview_id"]] = {"technical": prefetch}
+    
+    state = workflow.run_step(state)
+    
+    assert state["current_question"] and llm.calls == 1
+    assert prefetch.future.cancelled()
+
+
+def test_background_work_of_abandoned_interviews_is_bounded(monkeypatch):
+    """Prefetched openers and assessments are kept for the most recent interviews only."""
+    monkeypatch.setattr(settings, "EVALUATION_MODE", "incremental")
+    workflow = InterviewWorkflow(max_interviews=2)
+    install_fake_llm(workflow, FakeInterviewLLM())
+    states = []
+    for _ in range(3):
+        state = workflow.prefetch_openers(create_initial_state("Test", "Data Scientist", "Junior"))
+        state = workflow.run_step(state)
+        states.append(workflow.process_answer(state, "An answer."))
+    ids = [state["interview_id"] for state in states]
+    
+    assert list(workflow._prefetched_openers) == ids[1:]
+    assert list(workflow._pending_assessments) == ids[1:]
+    
+    assert ids[1] in workflow.context_builder._contexts
+    workflow.discard(ids[1])
+    
+    assert list(workflow._prefetched_openers) == ids[2:]
+    assert list(workflow._pending_assessments) == ids[2:]
+    assert ids[1] not in workflow.context_builder._contexts
+
+
+def test_parallel_evaluation_merges_rounds(monkeypatch):
+    """Parallel evaluation scores each round once and merges the results."""
+    monkeypatch.setattr(settings, "EVALUATION_MODE", "parallel")
+    workflow = InterviewWorkflow()
+    llm = FakeInterviewLLM()
+    install_fake_llm(workflow, llm)
+    state = create_initial_state("Test", "System Architect", "Senior")
+    
+    while not state["is_complete"]:
+        state = workflow.run_step(state)
+        if state["current_question"]:
+            state = workflow.process_answer(state, "An answer.")
+    
+    evaluation = state["evaluation"]
+    assert evaluation["score"] == 78
+    assert evaluation["strengths"] == ["Clear and structured answers", "Good grasp of fundamentals"]
+    assert evaluation["overall_feedback"].startswith("Technical Round: A solid interview")
+    assert "Managerial Round:" in evaluation["overall_feedback"]
+
+
+def test_incremental_evaluation_aggregates_answer_assessments(monkeypatch):
+    """Answers are assessed as they arrive; the final step only aggregates."""
+    monkeypatch.setattr(settings, "EVALUATION_MODE", "incremental")
+    workflow = InterviewWorkflow()
+    llm = FakeInterviewLLM()
+    install_fake_llm(workflow, llm)
+    state = create_initial_state("Test", "Backend Developer", "Mid-Level")
+    
+    while not state["is_complete"]:
+        state = workflow.run_step(state)
+        if state["current_question"]:
+            state = workflow.process_answer(state, "An answer.")
+    
+    assert llm.calls == expected_llm_calls()
+    assert len(state["answer_assessments"]) == len(state["qa_pairs"])
+    assert all(assessment["score"] == 78 for assessment in state["answer_assessments"])
+    assert state["evaluation"]["score"] == 78
+    assert "Technical Round: Averaged 78/100 across" in state["evaluation"]["overall_feedback"]
+    assert workflow._pending_assessments == {}
+
+
+def test_incremental_evaluation_tolerates_lost_assessments(monkeypatch):
+    """Answers without a background assessment are assessed at the end."""
+    monkeypatch.setattr(settings, "EVALUATION_MODE", "incremental")
+    workflow = InterviewWorkflow()
+    llm = FakeInterviewLLM()
+    install_fake_llm(workflow, llm)
+    state = create_initial_state("Test", "Backend Developer", "Mid-Level")
+    
+    while not state["is_complete"]:
+        if workflow.next_agent(state) == "evaluation":
+            # Simulate a restart that lost the background work
+            workflow._collect_assessments(state, wait=True)
+            state["answer_assessments"][0] = None
+            state["answer_assessments"][-1] = None
+        state = workflow.run_step(state)
+        if state["current_question"]:
+            state = workflow.process_answer(state, "An answer.")
+    
+    assert llm.calls == expected_llm_calls() + 2
+    assert state["evaluation"]["score"] == 78
+
+
+LONG_RESUME = "\n".join(
+    f"Built service {i} in Python and Go, owning its design, rollout and on-call." for i in range(150)
+)
+
+
+def test_resume_digest_runs_once_and_replaces_raw_resume(monkeypatch):
+    """The resume is summarized once and prompts carry the digest instead."""
+    monkeypatch.setattr(settings, "EVALUATION_MODE", "parallel")
+    monkeypatch.setattr(settings, "RESUME_RETRIEVAL_ENABLED", False)
+    workflow = InterviewWorkflow()
+    llm = FakeInterviewLLM()
+    install_fake_llm(workflow, llm)
+    state = create_initial_state("Test", "Backend Developer", "Senior", resume_text=LONG_RESUME)
+    
+    state = workflow.run_step(state)
+    
+    assert llm.calls == 2
+    assert state["resume_digest"]["skills"][0] == "Python"
+    assert state["resume_digest"]["years_experience"] == 8
+    assert len(state["resume_digest"]["projects"]) == 2
+    
+    while not state["is_complete"]:
+        if state["current_question"]:
+            state = workflow.process_answer(state, "An answer.")
+        state = workflow.run_step(state)
+    
+    assert llm.calls == expected_llm_calls() + 1
+    
+    with_digest = workflow.hr_agent.build_prompt(state)
+    raw = workflow.hr_agent.build_prompt({**state, "resume_digest": {}})
+    base = workflow.hr_agent.build_prompt({**state, "resume_text": None, "resume_digest": None})
+    assert "CANDIDATE PROFILE" in with_digest and LONG_RESUME[:100] not in with_digest
+    assert (len(raw) - len(base)) > 3 * (len(with_digest) - len(base))
+
+
+def test_prefetched_digest_feeds_openers(monkeypatch):
+    """With prefetching, the digest and openers are ready before the first step."""
+    workflow = InterviewWorkflow()
+    llm = FakeInterviewLLM()
+    install_fake_llm(workflow, llm)
+    state = create_initial_state("Test", "Backend Developer", "Senior", resume_text=LONG_RESUME)
+    state = workflow.prefetch_openers(state)
+    for prefetch in workflow._prefetched_openers[state["interview_id"]].values():
+        prefetch.future.result()
+    before = llm.calls
+    
+    state = workflow.run_step(state)
+    
+    assert before == 4
+    assert llm.calls == before
+    assert state["resume_digest"]["education"].startswith("BSc")
+    assert workflow._prefetched_digests == {}
+
+
+def test_sync_methods_refuse_to_block_the_workflow_loop():
+    """Sync methods called from the workflow's own loop raise instead of deadlocking."""
+    workflow = InterviewWorkflow()
+    install_fake_llm(workflow, FakeInterviewLLM())
+    state = create_initial_state("Test", "Software Engineer", "Junior")
+    
+    async def step_synchronously():
+        return workflow.run_step(state)
+    
+    with pytest.raises(RuntimeError):
+        run_in_background(step_synchronously())
+
+
+def test_process_answer_leaves_given_state_unchanged():
+    """Answers produce a new state, so a state can be shared without copying."""
+    workflow = InterviewWorkflow()
+    install_fake_llm(workflow, FakeInterviewLLM())
+    state = workflow.run_step(create_initial_state("Test", "Software Engineer", "Junior"))
+    history = list(state["conversation_history"])
+    
+    answered = workflow.process_answer(state, "An answer.")
+    
+    assert state["conversation_history"] == history
+    assert state["qa_pairs"] == [] and state["current_question"]
+    assert len(answered["conversation_history"]) == 2
+    assert answered["technical_questions_asked"] == 1
+
+
+def test_one_workflow_serves_concurrent_sessions(monkeypatch):
+    """Many sessions driven through one instance from a thread pool stay separate."""
+    monkeypatch.setattr(settings, "EVALUATION_MODE", "incremental")
+    workflow = InterviewWorkflow()
+    llm = FakeInterviewLLM()
+    install_fake_llm(workflow, llm)
+    
+    def interview(number):
+        state = workflow.prefetch_openers(create_initial_state(f"Candidate {number}", "Backend Developer", "Senior"))
+        while not state["is_complete"]:
+            state = workflow.run_step(state)
+            if state["current_question"]:
+                state = workflow.process_answer(state, f"Answer from candidate {number}.")
+        return number, state
+    
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(interview, range(16)))
+    
+    for number, state in results:
+        assert state["evaluation"]["score"] == 78
+        assert len(state["qa_pairs"]) == total_questions()
+        assert {qa.answer for qa in state["qa_pairs"]} == {f"Answer from candidate {number}."}
+        assert workflow.load_state(state["interview_id"])["qa_pairs"] == state["qa_pairs"]
+    assert llm.calls == 16 * expected_llm_calls()
+    assert workflow._pending_assessments == {}
+    assert workflow._prefetched_openers == {}